@@ -54,6 +54,10 @@ class FileLimits:
     MAX_FILES_COUNT = 20  # Maximum number of files per upload
     SUPPORTED_EXTENSIONS = [".ags", ".AGS"]  # Supported file extensions
 
+    # Chunked uploads
+    UPLOAD_CHUNK_SIZE_KB = 1024  # Size of each chunk sent by the browser
+    UPLOAD_SPOOL_TTL_SECONDS = 3600  # Abandoned uploads are discarded after this
+
 
 # ====================================================================
 # MAP CONFIGURATION
@@ -86,6 +90,16 @@ class MapConfig:
     MIN_BUFFER_METERS = 10
     MAX_BUFFER_METERS = 1000
 
+    # Server-side borehole tiles (large datasets)
+    TILE_LAYER_MIN_BOREHOLES = 5000  # Serve points as tiles above this count
+    TILE_INDEX_ZOOM = 16  # Zoom level of the per-dataset spatial index
+    TILE_MAX_FEATURES = 500  # Points per tile before aggregating into clusters
+    TILE_CLUSTER_DEPTH = 4  # Cluster cells per tile edge = 2 ** depth
+    TILE_CACHE_SIZE = 2048  # Rendered tiles kept in the LRU cache
+    TILE_BROWSER_CACHE_SIZE = 256  # Tiles kept per page in the browser LRU
+    TILE_MAX_DATASETS = 4  # Spatial indexes kept in memory
+    TILE_URL_TEMPLATE = "/tiles/boreholes/{dataset_id}/{z}/{x}/{y}.geojson"
+
 
 # ====================================================================
 # PLOT CONFIGURATION
@@ -103,7 +117,12 @@ class PlotConfig:
 
     # DPI settings
     DEFAULT_DPI = 300  # High quality for professional output
-    PREVIEW_DPI = 150  # Lower DPI for web preview
+    PREVIEW_DPI = 100  # Lower DPI for web preview
+    PREVIEW_HATCHING = False  # Skip hatch patterns in interactive previews
+    DOWNLOAD_DPI = 300  # Resolution of downloaded raster sections
+    DOWNLOAD_FORMATS = ("png", "pdf", "svg")  # Offered section download formats
+    DEFAULT_DOWNLOAD_FORMAT = "png"
+    LOG_DISPLAY_DPI = 150  # Borehole log pages shown in the browser
 
     # Color schemes
     DEFAULT_COLORMAP = "tab20"
@@ -221,6 +240,49 @@ class PerformanceConfig:
     MAX_MEMORY_USAGE_MB = 512  # Maximum memory usage per process
     GARBAGE_COLLECTION_THRESHOLD = 100  # Objects before triggering GC
 
+    # Per-session application state
+    SESSION_COOKIE_NAME = "borehole_session"  # Cookie carrying the session ID
+    SESSION_STATE_TTL_SECONDS = 1800  # Idle time before a session is evicted
+    SESSION_STATE_MAX_SESSIONS = 100  # Maximum live session states
+    SESSION_STATE_MAX_MEMORY_MB = 256  # Memory cap across all session states
+    SESSION_STATE_SWEEP_SECONDS = 30  # Minimum interval between eviction sweeps
+
+    # Store serialization
+    STORE_BINARY_COLUMNS = True  # Base64 numpy buffers for numeric store columns
+    DERIVED_VIEW_CACHE_SIZE = 64  # Memoized derived views (frames, options, markers)
+
+    # Response compression
+    RESPONSE_COMPRESSION_ENABLED = True  # Compress large callback/route responses
+    RESPONSE_COMPRESSION_MIN_BYTES = 1024  # Smaller responses are sent as-is
+    RESPONSE_COMPRESSION_GZIP_LEVEL = 6  # gzip level (1 fastest - 9 smallest)
+    RESPONSE_COMPRESSION_BROTLI_QUALITY = 5  # brotli quality (0 - 11)
+
+    # Section rendering
+    SECTION_RENDER_CACHE_MAX_MB = 64  # Encoded section images kept in memory
+    LOG_RENDER_CACHE_MAX_MB = 32  # Borehole log pages (separate budget)
+    RENDER_IMAGE_ROUTE = "/renders"  # URL prefix serving cached images
+    RENDER_IMAGE_MAX_AGE_SECONDS = 3600  # Browser cache lifetime of served images
+    RENDER_IMAGE_PIN_SECONDS = 120  # Served images kept until fetched (at most)
+    RENDER_IMAGE_PIN_FRACTION = 0.5  # Share of a render cache that may be pinned
+
+    # Off-thread rendering
+    RENDER_WORKERS = 2  # Render worker processes
+    RENDER_QUEUE_SIZE = 8  # Renders queued or running before new ones are refused
+    RENDER_USE_PROCESSES = True  # Fall back to threads when False
+    BACKGROUND_CALLBACK_THREADS = 4  # Threads running Dash background callbacks
+    BACKGROUND_CALLBACK_POLL_MS = 500  # Browser polling interval for results
+    RENDER_GENERATION_SLOTS = 1024  # Sessions tracked for superseded renders
+
+    # Borehole log warm-up after upload
+    LOG_WARMUP_ENABLED = True  # Pre-render logs on idle render workers
+    LOG_WARMUP_MAX_BOREHOLES = 50  # Boreholes nearest the map centre to warm
+    LOG_WARMUP_POLL_SECONDS = 0.25  # Interval for checking the pool is idle
+    LOG_WARMUP_MAX_CACHE_FILL = 0.5  # Stop warming once the log cache is this full
+
+    # Bulk borehole log export
+    LOG_EXPORT_MAX_BOREHOLES = 500  # Logs in one ZIP export
+    LOG_EXPORT_MAX_COMBINED_PDF = 50  # Logs in one combined PDF (merged in memory)
+
 
 # ====================================================================
 # LOGGING CONFIGURATION
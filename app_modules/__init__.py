@@ -14,6 +14,8 @@ Modules:
     layout: Complete application layout components
     clientside_callbacks: Browser-side callbacks for performance
     server_callbacks: Server-side data processing callbacks
+    server_routes: Flask routes served alongside the Dash callbacks
+    response_compression: gzip/brotli compression of large responses
     main: Main application integration and coordination
 """
 
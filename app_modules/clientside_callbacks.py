@@ -9,6 +9,8 @@ import dash
 from dash import dcc
 import logging
 
+from app_constants import MAP_CONFIG
+
 
 def register_theme_callbacks(app):
     """
@@ -173,6 +175,322 @@ def register_shape_handling_callbacks(app):
     )
 
 
+def register_marker_click_relay(app):
+    """
+    Register the clientside relay that turns marker clicks into a single store update.
+
+    The pattern-matching n_clicks array stays in the browser; only the clicked
+    marker's LOCA_ID (taken from the triggered id) and the dataset ID are sent
+    to the server. The clicked marker turns green and the previously active
+    one blue through a ``dash_clientside.Patch`` of just those markers, so
+    neither the marker list nor the dataset is sent to the server.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+    """
+    app.clientside_callback(
+        """
+        function(n_clicks, markers, boreholeData) {
+            const dc = window.dash_clientside;
+            const ctx = dc.callback_context;
+            const triggeredId = ctx.triggered_id;
+            // Markers being (re)rendered also fire this callback with n_clicks 0
+            if (!triggeredId || typeof triggeredId !== 'object' ||
+                !ctx.triggered.length || !ctx.triggered[0].value) {
+                return [dc.no_update, dc.no_update];
+            }
+
+            const clickedId = String(triggeredId.index);
+            const patch = new dc.Patch();
+            let changed = false;
+            (markers || []).forEach((marker, position) => {
+                const props = marker && marker.props;
+                if (!props || !props.icon || !props.id) {
+                    return;
+                }
+                const iconUrl = String(props.id.index) === clickedId
+                    ? '__SELECTED_MARKER__' : '__DEFAULT_MARKER__';
+                if (props.icon.iconUrl !== iconUrl) {
+                    patch.assign([position, 'props', 'icon', 'iconUrl'], iconUrl);
+                    changed = true;
+                }
+            });
+
+            return [
+                {
+                    loca_id: triggeredId.index,
+                    dataset_id: boreholeData ? boreholeData.dataset_id : null,
+                    timestamp: Date.now()
+                },
+                changed ? patch.build() : dc.no_update
+            ];
+        }
+        """.replace(
+            "__SELECTED_MARKER__", MAP_CONFIG.GREEN_MARKER_URL
+        ).replace("__DEFAULT_MARKER__", MAP_CONFIG.BLUE_MARKER_URL),
+        [
+            dash.Output("marker-click-store", "data"),
+            dash.Output("borehole-markers", "children", allow_duplicate=True),
+        ],
+        dash.Input({"type": "borehole-marker", "index": dash.ALL}, "n_clicks"),
+        [
+            dash.State("borehole-markers", "children"),
+            dash.State("borehole-data-store", "data"),
+        ],
+        prevent_initial_call=True,
+    )
+
+
+def register_borehole_tile_callbacks(app):
+    """
+    Register clientside callbacks for the server-side borehole tile layer.
+
+    The visible slippy-map tiles are computed from the map bounds and fetched
+    from the tile route; tiles are cached in the browser per URL (an LRU of
+    MAP_CONFIG.TILE_BROWSER_CACHE_SIZE tiles) so panning back over an area
+    does not refetch it. Failed tiles are not cached. If the server no longer
+    has the dataset (404), a one-off restore is requested through
+    dataset-sync-store.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+    """
+    app.clientside_callback(
+        """
+        async function(bounds, zoom, tileSource) {
+            const noUpdate = window.dash_clientside.no_update;
+            const empty = {type: 'FeatureCollection', features: []};
+            if (!tileSource || !tileSource.url) {
+                return [empty, noUpdate];
+            }
+            if (!bounds || zoom === undefined || zoom === null) {
+                return [noUpdate, noUpdate];
+            }
+
+            const z = Math.max(0, Math.min(tileSource.max_zoom || 18, Math.round(zoom)));
+            const n = Math.pow(2, z);
+            const clamp = (v, lo, hi) => Math.max(lo, Math.min(hi, v));
+            const tileX = lon => clamp(Math.floor((lon + 180) / 360 * n), 0, n - 1);
+            const tileY = lat => {
+                const rad = clamp(lat, -85.05112878, 85.05112878) * Math.PI / 180;
+                return clamp(Math.floor((1 - Math.asinh(Math.tan(rad)) / Math.PI) / 2 * n), 0, n - 1);
+            };
+
+            // bounds = [[south, west], [north, east]]
+            const xMin = tileX(bounds[0][1]), xMax = tileX(bounds[1][1]);
+            const yMin = tileY(bounds[1][0]), yMax = tileY(bounds[0][0]);
+
+            // LRU of tile promises by URL (a Map keeps insertion order).
+            // Failed responses are dropped so a later pan retries them.
+            const cache = window.boreholeTileCache = window.boreholeTileCache || new Map();
+            const maxTiles = __TILE_BROWSER_CACHE_SIZE__;
+            const requests = [];
+            for (let x = xMin; x <= xMax; x++) {
+                for (let y = yMin; y <= yMax; y++) {
+                    const url = tileSource.url
+                        .replace('{z}', z).replace('{x}', x).replace('{y}', y);
+                    let request = cache.get(url);
+                    if (request) {
+                        cache.delete(url);
+                    } else {
+                        request = fetch(url)
+                            .then(response => {
+                                if (response.ok) {
+                                    return response.json();
+                                }
+                                cache.delete(url);
+                                return {...empty, status: response.status};
+                            })
+                            .catch(() => { cache.delete(url); return empty; });
+                    }
+                    cache.set(url, request);
+                    requests.push(request);
+                }
+            }
+            while (cache.size > maxTiles) {
+                cache.delete(cache.keys().next().value);
+            }
+
+            const tiles = await Promise.all(requests);
+            // The server lost the dataset's index: ask for a restore, once
+            const missing = !tileSource.restored && tiles.some(tile => tile.status === 404);
+            return [
+                {
+                    type: 'FeatureCollection',
+                    features: [].concat(...tiles.map(tile => tile.features || []))
+                },
+                missing ? {dataset_id: tileSource.dataset_id, tiles: true} : noUpdate
+            ];
+        }
+        """.replace(
+            "__TILE_BROWSER_CACHE_SIZE__", str(MAP_CONFIG.TILE_BROWSER_CACHE_SIZE)
+        ),
+        [
+            dash.Output("borehole-tile-layer", "data"),
+            dash.Output("dataset-sync-store", "data", allow_duplicate=True),
+        ],
+        [
+            dash.Input("borehole-map", "bounds"),
+            dash.Input("borehole-map", "zoom"),
+            dash.Input("borehole-tiles-store", "data"),
+        ],
+        prevent_initial_call=True,
+    )
+
+    # Clicking a borehole point on the tile layer behaves like a marker click
+    app.clientside_callback(
+        """
+        function(clickData, tileSource) {
+            // clickData holds the clicked GeoJSON feature
+            const feature = clickData && (clickData.feature || clickData);
+            const props = feature && feature.properties;
+            if (!props || props.cluster || !props.loca_id) {
+                return window.dash_clientside.no_update;
+            }
+            return {
+                loca_id: props.loca_id,
+                dataset_id: tileSource ? tileSource.dataset_id : null,
+                timestamp: Date.now()
+            };
+        }
+        """,
+        dash.Output("marker-click-store", "data", allow_duplicate=True),
+        dash.Input("borehole-tile-layer", "clickData"),
+        dash.State("borehole-tiles-store", "data"),
+        prevent_initial_call=True,
+    )
+
+
+def register_selection_preview_callbacks(app):
+    """
+    Register browser-side selection highlighting and buffer preview.
+
+    Ticking boreholes in the subselection grid recolours markers and redraws
+    the PCA line in the browser, and editing the buffer width previews an
+    approximate buffer. The server is only called when the authoritative
+    selection is recomputed (drawing a shape or clicking "Update Buffer").
+    Geometry helpers live in assets/selection_preview.js.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+    """
+    # Highlight checked markers and redraw the PCA line for shape selections
+    app.clientside_callback(
+        """
+        function(checkedIds, markers, lineChildren, selection) {
+            const preview = window.selectionPreview;
+            if (!preview || !markers) {
+                return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+            }
+            const updatedMarkers = preview.highlightMarkers(
+                markers, checkedIds, '__SELECTED_MARKER__', '__DEFAULT_MARKER__'
+            );
+
+            // Polyline selections keep their section line and buffer
+            if (selection && selection.is_polyline) {
+                return [updatedMarkers, window.dash_clientside.no_update];
+            }
+
+            const checked = new Set((checkedIds || []).map(String));
+            const positions = markers
+                .filter(m => m && m.props && m.props.id && checked.has(String(m.props.id.index)))
+                .map(m => m.props.position);
+            const line = preview.pcaLine(positions);
+            const lineElements = line ? [{
+                namespace: 'dash_leaflet',
+                type: 'Polyline',
+                props: {
+                    positions: line,
+                    color: 'red',
+                    weight: 3,
+                    opacity: 0.8,
+                    dashArray: '5, 5',
+                    children: {
+                        namespace: 'dash_leaflet',
+                        type: 'Tooltip',
+                        props: {children: 'Extended PCA section line'}
+                    }
+                }
+            }] : [];
+            return [updatedMarkers, lineElements];
+        }
+        """.replace(
+            "__SELECTED_MARKER__", MAP_CONFIG.GREEN_MARKER_URL
+        ).replace("__DEFAULT_MARKER__", MAP_CONFIG.BLUE_MARKER_URL),
+        [
+            dash.Output("borehole-markers", "children", allow_duplicate=True),
+            dash.Output("pca-line-group", "children", allow_duplicate=True),
+        ],
+        dash.Input("subselection-checkbox-grid", "value"),
+        [
+            dash.State("borehole-markers", "children"),
+            dash.State("pca-line-group", "children"),
+            dash.State("selection-store", "data"),
+        ],
+        prevent_initial_call=True,
+    )
+
+    # Preview the buffer while the width is edited; "Update Buffer" applies it
+    app.clientside_callback(
+        """
+        function(bufferMeters, lineChildren, polyline) {
+            const preview = window.selectionPreview;
+            if (!preview || !polyline || !polyline.last_polyline) {
+                return window.dash_clientside.no_update;
+            }
+            const ring = preview.bufferPolygon(polyline.last_polyline, Number(bufferMeters));
+            if (!ring) {
+                return window.dash_clientside.no_update;
+            }
+            const bufferPreview = {
+                namespace: 'dash_leaflet',
+                type: 'Polygon',
+                props: {
+                    positions: ring,
+                    color: 'blue',
+                    fillColor: 'blue',
+                    fillOpacity: 0.1,
+                    weight: 1,
+                    opacity: 0.7,
+                    dashArray: '2,6',
+                    children: {
+                        namespace: 'dash_leaflet',
+                        type: 'Tooltip',
+                        props: {children: `${bufferMeters}m buffer preview (click Update Buffer to apply)`}
+                    }
+                }
+            };
+            // Replace the current buffer polygon, keep the section line
+            const kept = (lineChildren || []).filter(child => !child || child.type !== 'Polygon');
+            return kept.concat([bufferPreview]);
+        }
+        """,
+        dash.Output("pca-line-group", "children", allow_duplicate=True),
+        dash.Input("buffer-input", "value"),
+        [
+            dash.State("pca-line-group", "children"),
+            dash.State("polyline-store", "data"),
+        ],
+        prevent_initial_call=True,
+    )
+
+    # A newly loaded dataset starts with no selection, polyline or buffer
+    app.clientside_callback(
+        """
+        function(storedData) {
+            return [null, null, null];
+        }
+        """,
+        [
+            dash.Output("selection-store", "data", allow_duplicate=True),
+            dash.Output("polyline-store", "data", allow_duplicate=True),
+            dash.Output("buffer-store", "data", allow_duplicate=True),
+        ],
+        dash.Input("borehole-data-store", "data"),
+        prevent_initial_call=True,
+    )
+
+
 def register_all_clientside_callbacks(app):
     """
     Register all clientside callbacks for the application.
@@ -184,5 +502,8 @@ def register_all_clientside_callbacks(app):
 
     register_theme_callbacks(app)
     register_shape_handling_callbacks(app)
+    register_marker_click_relay(app)
+    register_borehole_tile_callbacks(app)
+    register_selection_preview_callbacks(app)
 
     logging.info("✅ All clientside callbacks registered successfully!")
@@ -18,6 +18,8 @@ from config_modules import (
     UPLOAD_PROMPT,
     LABELS_CHECKBOX_LABEL,
     DOWNLOAD_BUTTON_LABEL,
+    LOG_EXPORT_BUTTON_LABEL,
+    LOG_EXPORT_FORMAT_LABELS,
     HEADER_H1_CENTER_STYLE,
     HEADER_H2_CENTER_STYLE,
     HEADER_H2_LEFT_STYLE,
@@ -27,6 +29,8 @@ from config_modules import (
     CHECKBOX_CONTROL_STYLE,
     BUTTON_RIGHT_STYLE,
 )
+from app_constants import PLOT_CONFIG
+from borehole_log import available_export_formats
 
 
 def create_header_section():
@@ -82,13 +86,11 @@ def create_file_upload_section():
     """
     return [
         # ===== FILE UPLOAD SECTION =====
-        # AGS file upload component with drag-and-drop functionality
-        dcc.Upload(
+        # AGS file drop zone; files are sent in chunks by assets/chunked_upload.js
+        html.Div(
             id="upload-ags",
             children=html.Div(["Drag and Drop or ", html.A(UPLOAD_PROMPT)]),
-            style=UPLOAD_AREA_CENTER_STYLE,
-            multiple=True,
-            accept=".ags",
+            style={**UPLOAD_AREA_CENTER_STYLE, "cursor": "pointer"},
         ),
         html.Div(id="output-upload"),
         html.Hr(),
@@ -252,6 +254,12 @@ def create_map_feature_groups():
             ],
             id="borehole-markers",
         ),
+        # Server-side tile layer for very large datasets (fed by a clientside fetch)
+        dl.GeoJSON(
+            id="borehole-tile-layer",
+            data=None,
+            pointToLayer={"variable": "boreholeTiles.pointToLayer"},
+        ),
         # Feature group for selection shapes (polygons, rectangles, etc.)
         dl.FeatureGroup(
             [
@@ -368,6 +376,7 @@ def create_output_sections():
         # ===== OUTPUT SECTIONS =====
         # Dynamic content areas populated by callbacks
         html.Div(id="selected-borehole-info"),  # Selected borehole information display
+        html.Div(id="section-plot-progress"),  # Background render progress
         html.Div(id="section-plot-output"),  # Cross-sectional plots
         html.Div(id="log-plot-output"),  # Individual borehole logs
         # ===== CONTROL BUTTONS AND DOWNLOADS =====
@@ -387,9 +396,43 @@ def create_output_sections():
                     n_clicks=0,
                     style=BUTTON_RIGHT_STYLE,
                 ),
+                dcc.RadioItems(
+                    id="download-format-selector",
+                    options=[
+                        {"label": fmt.upper(), "value": fmt}
+                        for fmt in PLOT_CONFIG.DOWNLOAD_FORMATS
+                    ],
+                    value=PLOT_CONFIG.DEFAULT_DOWNLOAD_FORMAT,
+                    inline=True,
+                    style={"float": "right", "margin": "1em 1em 0 0"},
+                ),
                 dcc.Download(id="download-section-plot"),
             ]
         ),
+        # Bulk borehole log export (selected boreholes, or all if none)
+        html.Div(
+            [
+                html.Button(
+                    LOG_EXPORT_BUTTON_LABEL,
+                    id="export-logs-btn",
+                    n_clicks=0,
+                    style=BUTTON_RIGHT_STYLE,
+                ),
+                dcc.RadioItems(
+                    id="log-export-format-selector",
+                    options=[
+                        {"label": LOG_EXPORT_FORMAT_LABELS[fmt], "value": fmt}
+                        for fmt in available_export_formats()
+                    ],
+                    value="zip",
+                    inline=True,
+                    style={"float": "right", "margin": "1em 1em 0 0"},
+                ),
+                dcc.Download(id="download-log-export"),
+                html.Div(id="log-export-progress", style={"clear": "both"}),
+                html.Div(id="log-export-status"),
+            ]
+        ),
         # ===== FEEDBACK AND SUBSELECTION =====
         # UI feedback and borehole subselection components
         html.Div(id="ui-feedback"),
@@ -413,10 +456,16 @@ def create_data_stores():
     return [
         # ===== DATA STORES =====
         # Store components for data sharing between callbacks
-        dcc.Store(id="upload-data-store"),  # Uploaded file data
+        dcc.Store(id="upload-data-store"),  # Chunked upload manifest
         dcc.Store(id="borehole-data-store"),  # Processed borehole data
         dcc.Store(id="search-selected-borehole", data=None),  # Search selection state
         dcc.Store(id="draw-state-store", data={"lastUpdate": 0}),  # Draw state tracking
+        dcc.Store(id="marker-click-store", data=None),  # Last clicked marker LOCA_ID
+        dcc.Store(id="dataset-sync-store", data=None),  # Dataset restore requests
+        dcc.Store(id="borehole-tiles-store", data=None),  # Tile source for large data
+        dcc.Store(id="selection-store", data=None),  # Selected borehole IDs
+        dcc.Store(id="polyline-store", data=None),  # Last drawn section polyline
+        dcc.Store(id="buffer-store", data=None),  # Applied buffer width
     ]
 
 
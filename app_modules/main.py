@@ -16,6 +16,9 @@ from .app_setup import (
 from .layout import create_complete_layout
 from .clientside_callbacks import register_all_clientside_callbacks
 from .server_callbacks import register_all_server_callbacks
+from .server_routes import register_all_server_routes
+from .response_compression import register_response_compression
+from app_constants import PERFORMANCE_CONFIG
 
 
 def create_and_configure_app(logfile="app_debug.log"):
@@ -50,6 +53,13 @@ def create_and_configure_app(logfile="app_debug.log"):
     # Register server-side callbacks
     register_all_server_callbacks(app)
 
+    # Register Flask routes served alongside the callbacks
+    register_all_server_routes(app)
+
+    # Compress large callback and route responses
+    if PERFORMANCE_CONFIG.RESPONSE_COMPRESSION_ENABLED:
+        register_response_compression(app)
+
     # Register modular callbacks from the callbacks package
     logging.info("Registering split callbacks...")
     register_callbacks(app)
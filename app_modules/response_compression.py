@@ -0,0 +1,196 @@
+"""
+HTTP response compression for Dash callback and route payloads.
+
+Callback responses (markers, base64 plot images, store data) and GeoJSON
+tiles are plain JSON and compress very well, but the Dash server sends them
+uncompressed unless ``flask-compress`` is installed. This module adds a small
+``after_request`` hook that compresses large text responses with brotli (when
+the ``brotli`` package is available) or gzip, and records payload sizes
+before and after compression per Dash callback output.
+
+Key Features:
+- **Size Threshold**: Responses smaller than
+  ``PERFORMANCE_CONFIG.RESPONSE_COMPRESSION_MIN_BYTES`` are sent as-is
+- **Content Negotiation**: Uses the best encoding accepted by the browser
+- **Per-Callback Metrics**: Raw and transferred bytes logged and aggregated
+  per callback ID (see ``get_compression_stats``)
+"""
+
+import gzip
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from flask import request
+
+from app_constants import PERFORMANCE_CONFIG
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = (
+    "application/json",
+    "application/geo+json",
+    "application/javascript",
+    "text/",
+)
+
+DASH_CALLBACK_PATH = "_dash-update-component"
+
+
+def _accepted_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred supported encoding from an Accept-Encoding header."""
+    accepted = set()
+    for part in (accept_encoding or "").split(","):
+        coding, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        # q=0 (in any spelling, e.g. "q=0.0" or "; q=0") means "not acceptable"
+        if coding and quality > 0:
+            accepted.add(coding.lower())
+    if BROTLI_AVAILABLE and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress_payload(data: bytes, encoding: str) -> bytes:
+    """
+    Compress a payload with the given content encoding.
+
+    Args:
+        data: Raw response body
+        encoding: ``"br"`` or ``"gzip"``
+
+    Returns:
+        bytes: Compressed body
+    """
+    if encoding == "br":
+        return brotli.compress(
+            data, quality=PERFORMANCE_CONFIG.RESPONSE_COMPRESSION_BROTLI_QUALITY
+        )
+    return gzip.compress(
+        data, compresslevel=PERFORMANCE_CONFIG.RESPONSE_COMPRESSION_GZIP_LEVEL
+    )
+
+
+class CompressionStats:
+    """Aggregated payload sizes per callback ID (or request path)."""
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, raw_bytes: int, sent_bytes: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                key, {"responses": 0, "raw_bytes": 0, "sent_bytes": 0}
+            )
+            stats["responses"] += 1
+            stats["raw_bytes"] += raw_bytes
+            stats["sent_bytes"] += sent_bytes
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                key: {
+                    **stats,
+                    "saved_bytes": stats["raw_bytes"] - stats["sent_bytes"],
+                    "ratio": (
+                        stats["sent_bytes"] / stats["raw_bytes"]
+                        if stats["raw_bytes"]
+                        else 1.0
+                    ),
+                }
+                for key, stats in self._stats.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_compression_stats = CompressionStats()
+
+
+def get_compression_stats() -> CompressionStats:
+    """Get the global response compression statistics."""
+    return _compression_stats
+
+
+def _payload_key() -> str:
+    """Identify the response for metrics: Dash callback output or URL path."""
+    if request.path.endswith(DASH_CALLBACK_PATH):
+        body = request.get_json(silent=True) or {}
+        return str(body.get("output", request.path))
+    return request.path
+
+
+def register_response_compression(app, min_bytes: Optional[int] = None):
+    """
+    Compress large text responses from the Dash server.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+        min_bytes: Minimum body size to compress; defaults to
+            PERFORMANCE_CONFIG.RESPONSE_COMPRESSION_MIN_BYTES
+    """
+    if min_bytes is None:
+        min_bytes = PERFORMANCE_CONFIG.RESPONSE_COMPRESSION_MIN_BYTES
+
+    @app.server.after_request
+    def compress_response(response):
+        is_callback = request.path.endswith(DASH_CALLBACK_PATH)
+        if (
+            response.direct_passthrough
+            or response.status_code < 200
+            or response.status_code >= 300
+            or "Content-Encoding" in response.headers
+            or not response.mimetype.startswith(COMPRESSIBLE_MIMETYPES)
+        ):
+            return response
+
+        raw = response.get_data()
+        encoding = _accepted_encoding(request.headers.get("Accept-Encoding", ""))
+        response.vary.add("Accept-Encoding")
+
+        if encoding is None or len(raw) < min_bytes:
+            if is_callback:
+                _compression_stats.record(_payload_key(), len(raw), len(raw))
+            return response
+
+        compressed = compress_payload(raw, encoding)
+        if len(compressed) >= len(raw):
+            # Sent uncompressed, but still counted in the payload metrics
+            _compression_stats.record(_payload_key(), len(raw), len(raw))
+            return response
+
+        response.set_data(compressed)
+        response.headers["Content-Encoding"] = encoding
+        response.headers["Content-Length"] = str(len(compressed))
+
+        key = _payload_key()
+        _compression_stats.record(key, len(raw), len(compressed))
+        logger.info(
+            f"📦 {key}: {len(raw) / 1024:.1f}KB -> {len(compressed) / 1024:.1f}KB "
+            f"({encoding})"
+        )
+        return response
+
+    logger.info(
+        f"Response compression enabled (threshold {min_bytes} bytes, "
+        f"{'brotli/gzip' if BROTLI_AVAILABLE else 'gzip'})"
+    )
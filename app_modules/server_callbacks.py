@@ -2,66 +2,141 @@
 Server-side callback functions for data handling.
 
 This module contains server-side callbacks that handle data processing,
-state management, and other server-side operations.
+state management, and other server-side operations. Uploaded files no
+longer pass through a callback here: they are streamed to the upload spool by
+the chunked upload routes (see server_routes).
+
+Callbacks that only receive a dataset ID find the uploaded data in the
+session's server-side state. When this process does not hold it (server
+restart, session eviction, another worker), they write a restore request to
+``dataset-sync-store`` and the restore callback reloads the dataset from
+``borehole-data-store`` once, then replays the request.
 """
 
+import time
+
 import dash
 import logging
 
+from borehole_tiles import get_tile_service, get_tile_url_template
+from callbacks.file_upload.processing import store_session_dataset
+from state_management import get_borehole_frame
+
 
-def store_upload_data(contents, filenames):
+def select_borehole_tile_source(stored_borehole_data):
     """
-    Store uploaded file data in a dcc.Store component for use across callbacks.
+    Select the tile source for the loaded dataset.
 
-    This callback processes uploaded AGS files and stores their contents and filenames
-    in a Dash Store component, making the data available to other callbacks without
-    requiring re-upload or re-processing.
+    Datasets registered with the tile service (large uploads) are drawn by
+    the tile layer instead of individual markers.
 
     Args:
-        contents (list/str): Base64 encoded file contents from dcc.Upload
-        filenames (list/str): Original filenames of uploaded files
+        stored_borehole_data (dict/None): Contents of borehole-data-store
 
     Returns:
-        dict/None: Dictionary containing contents and filenames, or None if no upload
-
-    Structure of returned data:
-        {
-            "contents": [base64_string1, base64_string2, ...],
-            "filenames": ["file1.ags", "file2.ags", ...]
-        }
+        dict/None: {"dataset_id", "url", "max_zoom"} or None for marker rendering
     """
-    if contents is None:
-        logging.info("No upload data to store")
+    if not stored_borehole_data:
         return None
 
-    try:
-        logging.info("=== STORING UPLOAD DATA ===")
-        if isinstance(contents, list):
-            logging.info(f"Storing {len(contents)} files")
-            return {"contents": contents, "filenames": filenames}
-        else:
-            logging.info("Storing single file")
-            return {"contents": [contents], "filenames": [filenames]}
-    except Exception as e:
-        logging.error(f"Error storing upload data: {str(e)}")
+    dataset_id = stored_borehole_data.get("dataset_id")
+    if not get_tile_service().has_dataset(dataset_id):
         return None
 
+    return {
+        "dataset_id": dataset_id,
+        "url": get_tile_url_template(dataset_id),
+        "max_zoom": 18,
+    }
+
+
+def register_tile_source_callback(app):
+    """
+    Register the callback that points the tile layer at the loaded dataset.
 
-def register_upload_callback(app):
+    Args:
+        app (dash.Dash): The Dash application instance
     """
-    Register the upload data store callback.
+
+    @app.callback(
+        dash.Output("borehole-tiles-store", "data"),
+        dash.Input("borehole-data-store", "data"),
+        prevent_initial_call=True,
+    )
+    def _select_tile_source_callback(stored_borehole_data):
+        return select_borehole_tile_source(stored_borehole_data)
+
+
+def restore_session_dataset(sync_request, stored_borehole_data):
+    """
+    Reload a dataset into the session's server-side state from the client store.
+
+    Args:
+        sync_request (dict/None): Restore request ``{"dataset_id", "click"}``
+            from a marker click, or ``{"dataset_id", "tiles": True}`` from a
+            tile the server could not find
+        stored_borehole_data (dict/None): Contents of borehole-data-store
+
+    Returns:
+        tuple: (replayed marker click, refreshed tile source); each is None
+        when there is nothing to replay
+    """
+    if not sync_request or not stored_borehole_data:
+        return None, None
+
+    dataset_id = sync_request.get("dataset_id")
+    if not dataset_id or stored_borehole_data.get("dataset_id") != dataset_id:
+        # The browser has since loaded another dataset
+        return None, None
+
+    store_session_dataset(
+        get_borehole_frame(stored_borehole_data),
+        stored_borehole_data.get("filename_map") or {},
+        dataset_id,
+    )
+    logging.info(f"Restored dataset {dataset_id} from borehole-data-store")
+
+    # Replayed requests are marked so a failed restore cannot loop
+    click = sync_request.get("click")
+    if click:
+        click = {**click, "timestamp": time.time() * 1000, "restored": True}
+
+    tile_source = None
+    if sync_request.get("tiles") and get_tile_service().restore_dataset(dataset_id):
+        tile_source = {
+            **select_borehole_tile_source(stored_borehole_data),
+            "restored": True,
+        }
+
+    return click or None, tile_source
+
+
+def register_dataset_restore_callback(app):
+    """
+    Register the callback that restores a dataset this process does not hold.
+
+    ``borehole-data-store`` is only sent to the server here, on a miss, rather
+    than with every marker click.
 
     Args:
         app (dash.Dash): The Dash application instance
     """
 
     @app.callback(
-        dash.Output("upload-data-store", "data"),
-        dash.Input("upload-ags", "contents"),
-        dash.State("upload-ags", "filename"),
+        dash.Output("marker-click-store", "data", allow_duplicate=True),
+        dash.Output("borehole-tiles-store", "data", allow_duplicate=True),
+        dash.Input("dataset-sync-store", "data"),
+        dash.State("borehole-data-store", "data"),
+        prevent_initial_call=True,
     )
-    def _store_upload_data_callback(contents, filenames):
-        return store_upload_data(contents, filenames)
+    def _restore_dataset_callback(sync_request, stored_borehole_data):
+        click, tile_source = restore_session_dataset(
+            sync_request, stored_borehole_data
+        )
+        return (
+            click if click is not None else dash.no_update,
+            tile_source if tile_source is not None else dash.no_update,
+        )
 
 
 def register_all_server_callbacks(app):
@@ -73,6 +148,7 @@ def register_all_server_callbacks(app):
     """
     logging.info("Registering server-side callbacks...")
 
-    register_upload_callback(app)
+    register_tile_source_callback(app)
+    register_dataset_restore_callback(app)
 
     logging.info("✅ All server-side callbacks registered successfully!")
@@ -0,0 +1,166 @@
+"""
+Flask routes registered on the Dash server.
+
+This module contains plain HTTP endpoints that are served alongside the Dash
+callbacks, for payloads that should be fetched directly by the browser rather
+than shipped through the Dash layout or callback responses.
+"""
+
+import logging
+
+from flask import Response, abort, g, jsonify, request
+
+from app_constants import FILE_LIMITS, PERFORMANCE_CONFIG
+from borehole_tiles import get_tile_service
+from section.render_cache import get_rendered_image
+from state_management.session_store import new_session_id
+from upload_spool import UploadNotFoundError, UploadSpoolError, get_upload_spool
+
+
+def register_borehole_tile_routes(app):
+    """
+    Register the borehole tile endpoint.
+
+    Tiles are compact GeoJSON FeatureCollections addressed by dataset and
+    slippy-map tile coordinates. The dataset ID is a content hash, so tiles
+    are immutable and can be cached by the browser.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+    """
+
+    @app.server.route("/tiles/boreholes/<dataset_id>/<int:z>/<int:x>/<int:y>.geojson")
+    def borehole_tile(dataset_id, z, x, y):
+        payload = get_tile_service().get_tile(dataset_id, z, x, y)
+        if payload is None:
+            abort(404)
+
+        response = Response(payload, mimetype="application/geo+json")
+        response.headers["Cache-Control"] = "public, max-age=86400, immutable"
+        return response
+
+
+def register_render_image_routes(app):
+    """
+    Register the rendered image endpoint.
+
+    Section and log images are kept in the render cache and referenced from
+    ``html.Img`` by URL, so callback responses stay small and repeat views are
+    answered by the browser cache. The image ID is derived from the render
+    inputs (dataset content hash, selection, options), so it doubles as the
+    ETag. Images are pinned in the cache from the time their URL is handed
+    out until it is first fetched, so a fresh URL is not lost to eviction
+    by other sessions' renders; older URLs return 404 once evicted.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+    """
+    route = PERFORMANCE_CONFIG.RENDER_IMAGE_ROUTE
+    cache_control = f"private, max-age={PERFORMANCE_CONFIG.RENDER_IMAGE_MAX_AGE_SECONDS}"
+
+    @app.server.route(f"{route}/<image_id>.<image_format>")
+    def rendered_image(image_id, image_format):
+        cached = get_rendered_image(image_id)
+        if cached is None:
+            abort(404)
+
+        data, mimetype = cached
+        response = Response(data, mimetype=mimetype)
+        response.set_etag(image_id)
+        response.headers["Cache-Control"] = cache_control
+        return response.make_conditional(request)
+
+
+def register_chunked_upload_routes(app):
+    """
+    Register the chunked upload endpoints.
+
+    The browser (assets/chunked_upload.js) creates an upload, sends each file
+    as raw byte chunks, then completes the upload and places the returned
+    manifest in ``upload-data-store``. Chunks are streamed to the upload
+    spool on disk.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+    """
+    max_chunk_bytes = FILE_LIMITS.UPLOAD_CHUNK_SIZE_KB * 1024
+
+    def _error(error):
+        status = 404 if isinstance(error, UploadNotFoundError) else 400
+        return jsonify(error=str(error)), status
+
+    @app.server.route("/uploads", methods=["POST"])
+    def create_upload():
+        upload_id = get_upload_spool().create_upload()
+        return jsonify(upload_id=upload_id, chunk_size=max_chunk_bytes)
+
+    @app.server.route(
+        "/uploads/<upload_id>/files/<int:file_index>", methods=["PUT"]
+    )
+    def upload_chunk(upload_id, file_index):
+        if (request.content_length or 0) > max_chunk_bytes:
+            return jsonify(error="Chunk too large"), 413
+        try:
+            received = get_upload_spool().append_chunk(
+                upload_id,
+                file_index,
+                request.args.get("name", ""),
+                request.args.get("offset", 0, type=int),
+                request.get_data(cache=False),
+            )
+        except UploadSpoolError as e:
+            return _error(e)
+        return jsonify(received=received)
+
+    @app.server.route("/uploads/<upload_id>/complete", methods=["POST"])
+    def complete_upload(upload_id):
+        try:
+            manifest = get_upload_spool().complete_upload(upload_id)
+        except UploadSpoolError as e:
+            return _error(e)
+        return jsonify(manifest)
+
+
+def register_session_hooks(app):
+    """
+    Issue a session cookie so application state can be kept per session.
+
+    The first request without a cookie is assigned a new session ID, which
+    is visible to callbacks in the same request via ``flask.g`` and sent back
+    as an HTTP-only cookie.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+    """
+    cookie_name = PERFORMANCE_CONFIG.SESSION_COOKIE_NAME
+
+    @app.server.before_request
+    def assign_session_id():
+        if not request.cookies.get(cookie_name):
+            g.borehole_session_id = new_session_id()
+
+    @app.server.after_request
+    def set_session_cookie(response):
+        session_id = getattr(g, "borehole_session_id", None)
+        if session_id:
+            response.set_cookie(
+                cookie_name, session_id, httponly=True, samesite="Lax"
+            )
+        return response
+
+
+def register_all_server_routes(app):
+    """
+    Register all Flask routes for the application.
+
+    Args:
+        app (dash.Dash): The Dash application instance
+    """
+    logging.info("Registering server routes...")
+
+    register_session_hooks(app)
+    register_borehole_tile_routes(app)
+    register_render_image_routes(app)
+    register_chunked_upload_routes(app)
+
+    logging.info("✅ All server routes registered successfully!")
@@ -0,0 +1,29 @@
+/*
+ * Point styling for the server-side borehole tile layer.
+ *
+ * Referenced from the dash-leaflet GeoJSON layer via
+ * pointToLayer={"variable": "boreholeTiles.pointToLayer"}.
+ */
+window.boreholeTiles = Object.assign({}, window.boreholeTiles, {
+    pointToLayer: function (feature, latlng) {
+        const props = feature.properties || {};
+        if (props.cluster) {
+            // Scale cluster circles with the log of the aggregated count
+            const radius = Math.min(24, 6 + 6 * Math.log10(props.point_count || 1));
+            return L.circleMarker(latlng, {
+                radius: radius,
+                color: "#1f4e79",
+                weight: 1,
+                fillColor: "#3388ff",
+                fillOpacity: 0.6
+            });
+        }
+        return L.circleMarker(latlng, {
+            radius: 5,
+            color: "#1f4e79",
+            weight: 1,
+            fillColor: "#3388ff",
+            fillOpacity: 0.9
+        });
+    }
+});
@@ -0,0 +1,91 @@
+/*
+ * Chunked AGS upload.
+ *
+ * Files picked by clicking #upload-ags or dropped on it are sent to the
+ * /uploads endpoints as raw byte chunks (no base64 data URIs). When all files
+ * are spooled on the server, the small upload manifest is written to
+ * upload-data-store, which triggers the ingest callback.
+ */
+window.chunkedUpload = Object.assign({}, window.chunkedUpload, {
+    _setProps: function (id, props) {
+        if (window.dash_clientside && window.dash_clientside.set_props) {
+            window.dash_clientside.set_props(id, props);
+        }
+    },
+
+    _request: async function (url, options) {
+        const response = await fetch(url, Object.assign({credentials: 'same-origin'}, options));
+        const body = await response.json().catch(() => ({}));
+        if (!response.ok) {
+            throw new Error(body.error || `Upload failed (${response.status})`);
+        }
+        return body;
+    },
+
+    uploadFiles: async function (fileList) {
+        const files = Array.from(fileList || []);
+        if (!files.length) {
+            return null;
+        }
+        const totalBytes = files.reduce((sum, file) => sum + file.size, 0);
+        let sentBytes = 0;
+        const report = () => this._setProps('output-upload', {
+            children: `Uploading ${files.length} file(s)... ${totalBytes ? Math.round(100 * sentBytes / totalBytes) : 100}%`
+        });
+
+        try {
+            const upload = await this._request('/uploads', {method: 'POST'});
+            for (let index = 0; index < files.length; index++) {
+                const file = files[index];
+                const name = encodeURIComponent(file.name);
+                let offset = 0;
+                do {
+                    const chunk = file.slice(offset, offset + upload.chunk_size);
+                    await this._request(
+                        `/uploads/${upload.upload_id}/files/${index}?name=${name}&offset=${offset}`,
+                        {method: 'PUT', body: chunk}
+                    );
+                    offset += chunk.size;
+                    sentBytes += chunk.size;
+                    report();
+                } while (offset < file.size);
+            }
+            const manifest = await this._request(
+                `/uploads/${upload.upload_id}/complete`, {method: 'POST'}
+            );
+            manifest.timestamp = Date.now();
+            this._setProps('upload-data-store', {data: manifest});
+            return manifest;
+        } catch (error) {
+            this._setProps('output-upload', {children: `Upload failed: ${error.message}`});
+            return null;
+        }
+    }
+});
+
+document.addEventListener('click', event => {
+    if (event.target.closest && event.target.closest('#upload-ags')) {
+        const input = document.createElement('input');
+        input.type = 'file';
+        input.multiple = true;
+        input.accept = '.ags';
+        input.addEventListener('change', () => window.chunkedUpload.uploadFiles(input.files));
+        input.click();
+    }
+});
+
+document.addEventListener('dragover', event => {
+    if (event.target.closest && event.target.closest('#upload-ags')) {
+        event.preventDefault();
+    }
+});
+
+document.addEventListener('drop', event => {
+    if (event.target.closest && event.target.closest('#upload-ags')) {
+        event.preventDefault();
+        const files = Array.from(event.dataTransfer.files).filter(
+            file => file.name.toLowerCase().endsWith('.ags')
+        );
+        window.chunkedUpload.uploadFiles(files);
+    }
+});
@@ -0,0 +1,93 @@
+/*
+ * Browser-side geometry helpers for selection highlighting and buffer preview.
+ *
+ * These are approximations computed in a local equirectangular projection
+ * (metres around the mean latitude). They only drive previews; the
+ * authoritative selection is still recomputed on the server.
+ */
+window.selectionPreview = Object.assign({}, window.selectionPreview, {
+    // Project [lat, lon] pairs to local metres around their mean latitude
+    _projection: function (latlngs) {
+        const lat0 = latlngs.reduce((sum, p) => sum + p[0], 0) / latlngs.length;
+        const kx = 111320 * Math.cos(lat0 * Math.PI / 180);
+        const ky = 110540;
+        return {
+            forward: p => [p[1] * kx, p[0] * ky],
+            inverse: p => [p[1] / ky, p[0] / kx]
+        };
+    },
+
+    // Recolour borehole markers: checked ids get the selected icon
+    highlightMarkers: function (markers, checkedIds, selectedUrl, defaultUrl) {
+        const checked = new Set((checkedIds || []).map(String));
+        return (markers || []).map(marker => {
+            const props = marker && marker.props;
+            if (!props || !props.id || props.id.type !== 'borehole-marker' || !props.icon) {
+                return marker;
+            }
+            const iconUrl = checked.has(String(props.id.index)) ? selectedUrl : defaultUrl;
+            if (props.icon.iconUrl === iconUrl) {
+                return marker;
+            }
+            return Object.assign({}, marker, {
+                props: Object.assign({}, props, {
+                    icon: Object.assign({}, props.icon, {iconUrl: iconUrl})
+                })
+            });
+        });
+    },
+
+    // Principal-axis line through the points, extended 20% beyond each end
+    pcaLine: function (latlngs) {
+        if (!latlngs || latlngs.length < 2) {
+            return null;
+        }
+        const proj = this._projection(latlngs);
+        const pts = latlngs.map(proj.forward);
+        const mx = pts.reduce((s, p) => s + p[0], 0) / pts.length;
+        const my = pts.reduce((s, p) => s + p[1], 0) / pts.length;
+        let sxx = 0, syy = 0, sxy = 0;
+        pts.forEach(p => {
+            const dx = p[0] - mx, dy = p[1] - my;
+            sxx += dx * dx; syy += dy * dy; sxy += dx * dy;
+        });
+        const angle = 0.5 * Math.atan2(2 * sxy, sxx - syy);
+        const ux = Math.cos(angle), uy = Math.sin(angle);
+        const along = pts.map(p => (p[0] - mx) * ux + (p[1] - my) * uy);
+        const length = Math.max(...along) - Math.min(...along);
+        const half = length / 2 + length * 0.2;
+        return [
+            proj.inverse([mx - ux * half, my - uy * half]),
+            proj.inverse([mx + ux * half, my + uy * half])
+        ];
+    },
+
+    // Flat-capped buffer ring around a polyline, with mitred joins
+    bufferPolygon: function (latlngs, meters) {
+        if (!latlngs || latlngs.length < 2 || !(meters > 0)) {
+            return null;
+        }
+        const proj = this._projection(latlngs);
+        const pts = latlngs.map(proj.forward);
+        const normals = [];
+        for (let i = 0; i < pts.length - 1; i++) {
+            const dx = pts[i + 1][0] - pts[i][0], dy = pts[i + 1][1] - pts[i][1];
+            const len = Math.hypot(dx, dy) || 1;
+            normals.push([-dy / len, dx / len]);
+        }
+        const left = [], right = [];
+        pts.forEach((p, i) => {
+            const a = normals[Math.max(i - 1, 0)], b = normals[Math.min(i, normals.length - 1)];
+            let nx = a[0] + b[0], ny = a[1] + b[1];
+            const len = Math.hypot(nx, ny) || 1;
+            nx /= len; ny /= len;
+            // Mitre length, capped for very sharp turns
+            const scale = meters / Math.max(0.25, nx * b[0] + ny * b[1]);
+            left.push(proj.inverse([p[0] + nx * scale, p[1] + ny * scale]));
+            right.push(proj.inverse([p[0] - nx * scale, p[1] - ny * scale]));
+        });
+        const ring = left.concat(right.reverse());
+        ring.push(ring[0]);
+        return ring;
+    }
+});
@@ -8,8 +8,11 @@ borehole logs from AGS format data, with automatic overflow handling, proper for
 and standardized layout.
 
 Main Components:
-- plotting: Main plotting functionality and PDF generation
+- plotting: Main plotting functionality and PDF/in-memory page generation
+- rendering: Borehole logs rendered straight from AGS content (web app)
+- export: Bulk export of many logs as a ZIP or combined PDF
 - utils: Core utilities for figure management and text processing
+- text_layout: Glyph-width text measurement and cached wrapping
 - layout: Page layout and positioning calculations
 - header_footer: Professional header and footer generation
 - overflow: Multi-page overflow handling and page break calculation
@@ -32,6 +35,8 @@ Compatible with: AGS4 format, matplotlib 3.x, Python 3.8+
 # Import main functions for easy access
 from .plotting import (
     create_borehole_log,
+    render_borehole_log_pages,
+    render_borehole_log_pdf,
     plot_single_page,
     get_default_page_settings,
     validate_plot_data,
@@ -52,16 +57,29 @@ from .layout import (
     validate_layout_settings,
 )
 
+from .text_layout import get_text_layout
+
 from .header_footer import (
     create_header_content,
     create_footer_content,
     validate_header_data,
 )
 
+from .rendering import (
+    build_borehole_log_index,
+    render_borehole_log_from_ags,
+)
+
+from .export import (
+    available_export_formats,
+    export_borehole_logs,
+)
+
 from .overflow import (
     check_depth_overflow,
     calculate_page_breaks_by_stratum,
     get_overflow_summary,
+    split_data_by_page,
 )
 
 # Package metadata
@@ -103,6 +121,13 @@ QUALITY_PRESETS = {
 __all__ = [
     # Main functions
     "create_borehole_log",
+    "render_borehole_log_pages",
+    "render_borehole_log_from_ags",
+    "render_borehole_log_pdf",
+    "build_borehole_log_index",
+    "export_borehole_logs",
+    "available_export_formats",
+    "plot_borehole_log_from_ags_content",
     "plot_single_page",
     "get_default_page_settings",
     "validate_plot_data",
@@ -111,6 +136,7 @@ __all__ = [
     "safe_close_figure",
     "wrap_text_smart",
     "calculate_text_dimensions",
+    "get_text_layout",
     "format_depth_value",
     # Layout functions
     "calculate_plot_layout",
@@ -125,6 +151,7 @@ __all__ = [
     "check_depth_overflow",
     "calculate_page_breaks_by_stratum",
     "get_overflow_summary",
+    "split_data_by_page",
     # Constants
     "DEFAULT_PAGE_SETTINGS",
     "SUPPORTED_AGS_GROUPS",
@@ -266,29 +293,24 @@ def plot_borehole_log_from_ags_content(
     Args:
         ags_content: AGS file content as string
         loca_id: Borehole ID to plot
-        show_labels: Whether to show labels (compatibility parameter)
+        show_labels: Whether to label samples
         fig_height: Figure height in inches
         fig_width: Figure width in inches
-        geology_csv_path: Path to geology codes CSV (optional)
+        geology_csv_path: Path to geology codes CSV (unused, compatibility)
         title: Plot title (optional)
         dpi: Resolution for output
-        **kwargs: Additional parameters for compatibility
+        **kwargs: Additional parameters for compatibility (e.g. data_key)
 
     Returns:
-        list: List of base64-encoded image strings
+        list: PNG image bytes for each page
     """
-    try:
-        import io
-        import base64
-        from matplotlib.backends.backend_pdf import PdfPages
-
-        # For now, return a simple compatibility response
-        # TODO: Implement full compatibility wrapper when needed
-        print(f"Compatibility wrapper called for borehole {loca_id}")
-
-        # Return empty list to avoid breaking existing code
-        return []
-
-    except Exception as e:
-        print(f"Error in compatibility wrapper: {e}")
-        return []
+    return render_borehole_log_from_ags(
+        [("ags_content", ags_content)],
+        loca_id,
+        show_labels=show_labels,
+        fig_height=fig_height,
+        fig_width=fig_width,
+        dpi=dpi,
+        title=title,
+        data_key=kwargs.get("data_key"),
+    )
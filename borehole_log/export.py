@@ -0,0 +1,126 @@
+"""
+Bulk Borehole Log Export
+
+This module exports the logs of many boreholes as one deliverable: a ZIP of
+per-borehole PDFs, or a single combined PDF when pypdf is installed. Logs
+are rendered (optionally in a worker pool) in selection order. ZIP exports
+write each log to the output file as it completes, so only the logs in
+flight are held in memory. A combined PDF is assembled in a pypdf
+``PdfWriter``, which keeps every appended log in memory until the merged
+document is written at the end, so combined PDFs are limited to
+``PERFORMANCE_CONFIG.LOG_EXPORT_MAX_COMBINED_PDF`` logs.
+
+Key Functions:
+- export_borehole_logs: Write the logs of a selection to a ZIP or combined PDF
+- available_export_formats: Export formats usable with installed packages
+"""
+
+import io
+import logging
+import re
+import zipfile
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from app_constants import PERFORMANCE_CONFIG
+
+from .plotting import render_borehole_log_pdf
+from .rendering import borehole_log_inputs, build_borehole_log_index
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("zip", "pdf")
+
+
+def available_export_formats() -> Tuple[str, ...]:
+    """Get the export formats usable here (combined PDFs require pypdf)."""
+    return EXPORT_FORMATS if PdfWriter is not None else ("zip",)
+
+
+def log_archive_name(borehole_id: str) -> str:
+    """Get the file name of a borehole's log inside an export ZIP."""
+    safe_id = re.sub(r"[^\w.-]+", "_", str(borehole_id))
+    return f"borehole_log_{safe_id}.pdf"
+
+
+def export_borehole_logs(
+    ags_data: List[Tuple[str, str]],
+    borehole_ids: Sequence[str],
+    output_file: BinaryIO,
+    export_format: str = "zip",
+    show_labels: bool = True,
+    data_key: Optional[str] = None,
+    pool: Optional[Any] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Render the logs of several boreholes into one ZIP or combined PDF.
+
+    Args:
+        ags_data: List of (filename, content) tuples containing AGS data
+        borehole_ids: Boreholes to export, in output order
+        output_file: Writable binary file receiving the export
+        export_format: "zip" (one PDF per borehole, streamed to output_file)
+            or "pdf" (combined in memory, then written to output_file)
+        show_labels: Whether to label samples
+        data_key: Identifier of ags_data (e.g. the dataset ID)
+        pool: Optional render worker pool; logs are rendered with its
+            ``imap`` so only a window of logs is in flight at once
+        progress: Optional callback receiving (logs done, logs total)
+
+    Returns:
+        int: Number of logs exported (boreholes without strata are skipped)
+
+    Raises:
+        ValueError: If the export format is unknown or needs a missing
+            package, or a combined PDF would exceed its log limit
+    """
+    if export_format not in available_export_formats():
+        raise ValueError(f"Unsupported log export format: {export_format}")
+
+    index = build_borehole_log_index(ags_data, data_key)
+    jobs = [
+        inputs
+        for inputs in (
+            borehole_log_inputs(index, borehole_id, show_labels=show_labels)
+            for borehole_id in borehole_ids
+        )
+        if inputs is not None
+    ]
+    total = len(jobs)
+    max_combined = PERFORMANCE_CONFIG.LOG_EXPORT_MAX_COMBINED_PDF
+    if export_format == "pdf" and total > max_combined:
+        raise ValueError(
+            f"Combined PDF exports are limited to {max_combined} logs ({total} requested)"
+        )
+    logger.info(f"Exporting {total} borehole log(s) as {export_format.upper()}")
+    if progress is not None:
+        progress(0, total)
+
+    pdfs = _render_pdfs(jobs, pool)
+    if export_format == "zip":
+        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as archive:
+            for done, (inputs, pdf) in enumerate(zip(jobs, pdfs), start=1):
+                archive.writestr(log_archive_name(inputs[0]), pdf)
+                if progress is not None:
+                    progress(done, total)
+    else:
+        writer = PdfWriter()
+        for done, (inputs, pdf) in enumerate(zip(jobs, pdfs), start=1):
+            writer.append(io.BytesIO(pdf), outline_item=inputs[0])
+            if progress is not None:
+                progress(done, total)
+        writer.write(output_file)
+
+    return total
+
+
+def _render_pdfs(jobs: List[Tuple], pool: Optional[Any]) -> Iterator[bytes]:
+    """Render log PDFs in job order, lazily."""
+    if pool is None or not jobs:
+        return (render_borehole_log_pdf(*inputs) for inputs in jobs)
+    return pool.imap(render_borehole_log_pdf, *zip(*jobs))
@@ -9,6 +9,8 @@ Key Functions:
 - calculate_page_breaks: Determine optimal page break points
 - handle_multi_page_layout: Coordinate multi-page rendering
 - get_page_depth_range: Calculate depth range for each page
+- split_data_by_page: Filter records for all pages at once using depth
+  intervals sorted into numpy arrays (``searchsorted`` page lookups)
 """
 
 import logging
@@ -229,69 +231,144 @@ def get_page_depth_range(
         return (0.0, 0.0)
 
 
-def filter_data_for_page(
+def index_depth_intervals(
     data_list: List[Dict],
-    page_start_depth: float,
-    page_end_depth: float,
     depth_field: str = "GEOL_TOP",
     depth_field_end: Optional[str] = "GEOL_BASE",
-) -> List[Dict]:
+) -> Dict[str, np.ndarray]:
     """
-    Filter geological/sample data for a specific page depth range.
+    Sort the depth intervals of a record list into arrays for page lookups.
+
+    Depths are parsed once here instead of once per page. Records without a
+    valid start depth are left out; a missing or invalid end depth (or one
+    above the start) is treated as the start depth.
 
     Args:
         data_list: List of data records
-        page_start_depth: Page start depth
-        page_end_depth: Page end depth
         depth_field: Field name for depth start
         depth_field_end: Field name for depth end (optional)
 
     Returns:
-        list: Filtered data records for the page
+        dict: ``{"order", "tops", "bases", "reach"}`` arrays sorted by start
+        depth; ``order`` holds record positions in data_list and ``reach``
+        is the running maximum of the end depths
     """
-    filtered_data = []
-
-    for record in data_list:
+    positions, tops, bases = [], [], []
+    for position, record in enumerate(data_list):
         try:
-            # Get record depth
             record_top = record.get(depth_field)
             if record_top is None:
                 continue
-
             record_top = float(record_top)
-
-            # Get record base depth if available
-            record_base = record_top
-            if depth_field_end and record.get(depth_field_end) is not None:
-                try:
-                    record_base = float(record.get(depth_field_end))
-                except (ValueError, TypeError):
-                    record_base = record_top
-
-            # Check if record overlaps with page range
-            if _record_overlaps_page(
-                record_top, record_base, page_start_depth, page_end_depth
-            ):
-                filtered_data.append(record)
-
         except (ValueError, TypeError) as e:
             logger.warning(f"Skipping record with invalid depth: {e}")
             continue
 
-    return filtered_data
+        record_base = record_top
+        if depth_field_end and record.get(depth_field_end) is not None:
+            try:
+                record_base = max(float(record.get(depth_field_end)), record_top)
+            except (ValueError, TypeError):
+                record_base = record_top
+
+        positions.append(position)
+        tops.append(record_top)
+        bases.append(record_base)
+
+    tops = np.asarray(tops, dtype=float)
+    order = np.argsort(tops, kind="stable")
+    bases = np.asarray(bases, dtype=float)[order]
+    return {
+        "order": np.asarray(positions, dtype=np.intp)[order],
+        "tops": tops[order],
+        "bases": bases,
+        "reach": np.maximum.accumulate(bases) if len(bases) else bases,
+    }
+
 
+def page_record_positions(
+    depth_index: Dict[str, np.ndarray], page_ranges: List[Tuple[float, float]]
+) -> List[np.ndarray]:
+    """
+    Find the records overlapping each page in one pass over all pages.
 
-def _record_overlaps_page(
-    record_top: float, record_base: float, page_start: float, page_end: float
-) -> bool:
-    """Check if a record overlaps with the page depth range."""
+    A record overlaps a page if it starts at or above the page end and ends
+    at or below the page start. ``searchsorted`` bounds each page to the
+    records starting above its end whose running end depth reaches its
+    start; only that slice is checked record by record.
 
-    # Ensure record_base >= record_top
-    if record_base < record_top:
-        record_base = record_top
+    Args:
+        depth_index: Output of index_depth_intervals
+        page_ranges: List of (start_depth, end_depth) tuples
+
+    Returns:
+        list: For each page, positions in the original list, in list order
+    """
+    if not page_ranges:
+        return []
 
-    # Check for overlap
-    return not (record_base < page_start or record_top > page_end)
+    starts, ends = np.asarray(page_ranges, dtype=float).reshape(-1, 2).T
+    lows = np.searchsorted(depth_index["reach"], starts, side="left")
+    highs = np.searchsorted(depth_index["tops"], ends, side="right")
+
+    pages = []
+    for start, low, high in zip(starts, lows, highs):
+        overlaps = depth_index["bases"][low:high] >= start
+        pages.append(np.sort(depth_index["order"][low:high][overlaps]))
+    return pages
+
+
+def split_data_by_page(
+    data_list: List[Dict],
+    page_ranges: List[Tuple[float, float]],
+    depth_field: str = "GEOL_TOP",
+    depth_field_end: Optional[str] = "GEOL_BASE",
+) -> List[List[Dict]]:
+    """
+    Filter geological/sample data for every page of a multi-page layout.
+
+    Equivalent to calling filter_data_for_page per page, but the depths are
+    parsed and sorted only once.
+
+    Args:
+        data_list: List of data records
+        page_ranges: List of (start_depth, end_depth) tuples
+        depth_field: Field name for depth start
+        depth_field_end: Field name for depth end (optional)
+
+    Returns:
+        list: Filtered data records for each page
+    """
+    depth_index = index_depth_intervals(data_list, depth_field, depth_field_end)
+    return [
+        [data_list[position] for position in positions]
+        for positions in page_record_positions(depth_index, page_ranges)
+    ]
+
+
+def filter_data_for_page(
+    data_list: List[Dict],
+    page_start_depth: float,
+    page_end_depth: float,
+    depth_field: str = "GEOL_TOP",
+    depth_field_end: Optional[str] = "GEOL_BASE",
+) -> List[Dict]:
+    """
+    Filter geological/sample data for a specific page depth range.
+
+    Args:
+        data_list: List of data records
+        page_start_depth: Page start depth
+        page_end_depth: Page end depth
+        depth_field: Field name for depth start
+        depth_field_end: Field name for depth end (optional)
+
+    Returns:
+        list: Filtered data records for the page
+    """
+    return split_data_by_page(
+        data_list, [(page_start_depth, page_end_depth)], depth_field, depth_field_end
+    )[0]
 
 
 def calculate_continuation_indicators(
@@ -6,6 +6,11 @@ coordinating between layout, overflow, and header/footer modules.
 
 Key Functions:
 - create_borehole_log: Main function to create complete borehole log
+- render_borehole_log_pages: Render a borehole log to in-memory images per page,
+  optionally rendering the pages concurrently on an executor
+- render_log_page: Render one page (picklable, for worker processes)
+- save_log_pages: Append a borehole log's pages to an open PDF
+- render_borehole_log_pdf: Render a borehole log to PDF bytes (picklable)
 - plot_single_page: Plot a single page of borehole log
 - setup_plot_axes: Configure matplotlib axes for professional plotting
 - coordinate_multi_page_layout: Handle multi-page borehole logs
@@ -14,11 +19,15 @@ Key Functions:
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.backends.backend_pdf import PdfPages
+from concurrent.futures import Executor
+import io
+import itertools
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 import os
 
-from .utils import matplotlib_figure, safe_close_figure, wrap_text_smart
+from .utils import safe_close_figure
+from .text_layout import get_text_layout
 from .layout import calculate_plot_layout, create_column_layout, calculate_depths
 from .header_footer import (
     draw_header,
@@ -28,11 +37,16 @@ from .header_footer import (
 )
 from .overflow import (
     check_depth_overflow,
-    filter_data_for_page,
+    split_data_by_page,
     get_page_depth_range,
     calculate_continuation_indicators,
 )
 
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +58,7 @@ def create_borehole_log(
     project_info: Optional[Dict] = None,
     output_path: Optional[str] = None,
     page_settings: Optional[Dict] = None,
+    executor: Optional[Executor] = None,
 ) -> str:
     """
     Create a complete professional borehole log with multi-page support.
@@ -56,6 +71,8 @@ def create_borehole_log(
         project_info: Project information (PROJ group, optional)
         output_path: Output file path (if None, auto-generate)
         page_settings: Page layout settings
+        executor: Optional executor (e.g. the render worker pool) to render
+            the pages concurrently; requires pypdf to merge them
 
     Returns:
         str: Path to created PDF file
@@ -68,39 +85,38 @@ def create_borehole_log(
         if output_path is None:
             output_path = f"borehole_log_{borehole_id}.pdf"
 
-        # Calculate total depth and check for overflow
-        total_depth = _calculate_total_depth(geology_data, sample_data)
-        layout_info = calculate_plot_layout(page_settings)
-
-        needs_overflow, total_pages, page_ranges = check_depth_overflow(
-            total_depth,
-            layout_info["plot_height"],
-            page_settings.get("depth_scale", 50.0),
-        )
-
-        # Create header and footer content
-        header_content = create_header_content(loca_data, project_info)
-        footer_content = create_footer_content(project_info)
-
-        # Create PDF with multiple pages
-        with PdfPages(output_path) as pdf_pages:
-            for page_num in range(1, total_pages + 1):
-                fig = _create_single_page(
-                    page_num,
-                    total_pages,
-                    page_ranges,
+        if executor is not None and PdfWriter is not None:
+            # Each page becomes a one-page PDF; merge them in page order
+            pages = render_borehole_log_pages(
+                borehole_id,
+                loca_data,
+                geology_data,
+                sample_data,
+                project_info,
+                page_settings,
+                dpi=300,
+                image_format="pdf",
+                executor=executor,
+                bbox_inches="tight",
+            )
+            writer = PdfWriter()
+            for page in pages:
+                writer.append(io.BytesIO(page))
+            with open(output_path, "wb") as output_file:
+                writer.write(output_file)
+            total_pages = len(pages)
+        else:
+            # Create PDF with multiple pages
+            with PdfPages(output_path) as pdf_pages:
+                total_pages = save_log_pages(
+                    pdf_pages,
+                    loca_data,
                     geology_data,
                     sample_data,
-                    header_content,
-                    footer_content,
+                    project_info,
                     page_settings,
-                    layout_info,
                 )
 
-                if fig:
-                    pdf_pages.savefig(fig, bbox_inches="tight", dpi=300)
-                    safe_close_figure(fig)
-
         logger.info(f"Borehole log created: {output_path} ({total_pages} pages)")
         return output_path
 
@@ -109,31 +125,303 @@ def create_borehole_log(
         raise
 
 
-def _create_single_page(
+def save_log_pages(
+    pdf_pages: PdfPages,
+    loca_data: Dict,
+    geology_data: List[Dict],
+    sample_data: Optional[List[Dict]] = None,
+    project_info: Optional[Dict] = None,
+    page_settings: Optional[Dict] = None,
+    dpi: int = 300,
+) -> int:
+    """
+    Append the pages of a borehole log to an open PDF.
+
+    Pages are drawn, written and closed one at a time, so several logs can
+    be streamed into one PDF without holding their pages in memory.
+
+    Args:
+        pdf_pages: Open matplotlib PdfPages writer
+        loca_data: Location data (LOCA group)
+        geology_data: Geological data (GEOL group)
+        sample_data: Sample data (SAMP group, optional)
+        project_info: Project information (PROJ group, optional)
+        page_settings: Page layout settings
+        dpi: Resolution of raster elements
+
+    Returns:
+        int: Number of pages written
+    """
+    if page_settings is None:
+        page_settings = get_default_page_settings()
+
+    total_pages = 0
+    for fig in _iter_log_pages(
+        loca_data, geology_data, sample_data, project_info, page_settings
+    ):
+        try:
+            pdf_pages.savefig(fig, bbox_inches="tight", dpi=dpi)
+            total_pages += 1
+        finally:
+            safe_close_figure(fig)
+    return total_pages
+
+
+def render_borehole_log_pages(
+    borehole_id: str,
+    loca_data: Dict,
+    geology_data: List[Dict],
+    sample_data: Optional[List[Dict]] = None,
+    project_info: Optional[Dict] = None,
+    page_settings: Optional[Dict] = None,
+    dpi: int = 150,
+    image_format: str = "png",
+    executor: Optional[Executor] = None,
+    bbox_inches: Optional[str] = None,
+) -> List[bytes]:
+    """
+    Render a borehole log to encoded images, one per page, without touching disk.
+
+    Pages are independent figures, so with an executor each page is drawn
+    and encoded by a separate job (in worker processes for a process pool)
+    and the results are collected in page order.
+
+    Args:
+        borehole_id: Borehole identifier
+        loca_data: Location data (LOCA group)
+        geology_data: Geological data (GEOL group)
+        sample_data: Sample data (SAMP group, optional)
+        project_info: Project information (PROJ group, optional)
+        page_settings: Page layout settings
+        dpi: Output resolution
+        image_format: Matplotlib output format
+        executor: Optional executor with an ordered ``map`` (e.g. the render
+            worker pool) to render multi-page logs concurrently
+        bbox_inches: Passed to savefig ("tight" crops to the drawn content)
+
+    Returns:
+        list: Encoded image bytes for each page
+    """
+    if page_settings is None:
+        page_settings = get_default_page_settings()
+
+    plan = _plan_log_pages(
+        loca_data, geology_data, sample_data, project_info, page_settings
+    )
+    page_numbers = range(1, plan["total_pages"] + 1)
+    # Each job only receives the records drawn on its page
+    page_geology, page_samples = _split_log_data(
+        geology_data, sample_data, plan["page_ranges"]
+    )
+    shared_args = (page_settings, dpi, image_format, bbox_inches)
+
+    if executor is not None:
+        rendered = list(
+            executor.map(
+                render_log_page,
+                page_numbers,
+                itertools.repeat(plan),
+                page_geology,
+                page_samples,
+                *(itertools.repeat(arg) for arg in shared_args),
+            )
+        )
+    else:
+        rendered = [
+            render_log_page(page_num, plan, geology, samples, *shared_args)
+            for page_num, geology, samples in zip(
+                page_numbers, page_geology, page_samples
+            )
+        ]
+    pages = [page for page in rendered if page is not None]
+
+    logger.info(f"Rendered borehole log for {borehole_id}: {len(pages)} page(s)")
+    return pages
+
+
+def render_borehole_log_pdf(
+    borehole_id: str,
+    loca_data: Dict,
+    geology_data: List[Dict],
+    sample_data: Optional[List[Dict]] = None,
+    project_info: Optional[Dict] = None,
+    page_settings: Optional[Dict] = None,
+    dpi: int = 300,
+) -> bytes:
+    """
+    Render a complete borehole log to multi-page PDF bytes.
+
+    A module-level function so that it can run in a worker process.
+
+    Returns:
+        bytes: PDF document
+    """
+    buffer = io.BytesIO()
+    with PdfPages(buffer) as pdf_pages:
+        total_pages = save_log_pages(
+            pdf_pages,
+            loca_data,
+            geology_data,
+            sample_data,
+            project_info,
+            page_settings,
+            dpi=dpi,
+        )
+    logger.debug(f"Rendered borehole log PDF for {borehole_id}: {total_pages} page(s)")
+    return buffer.getvalue()
+
+
+def render_log_page(
     page_num: int,
-    total_pages: int,
+    plan: Dict,
+    page_geology: List[Dict],
+    page_samples: List[Dict],
+    page_settings: Dict,
+    dpi: int = 150,
+    image_format: str = "png",
+    bbox_inches: Optional[str] = None,
+) -> Optional[bytes]:
+    """
+    Render and encode one page of a planned borehole log.
+
+    A module-level function so that it can run in a worker process.
+
+    Args:
+        page_num: Page number (1-based)
+        plan: Page plan from _plan_log_pages
+        page_geology: Geological data drawn on this page
+        page_samples: Sample data drawn on this page
+        page_settings: Page layout settings
+        dpi: Output resolution
+        image_format: Matplotlib output format
+        bbox_inches: Passed to savefig
+
+    Returns:
+        bytes: Encoded page, or None if the page could not be drawn
+    """
+    fig = _create_single_page(
+        page_num,
+        plan["total_pages"],
+        plan["page_ranges"],
+        page_geology,
+        page_samples,
+        plan["header_content"],
+        plan["footer_content"],
+        page_settings,
+        plan["layout_info"],
+    )
+    if fig is None:
+        return None
+
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(
+            buffer,
+            format=image_format,
+            dpi=dpi,
+            bbox_inches=bbox_inches,
+            facecolor="white",
+        )
+        return buffer.getvalue()
+    finally:
+        safe_close_figure(fig)
+
+
+def _plan_log_pages(
+    loca_data: Dict,
+    geology_data: List[Dict],
+    sample_data: Optional[List[Dict]],
+    project_info: Optional[Dict],
+    page_settings: Dict,
+) -> Dict[str, Any]:
+    """Work out the page ranges, layout and header/footer shared by all pages."""
+    # Calculate total depth and check for overflow
+    total_depth = _calculate_total_depth(geology_data, sample_data)
+    layout_info = calculate_plot_layout(page_settings)
+
+    needs_overflow, total_pages, page_ranges = check_depth_overflow(
+        total_depth,
+        layout_info["plot_height"],
+        page_settings.get("depth_scale", 50.0),
+    )
+
+    # Create header and footer content
+    return {
+        "total_pages": total_pages,
+        "page_ranges": page_ranges,
+        "layout_info": layout_info,
+        "header_content": create_header_content(
+            loca_data, project_info, page_settings.get("header_info")
+        ),
+        "footer_content": create_footer_content(project_info),
+    }
+
+
+def _split_log_data(
+    geology_data: List[Dict],
+    sample_data: Optional[List[Dict]],
     page_ranges: List[Tuple[float, float]],
+) -> Tuple[List[List[Dict]], List[List[Dict]]]:
+    """Split geology and sample records by page (sorted once per borehole)."""
+    page_geology = split_data_by_page(geology_data, page_ranges)
+    if sample_data:
+        page_samples = split_data_by_page(
+            sample_data, page_ranges, "SAMP_TOP", "SAMP_BASE"
+        )
+    else:
+        page_samples = [[] for _ in page_ranges]
+    return page_geology, page_samples
+
+
+def _iter_log_pages(
+    loca_data: Dict,
     geology_data: List[Dict],
     sample_data: Optional[List[Dict]],
+    project_info: Optional[Dict],
+    page_settings: Dict,
+) -> Iterator[plt.Figure]:
+    """Yield the figure of each page; the caller must close each one."""
+    plan = _plan_log_pages(
+        loca_data, geology_data, sample_data, project_info, page_settings
+    )
+
+    page_geology, page_samples = _split_log_data(
+        geology_data, sample_data, plan["page_ranges"]
+    )
+
+    for page_num in range(1, plan["total_pages"] + 1):
+        fig = _create_single_page(
+            page_num,
+            plan["total_pages"],
+            plan["page_ranges"],
+            page_geology[page_num - 1],
+            page_samples[page_num - 1],
+            plan["header_content"],
+            plan["footer_content"],
+            page_settings,
+            plan["layout_info"],
+        )
+        if fig:
+            yield fig
+
+
+def _create_single_page(
+    page_num: int,
+    total_pages: int,
+    page_ranges: List[Tuple[float, float]],
+    page_geology: List[Dict],
+    page_samples: List[Dict],
     header_content: Dict,
     footer_content: Dict,
     page_settings: Dict,
     layout_info: Dict,
 ) -> Optional[plt.Figure]:
-    """Create a single page of the borehole log."""
+    """Create a single page of the borehole log from the page's records."""
 
     try:
         # Get page depth range
         page_start, page_end = get_page_depth_range(page_num, page_ranges)
 
-        # Filter data for this page
-        page_geology = filter_data_for_page(geology_data, page_start, page_end)
-        page_samples = []
-        if sample_data:
-            page_samples = filter_data_for_page(
-                sample_data, page_start, page_end, "SAMP_TOP", "SAMP_BASE"
-            )
-
         # Create figure and plot
         fig = plot_single_page(
             page_geology,
@@ -183,11 +471,12 @@ def plot_single_page(
         layout_info: Layout calculation results
 
     Returns:
-        matplotlib.figure.Figure: Configured figure
+        matplotlib.figure.Figure: Configured figure (the caller must close it)
     """
     try:
-        # Create figure with proper size
-        fig = matplotlib_figure(
+        # Create figure with proper size; it outlives this function, so the
+        # matplotlib_figure context manager (which closes on exit) is not used
+        fig = plt.figure(
             figsize=(page_settings["page_width"], page_settings["page_height"])
         )
 
@@ -210,18 +499,28 @@ def plot_single_page(
         # Setup axes for borehole plotting
         setup_plot_axes(main_ax, start_depth, end_depth, page_settings)
 
-        # Create column layout
-        column_layout = create_column_layout(layout_info["plot_width"])
+        # Create column layout in the axes' percentage-based x units
+        column_layout = create_column_layout(100)
 
-        # Plot geological data
+        # Plot geological data; descriptions wrap to the column's width in points
         _plot_geology_column(
-            main_ax, geology_data, column_layout, start_depth, end_depth
+            main_ax,
+            geology_data,
+            column_layout,
+            start_depth,
+            end_depth,
+            layout_info["plot_width"] / 100,
         )
 
         # Plot sample data if available
         if sample_data:
             _plot_sample_column(
-                main_ax, sample_data, column_layout, start_depth, end_depth
+                main_ax,
+                sample_data,
+                column_layout,
+                start_depth,
+                end_depth,
+                page_settings.get("show_labels", True),
             )
 
         # Add depth scale
@@ -281,10 +580,18 @@ def _plot_geology_column(
     column_layout: Dict,
     start_depth: float,
     end_depth: float,
+    points_per_unit: float = 1.0,
 ) -> None:
-    """Plot geological information in the geology column."""
+    """
+    Plot geological information in the geology column.
+
+    points_per_unit converts the axes' x units to points for wrapping the
+    descriptions with real glyph widths.
+    """
 
     geology_col = column_layout["geology"]
+    text_layout = get_text_layout()
+    text_width = geology_col["width"] * points_per_unit * 0.9
 
     for stratum in geology_data:
         try:
@@ -301,7 +608,9 @@ def _plot_geology_column(
 
             # Get geological description
             description = stratum.get("GEOL_DESC", "Unknown")
-            description = wrap_text_smart(description, geology_col["width"] * 0.8)
+            description = text_layout.wrap(
+                description, text_width, fontsize=8, max_lines=5
+            )
 
             # Draw stratum rectangle
             rect = patches.Rectangle(
@@ -324,7 +633,6 @@ def _plot_geology_column(
                 ha="center",
                 va="center",
                 fontsize=8,
-                wrap=True,
             )
 
         except (ValueError, TypeError) as e:
@@ -338,6 +646,7 @@ def _plot_sample_column(
     column_layout: Dict,
     start_depth: float,
     end_depth: float,
+    show_labels: bool = True,
 ) -> None:
     """Plot sample information in the sample column."""
 
@@ -373,6 +682,8 @@ def _plot_sample_column(
             )
 
             # Add sample label
+            if not show_labels:
+                continue
             ax.text(
                 sample_col["left"] + sample_col["width"] + 2,
                 marker_y,
@@ -0,0 +1,197 @@
+"""
+Borehole Log Rendering from AGS Content
+
+This module renders borehole logs for the web app straight from uploaded AGS
+content. Each dataset is parsed once into a per-borehole index (LOCA record,
+GEOL strata and SAMP samples grouped by LOCA_ID), memoized through the shared
+derived-view cache, so drawing another borehole's log is a dictionary lookup
+followed by the page render.
+
+Key Functions:
+- build_borehole_log_index: Parse AGS files into a per-borehole index
+- render_borehole_log_from_ags: Render one borehole's log to PNG bytes per page
+- borehole_log_inputs: Look up one borehole's data and page settings
+"""
+
+import logging
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from section.parsing import parse_ags_groups_from_string
+from section.plotting.pipeline import section_data_key
+from state_management.derived_views import derived_view
+
+from .plotting import get_default_page_settings, render_borehole_log_pages
+
+logger = logging.getLogger(__name__)
+
+LOG_GROUPS = {
+    "LOCA": ["LOCA_NATE", "LOCA_NATN", "LOCA_GL"],
+    "GEOL": ["GEOL_TOP", "GEOL_BASE"],
+    "SAMP": ["SAMP_TOP", "SAMP_BASE"],
+    "PROJ": [],
+}
+
+
+def _records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a frame to records with missing values as None."""
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def _group_records(
+    df: pd.DataFrame, sort_column: str
+) -> Dict[str, List[Dict[str, Any]]]:
+    if df.empty or "LOCA_ID" not in df.columns:
+        return {}
+    if sort_column in df.columns:
+        df = df.sort_values(["LOCA_ID", sort_column], kind="stable")
+    return {
+        str(loca_id): _records(group)
+        for loca_id, group in df.groupby("LOCA_ID", sort=False)
+    }
+
+
+@derived_view("borehole_log_index", depends_on=("data_key",))
+def _build_index(
+    ags_data: List[Tuple[str, str]], data_key: Optional[str] = None
+) -> Dict[str, Any]:
+    frames = {group: [] for group in LOG_GROUPS}
+    for _, content in ags_data:
+        for group, df in parse_ags_groups_from_string(content, LOG_GROUPS).items():
+            if not df.empty:
+                frames[group].append(df)
+
+    combined = {
+        group: pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+        for group, dfs in frames.items()
+    }
+
+    loca_df = combined["LOCA"]
+    locations = {}
+    if not loca_df.empty and "LOCA_ID" in loca_df.columns:
+        for record in _records(loca_df.drop_duplicates("LOCA_ID")):
+            locations[str(record["LOCA_ID"])] = record
+
+    proj_df = combined["PROJ"]
+    return {
+        "locations": locations,
+        "geology": _group_records(combined["GEOL"], "GEOL_TOP"),
+        "samples": _group_records(combined["SAMP"], "SAMP_TOP"),
+        "project": _records(proj_df.head(1))[0] if not proj_df.empty else None,
+    }
+
+
+def build_borehole_log_index(
+    ags_data: List[Tuple[str, str]], data_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Parse AGS files into a per-borehole index (memoized per dataset).
+
+    Args:
+        ags_data: List of (filename, content) tuples containing AGS data
+        data_key: Identifier of ags_data; computed from the contents if None
+
+    Returns:
+        dict: ``{"locations", "geology", "samples", "project"}``; the first
+        three map LOCA_ID to its LOCA record / GEOL strata / SAMP samples.
+        The index is shared between callers and must be treated as read-only.
+    """
+    return _build_index(ags_data, data_key=data_key or section_data_key(ags_data))
+
+
+def render_borehole_log_from_ags(
+    ags_data: List[Tuple[str, str]],
+    loca_id: str,
+    show_labels: bool = True,
+    fig_height: float = 11.69,
+    fig_width: float = 8.27,
+    dpi: int = 150,
+    title: Optional[str] = None,
+    data_key: Optional[str] = None,
+    image_format: str = "png",
+    executor: Optional[Executor] = None,
+) -> List[bytes]:
+    """
+    Render one borehole's log from AGS files.
+
+    Args:
+        ags_data: List of (filename, content) tuples containing AGS data
+        loca_id: Borehole ID to plot
+        show_labels: Whether to label samples
+        fig_height: Page height in inches
+        fig_width: Page width in inches
+        dpi: Output resolution
+        title: Optional header title
+        data_key: Identifier of ags_data (e.g. the dataset ID)
+        image_format: Matplotlib output format
+        executor: Optional executor (e.g. the render worker pool) that
+            renders the pages of multi-page logs concurrently
+
+    Returns:
+        list: Encoded image bytes per page (empty if the borehole has no strata)
+    """
+    inputs = borehole_log_inputs(
+        build_borehole_log_index(ags_data, data_key),
+        loca_id,
+        show_labels=show_labels,
+        fig_height=fig_height,
+        fig_width=fig_width,
+        title=title,
+    )
+    if inputs is None:
+        return []
+
+    return render_borehole_log_pages(
+        *inputs, dpi=dpi, image_format=image_format, executor=executor
+    )
+
+
+def borehole_log_inputs(
+    index: Dict[str, Any],
+    loca_id: str,
+    show_labels: bool = True,
+    fig_height: float = 11.69,
+    fig_width: float = 8.27,
+    title: Optional[str] = None,
+) -> Optional[Tuple[str, Dict, List[Dict], Optional[List[Dict]], Any, Dict]]:
+    """
+    Look up the data and page settings for one borehole's log.
+
+    Args:
+        index: Output of build_borehole_log_index
+        loca_id: Borehole ID to plot
+        show_labels: Whether to label samples
+        fig_height: Page height in inches
+        fig_width: Page width in inches
+        title: Optional header title
+
+    Returns:
+        tuple: (borehole_id, loca_data, geology_data, sample_data,
+        project_info, page_settings) as taken by the plotting functions, or
+        None if the borehole has no strata
+    """
+    loca_id = str(loca_id)
+    geology = index["geology"].get(loca_id, [])
+    if not geology:
+        logger.warning(f"No GEOL records for borehole {loca_id}")
+        return None
+
+    page_settings = {
+        **get_default_page_settings(),
+        "page_width": fig_width,
+        "page_height": fig_height,
+        "show_labels": show_labels,
+    }
+    if title:
+        page_settings["header_info"] = {"title": title}
+
+    return (
+        loca_id,
+        index["locations"].get(loca_id, {"LOCA_ID": loca_id}),
+        geology,
+        index["samples"].get(loca_id),
+        index["project"],
+        page_settings,
+    )
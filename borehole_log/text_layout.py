@@ -0,0 +1,248 @@
+"""
+Borehole Log Text Layout Module
+
+This module measures text with the real glyph advance widths of the font
+matplotlib will draw it in, and wraps text to a width in points. Glyph widths
+are loaded once per (font, size) and wrapped results are cached per (text,
+width, font, size, line limit), so a description repeated across strata,
+pages and logs is laid out once per process.
+
+Key Functions:
+- get_text_layout: Get the shared TextLayout instance
+- TextLayout.text_width: Width of one line of text in points
+- TextLayout.wrap: Wrap text to a width in points
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import matplotlib.pyplot as plt
+from matplotlib import font_manager
+from matplotlib.ft2font import FT2Font
+
+try:
+    from matplotlib.ft2font import LoadFlags
+
+    NO_HINTING = LoadFlags.NO_HINTING
+except ImportError:  # matplotlib < 3.10
+    from matplotlib.ft2font import LOAD_NO_HINTING as NO_HINTING
+
+logger = logging.getLogger(__name__)
+
+MAX_WRAPPED_ENTRIES = 4096
+LINE_SPACING = 1.2  # matplotlib's default text line spacing
+ELLIPSIS = "..."
+
+FontFamily = Union[str, Sequence[str]]
+
+
+class GlyphMetrics:
+    """Advance widths (in points) of the glyphs of one font at one size."""
+
+    def __init__(self, font_path: str, size: float):
+        self.font_path = font_path
+        self.size = size
+        self._font = FT2Font(font_path)
+        self._font.set_size(size, 72)  # 72 dpi: one pixel per point
+        self._widths: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.widths(" abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+
+    def widths(self, text: str) -> List[float]:
+        """Get the advance width of each character of text."""
+        missing = set(text).difference(self._widths)
+        if missing:
+            with self._lock:
+                for char in missing:
+                    glyph = self._font.load_char(ord(char), flags=NO_HINTING)
+                    self._widths[char] = glyph.linearHoriAdvance / 65536
+        return [self._widths[char] for char in text]
+
+    def width(self, text: str) -> float:
+        """Get the width of one line of text."""
+        return sum(self.widths(text))
+
+    @property
+    def average_char_width(self) -> float:
+        """Mean width of the letters, digits and space."""
+        return self.width(" etaoinshrdlu") / 13
+
+
+class TextLayout:
+    """Text measurement and wrapping with cached glyph metrics and results."""
+
+    def __init__(self, max_entries: int = MAX_WRAPPED_ENTRIES):
+        self.max_entries = max_entries
+        self._metrics: Dict[Tuple[str, float], GlyphMetrics] = {}
+        self._fonts: Dict[Tuple[Tuple[str, ...], str, str], str] = {}
+        self._wrapped: "OrderedDict[tuple, str]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def _font_path(self, family: Optional[FontFamily], weight: str, style: str) -> str:
+        if family is None:
+            family = plt.rcParams["font.family"]
+        family = (family,) if isinstance(family, str) else tuple(family)
+        key = (family, weight, style)
+        path = self._fonts.get(key)
+        if path is None:
+            path = font_manager.findfont(
+                font_manager.FontProperties(
+                    family=list(family), weight=weight, style=style
+                )
+            )
+            self._fonts[key] = path
+        return path
+
+    def metrics(
+        self,
+        fontsize: float = 10,
+        family: Optional[FontFamily] = None,
+        weight: str = "normal",
+        style: str = "normal",
+    ) -> GlyphMetrics:
+        """
+        Get the glyph metrics of a font at a size (loaded once per pair).
+
+        Args:
+            fontsize: Font size in points
+            family: Font family (or list of families); rcParams if None
+            weight: Font weight
+            style: Font style
+
+        Returns:
+            GlyphMetrics: Metrics of the font file matplotlib resolves
+        """
+        key = (self._font_path(family, weight, style), float(fontsize))
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            with self._lock:
+                metrics = self._metrics.get(key)
+                if metrics is None:
+                    metrics = GlyphMetrics(*key)
+                    self._metrics[key] = metrics
+        return metrics
+
+    def text_width(self, text: str, fontsize: float = 10, **font) -> float:
+        """Get the width in points of the widest line of text."""
+        metrics = self.metrics(fontsize, **font)
+        return max((metrics.width(line) for line in str(text).split("\n")), default=0.0)
+
+    def text_size(self, text: str, fontsize: float = 10, **font) -> Tuple[float, float]:
+        """Get the (width, height) in points of (multi-line) text."""
+        if not text:
+            return (0.0, 0.0)
+        line_count = str(text).count("\n") + 1
+        return (
+            self.text_width(text, fontsize, **font),
+            line_count * fontsize * LINE_SPACING,
+        )
+
+    def wrap(
+        self,
+        text: Optional[str],
+        width: float,
+        fontsize: float = 10,
+        max_lines: Optional[int] = None,
+        **font,
+    ) -> str:
+        """
+        Wrap text to lines no wider than width points.
+
+        Lines break between words; words wider than a line are split. Text
+        running past max_lines is cut and ends with an "..." line.
+
+        Args:
+            text: Text to wrap (None is treated as empty)
+            width: Maximum line width in points
+            fontsize: Font size in points
+            max_lines: Maximum number of lines, unlimited if None
+            **font: family, weight and style, as for metrics()
+
+        Returns:
+            str: Wrapped text with lines separated by newlines
+        """
+        if not text:
+            return ""
+        text = " ".join(str(text).split())
+        metrics = self.metrics(fontsize, **font)
+        key = (text, round(float(width), 2), metrics.font_path, metrics.size, max_lines)
+
+        with self._lock:
+            wrapped = self._wrapped.get(key)
+            if wrapped is not None:
+                self._wrapped.move_to_end(key)
+                self._stats["hits"] += 1
+                return wrapped
+            self._stats["misses"] += 1
+
+        lines = _wrap_words(text, width, metrics)
+        if max_lines is not None and len(lines) > max_lines:
+            lines = lines[: max(max_lines - 1, 0)] + [ELLIPSIS]
+        wrapped = "\n".join(lines)
+
+        with self._lock:
+            self._wrapped[key] = wrapped
+            while len(self._wrapped) > self.max_entries:
+                self._wrapped.popitem(last=False)
+        return wrapped
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get wrap cache hits and misses and the number of loaded fonts."""
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._wrapped),
+                "fonts": len(self._metrics),
+            }
+
+
+def _wrap_words(text: str, width: float, metrics: GlyphMetrics) -> List[str]:
+    """Greedily fill lines with words, splitting words wider than a line."""
+    space = metrics.width(" ")
+    lines: List[str] = []
+    line: List[str] = []
+    line_width = 0.0
+
+    for word in text.split(" "):
+        word_width = metrics.width(word)
+        if line and line_width + space + word_width <= width:
+            line.append(word)
+            line_width += space + word_width
+            continue
+        if line:
+            lines.append(" ".join(line))
+        if word_width <= width:
+            line, line_width = [word], word_width
+            continue
+
+        # Split a word wider than a whole line
+        piece, piece_width = "", 0.0
+        for char, char_width in zip(word, metrics.widths(word)):
+            if piece and piece_width + char_width > width:
+                lines.append(piece)
+                piece, piece_width = "", 0.0
+            piece += char
+            piece_width += char_width
+        line, line_width = [piece], piece_width
+
+    if line:
+        lines.append(" ".join(line))
+    return lines
+
+
+# Global text layout instance
+_text_layout: Optional[TextLayout] = None
+_layout_lock = threading.Lock()
+
+
+def get_text_layout() -> TextLayout:
+    """Get the shared text layout service."""
+    global _text_layout
+    if _text_layout is None:
+        with _layout_lock:
+            if _text_layout is None:
+                _text_layout = TextLayout()
+    return _text_layout
@@ -9,7 +9,8 @@ Key Functions:
 - safe_close_figure: Memory-safe figure cleanup
 - wrap_text_and_calculate_height: Text wrapping with height calculation
 - format_measurement: Consistent measurement formatting
-- calculate_text_metrics: Text sizing and positioning calculations
+- calculate_text_metrics: Text sizing and positioning calculations (measured
+  with cached glyph metrics from ``text_layout``)
 """
 
 import matplotlib.pyplot as plt
@@ -18,6 +19,8 @@ import textwrap
 from contextlib import contextmanager
 from typing import Tuple, Optional
 
+from .text_layout import get_text_layout
+
 logger = logging.getLogger(__name__)
 
 # Configure matplotlib for professional rendering
@@ -156,16 +159,14 @@ def calculate_text_metrics(text: str, font_size: int = 8) -> dict:
     max_line_length = max(len(line) for line in lines) if lines else 0
     line_count = len(lines)
 
-    # Estimate dimensions (rough approximation)
-    # Average character width is approximately 0.6 of font size
-    char_width_inches = (font_size * 0.6) / 72.0
-    line_height_inches = (font_size * 1.2) / 72.0
+    # Measure with the font's glyph widths
+    width_points, height_points = get_text_layout().text_size(text_str, font_size)
 
     return {
         "width_chars": max_line_length,
         "height_lines": line_count,
-        "estimated_width_inches": max_line_length * char_width_inches,
-        "estimated_height_inches": line_count * line_height_inches,
+        "estimated_width_inches": width_points / 72.0,
+        "estimated_height_inches": height_points / 72.0,
     }
 
 
@@ -269,13 +270,13 @@ def get_optimal_font_size(text_length: int, available_width: float) -> int:
     if text_length == 0 or available_width <= 0:
         return 8  # Default font size
 
-    # Estimate character width at different font sizes
-    # Average character width is approximately 0.6 of font size in points
+    # Average character width of the font at each candidate size
     min_font_size = 6
     max_font_size = 12
+    layout = get_text_layout()
 
     for font_size in range(max_font_size, min_font_size - 1, -1):
-        char_width_inches = (font_size * 0.6) / 72.0
+        char_width_inches = layout.metrics(font_size).average_char_width / 72.0
         required_width = text_length * char_width_inches
 
         if required_width <= available_width:
@@ -376,7 +377,7 @@ def wrap_text_smart(text: str, max_width: int = 50, max_lines: int = 5) -> str:
 
 def calculate_text_dimensions(text: str, fontsize: int = 10) -> Tuple[float, float]:
     """
-    Calculate approximate text dimensions for layout planning.
+    Calculate text dimensions for layout planning.
 
     Args:
         text: Text to measure
@@ -389,17 +390,8 @@ def calculate_text_dimensions(text: str, fontsize: int = 10) -> Tuple[float, flo
         return (0.0, 0.0)
 
     try:
-        # Approximate character width (varies by font)
-        char_width = fontsize * 0.6  # Rough approximation for Arial
-        line_height = fontsize * 1.2  # Standard line height
-
-        lines = text.split("\n")
-        max_line_length = max(len(line) for line in lines) if lines else 0
-
-        width = max_line_length * char_width
-        height = len(lines) * line_height
-
-        return (width, height)
+        # Glyph widths are loaded once per font size and reused
+        return get_text_layout().text_size(text, fontsize)
 
     except Exception as e:
         logger.warning(f"Error calculating text dimensions: {e}")
@@ -0,0 +1,227 @@
+"""
+Borehole Presentation Table Module.
+
+This module precomputes the display strings used for borehole markers and the
+search dropdown once per dataset, using vectorized pandas/numpy string
+operations instead of per-row formatting loops.
+
+Key Features:
+- **Dataset Identity**: Stable content hash of the uploaded AGS files
+- **Vectorized Formatting**: Ground level / depth strings built column-wise
+- **Per-Dataset Cache**: LRU cache of presentation tables keyed by dataset ID
+- **Ready-Made Arrays**: Marker tooltips, search labels and sort keys that
+  callers simply zip over
+
+Presentation table columns (indexed by LOCA_ID):
+- ``tooltip``: Marker tooltip text
+- ``search_label``: Dropdown label, e.g. ``"BH01 (GL: 10.00m, Depth: 20.00m)"``
+- ``search_key``: Lower-cased LOCA_ID for case-insensitive search
+- ``sort_key``: Integer rank of the search label (alphabetical order)
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app_constants import PERFORMANCE_CONFIG
+
+logger = logging.getLogger(__name__)
+
+PRESENTATION_COLUMNS = ["tooltip", "search_label", "search_key", "sort_key"]
+
+
+def compute_dataset_id(filename_map: Dict[str, str]) -> str:
+    """
+    Compute a stable identifier for an uploaded dataset.
+
+    Args:
+        filename_map: Mapping of filenames to AGS content
+
+    Returns:
+        str: Short hex digest identifying the dataset contents
+    """
+    digest = hashlib.sha1()
+    for filename in sorted(filename_map or {}):
+        digest.update(str(filename).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(str(filename_map[filename]).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def format_measurement_column(values: Any) -> pd.Series:
+    """
+    Format a column of measurements as ``"12.34m"`` strings, ``"N/A"`` if invalid.
+
+    Args:
+        values: Series or array-like of raw measurement values
+
+    Returns:
+        pd.Series: Formatted strings aligned with the input
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    numeric = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+    valid = ~np.isnan(numeric)
+    formatted = np.full(len(numeric), "N/A", dtype=object)
+    if valid.any():
+        formatted[valid] = np.char.mod("%.2fm", numeric[valid])
+    return pd.Series(formatted, index=series.index)
+
+
+def build_presentation_table(loca_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build the presentation table for a LOCA DataFrame.
+
+    Args:
+        loca_df: DataFrame containing LOCA_ID and optional LOCA_GL / LOCA_FDEP
+
+    Returns:
+        pd.DataFrame: Presentation columns indexed by LOCA_ID
+    """
+    if loca_df is None or loca_df.empty or "LOCA_ID" not in loca_df.columns:
+        return pd.DataFrame(
+            columns=PRESENTATION_COLUMNS, index=pd.Index([], name="LOCA_ID")
+        )
+
+    index = loca_df.index
+    ids = loca_df["LOCA_ID"].astype(str).str.strip()
+    missing = pd.Series(np.nan, index=index)
+    ground_level = format_measurement_column(loca_df.get("LOCA_GL", missing))
+    total_depth = format_measurement_column(loca_df.get("LOCA_FDEP", missing))
+
+    tooltip = (
+        "Borehole: "
+        + ids
+        + "\nGround Level: "
+        + ground_level
+        + "\nTotal Depth: "
+        + total_depth
+        + "\nClick to view borehole log"
+    )
+
+    # Search label only lists the measurements that are available
+    has_gl = ground_level != "N/A"
+    has_depth = total_depth != "N/A"
+    gl_part = ("GL: " + ground_level).where(has_gl, "")
+    depth_part = ("Depth: " + total_depth).where(has_depth, "")
+    separator = pd.Series(np.where(has_gl & has_depth, ", ", ""), index=index)
+    info = gl_part + separator + depth_part
+    search_label = ids + (" (" + info + ")").where(info != "", "")
+
+    label_values = search_label.to_numpy(dtype=str)
+    sort_key = np.empty(len(label_values), dtype=np.int64)
+    sort_key[np.argsort(label_values, kind="stable")] = np.arange(len(label_values))
+
+    table = pd.DataFrame(
+        {
+            "tooltip": tooltip.to_numpy(dtype=object),
+            "search_label": search_label.to_numpy(dtype=object),
+            "search_key": ids.str.lower().to_numpy(dtype=object),
+            "sort_key": sort_key,
+        },
+        index=pd.Index(ids.to_numpy(dtype=object), name="LOCA_ID"),
+    )
+    return table[~table.index.duplicated(keep="first")]
+
+
+class PresentationCache:
+    """
+    LRU cache of presentation tables keyed by dataset ID.
+    """
+
+    def __init__(self, max_datasets: int = PERFORMANCE_CONFIG.DATA_CACHE_SIZE):
+        self.max_datasets = max_datasets
+        self._tables: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, dataset_id: Optional[str]) -> Optional[pd.DataFrame]:
+        """Return the cached table for a dataset, or None if not cached."""
+        if not dataset_id:
+            return None
+
+        with self._lock:
+            table = self._tables.get(dataset_id)
+            if table is None:
+                self._stats["misses"] += 1
+                return None
+            self._tables.move_to_end(dataset_id)
+            self._stats["hits"] += 1
+            return table
+
+    def get_or_build(
+        self, dataset_id: Optional[str], loca_df: pd.DataFrame
+    ) -> pd.DataFrame:
+        """
+        Return the cached table for a dataset, building it from loca_df on a miss.
+
+        Args:
+            dataset_id: Dataset identifier (None disables caching)
+            loca_df: LOCA DataFrame used to build the table on a miss
+
+        Returns:
+            pd.DataFrame: Presentation table indexed by LOCA_ID
+        """
+        table = self.get(dataset_id)
+        if table is not None:
+            return table
+
+        table = build_presentation_table(loca_df)
+        if dataset_id:
+            with self._lock:
+                self._tables[dataset_id] = table
+                self._tables.move_to_end(dataset_id)
+                while len(self._tables) > self.max_datasets:
+                    self._tables.popitem(last=False)
+                    self._stats["evictions"] += 1
+        logger.debug(
+            f"Built presentation table for dataset {dataset_id}: {len(table)} rows"
+        )
+        return table
+
+    def clear_cache(self):
+        """Drop all cached presentation tables."""
+        with self._lock:
+            self._tables.clear()
+        logger.info("Presentation table cache cleared")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get presentation cache statistics."""
+        with self._lock:
+            return {**self._stats, "datasets": len(self._tables)}
+
+
+# Global presentation cache instance
+_presentation_cache = None
+
+
+def get_presentation_cache() -> PresentationCache:
+    """Get global presentation cache instance."""
+    global _presentation_cache
+    if _presentation_cache is None:
+        _presentation_cache = PresentationCache()
+    return _presentation_cache
+
+
+def get_presentation_table(
+    loca_df: pd.DataFrame, dataset_id: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Convenience accessor for the cached presentation table of a dataset.
+
+    Args:
+        loca_df: LOCA DataFrame (used only when the table is not cached)
+        dataset_id: Dataset identifier stored alongside the borehole data
+
+    Returns:
+        pd.DataFrame: Presentation table indexed by LOCA_ID
+    """
+    return get_presentation_cache().get_or_build(dataset_id, loca_df)
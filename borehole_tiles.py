@@ -0,0 +1,446 @@
+"""
+Server-Side Borehole Tile Module for National-Scale Datasets.
+
+This module serves borehole locations as compact per-tile GeoJSON so that very
+large datasets (100k+ LOCA rows) never have to be shipped to the browser as
+Dash marker components. The browser only requests the slippy-map tiles that
+are currently on screen.
+
+Key Features:
+- **Per-Dataset Spatial Index**: Points sorted by Morton (quadkey) code at a
+  fixed index zoom, so every tile at or above that zoom is a contiguous slice
+  found with two binary searches
+- **Tile Aggregation**: Dense tiles are aggregated into cluster points on a
+  sub-tile grid instead of returning every borehole
+- **Tile LRU Cache**: Encoded tiles cached by (dataset, z, x, y)
+- **Rebuild on Miss**: An evicted (or never built) index is rebuilt from the
+  LOCA data a live session holds for the dataset, and indexes of datasets
+  held by live sessions are never evicted
+
+Tile payload (GeoJSON FeatureCollection of Points):
+- Borehole features: ``{"loca_id": ..., "tooltip": ...}``
+- Cluster features: ``{"cluster": true, "point_count": n, "tooltip": ...}``
+
+Dependencies:
+- numpy: Vectorized tile coordinate and Morton code computation
+- pandas: Borehole location input
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app_constants import MAP_CONFIG
+from borehole_presentation import build_presentation_table
+
+logger = logging.getLogger(__name__)
+
+# Web Mercator latitude limit
+MAX_MERCATOR_LAT = 85.05112878
+
+
+def lonlat_to_unit(lon: np.ndarray, lat: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Project WGS84 coordinates to normalized Web Mercator [0, 1) tile space.
+
+    Args:
+        lon: Longitudes in degrees
+        lat: Latitudes in degrees
+
+    Returns:
+        Tuple of (x, y) arrays; multiply by 2**z for tile coordinates
+    """
+    lat_rad = np.radians(np.clip(lat, -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT))
+    x = (np.asarray(lon, dtype=float) + 180.0) / 360.0
+    y = (1.0 - np.arcsinh(np.tan(lat_rad)) / np.pi) / 2.0
+    upper = np.nextafter(1.0, 0.0)
+    return np.clip(x, 0.0, upper), np.clip(y, 0.0, upper)
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Interleave zero bits between the low 16 bits of each value."""
+    v = values.astype(np.uint64) & np.uint64(0xFFFF)
+    v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF)
+    v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+    v = (v | (v << np.uint64(2))) & np.uint64(0x33333333)
+    v = (v | (v << np.uint64(1))) & np.uint64(0x55555555)
+    return v
+
+
+def morton_code(tile_x: Any, tile_y: Any) -> np.ndarray:
+    """
+    Compute Morton (Z-order) codes for tile coordinates up to zoom 16.
+
+    Args:
+        tile_x: Tile column(s)
+        tile_y: Tile row(s)
+
+    Returns:
+        np.ndarray: uint64 codes; all descendants of a tile share its prefix
+    """
+    tile_x = np.atleast_1d(np.asarray(tile_x))
+    tile_y = np.atleast_1d(np.asarray(tile_y))
+    return _spread_bits(tile_x) | (_spread_bits(tile_y) << np.uint64(1))
+
+
+class BoreholeTileIndex:
+    """
+    Spatial index of one dataset's borehole locations.
+
+    Points are stored sorted by Morton code at ``index_zoom`` so that any tile
+    at zoom <= ``index_zoom`` covers a contiguous range of the arrays.
+    """
+
+    def __init__(
+        self,
+        loca_df: pd.DataFrame,
+        presentation: Optional[pd.DataFrame] = None,
+        index_zoom: int = MAP_CONFIG.TILE_INDEX_ZOOM,
+    ):
+        """
+        Build the index from a LOCA DataFrame with ``lat``/``lon`` columns.
+
+        Args:
+            loca_df: DataFrame with LOCA_ID, lat and lon columns
+            presentation: Presentation table providing tooltips (optional)
+            index_zoom: Zoom level of the Morton index (max 16)
+        """
+        self.index_zoom = min(int(index_zoom), 16)
+
+        lat = pd.to_numeric(loca_df["lat"], errors="coerce").to_numpy(float)
+        lon = pd.to_numeric(loca_df["lon"], errors="coerce").to_numpy(float)
+        valid = ~(np.isnan(lat) | np.isnan(lon))
+        ids = loca_df["LOCA_ID"].astype(str).str.strip().to_numpy()[valid]
+
+        if presentation is None:
+            presentation = build_presentation_table(loca_df)
+        tooltips = presentation["tooltip"].reindex(ids).fillna("").to_numpy()
+
+        unit_x, unit_y = lonlat_to_unit(lon[valid], lat[valid])
+        scale = 2**self.index_zoom
+        codes = morton_code(
+            (unit_x * scale).astype(np.int64), (unit_y * scale).astype(np.int64)
+        )
+        order = np.argsort(codes, kind="stable")
+
+        self.codes = codes[order]
+        self.unit_x = unit_x[order]
+        self.unit_y = unit_y[order]
+        self.lat = lat[valid][order]
+        self.lon = lon[valid][order]
+        self.loca_ids = ids[order]
+        self.tooltips = tooltips[order]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def query_tile(self, z: int, x: int, y: int) -> np.ndarray:
+        """
+        Return positions of the points inside tile (z, x, y).
+
+        Args:
+            z: Zoom level
+            x: Tile column
+            y: Tile row
+
+        Returns:
+            np.ndarray: Indices into the index arrays
+        """
+        if z < 0 or not (0 <= x < 2**z and 0 <= y < 2**z):
+            return np.empty(0, dtype=np.int64)
+
+        # Tiles deeper than the index are filtered inside their index ancestor
+        depth = max(z - self.index_zoom, 0)
+        ancestor_z = z - depth
+        code = int(morton_code(x >> depth, y >> depth)[0])
+        shift = 2 * (self.index_zoom - ancestor_z)
+        low = np.searchsorted(self.codes, np.uint64(code << shift), side="left")
+        high = np.searchsorted(self.codes, np.uint64((code + 1) << shift), side="left")
+        positions = np.arange(low, high)
+
+        if depth:
+            scale = 2**z
+            inside = (np.floor(self.unit_x[positions] * scale) == x) & (
+                np.floor(self.unit_y[positions] * scale) == y
+            )
+            positions = positions[inside]
+
+        return positions
+
+    def build_tile(
+        self,
+        z: int,
+        x: int,
+        y: int,
+        max_features: int = MAP_CONFIG.TILE_MAX_FEATURES,
+        cluster_depth: int = MAP_CONFIG.TILE_CLUSTER_DEPTH,
+    ) -> Dict[str, Any]:
+        """
+        Build the GeoJSON FeatureCollection for one tile.
+
+        Tiles with more than ``max_features`` points are aggregated on a
+        ``2**cluster_depth`` grid of sub-cells; single-point cells stay as
+        individual borehole features.
+        """
+        positions = self.query_tile(z, x, y)
+
+        if len(positions) <= max_features:
+            return self._feature_collection(positions, None, None, None)
+
+        # Sub-cell key per point; points inside a tile are Morton-sorted, so
+        # sub-cells at zoom <= index_zoom are contiguous runs
+        cell_zoom = z + cluster_depth
+        if cell_zoom <= self.index_zoom:
+            keys = self.codes[positions] >> np.uint64(
+                2 * (self.index_zoom - cell_zoom)
+            )
+        else:
+            scale = 2**cell_zoom
+            keys = morton_code(
+                np.floor(self.unit_x[positions] * scale).astype(np.int64),
+                np.floor(self.unit_y[positions] * scale).astype(np.int64),
+            )
+            order = np.argsort(keys, kind="stable")
+            positions, keys = positions[order], keys[order]
+
+        _, starts, counts = np.unique(keys, return_index=True, return_counts=True)
+        lat_means = np.add.reduceat(self.lat[positions], starts) / counts
+        lon_means = np.add.reduceat(self.lon[positions], starts) / counts
+
+        singles = positions[starts[counts == 1]]
+        clustered = counts > 1
+        return self._feature_collection(
+            singles, lat_means[clustered], lon_means[clustered], counts[clustered]
+        )
+
+    def _feature_collection(
+        self,
+        positions: np.ndarray,
+        cluster_lat: Optional[np.ndarray],
+        cluster_lon: Optional[np.ndarray],
+        cluster_counts: Optional[np.ndarray],
+    ) -> Dict[str, Any]:
+        """Assemble borehole and cluster point features."""
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                "properties": {"loca_id": loca_id, "tooltip": tooltip},
+            }
+            for lon, lat, loca_id, tooltip in zip(
+                np.round(self.lon[positions], 6).tolist(),
+                np.round(self.lat[positions], 6).tolist(),
+                self.loca_ids[positions].tolist(),
+                self.tooltips[positions].tolist(),
+            )
+        ]
+
+        if cluster_counts is not None:
+            features.extend(
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [lon, lat]},
+                    "properties": {
+                        "cluster": True,
+                        "point_count": count,
+                        "tooltip": f"{count} boreholes",
+                    },
+                }
+                for lon, lat, count in zip(
+                    np.round(cluster_lon, 6).tolist(),
+                    np.round(cluster_lat, 6).tolist(),
+                    cluster_counts.tolist(),
+                )
+            )
+
+        return {"type": "FeatureCollection", "features": features}
+
+
+class BoreholeTileService:
+    """
+    Registry of per-dataset tile indexes with an LRU cache of encoded tiles.
+
+    ``load_locations`` returns a dataset's LOCA DataFrame (with lat/lon) or
+    None; it is used to rebuild an index on a miss. ``pinned_datasets``
+    returns the dataset IDs whose indexes must not be evicted. At most
+    ``max_datasets`` unpinned indexes are kept.
+    """
+
+    def __init__(
+        self,
+        max_datasets: int = MAP_CONFIG.TILE_MAX_DATASETS,
+        max_tiles: int = MAP_CONFIG.TILE_CACHE_SIZE,
+        load_locations: Optional[Callable[[str], Optional[pd.DataFrame]]] = None,
+        pinned_datasets: Optional[Callable[[], Set[str]]] = None,
+    ):
+        self.max_datasets = max_datasets
+        self.max_tiles = max_tiles
+        self.load_locations = load_locations
+        self.pinned_datasets = pinned_datasets
+        self._indexes: "OrderedDict[str, BoreholeTileIndex]" = OrderedDict()
+        self._tiles: "OrderedDict[Tuple[str, int, int, int], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def register_dataset(
+        self,
+        dataset_id: str,
+        loca_df: pd.DataFrame,
+        presentation: Optional[pd.DataFrame] = None,
+    ) -> BoreholeTileIndex:
+        """
+        Build (or reuse) the spatial index for a dataset.
+
+        Args:
+            dataset_id: Dataset identifier (content hash)
+            loca_df: DataFrame with LOCA_ID, lat and lon columns
+            presentation: Presentation table providing tooltips (optional)
+
+        Returns:
+            BoreholeTileIndex: Index for the dataset
+        """
+        with self._lock:
+            index = self._indexes.get(dataset_id)
+            if index is not None:
+                self._indexes.move_to_end(dataset_id)
+                return index
+
+        index = BoreholeTileIndex(loca_df, presentation)
+        pinned = self.pinned_datasets() if self.pinned_datasets else set()
+
+        with self._lock:
+            self._indexes[dataset_id] = index
+            self._indexes.move_to_end(dataset_id)
+            evictable = [
+                key for key in self._indexes if key != dataset_id and key not in pinned
+            ]
+            excess = len(self._indexes) - len(pinned & set(self._indexes))
+            for evicted_id in evictable[: max(excess - self.max_datasets, 0)]:
+                del self._indexes[evicted_id]
+                self._drop_tiles(evicted_id)
+
+        logger.info(f"Registered tile index for dataset {dataset_id}: {len(index)} points")
+        return index
+
+    def restore_dataset(self, dataset_id: str) -> Optional[BoreholeTileIndex]:
+        """Rebuild a missing index from the dataset's stored LOCA data."""
+        if self.load_locations is None or not dataset_id:
+            return None
+        loca_df = self.load_locations(dataset_id)
+        if loca_df is None or not {"lat", "lon"} <= set(loca_df.columns):
+            return None
+        # Only datasets large enough to be drawn as tiles get an index
+        located = loca_df["lat"].notna() & loca_df["lon"].notna()
+        if int(located.sum()) < MAP_CONFIG.TILE_LAYER_MIN_BOREHOLES:
+            return None
+        logger.info(f"Rebuilding tile index for dataset {dataset_id}")
+        return self.register_dataset(dataset_id, loca_df)
+
+    def has_dataset(self, dataset_id: Optional[str]) -> bool:
+        """Check whether a dataset is served as tiles."""
+        with self._lock:
+            return bool(dataset_id) and dataset_id in self._indexes
+
+    def get_tile(self, dataset_id: str, z: int, x: int, y: int) -> Optional[bytes]:
+        """
+        Get the encoded GeoJSON tile, or None if the dataset is not registered
+        and cannot be rebuilt.
+
+        Args:
+            dataset_id: Dataset identifier
+            z: Zoom level
+            x: Tile column
+            y: Tile row
+
+        Returns:
+            bytes: Compact JSON payload
+        """
+        key = (dataset_id, z, x, y)
+        with self._lock:
+            payload = self._tiles.get(key)
+            if payload is not None:
+                self._tiles.move_to_end(key)
+                self._stats["hits"] += 1
+                return payload
+            index = self._indexes.get(dataset_id)
+            self._stats["misses"] += 1
+
+        if index is None:
+            index = self.restore_dataset(dataset_id)
+        if index is None:
+            return None
+
+        payload = json.dumps(index.build_tile(z, x, y), separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+        with self._lock:
+            self._tiles[key] = payload
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+                self._stats["evictions"] += 1
+
+        return payload
+
+    def _drop_tiles(self, dataset_id: str):
+        """Remove cached tiles of a dataset (caller holds the lock)."""
+        for key in [key for key in self._tiles if key[0] == dataset_id]:
+            del self._tiles[key]
+
+    def clear_cache(self):
+        """Clear cached tiles (indexes are kept)."""
+        with self._lock:
+            self._tiles.clear()
+        logger.info("Borehole tile cache cleared")
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get tile cache statistics."""
+        with self._lock:
+            return {
+                **self._stats,
+                "tiles": len(self._tiles),
+                "datasets": len(self._indexes),
+            }
+
+
+# Global tile service instance
+_tile_service = None
+
+
+def _session_locations(dataset_id: str) -> Optional[pd.DataFrame]:
+    """LOCA data of a dataset held by a live session, if any."""
+    from state_management import get_session_state_store
+
+    dataset = get_session_state_store().find_dataset(dataset_id)
+    return dataset.loca_df if dataset is not None else None
+
+
+def _session_dataset_ids() -> Set[str]:
+    """Datasets held by live sessions."""
+    from state_management import get_session_state_store
+
+    return get_session_state_store().dataset_ids()
+
+
+def get_tile_service() -> BoreholeTileService:
+    """Get global borehole tile service instance."""
+    global _tile_service
+    if _tile_service is None:
+        _tile_service = BoreholeTileService(
+            load_locations=_session_locations, pinned_datasets=_session_dataset_ids
+        )
+    return _tile_service
+
+
+def get_tile_url_template(dataset_id: str) -> str:
+    """Return the tile URL template for a dataset ({z}/{x}/{y} left unfilled)."""
+    return MAP_CONFIG.TILE_URL_TEMPLATE.replace("{dataset_id}", dataset_id)
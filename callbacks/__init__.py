@@ -54,6 +54,7 @@ from .map_interactions import MapInteractionCallback
 from .plot_generation import PlotGenerationCallback
 from .search_functionality import SearchFunctionalityCallback
 from .marker_handling import MarkerHandlingCallback
+from .log_export import LogExportCallback
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +125,7 @@ def register_all_callbacks(app):
         PlotGenerationCallback(),
         SearchFunctionalityCallback(),
         MarkerHandlingCallback(),
+        LogExportCallback(),
     ]
 
     # Add to manager and register
@@ -159,6 +161,7 @@ __all__ = [
     "PlotGenerationCallback",
     "SearchFunctionalityCallback",
     "MarkerHandlingCallback",
+    "LogExportCallback",
     # Utility functions
     "register_all_callbacks",
 ]
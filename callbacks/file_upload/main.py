@@ -11,6 +11,10 @@ from typing import List, Tuple, Any
 from dash import html, Output, Input, State
 import dash
 
+from app_constants import PERFORMANCE_CONFIG
+from borehole_presentation import compute_dataset_id
+from render_warmup import get_log_warmup, nearest_boreholes
+from upload_spool import UploadSpoolError, get_upload_spool
 from ..base import FileUploadCallbackBase
 from ..error_handling import CallbackError, create_error_message
 
@@ -19,13 +23,16 @@ from .validation import (
     validate_total_upload_size,
     validate_individual_file_size,
     validate_file_content_security,
+    validate_ags_text,
 )
 from .processing import (
     process_uploaded_files,
+    process_spooled_files,
     load_and_optimize_borehole_data,
     transform_coordinates_and_create_markers,
     calculate_optimal_map_view,
     prepare_borehole_data_for_storage,
+    store_session_dataset,
 )
 from .ui_components import (
     create_upload_summary,
@@ -76,55 +83,85 @@ class FileUploadCallback(FileUploadCallbackBase):
                 map_zoom = map_zoom_state or 6
 
                 # Check if data was uploaded
-                if not stored_data or "contents" not in stored_data:
+                if not stored_data or not (
+                    "upload_id" in stored_data or "contents" in stored_data
+                ):
                     logger.info("No file uploaded yet")
                     return None, [], map_center, map_zoom, None, None
 
-                # Extract upload data
-                list_of_contents = stored_data["contents"]
-                list_of_names = stored_data["filenames"]
-                logger.info(f"Processing {len(list_of_contents)} uploaded files")
-
-                # Step 1: Validate file sizes and content
-                validation_result = self._validate_uploaded_files(
-                    list_of_contents, list_of_names
-                )
-                if validation_result["has_errors"]:
-                    return self._handle_validation_errors(
-                        validation_result, map_center, map_zoom
+                if "upload_id" in stored_data:
+                    # Steps 1-2: Read and validate files spooled by chunked upload
+                    ags_files, total_size, file_errors = self._read_spooled_upload(
+                        stored_data["upload_id"]
                     )
-
-                # Step 2: Process files and extract AGS data
-                ags_files, total_size = process_uploaded_files(
-                    list_of_contents, list_of_names
-                )
+                    list_of_names = [entry["name"] for entry in stored_data["files"]]
+                else:
+                    # Legacy base64 payload (dcc.Upload contents)
+                    list_of_contents = stored_data["contents"]
+                    list_of_names = stored_data["filenames"]
+                    logger.info(f"Processing {len(list_of_contents)} uploaded files")
+
+                    # Step 1: Validate file sizes and content
+                    validation_result = self._validate_uploaded_files(
+                        list_of_contents, list_of_names
+                    )
+                    if validation_result["has_errors"]:
+                        return self._handle_validation_errors(
+                            validation_result, map_center, map_zoom
+                        )
+
+                    # Step 2: Process files and extract AGS data
+                    ags_files, total_size = process_uploaded_files(
+                        list_of_contents, list_of_names
+                    )
+                    file_errors = []
 
                 if not ags_files:
                     error_msg = create_processing_error_message(
                         "No valid AGS files could be processed from the upload."
                     )
-                    return [error_msg], [], map_center, map_zoom, None, None
+                    return (
+                        [error_msg] + file_errors,
+                        [],
+                        map_center,
+                        map_zoom,
+                        None,
+                        None,
+                    )
 
                 # Step 3: Load and optimize borehole data
                 loca_df, filename_map = load_and_optimize_borehole_data(ags_files)
+                dataset_id = compute_dataset_id(filename_map)
 
                 # Step 4: Transform coordinates and create markers
                 markers, valid_coords = transform_coordinates_and_create_markers(
-                    loca_df
+                    loca_df, dataset_id
                 )
 
                 # Step 5: Calculate optimal map view
                 if valid_coords:
                     map_center, map_zoom = calculate_optimal_map_view(valid_coords)
 
-                # Step 6: Prepare data for storage
-                borehole_data = prepare_borehole_data_for_storage(loca_df, filename_map)
+                # Pre-render the logs users are likely to click first
+                if PERFORMANCE_CONFIG.LOG_WARMUP_ENABLED:
+                    warmup = get_log_warmup()
+                    warmup.start(
+                        list(filename_map.items()),
+                        dataset_id,
+                        nearest_boreholes(loca_df, map_center, warmup.max_boreholes),
+                    )
+
+                # Step 6: Prepare data for storage (client store and session)
+                borehole_data = prepare_borehole_data_for_storage(
+                    loca_df, filename_map, dataset_id
+                )
+                store_session_dataset(loca_df, filename_map, dataset_id)
 
                 # Step 7: Create UI status components
                 status_components = self._create_status_components(
                     ags_files,
                     total_size,
-                    list_of_contents,
+                    list_of_names,
                     filename_map,
                     loca_df,
                     markers,
@@ -137,7 +174,7 @@ class FileUploadCallback(FileUploadCallbackBase):
                 clear_shapes = datetime.now().timestamp()
 
                 return (
-                    status_components,
+                    status_components + file_errors,
                     markers,
                     map_center,
                     map_zoom,
@@ -153,6 +190,48 @@ class FileUploadCallback(FileUploadCallbackBase):
                 clear_shapes = datetime.now().timestamp()
                 return [error_msg], [], map_center, map_zoom, None, clear_shapes
 
+    def _read_spooled_upload(self, upload_id: str) -> Tuple[List, float, List]:
+        """
+        Read and validate the files of a chunked upload, then discard the spool.
+
+        Size and file-count limits are enforced while chunks are received, so
+        only content validation happens here.
+
+        Returns:
+            Tuple of (ags_files, total_size_mb, error_status_components)
+        """
+        spool = get_upload_spool()
+        opened = False
+        try:
+            with spool.open_files(upload_id) as spooled_files:
+                opened = True
+                ags_files, total_size, read_errors = process_spooled_files(
+                    spooled_files
+                )
+        except UploadSpoolError as e:
+            logger.error(f"Could not read spooled upload {upload_id}: {e}")
+            return [], 0.0, [create_file_error_status(str(e))]
+        finally:
+            # Only discard uploads the spool actually opened; unknown IDs
+            # from the client are never passed on for deletion
+            if opened:
+                spool.discard(upload_id)
+
+        file_errors = [create_file_error_status(error) for _, error in read_errors]
+        valid_files = []
+        for name, text_content in ags_files:
+            is_valid, error = validate_ags_text(text_content, name)
+            if is_valid:
+                valid_files.append((name, text_content))
+            else:
+                file_errors.append(create_file_error_status(error))
+
+        logger.info(
+            f"Read {len(valid_files)} of {len(ags_files) + len(read_errors)} "
+            f"spooled files ({total_size:.1f}MB)"
+        )
+        return valid_files, total_size, file_errors
+
     def _validate_uploaded_files(
         self, file_contents: List[str], file_names: List[str]
     ) -> dict:
@@ -9,6 +9,7 @@ import logging
 import base64
 import statistics
 from typing import List, Tuple, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 import dash_leaflet as dl
 
@@ -17,6 +18,17 @@ from data_loader import load_all_loca_data
 from coordinate_service import get_coordinate_service
 from dataframe_optimizer import optimize_borehole_dataframe
 from memory_manager import monitor_memory_usage
+from borehole_presentation import compute_dataset_id, get_presentation_table
+from borehole_tiles import get_tile_service
+from app_constants import MAP_CONFIG
+from state_management import get_app_state_manager
+from state_management.store_codec import encode_dataframe
+
+# Define marker constants
+try:
+    from ..coordinate_utils import BLUE_MARKER
+except ImportError:
+    BLUE_MARKER = "https://raw.githubusercontent.com/pointhi/leaflet-color-markers/master/img/marker-icon-blue.png"
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +76,40 @@ def process_uploaded_files(
     return ags_files, total_processed_size
 
 
+def process_spooled_files(
+    spooled_files: List[Tuple[str, Any, int]],
+) -> Tuple[List[Tuple[str, str]], float, List[Tuple[str, str]]]:
+    """
+    Read AGS data from spooled upload file handles.
+
+    Args:
+        spooled_files: List of (name, binary_file_handle, size_bytes) tuples,
+            as yielded by UploadSpool.open_files
+
+    Returns:
+        Tuple of (ags_files_list, total_size_mb, errors) where errors is a
+        list of (name, error_message) for files that could not be read
+    """
+    ags_files = []
+    errors = []
+    total_processed_size = 0.0
+
+    for name, handle, size_bytes in spooled_files:
+        try:
+            text_content = handle.read().decode("utf-8")
+        except UnicodeDecodeError as e:
+            logger.error(f"Error reading {name}: {e}")
+            errors.append((name, f"File {name} is not valid UTF-8 text"))
+            continue
+
+        size_mb = size_bytes / (1024 * 1024)
+        ags_files.append((name, text_content))
+        total_processed_size += size_mb
+        logger.info(f"Successfully read spooled file: {name} ({size_mb:.1f}MB)")
+
+    return ags_files, total_processed_size, errors
+
+
 def load_and_optimize_borehole_data(
     ags_files: List[Tuple[str, str]],
 ) -> Tuple[pd.DataFrame, Dict[str, str]]:
@@ -90,50 +136,66 @@ def load_and_optimize_borehole_data(
 
 def transform_coordinates_and_create_markers(
     loca_df: pd.DataFrame,
+    dataset_id: Optional[str] = None,
 ) -> Tuple[List[dl.Marker], List[Tuple[float, float]]]:
     """
     Transform coordinates and create map markers for boreholes.
 
+    Coordinates are transformed in a single batch and tooltips come from the
+    per-dataset presentation table, so marker creation is a zip over arrays.
+    Datasets with at least MAP_CONFIG.TILE_LAYER_MIN_BOREHOLES located
+    boreholes are registered with the tile service and get no markers.
+
     Args:
         loca_df: DataFrame containing borehole location data
+        dataset_id: Dataset identifier used to cache the presentation table
 
     Returns:
         Tuple of (markers_list, valid_coordinates_list)
     """
     coordinate_service = get_coordinate_service()
-    markers = []
-    valid_coords = []
 
-    # Define marker constants
-    try:
-        from .coordinate_utils import BLUE_MARKER
-    except ImportError:
-        BLUE_MARKER = "https://raw.githubusercontent.com/pointhi/leaflet-color-markers/master/img/marker-icon-blue.png"
+    # Transform all coordinates in one batch
+    eastings = pd.to_numeric(loca_df["LOCA_NATE"], errors="coerce").to_numpy(float)
+    northings = pd.to_numeric(loca_df["LOCA_NATN"], errors="coerce").to_numpy(float)
+    has_coords = ~(np.isnan(eastings) | np.isnan(northings))
 
-    for i, row in loca_df.iterrows():
+    lats = np.full(len(loca_df), np.nan)
+    lons = np.full(len(loca_df), np.nan)
+    if has_coords.any():
         try:
-            # Extract coordinates
-            easting = float(row["LOCA_NATE"]) if pd.notnull(row["LOCA_NATE"]) else None
-            northing = float(row["LOCA_NATN"]) if pd.notnull(row["LOCA_NATN"]) else None
-
-            if easting is not None and northing is not None:
-                # Transform coordinates
-                lat, lon = coordinate_service.transform_bng_to_wgs84(easting, northing)
-
-                if lat is not None and lon is not None:
-                    # Store coordinates in DataFrame
-                    loca_df.at[i, "lat"] = lat
-                    loca_df.at[i, "lon"] = lon
-                    valid_coords.append((lat, lon))
-
-                    # Create marker
-                    marker = _create_borehole_marker(row, i, lat, lon)
-                    markers.append(marker)
-
-        except Exception as e:
-            logger.warning(
-                f"Skipping marker for row {i} ({row.get('LOCA_ID', 'unknown')}): {e}"
+            lats[has_coords], lons[has_coords] = coordinate_service.transform_bng_to_wgs84(
+                eastings[has_coords], northings[has_coords]
             )
+        except Exception as e:
+            logger.warning(f"Skipping markers, coordinate transformation failed: {e}")
+
+    # Store coordinates in DataFrame
+    loca_df["lat"] = lats
+    loca_df["lon"] = lons
+
+    presentation = get_presentation_table(loca_df, dataset_id)
+    ids = loca_df["LOCA_ID"].astype(str).str.strip().to_numpy()
+    tooltips = presentation["tooltip"].reindex(ids).to_numpy()
+    valid = ~(np.isnan(lats) | np.isnan(lons))
+
+    # Very large datasets are served as server-side tiles instead of markers
+    if dataset_id and valid.sum() >= MAP_CONFIG.TILE_LAYER_MIN_BOREHOLES:
+        get_tile_service().register_dataset(dataset_id, loca_df, presentation)
+        valid_coords = list(zip(lats[valid].tolist(), lons[valid].tolist()))
+        logger.info(
+            f"Serving {len(valid_coords)} boreholes as map tiles instead of markers"
+        )
+        return [], valid_coords
+
+    markers = []
+    valid_coords = []
+    for loca_id, lat, lon, tooltip_text in zip(
+        ids[valid], lats[valid], lons[valid], tooltips[valid]
+    ):
+        lat, lon = float(lat), float(lon)
+        valid_coords.append((lat, lon))
+        markers.append(_create_borehole_marker(loca_id, lat, lon, tooltip_text))
 
     logger.info(
         f"Created {len(markers)} map markers from {len(valid_coords)} valid coordinates"
@@ -142,39 +204,26 @@ def transform_coordinates_and_create_markers(
 
 
 def _create_borehole_marker(
-    row: pd.Series, index: int, lat: float, lon: float
+    loca_id: str, lat: float, lon: float, tooltip_text: str
 ) -> dl.Marker:
     """
     Create individual borehole marker.
 
     Args:
-        row: DataFrame row containing borehole data
-        index: Row index for marker ID
+        loca_id: Borehole LOCA_ID, used as the marker ID index
         lat: Latitude coordinate
         lon: Longitude coordinate
+        tooltip_text: Precomputed tooltip text from the presentation table
 
     Returns:
         Dash Leaflet Marker component
     """
-    # Create marker ID
-    label = str(row["LOCA_ID"])
-    marker_id = {"type": "borehole-marker", "index": index}
-
-    # Format measurement values
-    ground_level = _format_measurement_value(row.get("LOCA_GL", "N/A"))
-    total_depth = _format_measurement_value(row.get("LOCA_FDEP", "N/A"))
-
-    # Create tooltip text
-    tooltip_text = f"""
-    Borehole: {label}
-    Ground Level: {ground_level}
-    Total Depth: {total_depth}
-    Click to view borehole log
-    """
+    # Create marker ID keyed by LOCA_ID so clicks resolve without positional lookup
+    marker_id = {"type": "borehole-marker", "index": loca_id}
 
     # Define marker icon
     marker_icon = {
-        "iconUrl": "https://raw.githubusercontent.com/pointhi/leaflet-color-markers/master/img/marker-icon-blue.png",
+        "iconUrl": BLUE_MARKER,
         "iconSize": [25, 41],
         "iconAnchor": [12, 41],
         "popupAnchor": [1, -34],
@@ -184,31 +233,12 @@ def _create_borehole_marker(
     return dl.Marker(
         id=marker_id,
         position=[lat, lon],
-        children=dl.Tooltip(tooltip_text.strip()),
+        children=dl.Tooltip(tooltip_text),
         icon=marker_icon,
         n_clicks=0,
     )
 
 
-def _format_measurement_value(value) -> str:
-    """
-    Format measurement values with proper units.
-
-    Args:
-        value: Raw measurement value
-
-    Returns:
-        Formatted measurement string
-    """
-    if value == "N/A" or value is None or not str(value).strip():
-        return "N/A"
-
-    try:
-        return f"{float(value):.2f}m"
-    except (ValueError, TypeError):
-        return "N/A"
-
-
 def calculate_optimal_map_view(
     coordinates: List[Tuple[float, float]],
 ) -> Tuple[List[float], int]:
@@ -255,7 +285,9 @@ def calculate_optimal_map_view(
 
 
 def prepare_borehole_data_for_storage(
-    loca_df: pd.DataFrame, filename_map: Dict[str, str]
+    loca_df: pd.DataFrame,
+    filename_map: Dict[str, str],
+    dataset_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Prepare borehole data for Dash dcc.Store component.
@@ -263,12 +295,38 @@ def prepare_borehole_data_for_storage(
     Args:
         loca_df: DataFrame containing borehole data
         filename_map: Mapping of filenames to content
+        dataset_id: Dataset identifier (computed from filename_map if omitted)
 
     Returns:
         Dictionary ready for Dash store
     """
     return {
-        "loca_df": loca_df.to_dict("records"),
+        "loca_df": encode_dataframe(loca_df),
         "filename_map": filename_map,
         "all_borehole_ids": loca_df["LOCA_ID"].tolist(),
+        "dataset_id": dataset_id or compute_dataset_id(filename_map),
     }
+
+
+def store_session_dataset(
+    loca_df: pd.DataFrame,
+    filename_map: Dict[str, str],
+    dataset_id: str,
+) -> None:
+    """
+    Keep an uploaded dataset in the current session's server-side state.
+
+    Callbacks that only receive a dataset ID (marker clicks, tile requests)
+    look the data up here instead of uploading borehole-data-store again.
+
+    Args:
+        loca_df: DataFrame containing borehole data (with lat/lon)
+        filename_map: Mapping of filenames to AGS content
+        dataset_id: Dataset identifier stored in borehole-data-store
+    """
+    get_app_state_manager().update_borehole_data(
+        loca_df=loca_df,
+        filename_map=filename_map,
+        all_borehole_ids=loca_df["LOCA_ID"].astype(str).tolist(),
+        dataset_id=dataset_id,
+    )
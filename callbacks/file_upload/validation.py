@@ -123,19 +123,32 @@ def validate_file_content_security(content_string: str, name: str) -> Tuple[bool
         # Attempt to decode Base64 content
         decoded = base64.b64decode(content_string)
         text_content = decoded.decode("utf-8", errors="ignore")
+        return validate_ags_text(text_content, name)
 
-        # Basic content validation for AGS files
-        if len(text_content.strip()) == 0:
-            return False, f"File {name} appears to be empty"
+    except Exception as e:
+        return False, f"File {name} content validation failed: {str(e)}"
 
-        # Check for potential AGS content indicators
-        ags_indicators = ["**PROJ", "**LOCA", "**GEOL", "GROUP", "DATA"]
-        has_ags_content = any(indicator in text_content for indicator in ags_indicators)
 
-        if not has_ags_content:
-            return (False, f"File {name} does not appear to contain valid AGS data")
+def validate_ags_text(text_content: str, name: str) -> Tuple[bool, str]:
+    """
+    Basic validation of decoded AGS file text.
 
-        return True, ""
+    Args:
+        text_content: Decoded file content
+        name: File name for error messages
 
-    except Exception as e:
-        return False, f"File {name} content validation failed: {str(e)}"
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    # Basic content validation for AGS files
+    if len(text_content.strip()) == 0:
+        return False, f"File {name} appears to be empty"
+
+    # Check for potential AGS content indicators
+    ags_indicators = ["**PROJ", "**LOCA", "**GEOL", "GROUP", "DATA"]
+    has_ags_content = any(indicator in text_content for indicator in ags_indicators)
+
+    if not has_ags_content:
+        return (False, f"File {name} does not appear to contain valid AGS data")
+
+    return True, ""
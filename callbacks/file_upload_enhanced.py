@@ -25,6 +25,7 @@ from data_loader import load_all_loca_data
 from coordinate_service import get_coordinate_service
 from dataframe_optimizer import optimize_borehole_dataframe
 from memory_manager import monitor_memory_usage
+from state_management.store_codec import encode_dataframe
 import config
 
 logger = logging.getLogger(__name__)
@@ -248,7 +249,7 @@ class EnhancedFileUploadCallback(FileUploadCallbackBase):
 
                 # Store data for other callbacks
                 borehole_data = {
-                    "loca_df": loca_df.to_dict("records"),
+                    "loca_df": encode_dataframe(loca_df),
                     "filename_map": filename_map,
                     "all_borehole_ids": loca_df["LOCA_ID"].tolist(),
                 }
@@ -295,7 +296,7 @@ class EnhancedFileUploadCallback(FileUploadCallbackBase):
     ) -> dl.Marker:
         """Create a borehole marker with proper formatting."""
         label = str(row["LOCA_ID"])
-        marker_id = {"type": "borehole-marker", "index": index}
+        marker_id = {"type": "borehole-marker", "index": label}
 
         # Format measurements
         ground_level = self._format_measurement(row.get("LOCA_GL", "N/A"))
@@ -0,0 +1,199 @@
+"""
+Borehole Log Export Callbacks Module
+
+This module handles the bulk export of borehole logs for the selected
+boreholes (or every borehole when none are selected) as a ZIP of PDFs or a
+single combined PDF, delivered through ``dcc.Download``.
+
+Responsibilities:
+- Rendering the logs in the render worker pool from a background callback
+- Writing the export to a temporary file (ZIP exports stream each log as
+  it is rendered; combined PDFs are merged in memory first, so they are
+  refused above a small log count)
+- Reporting export progress per borehole, and any boreholes left out by
+  the export size limit
+"""
+
+import logging
+import os
+import tempfile
+
+import dash
+from dash import Output, Input, State, dcc, html
+
+from .base import PlotGenerationCallbackBase
+from .error_handling import create_success_message
+from app_constants import PERFORMANCE_CONFIG
+from borehole_log import (
+    available_export_formats,
+    build_borehole_log_index,
+    export_borehole_logs,
+)
+from borehole_presentation import compute_dataset_id
+from error_handling import get_error_handler, ErrorCategory
+from loading_indicators import LoadingIndicator
+from render_workers import (
+    RenderQueueFullError,
+    get_background_callback_manager,
+    get_render_worker_pool,
+)
+
+
+class LogExportCallback(PlotGenerationCallbackBase):
+    """Handles bulk borehole log export."""
+
+    def __init__(self):
+        super().__init__("log_export")
+        self.logger = logging.getLogger(__name__)
+        self.error_handler = get_error_handler()
+
+    def register(self, app):
+        """Register the log export callback with the Dash app."""
+
+        @app.callback(
+            [
+                Output("download-log-export", "data"),
+                Output("log-export-status", "children"),
+            ],
+            Input("export-logs-btn", "n_clicks"),
+            [
+                State("borehole-data-store", "data"),
+                State("subselection-checkbox-grid", "value"),
+                State("show-labels-checkbox", "value"),
+                State("log-export-format-selector", "value"),
+            ],
+            prevent_initial_call=True,
+            background=True,
+            manager=get_background_callback_manager(),
+            progress=[Output("log-export-progress", "children")],
+            progress_default=[None],
+            interval=PERFORMANCE_CONFIG.BACKGROUND_CALLBACK_POLL_MS,
+        )
+        def handle_log_export(
+            set_progress,
+            n_clicks,
+            stored_borehole_data,
+            checked_ids,
+            show_labels_value,
+            export_format,
+        ):
+            """Export borehole logs (runs as a background job)"""
+            self.logger.info("=== LOG EXPORT CALLBACK ===")
+            try:
+                return self._export_logs(
+                    stored_borehole_data,
+                    checked_ids,
+                    show_labels_value,
+                    export_format,
+                    set_progress,
+                )
+            except Exception as e:
+                self.logger.error(f"Error in log export callback: {e}")
+                self.error_handler.handle_error(
+                    e, ErrorCategory.PLOT_GENERATION, "handle_log_export"
+                )
+                return None, html.Div(
+                    "Could not export borehole logs.",
+                    style={"textAlign": "center", "color": "red"},
+                )
+
+        self.logger.info("Registered log export callbacks")
+
+    def _export_logs(
+        self,
+        stored_borehole_data,
+        checked_ids,
+        show_labels_value,
+        export_format,
+        set_progress=None,
+    ):
+        """
+        Render the logs into a temporary file and send it for download.
+
+        Returns:
+            tuple: (dcc.Download data, status component)
+        """
+        if not stored_borehole_data or not stored_borehole_data.get("filename_map"):
+            return dash.no_update, dash.no_update
+
+        if export_format not in available_export_formats():
+            export_format = "zip"
+        show_labels = "show_labels" in (show_labels_value or [])
+        filename_map = stored_borehole_data["filename_map"]
+        ags_data = list(filename_map.items())
+        dataset_id = stored_borehole_data.get("dataset_id") or compute_dataset_id(
+            filename_map
+        )
+
+        borehole_ids = [str(borehole_id) for borehole_id in checked_ids or []]
+        if not borehole_ids:
+            borehole_ids = list(
+                build_borehole_log_index(ags_data, dataset_id)["geology"]
+            )
+        requested = len(borehole_ids)
+        max_combined = PERFORMANCE_CONFIG.LOG_EXPORT_MAX_COMBINED_PDF
+        if export_format == "pdf" and requested > max_combined:
+            self.logger.info(
+                f"Refused combined PDF of {requested} logs (limit {max_combined})"
+            )
+            return None, html.Div(
+                f"Combined PDF exports are limited to {max_combined} boreholes "
+                f"({requested} requested). Select fewer boreholes or choose "
+                "ZIP of PDFs.",
+                style={"textAlign": "center", "color": "orange"},
+            )
+        max_boreholes = PERFORMANCE_CONFIG.LOG_EXPORT_MAX_BOREHOLES
+        if requested > max_boreholes:
+            self.logger.warning(
+                f"Exporting the first {max_boreholes} of {requested} logs"
+            )
+            borehole_ids = borehole_ids[:max_boreholes]
+
+        def report_progress(done, total):
+            if set_progress is not None:
+                set_progress(
+                    [
+                        LoadingIndicator.create_progress_bar(
+                            "log-export", done, total, "Rendering borehole logs"
+                        )
+                    ]
+                )
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="log-export-") as export_dir:
+                path = os.path.join(export_dir, f"borehole_logs.{export_format}")
+                with open(path, "wb") as output_file:
+                    exported = export_borehole_logs(
+                        ags_data,
+                        borehole_ids,
+                        output_file,
+                        export_format=export_format,
+                        show_labels=show_labels,
+                        data_key=dataset_id,
+                        pool=get_render_worker_pool(),
+                        progress=report_progress,
+                    )
+                if not exported:
+                    return None, html.Div(
+                        "No borehole logs to export.",
+                        style={"textAlign": "center", "color": "orange"},
+                    )
+                download = dcc.send_file(path)
+        except RenderQueueFullError as e:
+            self.logger.warning(f"Log export refused: {e}")
+            return None, html.Div(
+                "⏳ The server is busy rendering other plots. Please try again shortly.",
+                style={"textAlign": "center", "color": "orange"},
+            )
+
+        self.logger.info(f"Exported {exported} borehole log(s) as {export_format}")
+        truncated = None
+        if requested > max_boreholes:
+            truncated = (
+                f"Only the first {max_boreholes} of {requested} boreholes were "
+                f"exported (limit {max_boreholes} per export). Select fewer "
+                "boreholes to export the rest."
+            )
+        return download, create_success_message(
+            f"Exported {exported} borehole log(s).", truncated
+        )
@@ -9,7 +9,7 @@ import logging
 from datetime import datetime
 from typing import List, Tuple, Any, Optional, Dict
 import pandas as pd
-from dash import html, Output, Input, State, callback_context
+from dash import html, Output, Input, State, callback_context, no_update
 import dash
 from sklearn.decomposition import PCA
 import dash_leaflet as dl
@@ -22,13 +22,20 @@ from polyline_utils import (
     project_boreholes_to_polyline,
 )
 from coordinate_service import get_coordinate_service
+from borehole_presentation import get_presentation_table
+from borehole_tiles import get_tile_service
 from app_constants import MAP_CONFIG
 
 # Marker URLs (extracted from original callbacks_split.py)
 BLUE_MARKER = MAP_CONFIG.BLUE_MARKER_URL
 GREEN_MARKER = MAP_CONFIG.GREEN_MARKER_URL
 from error_handling import get_error_handler, ErrorCategory, ErrorSeverity
-from state_management import get_app_state_manager
+from state_management import (
+    get_app_state_manager,
+    get_borehole_frame,
+    get_derived_view_cache,
+    selection_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,44 +56,52 @@ class MapInteractionCallback(MapInteractionCallbackBase):
                 Output("subselection-checkbox-grid-container", "children"),
                 Output("ui-feedback", "children"),
                 Output("borehole-markers", "children", allow_duplicate=True),
-                Output("borehole-data-store", "data", allow_duplicate=True),
+                Output("selection-store", "data", allow_duplicate=True),
+                Output("polyline-store", "data", allow_duplicate=True),
+                Output("buffer-store", "data", allow_duplicate=True),
                 Output("buffer-controls", "style", allow_duplicate=True),
                 Output("selection-shapes", "children"),
             ],
             [
                 Input("draw-control", "geojson"),
-                Input("subselection-checkbox-grid", "value"),
                 Input("update-buffer-btn", "n_clicks"),
             ],
             [
                 State("borehole-data-store", "data"),
                 State("borehole-markers", "children"),
                 State("buffer-input", "value"),
+                State("polyline-store", "data"),
+                State("buffer-store", "data"),
             ],
             prevent_initial_call=True,
         )
         def handle_map_interactions(
             drawn_geojson,
-            checked_ids,
             update_buffer_clicks,
             stored_borehole_data,
             marker_children,
             buffer_value,
+            polyline_data,
+            buffer_data,
         ):
-            """Handle map drawing and selection."""
+            """Handle map drawing and authoritative selection updates.
+
+            Subselection checkbox changes and buffer width edits are previewed
+            in the browser (see register_selection_preview_callbacks); this
+            callback only runs when the selection itself must be recomputed.
+            Selection, polyline and buffer state are written to their own
+            small stores, so the borehole dataset is never echoed back.
+            """
 
             try:
-                self.log_callback_start(
-                    {
-                        "trigger": self._get_trigger(),
-                        "has_geojson": bool(drawn_geojson),
-                        "checked_count": len(checked_ids) if checked_ids else 0,
-                    }
+                self.logger.info(
+                    f"Map interaction triggered by {self._get_trigger()} "
+                    f"(has_geojson={bool(drawn_geojson)})"
                 )
 
                 if not stored_borehole_data:
                     self.logger.warning("No stored borehole data available")
-                    return self._empty_response(stored_borehole_data)
+                    return self._empty_response()
 
                 ctx = callback_context
                 triggered = ctx.triggered[0]["prop_id"] if ctx.triggered else None
@@ -98,28 +113,27 @@ class MapInteractionCallback(MapInteractionCallbackBase):
                         stored_borehole_data,
                         marker_children,
                         buffer_value,
-                    )
-                elif self._is_checkbox_trigger(triggered, checked_ids):
-                    result = self._handle_checkbox_selection(
-                        checked_ids, stored_borehole_data
+                        buffer_data,
                     )
                 elif self._is_buffer_trigger(
-                    triggered, update_buffer_clicks, stored_borehole_data
+                    triggered, update_buffer_clicks, polyline_data
                 ):
                     result = self._handle_buffer_update(
-                        stored_borehole_data, buffer_value
+                        stored_borehole_data, polyline_data, buffer_value
                     )
                 else:
-                    result = self._empty_response(stored_borehole_data)
+                    result = self._empty_response()
 
-                self.log_callback_end({"success": True})
                 return result
 
             except Exception as e:
                 self.logger.error(
                     f"Error in map interactions callback: {e}", exc_info=True
                 )
-                return self.handle_error(e, output_count=8)
+                return self._error_response(
+                    stored_borehole_data,
+                    html.Div(f"Error processing selection: {e}", style={"color": "red"}),
+                )
 
     def _get_trigger(self) -> str:
         """Get the name of the triggered input."""
@@ -136,21 +150,18 @@ class MapInteractionCallback(MapInteractionCallbackBase):
             and drawn_geojson.get("features")
         )
 
-    def _is_checkbox_trigger(self, triggered: str, checked_ids: List[str]) -> bool:
-        """Check if this is a checkbox trigger."""
-        return "subselection-checkbox-grid.value" in (triggered or "") and checked_ids
-
     def _is_buffer_trigger(
-        self, triggered: str, clicks: int, stored_data: dict
+        self, triggered: str, clicks: int, polyline_data: Optional[dict]
     ) -> bool:
         """Check if this is a buffer update trigger."""
         return (
             "update-buffer-btn.n_clicks" in (triggered or "")
             and clicks
-            and stored_data.get("last_polyline")
+            and bool(polyline_data)
+            and bool(polyline_data.get("last_polyline"))
         )
 
-    def _empty_response(self, stored_data: dict) -> Tuple[Any, ...]:
+    def _empty_response(self) -> Tuple[Any, ...]:
         """Return empty response when no action is needed."""
         return (
             [],
@@ -158,7 +169,9 @@ class MapInteractionCallback(MapInteractionCallbackBase):
             None,
             None,
             [],
-            stored_data,
+            no_update,
+            no_update,
+            no_update,
             {"display": "none"},
             [],
         )
@@ -169,13 +182,14 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         stored_borehole_data: dict,
         marker_children: List,
         buffer_value: float,
+        buffer_data: Optional[dict] = None,
     ) -> Tuple[Any, ...]:
         """Handle shape drawing and borehole selection."""
 
         self.logger.info("🎨 Processing shape drawing event")
 
         # Get DataFrame
-        loca_df = pd.DataFrame(stored_borehole_data["loca_df"])
+        loca_df = get_borehole_frame(stored_borehole_data)
 
         # Extract features
         features = drawn_geojson.get("features", [])
@@ -191,7 +205,11 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         # Handle different geometry types
         if geom_type == "LineString":
             return self._handle_polyline_selection(
-                selected_feature, loca_df, stored_borehole_data, buffer_value
+                selected_feature,
+                loca_df,
+                stored_borehole_data,
+                buffer_value,
+                buffer_data,
             )
         else:
             return self._handle_polygon_selection(
@@ -204,6 +222,7 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         loca_df: pd.DataFrame,
         stored_data: dict,
         buffer_value: float,
+        buffer_data: Optional[dict] = None,
     ) -> Tuple[Any, ...]:
         """Handle polyline selection with buffer."""
 
@@ -211,7 +230,7 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         coordinates = feature["geometry"]["coordinates"]
         polyline_coords = [[lat, lon] for lon, lat in coordinates]
 
-        buffer_meters = buffer_value or stored_data.get(
+        buffer_meters = buffer_value or (buffer_data or {}).get(
             "buffer_meters", MAP_CONFIG.DEFAULT_BUFFER_METERS
         )
 
@@ -239,18 +258,6 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         if buffer_zone:
             line_elements.append(buffer_zone)
 
-        # Update stored data
-        updated_data = dict(stored_data)
-        updated_data.update(
-            {
-                "selection_boreholes": borehole_ids,
-                "polyline_feature": feature,
-                "last_polyline": polyline_coords,
-                "is_polyline": True,
-                "buffer_meters": buffer_meters,
-            }
-        )
-
         # Update state manager
         state_manager = get_app_state_manager()
         state_manager.update_selection_state(
@@ -264,9 +271,18 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         return self._success_response(
             line_elements=line_elements,
             borehole_ids=borehole_ids,
-            updated_data=updated_data,
+            stored_data=stored_data,
             feedback=f"Selected {len(borehole_ids)} boreholes along polyline",
             buffer_controls_visible=True,
+            selection_data={
+                "selection_boreholes": borehole_ids,
+                "is_polyline": True,
+            },
+            polyline_data={
+                "polyline_feature": feature,
+                "last_polyline": polyline_coords,
+            },
+            buffer_data={"buffer_meters": buffer_meters},
         )
 
     def _handle_polygon_selection(
@@ -299,15 +315,6 @@ class MapInteractionCallback(MapInteractionCallbackBase):
             filtered_df = loca_df[loca_df["LOCA_ID"].isin(borehole_ids)]
             pca_line = self._calculate_pca_line(filtered_df)
 
-        # Update stored data
-        updated_data = dict(stored_data)
-        updated_data.update(
-            {
-                "selection_boreholes": borehole_ids,
-                "is_polyline": False,
-            }
-        )
-
         # Update state manager
         state_manager = get_app_state_manager()
         state_manager.update_selection_state(
@@ -318,77 +325,25 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         return self._success_response(
             line_elements=pca_line,
             borehole_ids=borehole_ids,
-            updated_data=updated_data,
+            stored_data=stored_data,
             feedback=f"Selected {len(borehole_ids)} boreholes in shape",
             buffer_controls_visible=False,
-        )
-
-    def _handle_checkbox_selection(
-        self, checked_ids: List[str], stored_data: dict
-    ) -> Tuple[Any, ...]:
-        """Handle checkbox selection changes."""
-
-        self.logger.info("☑️ Processing checkbox selection")
-
-        loca_df = pd.DataFrame(stored_data["loca_df"])
-
-        # Use existing shape selection if available
-        shape_selected_ids = stored_data.get("selection_boreholes", checked_ids)
-
-        # Filter to checked boreholes
-        filtered_df = loca_df[loca_df["LOCA_ID"].isin(checked_ids)]
-
-        # Create appropriate line visualization
-        if stored_data.get("last_polyline"):
-            # Keep existing polyline visualization
-            polyline_coords = stored_data["last_polyline"]
-            buffer_meters = stored_data.get(
-                "buffer_meters", MAP_CONFIG.DEFAULT_BUFFER_METERS
-            )
-
-            section_line = create_polyline_section(polyline_coords)
-            buffer_zone = create_buffer_visualization(polyline_coords, buffer_meters)
-
-            line_elements = []
-            if isinstance(section_line, list):
-                line_elements.extend(section_line)
-            elif section_line:
-                line_elements.append(section_line)
-
-            if buffer_zone:
-                line_elements.append(buffer_zone)
-
-            buffer_controls_visible = True
-        else:
-            # Use PCA line
-            line_elements = self._calculate_pca_line(filtered_df)
-            buffer_controls_visible = False
-
-        # Update state manager
-        state_manager = get_app_state_manager()
-        state_manager.update_selection_state(
-            selected_borehole_ids=checked_ids,
-            selection_method="checkbox",
-        )
-
-        return self._success_response(
-            line_elements=line_elements,
-            borehole_ids=checked_ids,
-            updated_data=stored_data,
-            feedback=f"Using {len(checked_ids)} selected boreholes",
-            buffer_controls_visible=buffer_controls_visible,
-            shape_selected_ids=shape_selected_ids,
+            selection_data={
+                "selection_boreholes": borehole_ids,
+                "is_polyline": False,
+            },
+            polyline_data=None,
         )
 
     def _handle_buffer_update(
-        self, stored_data: dict, buffer_value: float
+        self, stored_data: dict, polyline_data: dict, buffer_value: float
     ) -> Tuple[Any, ...]:
         """Handle buffer distance update."""
 
         self.logger.info(f"📏 Updating buffer to {buffer_value}m")
 
-        polyline_coords = stored_data["last_polyline"]
-        loca_df = pd.DataFrame(stored_data["loca_df"])
+        polyline_coords = polyline_data["last_polyline"]
+        loca_df = get_borehole_frame(stored_data)
 
         # Re-filter with new buffer
         filtered_df = project_boreholes_to_polyline(
@@ -411,21 +366,17 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         if buffer_zone:
             line_elements.append(buffer_zone)
 
-        # Update stored data
-        updated_data = dict(stored_data)
-        updated_data.update(
-            {
-                "buffer_meters": buffer_value,
-                "selection_boreholes": new_borehole_ids,
-            }
-        )
-
         return self._success_response(
             line_elements=line_elements,
             borehole_ids=new_borehole_ids,
-            updated_data=updated_data,
+            stored_data=stored_data,
             feedback=f"Updated buffer to {buffer_value}m - {len(new_borehole_ids)} boreholes selected",
             buffer_controls_visible=True,
+            selection_data={
+                "selection_boreholes": new_borehole_ids,
+                "is_polyline": True,
+            },
+            buffer_data={"buffer_meters": buffer_value},
         )
 
     def _calculate_pca_line(self, filtered_df: pd.DataFrame) -> List:
@@ -506,16 +457,40 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         )
 
     def _update_marker_colors(self, stored_data: dict, selected_ids: List[str]) -> List:
-        """Update marker colors based on selection using lazy loading."""
+        """Update marker colors based on selection using lazy loading.
+
+        Marker lists are memoized per dataset and selection, so repeating a
+        selection (e.g. re-applying the same buffer) skips marker rebuilding.
+        """
 
         if not stored_data:
             return []
 
+        return get_derived_view_cache().get_or_compute(
+            "selection_markers",
+            (stored_data.get("dataset_id"), selection_key(selected_ids)),
+            lambda: self._build_selection_markers(stored_data, selected_ids),
+        )
+
+    def _build_selection_markers(
+        self, stored_data: dict, selected_ids: List[str]
+    ) -> List:
+        """Build the marker list for a selection."""
+
         try:
             # Import lazy marker manager
             from lazy_marker_manager import get_lazy_marker_manager, ViewportBounds
 
-            loca_df = pd.DataFrame(stored_data["loca_df"])
+            loca_df = get_borehole_frame(stored_data)
+            presentation = get_presentation_table(
+                loca_df, stored_data.get("dataset_id")
+            )
+
+            # Tile-backed datasets draw unselected boreholes on the tile layer
+            if get_tile_service().has_dataset(stored_data.get("dataset_id")):
+                loca_df = loca_df[
+                    loca_df["LOCA_ID"].astype(str).str.strip().isin(selected_ids)
+                ]
 
             # Get viewport info if available (for future viewport-based optimization)
             # For now, we'll use the smart loading based on dataset size
@@ -529,6 +504,7 @@ class MapInteractionCallback(MapInteractionCallbackBase):
                 viewport=None,  # TODO: Get from map state in future optimization
                 selected_ids=selected_ids,
                 force_all=force_all,
+                presentation=presentation,
             )
 
             self.logger.info(
@@ -547,34 +523,26 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         """Fallback marker update method (original implementation)."""
 
         try:
-            loca_df = pd.DataFrame(stored_data["loca_df"])
-            markers = []
+            loca_df = get_borehole_frame(stored_data)
+            if loca_df.empty:
+                return []
 
-            for i, row in loca_df.iterrows():
-                lat = row.get("lat")
-                lon = row.get("lon")
-
-                if pd.isna(lat) or pd.isna(lon):
-                    continue
-
-                borehole_id = str(row["LOCA_ID"]).strip()
-                is_selected = borehole_id in selected_ids
+            presentation = get_presentation_table(
+                loca_df, stored_data.get("dataset_id")
+            )
+            loca_df = loca_df.dropna(subset=["lat", "lon"])
+            ids = loca_df["LOCA_ID"].astype(str).str.strip()
+            tooltips = presentation["tooltip"].reindex(ids.to_numpy()).fillna("")
+            selected = ids.isin(selected_ids)
 
+            markers = []
+            for borehole_id, lat, lon, tooltip_text, is_selected in zip(
+                ids, loca_df["lat"], loca_df["lon"], tooltips, selected
+            ):
                 # Choose marker color
                 icon_url = GREEN_MARKER if is_selected else BLUE_MARKER
 
-                marker_id = {"type": "borehole-marker", "index": i}
-
-                # Format tooltip
-                ground_level = self._format_depth_value(row.get("LOCA_GL", "N/A"))
-                total_depth = self._format_depth_value(row.get("LOCA_FDEP", "N/A"))
-
-                tooltip_text = f"""
-                Borehole: {borehole_id}
-                Ground Level: {ground_level}
-                Total Depth: {total_depth}
-                Click to view borehole log
-                """
+                marker_id = {"type": "borehole-marker", "index": borehole_id}
 
                 marker_icon = {
                     "iconUrl": icon_url,
@@ -588,7 +556,7 @@ class MapInteractionCallback(MapInteractionCallbackBase):
                     dl.Marker(
                         id=marker_id,
                         position=[lat, lon],
-                        children=dl.Tooltip(tooltip_text.strip()),
+                        children=dl.Tooltip(tooltip_text),
                         icon=marker_icon,
                         n_clicks=0,
                     )
@@ -600,27 +568,23 @@ class MapInteractionCallback(MapInteractionCallbackBase):
             self.logger.error(f"Error in fallback marker update: {e}")
             return []
 
-    def _format_depth_value(self, value) -> str:
-        """Format depth values for display."""
-
-        if value == "N/A" or value is None or str(value).strip() == "":
-            return "N/A"
-
-        try:
-            return f"{float(value):.2f}m"
-        except (ValueError, TypeError):
-            return "N/A"
-
     def _success_response(
         self,
         line_elements: List,
         borehole_ids: List[str],
-        updated_data: dict,
+        stored_data: dict,
         feedback: str,
         buffer_controls_visible: bool,
         shape_selected_ids: Optional[List[str]] = None,
+        selection_data: Any = no_update,
+        polyline_data: Any = no_update,
+        buffer_data: Any = no_update,
     ) -> Tuple[Any, ...]:
-        """Create a successful response tuple."""
+        """Create a successful response tuple.
+
+        Only the small selection, polyline and buffer stores are returned;
+        pass ``no_update`` (the default) to leave a store unchanged.
+        """
 
         # Use shape_selected_ids for checkbox grid, borehole_ids for feedback
         checkbox_ids = (
@@ -628,7 +592,7 @@ class MapInteractionCallback(MapInteractionCallbackBase):
         )
 
         checkbox_grid = self._create_checkbox_grid(checkbox_ids, borehole_ids)
-        updated_markers = self._update_marker_colors(updated_data, borehole_ids)
+        updated_markers = self._update_marker_colors(stored_data, borehole_ids)
         feedback_div = html.Div(feedback)
         buffer_style = (
             {"display": "block"} if buffer_controls_visible else {"display": "none"}
@@ -640,7 +604,9 @@ class MapInteractionCallback(MapInteractionCallbackBase):
             checkbox_grid,
             feedback_div,
             updated_markers,
-            updated_data,
+            selection_data,
+            polyline_data,
+            buffer_data,
             buffer_style,
             [],  # Selection shapes cleared
         )
@@ -658,7 +624,9 @@ class MapInteractionCallback(MapInteractionCallbackBase):
             None,
             error_msg,
             updated_markers,
-            stored_data,
+            no_update,
+            no_update,
+            no_update,
             {"display": "none"},
             [],
         )
@@ -5,23 +5,24 @@ This module handles all borehole marker interactions and click functionality,
 refactored from the original monolithic callbacks_split.py file.
 
 Responsibilities:
-- Marker click handling for borehole log generation
-- Marker color state management (active/inactive)
+- Marker click handling for borehole log generation (marker colours are
+  switched by the clientside click relay)
 - Borehole log generation and display
 - Selection shape visualization
 """
 
 import logging
-import dash
 from dash import Output, Input, State, html, no_update
-import pandas as pd
 import dash_leaflet as dl
 
 from .base import MarkerHandlingCallbackBase
-from state_management import get_app_state_manager
 from error_handling import get_error_handler, ErrorCategory
-from app_constants import MAP_CONFIG
-from borehole_log import plot_borehole_log_from_ags_content  # Use compatibility wrapper
+from app_constants import PLOT_CONFIG
+from state_management import get_session_state_store
+from borehole_log import render_borehole_log_from_ags
+from render_workers import get_render_worker_pool
+from borehole_presentation import compute_dataset_id, get_presentation_table
+from section.render_cache import log_page_srcs
 
 
 class MarkerHandlingCallback(MarkerHandlingCallbackBase):
@@ -31,11 +32,6 @@ class MarkerHandlingCallback(MarkerHandlingCallbackBase):
         super().__init__("marker_handling")
         self.logger = logging.getLogger(__name__)
         self.error_handler = get_error_handler()
-        self.state_manager = get_app_state_manager()
-
-        # Define marker constants for easier access
-        self.BLUE_MARKER = MAP_CONFIG.BLUE_MARKER_URL
-        self.GREEN_MARKER = MAP_CONFIG.GREEN_MARKER_URL
 
     def register(self, app):
         """Register all marker handling callbacks with the Dash app."""
@@ -48,32 +44,16 @@ class MarkerHandlingCallback(MarkerHandlingCallbackBase):
         @app.callback(
             [
                 Output("section-plot-output", "children"),
-                Output("borehole-markers", "children", allow_duplicate=True),
-            ],
-            [
-                Input(
-                    {"type": "borehole-marker", "index": dash.dependencies.ALL},
-                    "n_clicks",
-                )
-            ],
-            [
-                State("borehole-data-store", "data"),
-                State("borehole-markers", "children"),
-                State("show-labels-checkbox", "value"),
+                Output("dataset-sync-store", "data", allow_duplicate=True),
             ],
+            [Input("marker-click-store", "data")],
+            [State("show-labels-checkbox", "value")],
             prevent_initial_call=True,
         )
-        def marker_click_handler(
-            marker_clicks, stored_borehole_data, current_markers, show_labels_value
-        ):
+        def marker_click_handler(marker_click, show_labels_value):
             """Handle marker clicks to generate borehole logs"""
             try:
-                return self._handle_marker_click_logic(
-                    marker_clicks,
-                    stored_borehole_data,
-                    current_markers,
-                    show_labels_value,
-                )
+                return self._handle_marker_click_logic(marker_click, show_labels_value)
             except Exception as e:
                 error_msg = f"Error in marker click handler: {str(e)}"
                 self.logger.error(error_msg)
@@ -82,77 +62,75 @@ class MarkerHandlingCallback(MarkerHandlingCallbackBase):
                 )
                 return html.Div(f"Error generating borehole log: {e}"), no_update
 
-    def _handle_marker_click_logic(
-        self, marker_clicks, stored_borehole_data, current_markers, show_labels_value
-    ):
-        """Core logic for handling marker clicks."""
+    def _handle_marker_click_logic(self, marker_click, show_labels_value):
+        """Core logic for handling marker clicks.
+
+        ``marker_click`` is the payload written by the clientside click relay
+        (``{"loca_id", "dataset_id", "timestamp"}``). Marker colours are
+        updated in the browser; the AGS data is taken from the session's
+        server-side copy of the dataset. If this process does not hold the
+        dataset (restart, eviction, another worker), a restore is requested
+        through ``dataset-sync-store`` and the click is replayed afterwards.
+        """
         self.logger.info("=== MARKER CLICK CALLBACK ===")
-        self.logger.info(f"Triggered by: {dash.callback_context.triggered}")
         self.logger.info(f"Show labels checkbox value: {show_labels_value}")
 
-        # Check if any marker was clicked
-        if not marker_clicks or all(
-            clicks is None or clicks == 0 for clicks in marker_clicks
-        ):
-            self.logger.info("No marker clicks detected")
-            return no_update, no_update
-
-        # Find which marker was clicked (latest click)
-        clicked_index = self._find_clicked_marker_index(marker_clicks)
-
-        if clicked_index is None:
+        borehole_id = self._get_clicked_borehole_id(marker_click)
+        if borehole_id is None:
             self.logger.info("No valid marker click found")
             return no_update, no_update
 
-        self.logger.info(f"Marker {clicked_index} was clicked")
-
-        # Get borehole data
-        if not stored_borehole_data:
-            self.logger.warning("No borehole data available")
-            return html.Div("No borehole data available"), no_update
+        self.logger.info(f"Marker {borehole_id} was clicked")
+
+        dataset_id = marker_click.get("dataset_id")
+        dataset = get_session_state_store().find_dataset(dataset_id)
+        if dataset is None:
+            if not dataset_id or marker_click.get("restored"):
+                self.logger.warning(f"No borehole data available for {dataset_id}")
+                return html.Div("No borehole data available"), no_update
+            self.logger.info(f"Dataset {dataset_id} not held here, requesting restore")
+            return (
+                html.Div(f"Loading borehole log for {borehole_id}..."),
+                {"dataset_id": dataset_id, "click": marker_click},
+            )
 
-        loca_df = pd.DataFrame(stored_borehole_data["loca_df"])
-        if clicked_index >= len(loca_df):
-            self.logger.warning(f"Invalid marker index: {clicked_index}")
+        if not self._is_known_borehole(dataset, borehole_id):
+            self.logger.warning(f"Unknown borehole clicked: {borehole_id}")
             return html.Div("Invalid borehole selected"), no_update
 
-        # Get the clicked borehole
-        clicked_borehole = loca_df.iloc[clicked_index]
-        borehole_id = clicked_borehole["LOCA_ID"]
         self.logger.info(f"Generating borehole log for: {borehole_id}")
 
         # Generate borehole log
         log_output = self._generate_borehole_log_display(
-            stored_borehole_data, borehole_id, show_labels_value
+            dataset.filename_map, dataset.dataset_id, borehole_id, show_labels_value
         )
 
-        # Update marker colors
-        updated_markers = self._update_marker_colors(current_markers, clicked_index)
+        return log_output, no_update
 
-        return log_output, updated_markers
+    def _get_clicked_borehole_id(self, marker_click):
+        """Extract the clicked LOCA_ID from the click relay payload."""
+        if not isinstance(marker_click, dict):
+            return None
 
-    def _find_clicked_marker_index(self, marker_clicks):
-        """Find which marker was clicked based on click counts."""
-        clicked_index = None
-        max_clicks = 0
+        loca_id = marker_click.get("loca_id")
+        if loca_id is None or str(loca_id).strip() == "":
+            return None
 
-        for i, clicks in enumerate(marker_clicks):
-            if clicks and clicks > max_clicks:
-                max_clicks = clicks
-                clicked_index = i
+        return str(loca_id)
 
-        return clicked_index
+    def _is_known_borehole(self, dataset, borehole_id):
+        """Check the clicked LOCA_ID against the dataset's presentation index."""
+        presentation = get_presentation_table(dataset.loca_df, dataset.dataset_id)
+        return borehole_id in presentation.index
 
     def _generate_borehole_log_display(
-        self, stored_borehole_data, borehole_id, show_labels_value
+        self, filename_map, dataset_id, borehole_id, show_labels_value
     ):
         """Generate the borehole log display for the selected borehole."""
         try:
             # Get AGS content
-            filename_map = stored_borehole_data["filename_map"]
-            combined_content = ""
-            for filename, content in filename_map.items():
-                combined_content += content + "\n"
+            ags_data = list(filename_map.items())
+            dataset_id = dataset_id or compute_dataset_id(filename_map)
 
             # Get if show_labels is enabled
             show_labels = "show_labels" in (show_labels_value or [])
@@ -160,17 +138,27 @@ class MarkerHandlingCallback(MarkerHandlingCallbackBase):
 
             # Use larger figure size and proper aspect ratio for borehole logs
             # Borehole logs are typically taller than they are wide (portrait orientation)
-            # The function returns a list of base64-encoded images
-            images = plot_borehole_log_from_ags_content(
-                combined_content,
+            # Pages are cached per (dataset, borehole, options); misses render
+            # page by page in the render worker pool, off the request thread's GIL
+            image_srcs = log_page_srcs(
+                dataset_id,
                 borehole_id,
-                show_labels=show_labels,
-                fig_height=11.69,  # A4 height
-                fig_width=8.27,  # A4 width
+                lambda: render_borehole_log_from_ags(
+                    ags_data,
+                    borehole_id,
+                    show_labels=show_labels,
+                    fig_height=PLOT_CONFIG.BOREHOLE_LOG_HEIGHT,
+                    fig_width=PLOT_CONFIG.BOREHOLE_LOG_WIDTH,
+                    dpi=PLOT_CONFIG.LOG_DISPLAY_DPI,
+                    data_key=dataset_id,
+                    executor=get_render_worker_pool(),
+                ),
+                show_labels,
+                PLOT_CONFIG.LOG_DISPLAY_DPI,
             )
 
-            if images and len(images) > 0:
-                return self._create_borehole_log_html(borehole_id, images)
+            if image_srcs:
+                return self._create_borehole_log_html(borehole_id, image_srcs)
             else:
                 return html.Div(
                     f"Could not generate borehole log for {borehole_id}",
@@ -185,7 +173,7 @@ class MarkerHandlingCallback(MarkerHandlingCallbackBase):
             )
 
     def _create_borehole_log_html(self, borehole_id, images):
-        """Create HTML display for borehole log images."""
+        """Create HTML display for borehole log pages (image URLs)."""
         # Create a custom style that preserves aspect ratio
         preserved_aspect_style = {
             "width": "66vw",  # 2/3 of viewport width for the image itself
@@ -199,7 +187,7 @@ class MarkerHandlingCallback(MarkerHandlingCallbackBase):
 
         # Create image elements for each page
         image_elements = []
-        for i, img_b64 in enumerate(images):
+        for i, img_src in enumerate(images):
             page_title = f"Page {i + 1} of {len(images)}" if len(images) > 1 else ""
             if page_title:
                 image_elements.append(
@@ -211,7 +199,7 @@ class MarkerHandlingCallback(MarkerHandlingCallbackBase):
 
             image_elements.append(
                 html.Img(
-                    src=f"data:image/png;base64,{img_b64}",
+                    src=img_src,
                     style=preserved_aspect_style,
                 )
             )
@@ -241,38 +229,6 @@ class MarkerHandlingCallback(MarkerHandlingCallbackBase):
             },
         )
 
-    def _update_marker_colors(self, current_markers, clicked_index):
-        """Update marker colors - make clicked marker green, others blue."""
-        updated_markers = []
-
-        if current_markers:
-            for i, marker in enumerate(current_markers):
-                if marker and marker.get("props"):
-                    # Copy the marker
-                    new_marker = marker.copy()
-                    new_props = marker["props"].copy()
-
-                    # Update icon color based on whether this marker was clicked
-                    if i == clicked_index:
-                        # Make clicked marker green
-                        if "icon" in new_props:
-                            new_icon = new_props["icon"].copy()
-                            new_icon["iconUrl"] = self.GREEN_MARKER
-                            new_props["icon"] = new_icon
-                    else:
-                        # Make other markers blue
-                        if "icon" in new_props:
-                            new_icon = new_props["icon"].copy()
-                            new_icon["iconUrl"] = self.BLUE_MARKER
-                            new_props["icon"] = new_icon
-
-                    new_marker["props"] = new_props
-                    updated_markers.append(new_marker)
-                else:
-                    updated_markers.append(marker)
-
-        return updated_markers
-
     def create_selection_shape_visual(self, feature):
         """Create a visual representation of a drawn selection shape for display."""
         try:
@@ -7,26 +7,36 @@ refactored from the original monolithic callbacks_split.py file.
 Responsibilities:
 - Section plot generation from AGS data
 - Plot download functionality
-- Coordinate transformation for polyline sections
-- Memory management for matplotlib figures
+- Polyline section lines
+- Caching of rendered section images, served by URL
+- Off-thread rendering (background callback plus render worker pool)
+- Dropping preview renders superseded by a newer selection
 """
 
 import logging
-import io
-import base64
 from datetime import datetime
 import dash
 from dash import Output, Input, State, dcc, html
-import pandas as pd
-import matplotlib.pyplot as plt
 
 from .base import PlotGenerationCallbackBase
-from state_management import get_app_state_manager
 from error_handling import get_error_handler, ErrorCategory
-from coordinate_service import get_coordinate_service
-import config
-from app_constants import PLOT_CONFIG
-from section import plot_section_from_ags_content
+from borehole_presentation import compute_dataset_id
+import config_modules as config
+from app_constants import PERFORMANCE_CONFIG, PLOT_CONFIG
+from loading_indicators import create_plot_loading
+from render_workers import (
+    RenderCancelled,
+    RenderQueueFullError,
+    get_background_callback_manager,
+    get_render_generations,
+    get_render_worker_pool,
+)
+from state_management import get_current_session_id
+from section import (
+    get_section_render_cache,
+    make_render_key,
+    render_section_image,
+)
 
 
 class PlotGenerationCallback(PlotGenerationCallbackBase):
@@ -36,8 +46,6 @@ class PlotGenerationCallback(PlotGenerationCallbackBase):
         super().__init__("plot_generation")
         self.logger = logging.getLogger(__name__)
         self.error_handler = get_error_handler()
-        self.state_manager = get_app_state_manager()
-        self.coordinate_service = get_coordinate_service()
 
     def register(self, app):
         """Register all plot generation callbacks with the Dash app."""
@@ -62,15 +70,31 @@ class PlotGenerationCallback(PlotGenerationCallbackBase):
             ],
             [
                 State("borehole-data-store", "data"),
+                State("polyline-store", "data"),
+                State("download-format-selector", "value"),
             ],
             prevent_initial_call=True,
+            background=True,
+            manager=get_background_callback_manager(),
+            progress=[Output("section-plot-progress", "children")],
+            progress_default=[None],
+            cache_ignore_triggered=False,
+            interval=PERFORMANCE_CONFIG.BACKGROUND_CALLBACK_POLL_MS,
         )
         def handle_plot_generation(
-            checked_ids, show_labels_value, download_clicks, stored_borehole_data
+            set_progress,
+            checked_ids,
+            show_labels_value,
+            download_clicks,
+            stored_borehole_data,
+            polyline_data,
+            download_format,
         ):
-            """Handle plot generation and downloads"""
+            """Handle plot generation and downloads (runs as a background job)"""
             self.logger.info("=== PLOT GENERATION CALLBACK ===")
-            self.logger.info(f"Triggered by: {dash.callback_context.triggered}")
+            ctx = dash.callback_context
+            self.logger.info(f"Triggered by: {ctx.triggered}")
+            triggered = ctx.triggered[0]["prop_id"] if ctx.triggered else None
 
             try:
                 return self._handle_plot_generation_logic(
@@ -78,6 +102,10 @@ class PlotGenerationCallback(PlotGenerationCallbackBase):
                     show_labels_value,
                     download_clicks,
                     stored_borehole_data,
+                    polyline_data,
+                    triggered,
+                    set_progress,
+                    download_format,
                 )
             except Exception as e:
                 error_msg = f"Error in plot generation callback: {str(e)}"
@@ -88,38 +116,96 @@ class PlotGenerationCallback(PlotGenerationCallbackBase):
                 return None, None, None
 
     def _handle_plot_generation_logic(
-        self, checked_ids, show_labels_value, download_clicks, stored_borehole_data
+        self,
+        checked_ids,
+        show_labels_value,
+        download_clicks,
+        stored_borehole_data,
+        polyline_data=None,
+        triggered=None,
+        set_progress=None,
+        download_format=None,
     ):
-        """Core logic for plot generation."""
-        ctx = dash.callback_context
-        triggered = ctx.triggered[0]["prop_id"] if ctx.triggered else None
-
+        """
+        Core logic for plot generation.
+
+        Input changes produce a fast, reduced-detail preview; the download
+        button produces a separately cached high-resolution file in the
+        selected format. Cache misses are rendered in the render worker pool;
+        progress is reported through set_progress when given. Each preview
+        supersedes earlier previews of the same session, which are dropped
+        before drawing or encoding.
+        """
         if not stored_borehole_data or not checked_ids:
             return None, None, None
 
         show_labels = "show_labels" in (show_labels_value or [])
 
         try:
-            # Get AGS content
             filename_map = stored_borehole_data["filename_map"]
-            combined_content = ""
-            for filename, content in filename_map.items():
-                combined_content += content + "\n"
+            ags_data = list(filename_map.items())
+            dataset_id = stored_borehole_data.get("dataset_id")
+            if not dataset_id:
+                dataset_id = compute_dataset_id(filename_map)
 
             # Generate section plot with polyline data if available
-            section_line = self._process_polyline_data(stored_borehole_data)
+            section_line = self._process_polyline_data(polyline_data)
 
-            fig = plot_section_from_ags_content(
-                combined_content,
+            self._report_progress(set_progress, "preparing")
+            render_args = (
+                ags_data,
+                dataset_id,
                 checked_ids,
-                section_line=section_line,
-                show_labels=show_labels,
+                section_line,
+                show_labels,
+                set_progress,
             )
 
-            if fig:
-                return self._process_plot_figure(fig, triggered, download_clicks)
-            else:
-                return None, None, None
+            # High-resolution output is only rendered when downloading
+            if download_clicks and "download-section-btn.n_clicks" in (triggered or ""):
+                image_format = (
+                    download_format
+                    if download_format in PLOT_CONFIG.DOWNLOAD_FORMATS
+                    else PLOT_CONFIG.DEFAULT_DOWNLOAD_FORMAT
+                )
+                _, data = self._render_section(
+                    *render_args,
+                    dpi=PLOT_CONFIG.DOWNLOAD_DPI,
+                    image_format=image_format,
+                    preview=False,
+                )
+                self._report_progress(set_progress, "finalizing")
+                return (
+                    dash.no_update,
+                    dash.no_update,
+                    dcc.send_bytes(data, f"section_plot.{image_format}"),
+                )
+
+            ticket = get_render_generations().begin(
+                ("section_preview", get_current_session_id())
+            )
+            render_key, img_bytes = self._render_section(
+                *render_args,
+                dpi=PLOT_CONFIG.PREVIEW_DPI,
+                image_format="png",
+                preview=True,
+                ticket=ticket,
+            )
+            self._report_progress(set_progress, "finalizing")
+            return self._build_section_image(render_key, img_bytes), None, None
+
+        except RenderCancelled:
+            self.logger.info("Section preview superseded by a newer selection")
+            get_render_generations().record_cancelled()
+            return dash.no_update, dash.no_update, dash.no_update
+
+        except RenderQueueFullError as e:
+            self.logger.warning(f"Section render refused: {e}")
+            busy = html.Div(
+                "⏳ The server is busy rendering other plots. Please try again shortly.",
+                style={"textAlign": "center", "color": "orange"},
+            )
+            return busy, None, None
 
         except Exception as e:
             self.logger.error(f"Error generating plot: {e}")
@@ -128,90 +214,113 @@ class PlotGenerationCallback(PlotGenerationCallbackBase):
             )
             return None, None, None
 
-    def _process_polyline_data(self, stored_borehole_data):
-        """Process polyline data for section generation."""
-        section_line = None
+    @staticmethod
+    def _report_progress(set_progress, stage):
+        """Show a plot loading indicator for the given stage, if supported."""
+        if set_progress is not None:
+            set_progress([create_plot_loading("section", stage)])
+
+    def _process_polyline_data(self, polyline_data):
+        """
+        Get the section line from polyline-store data.
+
+        The section plotter projects boreholes onto the line itself, so the
+        polyline is passed through as (lat, lon) pairs.
+        """
+        if polyline_data and polyline_data.get("last_polyline"):
+            section_line = [
+                (float(lat), float(lon)) for lat, lon in polyline_data["last_polyline"]
+            ]
+            self.logger.info(f"Using polyline section with {len(section_line)} points")
+            return section_line
+        return None
+
+    def _render_section(
+        self,
+        ags_data,
+        dataset_id,
+        checked_ids,
+        section_line,
+        show_labels,
+        set_progress,
+        dpi,
+        image_format,
+        preview,
+        ticket=None,
+    ):
+        """
+        Get an encoded section image from the render cache, rendering in the
+        worker pool on a miss.
+
+        Previews skip hatching (unless PLOT_CONFIG.PREVIEW_HATCHING) and the
+        tight-bounding-box layout pass; full renders include both.
+
+        Returns:
+            tuple: (render key, image bytes)
+
+        Raises:
+            RenderCancelled: If the ticket was superseded
+        """
+        render_key = make_render_key(
+            dataset_id,
+            checked_ids,
+            section_line,
+            show_labels,
+            dpi,
+            image_format,
+            "preview" if preview else "full",
+        )
 
-        if "last_polyline" in stored_borehole_data:
-            # Convert polyline coordinates to format expected by section_plot
-            polyline_coords = stored_borehole_data["last_polyline"]
+        def render():
+            if ticket is not None:
+                ticket.check()
+            self._report_progress(set_progress, "rendering")
+            return get_render_worker_pool().run(
+                render_section_image,
+                ags_data,
+                section_line=section_line,
+                show_labels=show_labels,
+                dpi=dpi,
+                image_format=image_format,
+                selected_boreholes=checked_ids,
+                tight=not preview,
+                hatching=PLOT_CONFIG.PREVIEW_HATCHING if preview else True,
+                data_key=dataset_id,
+                ticket=ticket,
+            )
 
-            # Convert polyline from geographic coordinates (lat/lon) to projected coordinates (easting/northing)
-            # to match the coordinate system used by LOCA_NATE/LOCA_NATN in the borehole data
+        while True:
             try:
-                from shapely.geometry import LineString
-
-                # Create a line from the polyline coordinates
-                line_points = [(lon, lat) for lat, lon in polyline_coords]
-                line = LineString(line_points)
-
-                # Extract lat/lon coordinates for transformation
-                lats, lons = zip(*[(lat, lon) for lat, lon in polyline_coords])
-
-                # Transform to UTM using coordinate service
-                utm_x, utm_y, utm_crs = self.coordinate_service.transform_wgs84_to_utm(
-                    lons, lats
-                )
-
-                # Create section line as (easting, northing) pairs
-                section_line = list(zip(utm_x, utm_y))
-
-                self.logger.info(
-                    f"Using polyline section with {len(section_line)} points"
+                return render_key, get_section_render_cache().get_or_render(
+                    render_key, render
                 )
-                self.logger.info(f"Polyline coords (lat/lon): {polyline_coords[:2]}...")
-                self.logger.info(
-                    f"Section line coords (UTM {utm_crs}): {section_line[:2]}..."
-                )
-
-            except Exception as e:
-                self.logger.error(f"Error converting polyline coordinates: {e}")
-                # Fallback to original method if conversion fails
-                section_line = [(lon, lat) for lat, lon in polyline_coords]
-                self.logger.info(
-                    f"Using fallback polyline section with {len(section_line)} points"
-                )
-
-        return section_line
-
-    def _process_plot_figure(self, fig, triggered, download_clicks):
-        """Process the matplotlib figure into display and download formats."""
-        try:
-            # Convert to image with higher DPI for sharper text
-            buf = io.BytesIO()
-            fig.savefig(
-                buf,
-                format="png",
-                bbox_inches="tight",
-                dpi=PLOT_CONFIG.PREVIEW_DPI,
-            )
-            buf.seek(0)
-            img_bytes = buf.read()
-            img_b64 = base64.b64encode(img_bytes).decode("utf-8")
-
-            # Create a custom style that preserves aspect ratio
-            preserved_aspect_style = {
-                **config.SECTION_PLOT_CENTER_STYLE,  # Copy base styles
-                "height": "auto",  # Let height be determined by width and aspect ratio
-                "maxHeight": "80vh",  # Maximum height (80% of viewport height)
-                "objectFit": "contain",  # Ensure the whole image is visible
-            }
-
-            section_plot = html.Img(
-                src=f"data:image/png;base64,{img_b64}",
-                style=preserved_aspect_style,
-            )
-
-            # Handle download
-            download_data = None
-            if "download-section-btn.n_clicks" in triggered and download_clicks:
-                download_data = dcc.send_bytes(img_bytes, "section_plot.png")
-
-            return section_plot, None, download_data
-
-        finally:
-            # MEMORY LEAK FIX: Always close the figure, even if an exception occurs
-            plt.close(fig)
+            except RenderCancelled:
+                # A coalesced render started by another, superseded request
+                # was dropped; render again if this request is still current
+                if ticket is None or not ticket.is_current():
+                    raise
+
+    def _build_section_image(self, render_key, img_bytes):
+        """
+        Build the section preview image component.
+
+        The image is referenced by its render-cache URL rather than embedded
+        as a base64 data URI.
+        """
+        src = get_section_render_cache().image_src(render_key, img_bytes)
+
+        # Create a custom style that preserves aspect ratio
+        preserved_aspect_style = {
+            **config.SECTION_PLOT_CENTER_STYLE,  # Copy base styles
+            "height": "auto",  # Let height be determined by width and aspect ratio
+            "maxHeight": "80vh",  # Maximum height (80% of viewport height)
+            "objectFit": "contain",  # Ensure the whole image is visible
+        }
+
+        return html.Img(
+            src=src,
+            style=preserved_aspect_style,
+        )
 
     def _register_shape_clearing_callback(self, app):
         """Register callback to explicitly clear shapes."""
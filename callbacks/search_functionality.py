@@ -16,11 +16,35 @@ from dash import Output, Input, State, html, no_update
 import pandas as pd
 
 from .base import SearchCallbackBase
-from state_management import get_app_state_manager
 from error_handling import get_error_handler, ErrorCategory
 from coordinate_service import get_coordinate_service
-from borehole_log import plot_borehole_log_from_ags_content  # Use compatibility wrapper
-import config
+from borehole_presentation import compute_dataset_id, get_presentation_table
+from state_management import derived_view, get_borehole_frame
+from borehole_log import render_borehole_log_from_ags
+from render_workers import get_render_worker_pool
+from app_constants import PLOT_CONFIG
+from section.render_cache import log_page_srcs
+import config_modules as config
+
+
+@derived_view("search_options", depends_on=("dataset_id",))
+def build_search_options(loca_df, dataset_id=None):
+    """Build search dropdown options, sorted by label (memoized per dataset)."""
+    # Labels and sort order are precomputed once per dataset
+    presentation = get_presentation_table(loca_df, dataset_id).sort_values("sort_key")
+
+    return [
+        {
+            "label": label,
+            "value": borehole_id,  # LOCA_ID, independent of row position
+            "search": search_key,  # For case-insensitive search
+        }
+        for borehole_id, label, search_key in zip(
+            presentation.index,
+            presentation["search_label"],
+            presentation["search_key"],
+        )
+    ]
 
 
 class SearchFunctionalityCallback(SearchCallbackBase):
@@ -30,7 +54,6 @@ class SearchFunctionalityCallback(SearchCallbackBase):
         super().__init__("search_functionality")
         self.logger = logging.getLogger(__name__)
         self.error_handler = get_error_handler()
-        self.state_manager = get_app_state_manager()
         self.coordinate_service = get_coordinate_service()
 
     def register(self, app):
@@ -69,55 +92,15 @@ class SearchFunctionalityCallback(SearchCallbackBase):
             self.logger.info("No borehole data available for search")
             return [], None
 
-        loca_df = pd.DataFrame(stored_borehole_data["loca_df"])
+        loca_df = get_borehole_frame(stored_borehole_data)
 
         if loca_df.empty:
             self.logger.info("Empty borehole dataframe")
             return [], None
 
-        # Create options for dropdown
-        options = []
-        for i, row in loca_df.iterrows():
-            borehole_id = str(row["LOCA_ID"]).strip()
-            ground_level = row.get("LOCA_GL", "N/A")
-            total_depth = row.get("LOCA_FDEP", "N/A")
-
-            # Format additional info for display
-            info_parts = []
-            if (
-                ground_level != "N/A"
-                and ground_level is not None
-                and str(ground_level).strip()
-            ):
-                try:
-                    gl_val = float(ground_level)
-                    info_parts.append(f"GL: {gl_val:.2f}m")
-                except (ValueError, TypeError):
-                    pass
-
-            if (
-                total_depth != "N/A"
-                and total_depth is not None
-                and str(total_depth).strip()
-            ):
-                try:
-                    td_val = float(total_depth)
-                    info_parts.append(f"Depth: {td_val:.2f}m")
-                except (ValueError, TypeError):
-                    pass
-
-            info_str = f" ({', '.join(info_parts)})" if info_parts else ""
-
-            options.append(
-                {
-                    "label": f"{borehole_id}{info_str}",
-                    "value": i,  # Use the DataFrame index as the value
-                    "search": borehole_id.lower(),  # For case-insensitive search
-                }
-            )
-
-        # Sort options alphabetically by borehole ID
-        options.sort(key=lambda x: x["label"])
+        options = build_search_options(
+            loca_df, dataset_id=stored_borehole_data.get("dataset_id")
+        )
 
         self.logger.info(f"Created {len(options)} search options")
         return options, None
@@ -160,7 +143,7 @@ class SearchFunctionalityCallback(SearchCallbackBase):
         )
         def handle_search_go(
             n_clicks,
-            selected_borehole_index,
+            selected_borehole_id,
             stored_borehole_data,
             show_labels_value,
             current_markers,
@@ -180,7 +163,7 @@ class SearchFunctionalityCallback(SearchCallbackBase):
 
             try:
                 return self._handle_search_go_logic(
-                    selected_borehole_index,
+                    selected_borehole_id,
                     stored_borehole_data,
                     show_labels_value,
                     current_markers,
@@ -199,13 +182,13 @@ class SearchFunctionalityCallback(SearchCallbackBase):
 
     def _handle_search_go_logic(
         self,
-        selected_borehole_index,
+        selected_borehole_id,
         stored_borehole_data,
         show_labels_value,
         current_markers,
     ):
         """Core logic for handling search go functionality."""
-        if selected_borehole_index is None:
+        if selected_borehole_id is None:
             feedback = html.Div(
                 "Please select a borehole from the dropdown.",
                 style={"color": "orange", "fontWeight": "bold"},
@@ -220,9 +203,13 @@ class SearchFunctionalityCallback(SearchCallbackBase):
             return (feedback, no_update, no_update, no_update, no_update, None)
 
         # Get the borehole data
-        loca_df = pd.DataFrame(stored_borehole_data["loca_df"])
+        loca_df = get_borehole_frame(stored_borehole_data)
 
-        if selected_borehole_index >= len(loca_df):
+        matches = loca_df[
+            loca_df["LOCA_ID"].astype(str).str.strip() == str(selected_borehole_id)
+        ]
+
+        if matches.empty:
             feedback = html.Div(
                 "Selected borehole not found in data.",
                 style={"color": "red", "fontWeight": "bold"},
@@ -230,7 +217,7 @@ class SearchFunctionalityCallback(SearchCallbackBase):
             return (feedback, no_update, no_update, no_update, no_update, None)
 
         # Get the selected borehole
-        selected_borehole = loca_df.iloc[selected_borehole_index]
+        selected_borehole = matches.iloc[0]
         borehole_id = str(selected_borehole["LOCA_ID"]).strip()
 
         self.logger.info(f"Searching for borehole: {borehole_id}")
@@ -289,24 +276,34 @@ class SearchFunctionalityCallback(SearchCallbackBase):
         try:
             # Get AGS content
             filename_map = stored_borehole_data["filename_map"]
-            combined_content = ""
-            for filename, content in filename_map.items():
-                combined_content += content + "\n"
+            ags_data = list(filename_map.items())
+            dataset_id = stored_borehole_data.get("dataset_id") or compute_dataset_id(
+                filename_map
+            )
 
             show_labels = "show_labels" in (show_labels_value or [])
 
-            # Generate borehole log - this returns base64 images, not a figure
-            images = plot_borehole_log_from_ags_content(
-                combined_content, borehole_id, show_labels=show_labels
+            # Borehole log pages are cached per (dataset, borehole, options);
+            # misses render page by page in the render worker pool
+            image_srcs = log_page_srcs(
+                dataset_id,
+                borehole_id,
+                lambda: render_borehole_log_from_ags(
+                    ags_data,
+                    borehole_id,
+                    show_labels=show_labels,
+                    dpi=PLOT_CONFIG.LOG_DISPLAY_DPI,
+                    data_key=dataset_id,
+                    executor=get_render_worker_pool(),
+                ),
+                show_labels,
+                PLOT_CONFIG.LOG_DISPLAY_DPI,
             )
 
-            if images and len(images) > 0:
-                # Use the first image for the log plot (already base64 encoded)
-                img_b64 = images[0]
-
-                # Create image component
+            if image_srcs:
+                # Use the first page for the log plot
                 log_plot = html.Img(
-                    src=f"data:image/png;base64,{img_b64}",
+                    src=image_srcs[0],
                     style=config.LOG_PLOT_CENTER_STYLE,
                 )
 
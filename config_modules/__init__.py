@@ -50,6 +50,7 @@ __all__ = [
     "CHECKBOX_SECTION_TITLE",
     "FILE_BREAKDOWN_TITLE",
     "FILE_UPLOAD_STATUS_TITLE",
+    "SEARCH_ZOOM_LEVEL",
     "UPLOAD_PROMPT",
     "CHECKBOX_INSTRUCTIONS",
     "SUCCESS_UPLOAD_MESSAGE",
@@ -59,6 +60,8 @@ __all__ = [
     "NO_BOREHOLES_MESSAGE",
     "NO_SELECTION_MESSAGE",
     "DOWNLOAD_BUTTON_LABEL",
+    "LOG_EXPORT_BUTTON_LABEL",
+    "LOG_EXPORT_FORMAT_LABELS",
     "LABELS_CHECKBOX_LABEL",
     "FILE_UPLOAD_SUCCESS_PREFIX",
     "FILE_UPLOAD_SUCCESS_SUFFIX",
@@ -119,6 +122,8 @@ __all__ = [
     "BUTTON_CENTER_STYLE",
     "BUTTON_RIGHT_STYLE",
     "CHECKBOX_CONTROL_STYLE",
+    "SECTION_PLOT_CENTER_STYLE",
+    "LOG_PLOT_CENTER_STYLE",
     # Colors and styling
     "PRIMARY_COLOR",
     "ERROR_COLOR",
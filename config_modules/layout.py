@@ -16,6 +16,10 @@ CHECKBOX_SECTION_TITLE = "Selected Boreholes:"
 FILE_BREAKDOWN_TITLE = "📁 File Breakdown"
 FILE_UPLOAD_STATUS_TITLE = "📊 File Upload Status"
 
+# ===== MAP NAVIGATION =====
+# Zoom level used when navigating to a searched borehole
+SEARCH_ZOOM_LEVEL = 16
+
 # ===== ALIGNMENT CONFIGURATION =====
 # Layout alignment options
 ALIGN_LEFT = "left"
@@ -62,6 +66,8 @@ NO_SELECTION_MESSAGE = "No boreholes selected for plotting."
 
 # Button labels
 DOWNLOAD_BUTTON_LABEL = "Download Section Plot"
+LOG_EXPORT_BUTTON_LABEL = "Download Borehole Logs"
+LOG_EXPORT_FORMAT_LABELS = {"zip": "ZIP of PDFs", "pdf": "Combined PDF"}
 LABELS_CHECKBOX_LABEL = "Labels"
 
 # File upload messages
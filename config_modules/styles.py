@@ -196,3 +196,18 @@ CHECKBOX_CONTROL_STYLE = {
     "marginBottom": STANDARD_MARGIN_BOTTOM,
     "textAlign": TEXT_ALIGN_LEFT,
 }
+
+# ===== PLOT IMAGE STYLES =====
+SECTION_PLOT_CENTER_STYLE = {
+    "width": "100%",
+    "display": "block",
+    "margin": "0 auto",
+}
+
+LOG_PLOT_CENTER_STYLE = {
+    "width": "66vw",
+    "height": "auto",
+    "display": "block",
+    "margin": "0 auto",
+    "objectFit": "contain",
+}
@@ -47,6 +47,8 @@ import dash_leaflet as dl
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+from borehole_presentation import build_presentation_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -110,6 +112,7 @@ class LazyMarkerManager:
         viewport: Optional[ViewportBounds] = None,
         selected_ids: Optional[List[str]] = None,
         force_all: bool = False,
+        presentation: Optional[pd.DataFrame] = None,
     ) -> List[dl.Marker]:
         """
         Get markers that should be visible based on viewport and zoom level.
@@ -119,6 +122,8 @@ class LazyMarkerManager:
             viewport: Current map viewport bounds and zoom
             selected_ids: List of selected borehole IDs (always visible)
             force_all: Force rendering all markers (for small datasets)
+            presentation: Precomputed presentation table for the dataset
+                (built on the fly if not provided)
 
         Returns:
             List of Dash Leaflet marker components
@@ -127,12 +132,17 @@ class LazyMarkerManager:
             if loca_df.empty:
                 return []
 
+            if presentation is None:
+                presentation = build_presentation_table(loca_df)
+
             # For small datasets, render all markers
             if len(loca_df) <= 50 or force_all:
                 logger.info(
                     f"Rendering all {len(loca_df)} markers (small dataset or forced)"
                 )
-                return self._create_all_markers(loca_df, selected_ids or [])
+                return self._create_all_markers(
+                    loca_df, selected_ids or [], presentation
+                )
 
             # Use viewport culling for large datasets
             if viewport is None:
@@ -141,7 +151,9 @@ class LazyMarkerManager:
                 logger.info(
                     f"No viewport info - rendering first {len(limited_df)} markers"
                 )
-                return self._create_all_markers(limited_df, selected_ids or [])
+                return self._create_all_markers(
+                    limited_df, selected_ids or [], presentation
+                )
 
             # Filter markers by viewport
             visible_df = self._filter_by_viewport(loca_df, viewport)
@@ -149,15 +161,19 @@ class LazyMarkerManager:
             # Apply clustering if needed
             if viewport.zoom < self.clustering_zoom_threshold:
                 return self._create_clustered_markers(
-                    visible_df, viewport, selected_ids or []
+                    visible_df, viewport, selected_ids or [], presentation
                 )
             else:
-                return self._create_viewport_markers(visible_df, selected_ids or [])
+                return self._create_viewport_markers(
+                    visible_df, selected_ids or [], presentation
+                )
 
         except Exception as e:
             logger.error(f"Error in get_visible_markers: {e}", exc_info=True)
             # Fallback to first 20 markers on error
-            return self._create_all_markers(loca_df.head(20), selected_ids or [])
+            return self._create_all_markers(
+                loca_df.head(20), selected_ids or [], presentation
+            )
 
     def _filter_by_viewport(
         self, loca_df: pd.DataFrame, viewport: ViewportBounds
@@ -199,7 +215,10 @@ class LazyMarkerManager:
         return visible_df
 
     def _create_viewport_markers(
-        self, df: pd.DataFrame, selected_ids: List[str]
+        self,
+        df: pd.DataFrame,
+        selected_ids: List[str],
+        presentation: Optional[pd.DataFrame] = None,
     ) -> List[dl.Marker]:
         """Create markers for viewport-filtered data."""
 
@@ -231,10 +250,14 @@ class LazyMarkerManager:
         else:
             final_df = df
 
-        return self._create_all_markers(final_df, selected_ids)
+        return self._create_all_markers(final_df, selected_ids, presentation)
 
     def _create_clustered_markers(
-        self, df: pd.DataFrame, viewport: ViewportBounds, selected_ids: List[str]
+        self,
+        df: pd.DataFrame,
+        viewport: ViewportBounds,
+        selected_ids: List[str],
+        presentation: Optional[pd.DataFrame] = None,
     ) -> List[dl.Marker]:
         """Create clustered markers for zoomed-out views."""
 
@@ -242,8 +265,11 @@ class LazyMarkerManager:
         selected_df = (
             df[df["LOCA_ID"].isin(selected_ids)] if selected_ids else pd.DataFrame()
         )
+        if presentation is None:
+            presentation = build_presentation_table(df)
+
         selected_markers = (
-            self._create_all_markers(selected_df, selected_ids)
+            self._create_all_markers(selected_df, selected_ids, presentation)
             if not selected_df.empty
             else []
         )
@@ -253,7 +279,9 @@ class LazyMarkerManager:
 
         if len(non_selected_df) <= 20:
             # Too few to cluster
-            non_selected_markers = self._create_all_markers(non_selected_df, [])
+            non_selected_markers = self._create_all_markers(
+                non_selected_df, [], presentation
+            )
             return selected_markers + non_selected_markers
 
         # Create clusters using simple grid-based clustering
@@ -266,7 +294,14 @@ class LazyMarkerManager:
                 single_row = non_selected_df[
                     non_selected_df["LOCA_ID"].isin(cluster.borehole_ids)
                 ].iloc[0]
-                marker = self._create_single_marker(single_row, is_selected=False)
+                borehole_id = str(single_row["LOCA_ID"]).strip()
+                marker = self._create_single_marker(
+                    borehole_id,
+                    single_row["lat"],
+                    single_row["lon"],
+                    presentation["tooltip"].get(borehole_id, f"Borehole: {borehole_id}"),
+                    is_selected=False,
+                )
                 cluster_markers.append(marker)
             else:
                 # Cluster marker
@@ -370,42 +405,45 @@ class LazyMarkerManager:
         )
 
     def _create_all_markers(
-        self, df: pd.DataFrame, selected_ids: List[str]
+        self,
+        df: pd.DataFrame,
+        selected_ids: List[str],
+        presentation: Optional[pd.DataFrame] = None,
     ) -> List[dl.Marker]:
         """Create markers for all rows in DataFrame."""
 
-        markers = []
-        for i, row in df.iterrows():
-            is_selected = row["LOCA_ID"] in selected_ids
-            marker = self._create_single_marker(row, is_selected, index=i)
-            markers.append(marker)
+        if df.empty:
+            return []
 
-        return markers
+        if presentation is None:
+            presentation = build_presentation_table(df)
+
+        ids = df["LOCA_ID"].astype(str).str.strip()
+        tooltips = presentation["tooltip"].reindex(ids.to_numpy()).fillna("")
+        selected = ids.isin(selected_ids)
+
+        return [
+            self._create_single_marker(loca_id, lat, lon, tooltip, is_selected)
+            for loca_id, lat, lon, tooltip, is_selected in zip(
+                ids, df["lat"], df["lon"], tooltips, selected
+            )
+        ]
 
     def _create_single_marker(
-        self, row: pd.Series, is_selected: bool, index: Optional[int] = None
+        self,
+        borehole_id: str,
+        lat: float,
+        lon: float,
+        tooltip_text: str,
+        is_selected: bool,
     ) -> dl.Marker:
-        """Create a single marker from a DataFrame row."""
-
-        lat, lon = row["lat"], row["lon"]
-        borehole_id = str(row["LOCA_ID"]).strip()
+        """Create a single marker from precomputed presentation values."""
 
         # Choose marker color
         icon_url = self._get_marker_icon_url(is_selected)
 
-        # Create marker ID
-        marker_id = {"type": "borehole-marker", "index": index or 0}
-
-        # Format tooltip
-        ground_level = self._format_depth_value(row.get("LOCA_GL", "N/A"))
-        total_depth = self._format_depth_value(row.get("LOCA_FDEP", "N/A"))
-
-        tooltip_text = f"""
-        Borehole: {borehole_id}
-        Ground Level: {ground_level}
-        Total Depth: {total_depth}
-        Click to view borehole log
-        """
+        # Marker ID is keyed by LOCA_ID so clicks resolve regardless of row order
+        marker_id = {"type": "borehole-marker", "index": borehole_id}
 
         marker_icon = {
             "iconUrl": icon_url,
@@ -418,7 +456,7 @@ class LazyMarkerManager:
         return dl.Marker(
             id=marker_id,
             position=[lat, lon],
-            children=dl.Tooltip(tooltip_text.strip()),
+            children=dl.Tooltip(tooltip_text),
             icon=marker_icon,
             n_clicks=0,
         )
@@ -431,17 +469,6 @@ class LazyMarkerManager:
         else:
             return "https://raw.githubusercontent.com/pointhi/leaflet-color-markers/master/img/marker-icon-blue.png"
 
-    def _format_depth_value(self, value) -> str:
-        """Format depth values for display."""
-
-        if value == "N/A" or value is None or str(value).strip() == "":
-            return "N/A"
-
-        try:
-            return f"{float(value):.2f}m"
-        except (ValueError, TypeError):
-            return "N/A"
-
     def update_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics for monitoring."""
 
@@ -229,6 +229,27 @@ class MemoryManager:
             marker_manager = get_lazy_marker_manager()
             marker_manager.clear_cache()
 
+            # Clear per-dataset presentation tables
+            from borehole_presentation import get_presentation_cache
+
+            get_presentation_cache().clear_cache()
+
+            # Clear encoded borehole tiles (spatial indexes are kept)
+            from borehole_tiles import get_tile_service
+
+            get_tile_service().clear_cache()
+
+            # Clear memoized derived views (decoded frames, options, markers)
+            from state_management import get_derived_view_cache
+
+            get_derived_view_cache().clear_cache()
+
+            # Clear cached section images and log pages
+            from section import get_log_render_cache, get_section_render_cache
+
+            get_section_render_cache().clear_cache()
+            get_log_render_cache().clear_cache()
+
             # Clear coordinate service cache if available
             try:
                 from coordinate_service import get_coordinate_service
@@ -354,6 +375,12 @@ class MemoryManager:
             "cache_info": {
                 "registered_caches": len(self.cache_references),
                 "cache_names": list(self.cache_references.keys()),
+                "derived_views": self._get_derived_view_stats(),
+                "section_renders": self._get_section_render_stats(),
+                "log_renders": self._get_log_render_stats(),
+                "render_coalescing": self._get_render_coalescing_stats(),
+                "render_generations": self._get_render_generation_stats(),
+                "log_warmup": self._get_log_warmup_stats(),
             },
             "cleanup_info": {
                 "auto_cleanup_enabled": self.enable_auto_cleanup,
@@ -372,6 +399,66 @@ class MemoryManager:
             "timestamp": current_stats.timestamp.isoformat(),
         }
 
+    def _get_derived_view_stats(self) -> Dict[str, Any]:
+        """Get derived view cache hit rates, if available."""
+        try:
+            from state_management import get_derived_view_cache
+
+            return get_derived_view_cache().get_stats()
+        except Exception as e:
+            logger.warning(f"Could not get derived view stats: {e}")
+            return {}
+
+    def _get_section_render_stats(self) -> Dict[str, Any]:
+        """Get section render cache occupancy and hit rate, if available."""
+        try:
+            from section import get_section_render_cache
+
+            return get_section_render_cache().get_stats()
+        except Exception as e:
+            logger.warning(f"Could not get section render stats: {e}")
+            return {}
+
+    def _get_log_render_stats(self) -> Dict[str, Any]:
+        """Get borehole log page cache occupancy and hit rate, if available."""
+        try:
+            from section import get_log_render_cache
+
+            return get_log_render_cache().get_stats()
+        except Exception as e:
+            logger.warning(f"Could not get log render stats: {e}")
+            return {}
+
+    def _get_render_coalescing_stats(self) -> Dict[str, Any]:
+        """Get counts of renders shared between concurrent requests."""
+        try:
+            from render_workers import get_render_single_flight
+
+            return get_render_single_flight().get_stats()
+        except Exception as e:
+            logger.warning(f"Could not get render coalescing stats: {e}")
+            return {}
+
+    def _get_render_generation_stats(self) -> Dict[str, Any]:
+        """Get counts of started and superseded (cancelled) renders."""
+        try:
+            from render_workers import get_render_generations
+
+            return get_render_generations().get_stats()
+        except Exception as e:
+            logger.warning(f"Could not get render generation stats: {e}")
+            return {}
+
+    def _get_log_warmup_stats(self) -> Dict[str, Any]:
+        """Get counts of background borehole log warm-ups."""
+        try:
+            from render_warmup import get_log_warmup
+
+            return get_log_warmup().get_stats()
+        except Exception as e:
+            logger.warning(f"Could not get log warm-up stats: {e}")
+            return {}
+
     def monitor_memory_async(self, callback_func: Optional[callable] = None):
         """
         Start asynchronous memory monitoring.
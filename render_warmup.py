@@ -0,0 +1,295 @@
+"""
+Borehole Log Warm-Up Module.
+
+After a project is uploaded, users typically click through many boreholes
+and each click pays the full log render. This module pre-renders the log
+pages of the boreholes nearest the map centre into the render cache in the
+background, so those clicks are cache hits.
+
+Key Features:
+- **Low Priority**: Warm-ups render one page at a time between them, and
+  only while the render worker pool has no queued or running jobs;
+  interactive renders never wait behind them for a worker or queue slot
+- **Same Cache Entries**: Pages are rendered through ``warm_log_pages`` with
+  the options of a default marker click, so a click on a warmed borehole (or
+  on the borehole being warmed) is served from the cache
+- **Per Session**: Each session has its own warm-up; ``cancel()`` or a newer
+  upload in the same session stops it before its next borehole, without
+  touching other users' warm-ups
+- **Bounded**: At most ``PERFORMANCE_CONFIG.LOG_WARMUP_MAX_BOREHOLES``
+  boreholes are warmed per upload
+- **Cache Headroom**: Warming stops once the log render cache is
+  ``PERFORMANCE_CONFIG.LOG_WARMUP_MAX_CACHE_FILL`` full, so warmed pages
+  never evict logs the user has opened
+- **Observable**: Started, completed, cancelled and cache-full warm-ups and
+  warmed borehole counts via ``get_stats()``
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app_constants import PERFORMANCE_CONFIG, PLOT_CONFIG
+from borehole_log import render_borehole_log_from_ags
+from render_workers import (
+    RenderQueueFullError,
+    RenderWorkerPool,
+    get_render_worker_pool,
+)
+from section.render_cache import get_log_render_cache, warm_log_pages
+from state_management.session_store import get_current_session_id
+
+logger = logging.getLogger(__name__)
+
+
+def nearest_boreholes(
+    loca_df: pd.DataFrame,
+    center: Optional[Sequence[float]],
+    limit: Optional[int] = None,
+) -> List[str]:
+    """
+    Order boreholes by distance from a map centre.
+
+    Args:
+        loca_df: Locations with ``LOCA_ID`` and, where known, ``lat``/``lon``
+        center: Map centre as [lat, lon]; file order is kept if None
+        limit: Maximum number of boreholes to return
+
+    Returns:
+        list: LOCA_IDs, nearest first; boreholes without coordinates last
+    """
+    if loca_df is None or loca_df.empty or "LOCA_ID" not in loca_df.columns:
+        return []
+
+    locations = loca_df.drop_duplicates("LOCA_ID")
+    ids = locations["LOCA_ID"].astype(str).str.strip().to_numpy()
+    if center is not None and {"lat", "lon"} <= set(locations.columns):
+        lats = pd.to_numeric(locations["lat"], errors="coerce").to_numpy(float)
+        lons = pd.to_numeric(locations["lon"], errors="coerce").to_numpy(float)
+        distances = np.hypot(lats - float(center[0]), lons - float(center[1]))
+        ids = ids[np.argsort(np.nan_to_num(distances, nan=np.inf), kind="stable")]
+
+    return ids[:limit].tolist() if limit is not None else ids.tolist()
+
+
+class LogWarmupJob:
+    """A running (or finished) warm-up of one uploaded dataset."""
+
+    def __init__(self, session_id: str, dataset_id: str, borehole_ids: List[str]):
+        self.session_id = session_id
+        self.dataset_id = dataset_id
+        self.borehole_ids = borehole_ids
+        self.warmed = 0
+        self.cancelled = threading.Event()
+        self.done = threading.Event()
+
+    def cancel(self) -> None:
+        """Stop the warm-up before its next borehole."""
+        self.cancelled.set()
+
+
+class _IdleWorkerExecutor:
+    """Executor running one job at a time in the render pool once it is idle."""
+
+    def __init__(
+        self,
+        pool: RenderWorkerPool,
+        wait_for_idle: Callable[[], bool],
+        page_lock: threading.Lock,
+    ):
+        self._pool = pool
+        self._wait_for_idle = wait_for_idle
+        self._page_lock = page_lock
+
+    def map(self, fn: Callable, *iterables) -> List[Any]:
+        results = []
+        for args in zip(*iterables):
+            # Warm-ups of different sessions take turns page by page
+            with self._page_lock:
+                while True:
+                    # A cancelled job finishes its current borehole without
+                    # waiting, since interactive requests may be coalesced
+                    # onto it
+                    idle = self._wait_for_idle()
+                    try:
+                        results.append(self._pool.run(fn, *args))
+                        break
+                    except RenderQueueFullError:
+                        # Interactive renders filled the queue after the check
+                        if not idle:
+                            raise
+        return results
+
+
+class LogWarmup:
+    """Pre-renders borehole logs into the render cache on idle workers."""
+
+    def __init__(
+        self,
+        pool: Optional[RenderWorkerPool] = None,
+        max_boreholes: int = PERFORMANCE_CONFIG.LOG_WARMUP_MAX_BOREHOLES,
+        poll_seconds: float = PERFORMANCE_CONFIG.LOG_WARMUP_POLL_SECONDS,
+        max_cache_fill: float = PERFORMANCE_CONFIG.LOG_WARMUP_MAX_CACHE_FILL,
+    ):
+        self._pool = pool
+        self.max_boreholes = max_boreholes
+        self.poll_seconds = poll_seconds
+        self.max_cache_fill = max_cache_fill
+        self._jobs: Dict[str, LogWarmupJob] = {}
+        self._stats = {
+            "started": 0,
+            "completed": 0,
+            "cancelled": 0,
+            "warmed": 0,
+            "cache_full": 0,
+        }
+        self._lock = threading.Lock()
+        self._page_lock = threading.Lock()
+
+    @property
+    def pool(self) -> RenderWorkerPool:
+        return self._pool or get_render_worker_pool()
+
+    def start(
+        self,
+        ags_data: List[Tuple[str, str]],
+        dataset_id: str,
+        borehole_ids: Sequence[str],
+        session_id: Optional[str] = None,
+    ) -> LogWarmupJob:
+        """
+        Start warming the logs of a dataset, cancelling the session's earlier
+        warm-up.
+
+        Args:
+            ags_data: List of (filename, content) tuples containing AGS data
+            dataset_id: Content hash of the uploaded AGS files
+            borehole_ids: Boreholes to warm, in priority order
+            session_id: Session the upload belongs to; defaults to the
+                current session
+
+        Returns:
+            LogWarmupJob: The started job
+        """
+        if session_id is None:
+            session_id = get_current_session_id()
+        job = LogWarmupJob(
+            session_id, dataset_id, list(borehole_ids)[: self.max_boreholes]
+        )
+        with self._lock:
+            previous = self._jobs.get(session_id)
+            if previous is not None:
+                previous.cancel()
+            self._jobs[session_id] = job
+            self._stats["started"] += 1
+
+        thread = threading.Thread(
+            target=self._run, args=(job, ags_data), name="log-warmup", daemon=True
+        )
+        thread.start()
+        logger.info(
+            f"Warming {len(job.borehole_ids)} borehole log(s) for dataset {dataset_id}"
+        )
+        return job
+
+    def cancel(self, session_id: Optional[str] = None) -> None:
+        """Cancel a session's warm-up, if any (defaults to the current session)."""
+        if session_id is None:
+            session_id = get_current_session_id()
+        with self._lock:
+            job = self._jobs.get(session_id)
+            if job is not None:
+                job.cancel()
+
+    def _wait_for_idle(self, job: LogWarmupJob) -> bool:
+        """Wait until the render pool is idle; False if the job was cancelled."""
+        while self.pool.get_stats()["pending"] > 0:
+            if job.cancelled.wait(self.poll_seconds):
+                return False
+        return not job.cancelled.is_set()
+
+    def _cache_has_room(self) -> bool:
+        """Check the log cache is below the warm-up fill threshold."""
+        stats = get_log_render_cache().get_stats()
+        return stats["cached_bytes"] < stats["max_bytes"] * self.max_cache_fill
+
+    def _run(self, job: LogWarmupJob, ags_data: List[Tuple[str, str]]) -> None:
+        executor = _IdleWorkerExecutor(
+            self.pool, lambda: self._wait_for_idle(job), self._page_lock
+        )
+        try:
+            for borehole_id in job.borehole_ids:
+                if not self._wait_for_idle(job):
+                    break
+                if not self._cache_has_room():
+                    logger.info(
+                        f"Log cache full; warmed {job.warmed} of "
+                        f"{len(job.borehole_ids)} borehole log(s)"
+                    )
+                    with self._lock:
+                        self._stats["cache_full"] += 1
+                    break
+                warm_log_pages(
+                    job.dataset_id,
+                    borehole_id,
+                    lambda: render_borehole_log_from_ags(
+                        ags_data,
+                        borehole_id,
+                        show_labels=True,
+                        fig_height=PLOT_CONFIG.BOREHOLE_LOG_HEIGHT,
+                        fig_width=PLOT_CONFIG.BOREHOLE_LOG_WIDTH,
+                        dpi=PLOT_CONFIG.LOG_DISPLAY_DPI,
+                        data_key=job.dataset_id,
+                        executor=executor,
+                    ),
+                    True,
+                    PLOT_CONFIG.LOG_DISPLAY_DPI,
+                )
+                job.warmed += 1
+                with self._lock:
+                    self._stats["warmed"] += 1
+        except Exception as e:
+            logger.warning(f"Borehole log warm-up stopped: {e}")
+        finally:
+            cancelled = job.cancelled.is_set()
+            with self._lock:
+                self._stats["cancelled" if cancelled else "completed"] += 1
+                if self._jobs.get(job.session_id) is job:
+                    del self._jobs[job.session_id]
+            job.done.set()
+            logger.info(
+                f"Borehole log warm-up {'cancelled' if cancelled else 'finished'}: "
+                f"{job.warmed} of {len(job.borehole_ids)} warmed"
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get warm-up counts and the number of running warm-ups."""
+        with self._lock:
+            return {
+                **self._stats,
+                "running": len(self._jobs),
+                "running_datasets": sorted(
+                    {job.dataset_id for job in self._jobs.values()}
+                ),
+            }
+
+
+# Global log warm-up instance
+_log_warmup: Optional[LogWarmup] = None
+_warmup_lock = threading.Lock()
+
+
+def get_log_warmup() -> LogWarmup:
+    """Get the global borehole log warm-up."""
+    global _log_warmup
+    if _log_warmup is None:
+        with _warmup_lock:
+            if _log_warmup is None:
+                _log_warmup = LogWarmup()
+    return _log_warmup
@@ -0,0 +1,12 @@
+"""
+Render Worker Entry Module.
+
+A spawned process imports its parent's ``__main__`` module before it runs
+any job. For the render worker pool that would be ``app.py`` (building the
+Dash app and initialising Sentry once per worker) or a WSGI server's entry
+script. ``render_workers.RenderWorkerPool`` presents this module as
+``__main__`` while it starts workers, so they import nothing but this.
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
@@ -0,0 +1,661 @@
+"""
+Off-Thread Render Workers Module.
+
+Section and log rendering are CPU-bound matplotlib jobs that can take several
+seconds at print resolution. Run inside a Dash request thread, they hold that
+worker (and the GIL) and stall every other user. This module moves them off
+the request path without an external broker:
+
+- ``InProcessCallbackManager`` is a Dash background callback manager that runs
+  background callbacks on a small thread pool inside the server process and
+  keeps their results, progress and ``set_props`` updates in memory. The
+  browser polls for results as with Dash's Diskcache/Celery managers.
+- ``RenderWorkerPool`` runs the actual rendering in a local process pool, so
+  rendering does not compete for the server's GIL.
+- ``RenderGenerations`` numbers the renders requested on a channel (e.g. a
+  session's section preview). A ``RenderTicket`` lets a render, even one
+  running in a worker process, check that it is still the latest request
+  and stop with ``RenderCancelled`` before its expensive stages.
+- ``SingleFlight`` coalesces identical concurrent renders (double clicks,
+  several tabs or users asking for the same section or log): one caller
+  renders, the others wait for and share its result.
+
+Key Features:
+- **No Broker**: Uses only ``concurrent.futures``; works where diskcache or
+  Celery are not installed
+- **Bounded Queue**: At most ``PERFORMANCE_CONFIG.RENDER_QUEUE_SIZE`` renders
+  are queued or running; further requests fail fast with
+  ``RenderQueueFullError`` so callers can ask the user to retry
+- **Batches**: ``RenderWorkerPool.map()`` spreads independent jobs (e.g. the
+  pages of a borehole log) over the workers and returns results in order;
+  ``imap()`` yields them with a bounded number of jobs in flight
+- **Progress Reporting**: Background callbacks receive ``set_progress`` and
+  can update ``loading_indicators`` components while they wait
+- **Self-Healing Pool**: A broken process pool (e.g. a crashed worker) is
+  recreated on the next submission
+- **Thread Fallback**: Renders run on threads if processes are disabled or
+  cannot be started
+- **Light Worker Start**: Workers start from ``render_worker_main`` instead of
+  re-importing the server's ``__main__`` module (e.g. ``app.py``)
+- **Superseded Render Cancellation**: Generations live in a small
+  memory-mapped table shared with the worker processes; cancelled and
+  started counts via ``get_render_generations().get_stats()``
+- **Request Coalescing**: Coalesced and in-flight render counts via
+  ``get_render_single_flight().get_stats()``
+
+Note: Worker processes keep their own memoization caches (e.g. the section
+pipeline stages), which persist across jobs handled by the same worker.
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import atexit
+import importlib
+import inspect
+import itertools
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import traceback
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextvars import copy_context
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, Iterator, Optional
+
+import numpy as np
+
+# InProcessCallbackManager relies on Dash internals that are not part of the
+# public API; tests/test_render_workers.py fails if a Dash release changes them
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+from dash.background_callback._proxy_set_props import ProxySetProps
+from dash.background_callback.managers import BaseBackgroundCallbackManager
+from dash.exceptions import PreventUpdate
+
+from app_constants import PERFORMANCE_CONFIG
+from state_management.session_store import bind_session_id, get_current_session_id
+
+logger = logging.getLogger(__name__)
+
+
+class RenderQueueFullError(RuntimeError):
+    """Raised when the render queue has no free slots."""
+
+
+class RenderCancelled(Exception):
+    """Raised when a render was superseded by a newer request."""
+
+
+# Generation tables opened by this process, by path
+_generation_tables: Dict[str, np.ndarray] = {}
+
+
+def _open_generation_table(path: str) -> np.ndarray:
+    table = _generation_tables.get(path)
+    if table is None:
+        table = np.memmap(path, dtype=np.int64, mode="r")
+        _generation_tables[path] = table
+    return table
+
+
+@dataclass(frozen=True)
+class RenderTicket:
+    """
+    Picklable handle identifying one render request on a channel.
+
+    The ticket is current while no newer render has been started on the
+    same channel; it can be checked from render worker processes.
+    """
+
+    path: str
+    slot: int
+    generation: int
+
+    def is_current(self) -> bool:
+        """Check whether this is still the latest render on its channel."""
+        try:
+            return int(_open_generation_table(self.path)[self.slot]) == self.generation
+        except (OSError, ValueError, IndexError):
+            # Without the table a render can never be treated as superseded
+            return True
+
+    def check(self) -> None:
+        """
+        Raises:
+            RenderCancelled: If a newer render was started on the channel
+        """
+        if not self.is_current():
+            raise RenderCancelled(f"Render generation {self.generation} superseded")
+
+
+class RenderGenerations:
+    """
+    Latest render generation per channel, shared with worker processes.
+
+    Generation numbers are unique across channels, so a stale ticket never
+    matches a recycled slot. Once more than ``slots`` channels are in use,
+    the least recently started channel's slot is reused.
+    """
+
+    def __init__(self, slots: int = PERFORMANCE_CONFIG.RENDER_GENERATION_SLOTS):
+        fd, self.path = tempfile.mkstemp(prefix="render-generations-", suffix=".bin")
+        os.close(fd)
+        self._table = np.memmap(self.path, dtype=np.int64, mode="w+", shape=(slots,))
+        self._slots: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._generations = itertools.count(1)
+        self._stats = {"started": 0, "cancelled": 0}
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def begin(self, channel: Hashable) -> RenderTicket:
+        """
+        Start a new render on a channel, superseding earlier ones.
+
+        Returns:
+            RenderTicket: Ticket for the new render
+        """
+        with self._lock:
+            slot = self._slots.pop(channel, None)
+            if slot is None:
+                if len(self._slots) < len(self._table):
+                    slot = len(self._slots)
+                else:
+                    _, slot = self._slots.popitem(last=False)
+            self._slots[channel] = slot
+            generation = next(self._generations)
+            self._table[slot] = generation
+            self._stats["started"] += 1
+        return RenderTicket(self.path, slot, generation)
+
+    def record_cancelled(self) -> None:
+        """Count a render dropped because it was superseded."""
+        with self._lock:
+            self._stats["cancelled"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get started and cancelled render counts."""
+        with self._lock:
+            return {**self._stats, "channels": len(self._slots)}
+
+    def close(self) -> None:
+        """Remove the shared generation table."""
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+def _init_render_worker() -> None:
+    """Configure a freshly started render worker process."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+
+# Serialises the __main__ swap in _RenderWorkerProcess.start()
+_worker_start_lock = threading.Lock()
+
+
+class _RenderWorkerProcess(multiprocessing.context.SpawnProcess):
+    """Spawned render worker that starts from ``render_worker_main``."""
+
+    def start(self):
+        # The child is told which __main__ to import while it is launched
+        with _worker_start_lock:
+            main_module = sys.modules["__main__"]
+            sys.modules["__main__"] = importlib.import_module("render_worker_main")
+            try:
+                super().start()
+            finally:
+                sys.modules["__main__"] = main_module
+
+
+class _RenderWorkerContext(multiprocessing.context.SpawnContext):
+    """Spawn context creating render worker processes."""
+
+    Process = _RenderWorkerProcess
+
+
+class RenderWorkerPool:
+    """Bounded pool of render workers (processes, or threads as a fallback)."""
+
+    def __init__(
+        self,
+        max_workers: int = PERFORMANCE_CONFIG.RENDER_WORKERS,
+        max_pending: int = PERFORMANCE_CONFIG.RENDER_QUEUE_SIZE,
+        use_processes: bool = PERFORMANCE_CONFIG.RENDER_USE_PROCESSES,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.use_processes = use_processes
+        self._executor = None
+        self._pending = 0
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._lock = threading.Lock()
+
+    def _create_executor(self):
+        if self.use_processes:
+            try:
+                return ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=_RenderWorkerContext(),
+                    initializer=_init_render_worker,
+                )
+            except (OSError, ValueError) as e:
+                logger.warning(f"Render process pool unavailable, using threads: {e}")
+                self.use_processes = False
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="render-worker"
+        )
+
+    def _job_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                self._stats["failed"] += 1
+            else:
+                self._stats["completed"] += 1
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a render job.
+
+        Args:
+            fn: Module-level (picklable) render function
+            *args, **kwargs: Arguments for fn; must be picklable
+
+        Returns:
+            Future: Future for the render result
+
+        Raises:
+            RenderQueueFullError: If max_pending jobs are already queued/running
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats["rejected"] += 1
+                raise RenderQueueFullError(
+                    f"Render queue is full ({self.max_pending} jobs pending)"
+                )
+            if self._executor is None:
+                self._executor = self._create_executor()
+            try:
+                future = self._executor.submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                logger.warning("Render process pool was broken; restarting it")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+                future = self._executor.submit(fn, *args, **kwargs)
+            self._pending += 1
+            self._stats["submitted"] += 1
+
+        future.add_done_callback(self._job_done)
+        return future
+
+    def run(self, fn: Callable, *args, timeout: Optional[float] = None, **kwargs):
+        """
+        Run a render job in the pool and wait for its result.
+
+        Args:
+            fn: Module-level (picklable) render function
+            timeout: Seconds to wait; defaults to
+                PERFORMANCE_CONFIG.MAX_PROCESSING_TIME_SECONDS
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            The render result
+        """
+        if timeout is None:
+            timeout = PERFORMANCE_CONFIG.MAX_PROCESSING_TIME_SECONDS
+        return self.submit(fn, *args, **kwargs).result(timeout=timeout)
+
+    def imap(
+        self,
+        fn: Callable,
+        *iterables,
+        timeout: Optional[float] = None,
+        window: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Run fn over argument iterables in the pool, yielding results in order.
+
+        At most ``window`` jobs of this call are queued or running at once,
+        so only that many results are held in memory however long the batch.
+        A full queue waits for this call's oldest job instead of failing.
+
+        Args:
+            fn: Module-level (picklable) render function
+            *iterables: Argument iterables, zipped into one call per item
+            timeout: Seconds to wait for each result; defaults to
+                PERFORMANCE_CONFIG.MAX_PROCESSING_TIME_SECONDS
+            window: Jobs kept in flight; defaults to the number of workers
+
+        Yields:
+            The results in argument order
+
+        Raises:
+            RenderQueueFullError: If the queue is full while none of this
+                call's jobs are queued
+        """
+        if timeout is None:
+            timeout = PERFORMANCE_CONFIG.MAX_PROCESSING_TIME_SECONDS
+        window = max(1, window or self.max_workers)
+
+        futures: Deque[Future] = deque()
+        try:
+            for args in zip(*iterables):
+                while len(futures) >= window:
+                    yield futures.popleft().result(timeout=timeout)
+                while True:
+                    try:
+                        futures.append(self.submit(fn, *args))
+                        break
+                    except RenderQueueFullError:
+                        if not futures:
+                            raise
+                        yield futures.popleft().result(timeout=timeout)
+            while futures:
+                yield futures.popleft().result(timeout=timeout)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def map(self, fn: Callable, *iterables, timeout: Optional[float] = None) -> list:
+        """
+        Run fn over argument iterables in the pool (like ``Executor.map``).
+
+        Jobs are submitted as queue slots allow: once some of this call's
+        jobs are queued, a full queue waits for one of them to finish instead
+        of failing, so a batch may be larger than the queue.
+
+        Args:
+            fn: Module-level (picklable) render function
+            *iterables: Argument iterables, zipped into one call per item
+            timeout: Seconds to wait for each result; defaults to
+                PERFORMANCE_CONFIG.MAX_PROCESSING_TIME_SECONDS
+
+        Returns:
+            list: Results in argument order
+
+        Raises:
+            RenderQueueFullError: If the queue is full before any job is queued
+        """
+        return list(
+            self.imap(fn, *iterables, timeout=timeout, window=self.max_pending)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job counts and queue occupancy."""
+        with self._lock:
+            return {
+                **self._stats,
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "workers": self.max_workers,
+                "mode": "processes" if self.use_processes else "threads",
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool; it is recreated on the next submission."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one computation.
+
+    The first caller for a key (the leader) runs the computation; callers
+    arriving while it is in flight wait for it and receive the same result
+    or exception. Nothing is cached once the computation finishes.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._stats = {"leaders": 0, "coalesced": 0}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn for key, or wait for the identical call already in flight.
+
+        Args:
+            key: Identity of the computation (e.g. a render key)
+            fn: Zero-argument function computing the result
+
+        Returns:
+            The result of fn (shared by all coalesced callers)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+                self._stats["leaders"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            logger.debug(f"Waiting for in-flight render {key}")
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the number of leading and coalesced calls."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+def _make_job_fn(fn, manager: "InProcessCallbackManager", progress):
+    """Wrap a background callback function to run on a manager thread."""
+
+    def job_fn(result_key, progress_key, user_callback_args, context, session_id):
+        def _set_progress(progress_value):
+            if not isinstance(progress_value, (list, tuple)):
+                progress_value = [progress_value]
+            manager._store(manager._progress, progress_key, progress_value)
+
+        def _set_props(_id, props):
+            manager._store(
+                manager._set_props, manager._make_set_props_key(result_key), {_id: props}
+            )
+
+        maybe_progress = [_set_progress] if progress else []
+
+        def run():
+            bind_session_id(session_id)
+            callback_context = AttributeDict(**context)
+            callback_context.ignore_register_page = False
+            callback_context.updated_props = ProxySetProps(_set_props)
+            context_value.set(callback_context)
+            try:
+                if isinstance(user_callback_args, dict):
+                    output = fn(*maybe_progress, **user_callback_args)
+                elif isinstance(user_callback_args, (list, tuple)):
+                    output = fn(*maybe_progress, *user_callback_args)
+                else:
+                    output = fn(*maybe_progress, user_callback_args)
+            except PreventUpdate:
+                output = {"_dash_no_update": "_dash_no_update"}
+            except Exception as err:
+                logger.error(f"Background callback failed: {err}")
+                output = {
+                    "background_callback_error": {
+                        "msg": str(err),
+                        "tb": traceback.format_exc(),
+                    }
+                }
+            manager._store(manager._results, result_key, output)
+
+        copy_context().run(run)
+
+    return job_fn
+
+
+class InProcessCallbackManager(BaseBackgroundCallbackManager):
+    """
+    Dash background callback manager running jobs on an in-process thread pool.
+
+    Results, progress and set_props updates are kept in bounded in-memory
+    maps until the polling request collects them.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = PERFORMANCE_CONFIG.BACKGROUND_CALLBACK_THREADS,
+        max_entries: int = 256,
+        cache_by=None,
+    ):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dash-background"
+        )
+        self.max_entries = max_entries
+        self._jobs: Dict[str, Future] = {}
+        self._results: "OrderedDict[str, Any]" = OrderedDict()
+        self._progress: "OrderedDict[str, Any]" = OrderedDict()
+        self._set_props: "OrderedDict[str, Any]" = OrderedDict()
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        super().__init__(cache_by)
+
+    def _store(self, entries: "OrderedDict[str, Any]", key: str, value: Any) -> None:
+        with self._lock:
+            entries[key] = value
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+
+    def _pop(self, entries: "OrderedDict[str, Any]", key: str) -> Any:
+        with self._lock:
+            return entries.pop(key, self.UNDEFINED)
+
+    def make_job_fn(self, fn, progress, key=None):
+        return _make_job_fn(fn, self, progress)
+
+    def call_job_fn(self, key, job_fn, args, context):
+        if inspect.iscoroutinefunction(job_fn):
+            raise NotImplementedError("Async background callbacks are not supported")
+        job_id = str(next(self._job_ids))
+        # Background jobs keep the session of the request that started them
+        future = self._executor.submit(
+            job_fn,
+            key,
+            self._make_progress_key(key),
+            args,
+            context,
+            get_current_session_id(),
+        )
+        with self._lock:
+            self._jobs[job_id] = future
+        future.add_done_callback(lambda _: self._forget_job(job_id))
+        return job_id
+
+    def _forget_job(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def terminate_job(self, job):
+        if job is None:
+            return
+        with self._lock:
+            future = self._jobs.pop(str(job), None)
+        if future is not None:
+            # Queued jobs are dropped; running jobs finish but are ignored
+            future.cancel()
+
+    def terminate_unhealthy_job(self, job):
+        return False
+
+    def job_running(self, job):
+        with self._lock:
+            future = self._jobs.get(str(job))
+        return future is not None and not future.done()
+
+    def clear_cache_entry(self, key):
+        self._pop(self._results, key)
+
+    def get_progress(self, key):
+        progress = self._pop(self._progress, self._make_progress_key(key))
+        return None if progress is self.UNDEFINED else progress
+
+    def result_ready(self, key):
+        with self._lock:
+            return key in self._results
+
+    def get_result(self, key, job):
+        result = self._pop(self._results, key)
+        if result is self.UNDEFINED:
+            return self.UNDEFINED
+        self._pop(self._progress, self._make_progress_key(key))
+        if job:
+            self.terminate_job(job)
+        return result
+
+    def get_updated_props(self, key):
+        result = self._pop(self._set_props, self._make_set_props_key(key))
+        return {} if result is self.UNDEFINED else result
+
+
+# Global instances
+_render_worker_pool: Optional[RenderWorkerPool] = None
+_background_manager: Optional[InProcessCallbackManager] = None
+_render_single_flight: Optional[SingleFlight] = None
+_render_generations: Optional[RenderGenerations] = None
+_instances_lock = threading.Lock()
+
+
+def get_render_worker_pool() -> RenderWorkerPool:
+    """Get global render worker pool instance."""
+    global _render_worker_pool
+    if _render_worker_pool is None:
+        with _instances_lock:
+            if _render_worker_pool is None:
+                _render_worker_pool = RenderWorkerPool()
+    return _render_worker_pool
+
+
+def get_background_callback_manager() -> InProcessCallbackManager:
+    """Get global background callback manager instance."""
+    global _background_manager
+    if _background_manager is None:
+        with _instances_lock:
+            if _background_manager is None:
+                _background_manager = InProcessCallbackManager()
+    return _background_manager
+
+
+def get_render_single_flight() -> SingleFlight:
+    """Get global render request coalescing instance."""
+    global _render_single_flight
+    if _render_single_flight is None:
+        with _instances_lock:
+            if _render_single_flight is None:
+                _render_single_flight = SingleFlight()
+    return _render_single_flight
+
+
+def get_render_generations() -> RenderGenerations:
+    """Get global render generation registry."""
+    global _render_generations
+    if _render_generations is None:
+        with _instances_lock:
+            if _render_generations is None:
+                _render_generations = RenderGenerations()
+    return _render_generations
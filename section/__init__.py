@@ -9,9 +9,20 @@ The package provides:
 - Professional geological plotting
 - Figure management utilities
 - Color and pattern mapping
+- Caching of rendered section images
 """
 
-from .plotting import plot_professional_borehole_sections, plot_section_from_ags_content
+from .plotting import (
+    plot_professional_borehole_sections,
+    plot_section_from_ags_content,
+    render_section_image,
+)
+from .render_cache import (
+    SectionRenderCache,
+    get_log_render_cache,
+    get_section_render_cache,
+    make_render_key,
+)
 from .parsing import (
     parse_ags_geol_section_from_string,
     validate_ags_format,
@@ -27,6 +38,11 @@ from .utils import (
 __all__ = [
     "plot_professional_borehole_sections",
     "plot_section_from_ags_content",
+    "render_section_image",
+    "SectionRenderCache",
+    "get_section_render_cache",
+    "get_log_render_cache",
+    "make_render_key",
     "parse_ags_geol_section_from_string",
     "validate_ags_format",
     "extract_ags_metadata",
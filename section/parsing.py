@@ -6,6 +6,7 @@ format files for geological and borehole data extraction.
 
 Key Functions:
 - parse_ags_geol_section_from_string: Parse AGS content to extract GEOL, LOCA, and ABBR data
+- parse_ags_groups_from_string: Parse any set of groups with a single CSV pass
 - parse_ags_group: Parse individual AGS group sections
 - validate_ags_format: Validate AGS file format compliance
 
@@ -62,6 +63,26 @@ def parse_ags_geol_section_from_string(
         return pd.DataFrame(), pd.DataFrame(), None
 
 
+def parse_ags_groups_from_string(
+    content: str, groups: Dict[str, List[str]]
+) -> Dict[str, pd.DataFrame]:
+    """
+    Parse several AGS groups from content, reading the CSV only once.
+
+    Args:
+        content: AGS file content as string
+        groups: Group names mapped to the columns to convert to numeric
+
+    Returns:
+        dict: Group name to DataFrame (empty if the group is missing)
+    """
+    parsed = _parse_csv_lines(content.splitlines())
+    return {
+        group_name: _parse_ags_group(parsed, group_name, numeric_columns)
+        for group_name, numeric_columns in groups.items()
+    }
+
+
 def _parse_csv_lines(lines: List[str]) -> List[List[str]]:
     """Parse CSV-formatted lines using proper CSV reader."""
     try:
@@ -7,11 +7,13 @@ This package provides modular plotting capabilities for AGS borehole data.
 Main Functions:
     plot_professional_borehole_sections: Main plotting function
     plot_section_from_ags_content: Convenience function for single AGS content
+    render_section_image: Render a section straight to encoded image bytes
 
 Modules:
     coordinates: Coordinate transformation and projection utilities
     geology: Geological plotting, colors, patterns, and legends
     layout: Professional figure layout and formatting
+    pipeline: Memoized prepare/project/style stages plus render and encode
     main: Main plotting interface and coordination
 """
 
@@ -19,6 +21,7 @@ Modules:
 from .main import (
     plot_professional_borehole_sections,
     plot_section_from_ags_content,
+    render_section_image,
 )
 
 # Re-export for backward compatibility with existing code
@@ -28,6 +31,7 @@ plot_section = plot_section_from_ags_content
 __all__ = [
     "plot_professional_borehole_sections",
     "plot_section_from_ags_content",
+    "render_section_image",
     "plot_professional_section",  # Legacy alias
     "plot_section",  # Legacy alias
 ]
@@ -3,7 +3,8 @@ Coordinate Transformation Module
 
 This module handles all coordinate transformations and data preparation
 for section plotting, including BNG to WGS84, UTM projections, and
-projection onto section lines.
+projection onto section lines. Boreholes are transformed, projected and
+ordered as whole arrays rather than row by row.
 """
 
 import pandas as pd
@@ -58,12 +59,6 @@ def prepare_utm_coordinates(
     """Handle UTM coordinate transformation for polyline projection."""
     logger.debug("Using polyline mode - need consistent coordinate system")
 
-    try:
-        from shapely.geometry import Point as ShapelyPoint, LineString
-    except ImportError:
-        logger.error("Shapely library required for polyline projection")
-        return None
-
     # BNG to WGS84 transformer
     bng_to_wgs84 = pyproj.Transformer.from_crs(
         "EPSG:27700", "EPSG:4326", always_xy=True
@@ -73,11 +68,10 @@ def prepare_utm_coordinates(
     utm_crs = "EPSG:32630"
     wgs84_to_utm = pyproj.Transformer.from_crs("EPSG:4326", utm_crs, always_xy=True)
 
-    # Transform section line from WGS84 to UTM
-    utm_section_line = []
-    for lat, lon in section_line:
-        utm_x, utm_y = wgs84_to_utm.transform(lon, lat)
-        utm_section_line.append((utm_x, utm_y))
+    # Transform section line from WGS84 to UTM in one call
+    line_lat_lon = np.asarray(section_line, dtype=float).reshape(-1, 2)
+    utm_x, utm_y = wgs84_to_utm.transform(line_lat_lon[:, 1], line_lat_lon[:, 0])
+    utm_section_line = list(zip(np.atleast_1d(utm_x), np.atleast_1d(utm_y)))
 
     logger.debug(f"UTM Section line: {utm_section_line}")
 
@@ -91,6 +85,15 @@ def prepare_utm_coordinates(
     return project_onto_section_line(geol_df, loca_df, utm_coords, utm_section_line)
 
 
+def _order_by_position(
+    borehole_ids: np.ndarray, positions: np.ndarray
+) -> Tuple[Dict[str, float], List[str]]:
+    """Build the borehole position map and the boreholes ordered by position."""
+    order = np.argsort(positions, kind="stable")
+    borehole_x_map = dict(zip(borehole_ids.tolist(), positions.tolist()))
+    return borehole_x_map, borehole_ids[order].tolist()
+
+
 def prepare_bng_coordinates(
     geol_df: pd.DataFrame, loca_df: pd.DataFrame
 ) -> Optional[Dict[str, Any]]:
@@ -106,29 +109,29 @@ def prepare_bng_coordinates(
 
     logger.debug(f"Merged DataFrame shape: {merged_df.shape}")
 
-    # Extract valid coordinates
-    valid_coords = []
-    borehole_x_map = {}
-
-    for _, row in merged_df.iterrows():
-        try:
-            easting = float(row["LOCA_NATE"])
-            borehole_id = row["LOCA_ID"]
-
-            if borehole_id not in borehole_x_map:
-                borehole_x_map[borehole_id] = easting
-                valid_coords.append(easting)
+    if "LOCA_NATE" not in merged_df.columns:
+        logger.warning("No valid coordinates found")
+        return None
 
-        except (ValueError, TypeError, KeyError):
-            continue
+    # One easting per borehole (first valid row), sorted for logical ordering
+    boreholes = (
+        pd.DataFrame(
+            {
+                "LOCA_ID": merged_df["LOCA_ID"],
+                "easting": pd.to_numeric(merged_df["LOCA_NATE"], errors="coerce"),
+            }
+        )
+        .dropna(subset=["easting"])
+        .drop_duplicates("LOCA_ID")
+    )
 
-    if not valid_coords:
+    if boreholes.empty:
         logger.warning("No valid coordinates found")
         return None
 
-    # Sort boreholes by easting for logical ordering
-    sorted_boreholes = sorted(borehole_x_map.items(), key=lambda x: x[1])
-    ordered_boreholes = [bh_id for bh_id, _ in sorted_boreholes]
+    borehole_x_map, ordered_boreholes = _order_by_position(
+        boreholes["LOCA_ID"].to_numpy(), boreholes["easting"].to_numpy(dtype=float)
+    )
 
     return finalize_coordinate_data(merged_df, borehole_x_map, ordered_boreholes)
 
@@ -138,37 +141,47 @@ def transform_to_utm(
     bng_to_wgs84: pyproj.Transformer,
     wgs84_to_utm: pyproj.Transformer,
 ) -> Optional[Dict[str, Tuple[float, float]]]:
-    """Transform coordinates from BNG to UTM via WGS84."""
-    utm_coords = {}
-
-    for _, row in loca_df.iterrows():
-        try:
-            borehole_id = row["LOCA_ID"]
-            bng_easting = float(row["LOCA_NATE"])
-            bng_northing = float(row["LOCA_NATN"])
-
-            # BNG to WGS84
-            wgs84_lon, wgs84_lat = bng_to_wgs84.transform(bng_easting, bng_northing)
-
-            # WGS84 to UTM
-            utm_x, utm_y = wgs84_to_utm.transform(wgs84_lon, wgs84_lat)
-
-            utm_coords[borehole_id] = (utm_x, utm_y)
+    """Transform coordinates from BNG to UTM via WGS84 (all boreholes at once)."""
+    if loca_df.empty or not {"LOCA_NATE", "LOCA_NATN"} <= set(loca_df.columns):
+        logger.error("No valid coordinates could be transformed")
+        return None
 
-            logger.debug(
-                f"BH {borehole_id}: BNG({bng_easting}, {bng_northing}) -> "
-                f"WGS84({wgs84_lat:.6f}, {wgs84_lon:.6f}) -> "
-                f"UTM({utm_x:.2f}, {utm_y:.2f})"
-            )
+    boreholes = (
+        pd.DataFrame(
+            {
+                "LOCA_ID": loca_df["LOCA_ID"],
+                "easting": pd.to_numeric(loca_df["LOCA_NATE"], errors="coerce"),
+                "northing": pd.to_numeric(loca_df["LOCA_NATN"], errors="coerce"),
+            }
+        )
+        .dropna(subset=["easting", "northing"])
+        .drop_duplicates("LOCA_ID", keep="last")
+    )
 
-        except Exception as e:
-            logger.warning(f"Failed to transform coordinates for {borehole_id}: {e}")
-            continue
+    wgs84_lon, wgs84_lat = bng_to_wgs84.transform(
+        boreholes["easting"].to_numpy(dtype=float),
+        boreholes["northing"].to_numpy(dtype=float),
+    )
+    utm_x, utm_y = wgs84_to_utm.transform(wgs84_lon, wgs84_lat)
+    utm_x, utm_y = np.atleast_1d(utm_x), np.atleast_1d(utm_y)
+
+    valid = np.isfinite(utm_x) & np.isfinite(utm_y)
+    if not valid.all():
+        failed = boreholes["LOCA_ID"].to_numpy()[~valid].tolist()
+        logger.warning(f"Failed to transform coordinates for {failed}")
+
+    utm_coords = dict(
+        zip(
+            boreholes["LOCA_ID"].to_numpy()[valid].tolist(),
+            zip(utm_x[valid].tolist(), utm_y[valid].tolist()),
+        )
+    )
 
     if not utm_coords:
         logger.error("No valid coordinates could be transformed")
         return None
 
+    logger.debug(f"Transformed {len(utm_coords)} boreholes from BNG to UTM")
     return utm_coords
 
 
@@ -180,9 +193,9 @@ def project_onto_section_line(
 ) -> Optional[Dict[str, Any]]:
     """Project borehole coordinates onto the section line."""
     try:
-        from shapely.geometry import Point as ShapelyPoint, LineString
+        from shapely import LineString, line_locate_point, points
     except ImportError:
-        logger.error("Shapely library required for projection")
+        logger.error("Shapely 2 required for projection")
         return None
 
     # Create section line geometry
@@ -191,39 +204,21 @@ def project_onto_section_line(
 
     logger.debug(f"Section line length: {section_length:.2f} meters")
 
-    # Project each borehole onto the section line
-    projected_positions = {}
-
-    for borehole_id, (utm_x, utm_y) in utm_coords.items():
-        try:
-            point = ShapelyPoint(utm_x, utm_y)
-
-            # Find the closest point on the section line
-            projected_point = section_line_geom.interpolate(
-                section_line_geom.project(point)
-            )
-
-            # Calculate distance along section line
-            distance_along_line = section_line_geom.project(projected_point)
-
-            projected_positions[borehole_id] = distance_along_line
-
-            logger.debug(
-                f"BH {borehole_id}: UTM({utm_x:.2f}, {utm_y:.2f}) -> "
-                f"Distance: {distance_along_line:.2f}m"
-            )
-
-        except Exception as e:
-            logger.warning(f"Failed to project {borehole_id}: {e}")
-            continue
+    # Distance along the line of each borehole's closest point, in one call
+    borehole_ids = np.array(list(utm_coords), dtype=object)
+    distances = line_locate_point(
+        section_line_geom, points(np.array(list(utm_coords.values()), dtype=float))
+    )
 
-    if not projected_positions:
+    valid = np.isfinite(distances)
+    if not valid.any():
         logger.error("No boreholes could be projected onto section line")
         return None
 
     # Sort boreholes by position along section line
-    sorted_boreholes = sorted(projected_positions.items(), key=lambda x: x[1])
-    ordered_boreholes = [bh_id for bh_id, _ in sorted_boreholes]
+    projected_positions, ordered_boreholes = _order_by_position(
+        borehole_ids[valid], distances[valid]
+    )
 
     # Create merged data
     merged_df = pd.merge(geol_df, loca_df, on="LOCA_ID", how="inner")
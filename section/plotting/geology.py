@@ -3,12 +3,14 @@ Geology Plotting Module
 
 This module handles the geological aspects of section plotting,
 including geology color/pattern mappings, interval plotting,
-and legend creation.
+and legend creation. Intervals are drawn as a few PolyCollections
+grouped by legend code and hatch rather than one patch per interval.
 """
 
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import PolyCollection
 import numpy as np
 import re
 import logging
@@ -105,61 +107,64 @@ def plot_geological_intervals(
     """
     logger.debug("Plotting geological intervals...")
 
-    interval_count = 0
-    plotted_boreholes = set()
-
-    for _, row in merged_df.iterrows():
-        borehole_id = row["LOCA_ID"]
-        if borehole_id not in ordered_boreholes:
-            continue
-
-        bh_x = borehole_x_map[borehole_id]
-        plotted_boreholes.add(borehole_id)
-
-        # Get geological properties
-        leg = row["GEOL_LEG"]
-        color = color_map.get(leg, "#CCCCCC")
-        hatch = hatch_map.get(leg, "")
-
-        # Calculate elevations
-        elev_top = row["ELEV_TOP"]
-        elev_base = row["ELEV_BASE"]
-        thickness = elev_top - elev_base
-
-        if thickness <= 0:
-            continue  # Skip invalid intervals
+    # Intervals of the plotted boreholes, with their x positions
+    in_section = merged_df["LOCA_ID"].isin(ordered_boreholes)
+    intervals = merged_df.loc[in_section]
+    x_centres = intervals["LOCA_ID"].map(borehole_x_map).to_numpy(dtype=float)
+    elev_top = pd.to_numeric(intervals["ELEV_TOP"], errors="coerce").to_numpy(float)
+    elev_base = pd.to_numeric(intervals["ELEV_BASE"], errors="coerce").to_numpy(float)
+
+    # Skip invalid intervals (zero/negative thickness or missing elevations)
+    valid = ((elev_top - elev_base) > 0) & ~np.isnan(x_centres)
+    legs = intervals["GEOL_LEG"].to_numpy()[valid]
+    left = x_centres[valid] - borehole_width / 2
+    right = x_centres[valid] + borehole_width / 2
+    top = elev_top[valid]
+    base = elev_base[valid]
+
+    # One rectangle per interval: (n, 4, 2) vertex array
+    vertices = np.stack(
+        [
+            np.column_stack([left, base]),
+            np.column_stack([right, base]),
+            np.column_stack([right, top]),
+            np.column_stack([left, top]),
+        ],
+        axis=1,
+    )
 
-        # Plot filled rectangle for geology color
-        rect_fill = patches.Rectangle(
-            (bh_x - borehole_width / 2, elev_base),
-            borehole_width,
-            thickness,
-            facecolor=color,
-            alpha=color_alpha,
-            edgecolor="black",
-            linewidth=0.5,
+    # Fill colours: one collection per legend code
+    leg_keys = pd.Series(legs, dtype=object)
+    for leg, positions in leg_keys.groupby(leg_keys, sort=False, dropna=False).indices.items():
+        ax.add_collection(
+            PolyCollection(
+                vertices[positions],
+                facecolors=color_map.get(leg, "#CCCCCC"),
+                edgecolors="black",
+                linewidths=0.5,
+                alpha=color_alpha,
+            )
         )
-        ax.add_patch(rect_fill)
-
-        # Plot hatched rectangle for geology pattern (if any)
-        if hatch:
-            rect_hatch = patches.Rectangle(
-                (bh_x - borehole_width / 2, elev_base),
-                borehole_width,
-                thickness,
-                facecolor="none",
+
+    # Hatch patterns: one collection per hatch
+    hatches = leg_keys.map(lambda leg: hatch_map.get(leg, "") or "")
+    for hatch, positions in hatches.groupby(hatches, sort=False).indices.items():
+        if not hatch:
+            continue
+        ax.add_collection(
+            PolyCollection(
+                vertices[positions],
+                facecolors="none",
+                edgecolors="black",
+                linewidths=0.5,
                 hatch=hatch,
                 alpha=hatch_alpha,
-                edgecolor="black",
-                linewidth=0.5,
             )
-            ax.add_patch(rect_hatch)
-
-        interval_count += 1
+        )
 
     logger.info(
-        f"Plotted {interval_count} geological intervals "
-        f"across {len(plotted_boreholes)} boreholes"
+        f"Plotted {len(vertices)} geological intervals "
+        f"across {intervals['LOCA_ID'][valid].nunique()} boreholes"
     )
 
 
@@ -3,36 +3,29 @@ Main Section Plotting Interface
 
 This module provides the main plotting functions that coordinate
 all the modular components for professional geological cross-section plotting.
+The work itself is done by the staged pipeline in ``pipeline.py``.
 """
 
 import logging
 from typing import Tuple, Optional, Dict, List, Union, Any
 
-# Import modular components
-from .coordinates import prepare_coordinate_data
-from .geology import (
-    create_geology_mappings,
-    plot_geological_intervals,
-    plot_ground_surface,
-    create_professional_legend,
-    calculate_borehole_width,
-)
-from .layout import (
-    create_professional_layout,
-    add_professional_formatting,
-    add_professional_footer,
-    add_title_and_header,
-    set_axis_limits_and_aspect,
-    optimize_layout_for_legend,
+import matplotlib.pyplot as plt
+
+# Import pipeline stages
+from .pipeline import (
+    section_data_key,
+    prepare_section_data,
+    project_section_data,
+    style_section_data,
+    render_section_figure,
+    encode_section_figure,
 )
 
 # Import utilities
-from ..parsing import parse_ags_geol_section_from_string
 from ..utils import (
     convert_figure_to_base64,
     save_high_resolution_outputs,
     safe_close_figure,
-    matplotlib_figure,
 )
 
 # Import constants
@@ -55,7 +48,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-def plot_professional_borehole_sections(
+def build_section_figure(
     ags_data: List[Tuple[str, str]],
     section_line: Optional[List[Tuple[float, float]]] = None,
     show_labels: bool = True,
@@ -63,10 +56,16 @@ def plot_professional_borehole_sections(
     dpi: int = DEFAULT_DPI,
     color_alpha: float = DEFAULT_COLOR_ALPHA,
     hatch_alpha: float = DEFAULT_HATCH_ALPHA,
-    output_high_res: bool = False,
-) -> Tuple[str, Optional[str], Optional[str]]:
+    selected_boreholes: Optional[List[str]] = None,
+    ags_title: Optional[str] = None,
+    data_key: Optional[str] = None,
+    hatching: bool = True,
+) -> plt.Figure:
     """
-    Create a professional geological cross-section plot with BGS standards compliance.
+    Build the cross-section figure. The caller is responsible for closing it.
+
+    Parsed, projected and styled data come from the memoized pipeline stages,
+    so only the drawing itself is repeated for new render options.
 
     Args:
         ags_data: List of (filename, content) tuples containing AGS data
@@ -76,108 +75,152 @@ def plot_professional_borehole_sections(
         dpi: Figure resolution
         color_alpha: Alpha value for geological fill colors
         hatch_alpha: Alpha value for geological patterns
-        output_high_res: Whether to save high-resolution outputs
+        selected_boreholes: Optional LOCA_IDs to include (all if None)
+        ags_title: Optional title for the section header
+        data_key: Identifier of ags_data (e.g. the dataset ID); computed
+            from the contents if None
+        hatching: Draw hatch patterns (disable for fast previews)
 
     Returns:
-        Tuple of (base64_image, svg_content, pdf_path) or error message
+        matplotlib Figure
+
+    Raises:
+        ValueError: If the AGS data contains nothing to plot
     """
-    logger.info("Starting professional borehole sections plot generation")
+    data_key = data_key or section_data_key(ags_data)
 
-    try:
-        # Parse AGS data
-        parse_result = parse_ags_geol_section_from_string(ags_data)
-        if not parse_result["success"]:
-            error_msg = (
-                f"AGS parsing failed: {parse_result.get('error', 'Unknown error')}"
-            )
-            logger.error(error_msg)
-            return error_msg, None, None
-
-        geol_df = parse_result["geol_df"]
-        loca_df = parse_result["loca_df"]
-        abbr_df = parse_result.get("abbr_df")
-        ags_title = parse_result.get("title", "Cross-Section")
-
-        logger.info(
-            f"Parsed AGS data: {len(geol_df)} geological records, {len(loca_df)} locations"
-        )
+    prepared = prepare_section_data(ags_data, selected_boreholes, data_key)
+    if prepared["geol_df"].empty or prepared["loca_df"].empty:
+        raise ValueError("AGS data contains no GEOL/LOCA records to plot")
 
-        # Prepare coordinate data
-        coord_data = prepare_coordinate_data(geol_df, loca_df, section_line)
-        if coord_data is None:
-            error_msg = "Failed to prepare coordinate data for plotting"
-            logger.error(error_msg)
-            return error_msg, None, None
+    logger.info(
+        f"Prepared AGS data: {len(prepared['geol_df'])} geological records, "
+        f"{len(prepared['loca_df'])} locations"
+    )
 
-        merged_df = coord_data["merged_df"]
-        borehole_x_map = coord_data["borehole_x_map"]
-        ordered_boreholes = coord_data["ordered_boreholes"]
+    projected = project_section_data(
+        ags_data, selected_boreholes, section_line, data_key
+    )
+    if projected is None:
+        raise ValueError("Failed to prepare coordinate data for plotting")
 
-        logger.info(f"Coordinate data prepared for {len(ordered_boreholes)} boreholes")
+    logger.info(
+        f"Coordinate data prepared for {len(projected['ordered_boreholes'])} boreholes"
+    )
 
-        # Calculate elevations
-        merged_df["ELEV_TOP"] = merged_df["LOCA_GL"] - merged_df["GEOL_TOP"].abs()
-        merged_df["ELEV_BASE"] = merged_df["LOCA_GL"] - merged_df["GEOL_BASE"].abs()
+    styles = style_section_data(ags_data, selected_boreholes, data_key)
+
+    return render_section_figure(
+        projected,
+        styles,
+        show_labels,
+        figsize,
+        dpi,
+        color_alpha,
+        hatch_alpha,
+        ags_title,
+        hatching,
+    )
 
-        # Create geology mappings
-        color_map, hatch_map, leg_label_map = create_geology_mappings(
-            merged_df, abbr_df
-        )
 
-        # Calculate borehole width
-        borehole_width = calculate_borehole_width(
-            borehole_x_map, len(ordered_boreholes)
-        )
+def render_section_image(
+    ags_data: List[Tuple[str, str]],
+    section_line: Optional[List[Tuple[float, float]]] = None,
+    show_labels: bool = True,
+    dpi: int = DEFAULT_DPI,
+    image_format: str = "png",
+    selected_boreholes: Optional[List[str]] = None,
+    tight: bool = True,
+    ticket: Optional[Any] = None,
+    **kwargs,
+) -> bytes:
+    """
+    Render a cross-section straight to encoded image bytes.
 
-        # Create professional layout
-        with matplotlib_figure():
-            fig, ax = create_professional_layout(figsize, dpi, ags_title)
-
-            # Plot geological intervals
-            plot_geological_intervals(
-                ax,
-                merged_df,
-                borehole_x_map,
-                ordered_boreholes,
-                color_map,
-                hatch_map,
-                borehole_width,
-                color_alpha,
-                hatch_alpha,
-            )
-
-            # Plot ground surface
-            plot_ground_surface(
-                ax, merged_df, borehole_x_map, ordered_boreholes, borehole_width
-            )
-
-            # Set axis limits and aspect
-            set_axis_limits_and_aspect(ax, merged_df, borehole_x_map)
-
-            # Add professional formatting
-            add_professional_formatting(
-                ax, merged_df, borehole_x_map, ordered_boreholes, show_labels
-            )
-
-            # Add title and header
-            add_title_and_header(fig, ax, ags_title, figsize)
-
-            # Optimize layout for legend
-            has_legend = bool(color_map)
-            optimize_layout_for_legend(fig, ax, has_legend, figsize)
-
-            # Create legend
-            if has_legend:
-                create_professional_legend(
-                    ax, color_map, hatch_map, leg_label_map, figsize
-                )
+    When a ticket is given, the render stops before drawing and again before
+    encoding if a newer render has superseded it.
+
+    Args:
+        ags_data: List of (filename, content) tuples containing AGS data
+        section_line: Optional polyline coordinates for projection
+        show_labels: Whether to show borehole labels
+        dpi: Output resolution
+        image_format: Matplotlib output format ('png', 'pdf', 'svg', ...)
+        selected_boreholes: Optional LOCA_IDs to include (all if None)
+        tight: Crop to the drawn content (extra layout pass)
+        ticket: Optional ``render_workers.RenderTicket`` for this render
+        **kwargs: Additional arguments passed to build_section_figure
 
-            # Add footer
-            add_professional_footer(fig, figsize)
+    Returns:
+        bytes: Encoded image
+
+    Raises:
+        render_workers.RenderCancelled: If the ticket was superseded
+    """
+    if ticket is not None:
+        ticket.check()
 
+    fig = build_section_figure(
+        ags_data,
+        section_line=section_line,
+        show_labels=show_labels,
+        dpi=dpi,
+        selected_boreholes=selected_boreholes,
+        **kwargs,
+    )
+    try:
+        if ticket is not None:
+            ticket.check()
+        return encode_section_figure(fig, dpi, image_format, tight)
+    finally:
+        safe_close_figure(fig)
+
+
+def plot_professional_borehole_sections(
+    ags_data: List[Tuple[str, str]],
+    section_line: Optional[List[Tuple[float, float]]] = None,
+    show_labels: bool = True,
+    figsize: Tuple[float, float] = (A4_LANDSCAPE_WIDTH, A4_LANDSCAPE_HEIGHT),
+    dpi: int = DEFAULT_DPI,
+    color_alpha: float = DEFAULT_COLOR_ALPHA,
+    hatch_alpha: float = DEFAULT_HATCH_ALPHA,
+    output_high_res: bool = False,
+    selected_boreholes: Optional[List[str]] = None,
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Create a professional geological cross-section plot with BGS standards compliance.
+
+    Args:
+        ags_data: List of (filename, content) tuples containing AGS data
+        section_line: Optional polyline coordinates for projection [(lat1, lon1), ...]
+        show_labels: Whether to show borehole labels
+        figsize: Figure size in inches (width, height)
+        dpi: Figure resolution
+        color_alpha: Alpha value for geological fill colors
+        hatch_alpha: Alpha value for geological patterns
+        output_high_res: Whether to save high-resolution outputs
+        selected_boreholes: Optional LOCA_IDs to include (all if None)
+
+    Returns:
+        Tuple of (base64_image, svg_content, pdf_path) or error message
+    """
+    logger.info("Starting professional borehole sections plot generation")
+
+    try:
+        fig = build_section_figure(
+            ags_data,
+            section_line=section_line,
+            show_labels=show_labels,
+            figsize=figsize,
+            dpi=dpi,
+            color_alpha=color_alpha,
+            hatch_alpha=hatch_alpha,
+            selected_boreholes=selected_boreholes,
+        )
+        try:
             # Convert to outputs
             logger.info("Converting plot to output formats")
-            base64_img = convert_figure_to_base64(fig)
+            base64_img = convert_figure_to_base64(fig, dpi=dpi)
 
             svg_content = None
             pdf_path = None
@@ -185,11 +228,11 @@ def plot_professional_borehole_sections(
                 svg_content, pdf_path = save_high_resolution_outputs(
                     fig, "professional_section"
                 )
-
+        finally:
             safe_close_figure(fig)
 
-            logger.info("Professional section plot generation completed successfully")
-            return base64_img, svg_content, pdf_path
+        logger.info("Professional section plot generation completed successfully")
+        return base64_img, svg_content, pdf_path
 
     except Exception as e:
         logger.error(f"Error in professional section plotting: {e}", exc_info=True)
@@ -0,0 +1,327 @@
+"""
+Staged Section Pipeline
+
+This module splits cross-section generation into explicit stages, each
+memoized on its own inputs through the shared derived-view cache:
+
+1. prepare - parse and type the AGS data, then filter it to the selected
+   boreholes (keyed by data key, then by data key and selection)
+2. project - merge GEOL/LOCA, project boreholes onto the section line and
+   compute elevations (keyed by data key, selection and section line)
+3. style   - geology colour, hatch and legend label maps (keyed by data key
+   and selection)
+4. render  - draw the matplotlib figure from the cached stage outputs
+   (optionally without hatch patterns for fast previews)
+5. encode  - save the figure to image bytes (optionally without the extra
+   tight-bounding-box layout pass)
+
+Changing only render options (labels, DPI, alpha) reuses the projected data;
+a new polyline reuses the parsed and filtered data. Figures are not cached;
+encoded images are cached by ``section.render_cache``.
+
+Stage outputs are shared between callers and must be treated as read-only.
+"""
+
+import hashlib
+import io
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+from state_management.derived_views import derived_view
+
+from .coordinates import prepare_coordinate_data
+from .geology import (
+    create_geology_mappings,
+    plot_geological_intervals,
+    plot_ground_surface,
+    create_professional_legend,
+    calculate_borehole_width,
+)
+from .layout import (
+    create_professional_layout,
+    add_professional_formatting,
+    add_professional_footer,
+    add_title_and_header,
+    set_axis_limits_and_aspect,
+    optimize_layout_for_legend,
+)
+from ..parsing import parse_ags_geol_section_from_string
+from ..render_cache import hash_section_line
+from ..utils import safe_close_figure
+
+logger = logging.getLogger(__name__)
+
+ALL_BOREHOLES = "all"
+STRAIGHT_SECTION = "straight"
+
+
+def section_data_key(ags_data: List[Tuple[str, str]]) -> str:
+    """Compute a content hash identifying a set of AGS files."""
+    digest = hashlib.sha1()
+    for filename, content in ags_data:
+        digest.update(str(filename).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(str(content).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def _selection_dependency(selected_boreholes: Optional[List[str]]) -> Any:
+    if selected_boreholes is None:
+        return ALL_BOREHOLES
+    return tuple(sorted({str(borehole_id) for borehole_id in selected_boreholes}))
+
+
+def _line_dependency(section_line: Optional[List[Tuple[float, float]]]) -> str:
+    return hash_section_line(section_line) or STRAIGHT_SECTION
+
+
+@derived_view("section_parse", depends_on=("data_key",))
+def _parse_stage(
+    ags_data: List[Tuple[str, str]], data_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """Parse and combine GEOL, LOCA and ABBR data from all AGS files."""
+    geol_frames, loca_frames, abbr_frames = [], [], []
+    for filename, content in ags_data:
+        geol_df, loca_df, abbr_df = parse_ags_geol_section_from_string(content)
+        logger.debug(f"Parsed {filename}: {len(geol_df)} GEOL, {len(loca_df)} LOCA")
+        if not geol_df.empty:
+            geol_frames.append(geol_df)
+        if not loca_df.empty:
+            loca_frames.append(loca_df)
+        if abbr_df is not None and not abbr_df.empty:
+            abbr_frames.append(abbr_df)
+
+    return {
+        "geol_df": (
+            pd.concat(geol_frames, ignore_index=True) if geol_frames else pd.DataFrame()
+        ),
+        "loca_df": (
+            pd.concat(loca_frames, ignore_index=True).drop_duplicates("LOCA_ID")
+            if loca_frames
+            else pd.DataFrame()
+        ),
+        "abbr_df": pd.concat(abbr_frames, ignore_index=True) if abbr_frames else None,
+    }
+
+
+@derived_view("section_prepare", depends_on=("data_key", "selection"))
+def _prepare_stage(
+    ags_data: List[Tuple[str, str]],
+    selected_boreholes: Optional[List[str]],
+    data_key: Optional[str] = None,
+    selection: Any = None,
+) -> Dict[str, Any]:
+    """Filter parsed data to the selected boreholes that have a location."""
+    parsed = _parse_stage(ags_data, data_key=data_key)
+    geol_df, loca_df = parsed["geol_df"], parsed["loca_df"]
+    if geol_df.empty or loca_df.empty:
+        return {"geol_df": geol_df, "loca_df": loca_df, "abbr_df": parsed["abbr_df"]}
+
+    if selected_boreholes is not None:
+        selected = {str(borehole_id) for borehole_id in selected_boreholes}
+        loca_df = loca_df[loca_df["LOCA_ID"].astype(str).isin(selected)]
+    geol_df = geol_df[geol_df["LOCA_ID"].isin(loca_df["LOCA_ID"])]
+
+    return {"geol_df": geol_df, "loca_df": loca_df, "abbr_df": parsed["abbr_df"]}
+
+
+@derived_view("section_project", depends_on=("data_key", "selection", "line"))
+def _project_stage(
+    ags_data: List[Tuple[str, str]],
+    selected_boreholes: Optional[List[str]],
+    section_line: Optional[List[Tuple[float, float]]],
+    data_key: Optional[str] = None,
+    selection: Any = None,
+    line: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """Merge, project and compute elevations for the prepared data."""
+    prepared = _prepare_stage(
+        ags_data, selected_boreholes, data_key=data_key, selection=selection
+    )
+    coord_data = prepare_coordinate_data(
+        prepared["geol_df"], prepared["loca_df"], section_line
+    )
+    if coord_data is None:
+        return None
+
+    merged_df = coord_data["merged_df"]
+    merged_df["ELEV_TOP"] = merged_df["LOCA_GL"] - merged_df["GEOL_TOP"].abs()
+    merged_df["ELEV_BASE"] = merged_df["LOCA_GL"] - merged_df["GEOL_BASE"].abs()
+    return coord_data
+
+
+@derived_view("section_style", depends_on=("data_key", "selection"))
+def _style_stage(
+    ags_data: List[Tuple[str, str]],
+    selected_boreholes: Optional[List[str]],
+    data_key: Optional[str] = None,
+    selection: Any = None,
+) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """Build geology colour, hatch and label maps for the prepared data."""
+    prepared = _prepare_stage(
+        ags_data, selected_boreholes, data_key=data_key, selection=selection
+    )
+    return create_geology_mappings(prepared["geol_df"], prepared["abbr_df"])
+
+
+def prepare_section_data(
+    ags_data: List[Tuple[str, str]],
+    selected_boreholes: Optional[List[str]] = None,
+    data_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Prepare stage: parsed GEOL/LOCA/ABBR frames for the selected boreholes.
+
+    Args:
+        ags_data: List of (filename, content) tuples containing AGS data
+        selected_boreholes: Optional LOCA_IDs to keep (all boreholes if None)
+        data_key: Identifier of ags_data; computed from the contents if None
+
+    Returns:
+        dict: ``{"geol_df", "loca_df", "abbr_df"}``
+    """
+    return _prepare_stage(
+        ags_data,
+        selected_boreholes,
+        data_key=data_key or section_data_key(ags_data),
+        selection=_selection_dependency(selected_boreholes),
+    )
+
+
+def project_section_data(
+    ags_data: List[Tuple[str, str]],
+    selected_boreholes: Optional[List[str]] = None,
+    section_line: Optional[List[Tuple[float, float]]] = None,
+    data_key: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Project stage: merged data with elevations and borehole positions.
+
+    Returns:
+        dict: ``{"merged_df", "borehole_x_map", "ordered_boreholes"}``, or
+        None if no borehole could be positioned
+    """
+    return _project_stage(
+        ags_data,
+        selected_boreholes,
+        section_line,
+        data_key=data_key or section_data_key(ags_data),
+        selection=_selection_dependency(selected_boreholes),
+        line=_line_dependency(section_line),
+    )
+
+
+def style_section_data(
+    ags_data: List[Tuple[str, str]],
+    selected_boreholes: Optional[List[str]] = None,
+    data_key: Optional[str] = None,
+) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """
+    Style stage: geology mappings for the selected boreholes.
+
+    Returns:
+        Tuple of (color_map, hatch_map, leg_label_map)
+    """
+    return _style_stage(
+        ags_data,
+        selected_boreholes,
+        data_key=data_key or section_data_key(ags_data),
+        selection=_selection_dependency(selected_boreholes),
+    )
+
+
+def render_section_figure(
+    projected: Dict[str, Any],
+    styles: Tuple[Dict[str, str], Dict[str, str], Dict[str, str]],
+    show_labels: bool,
+    figsize: Tuple[float, float],
+    dpi: int,
+    color_alpha: float,
+    hatch_alpha: float,
+    ags_title: Optional[str] = None,
+    hatching: bool = True,
+) -> plt.Figure:
+    """
+    Render stage: draw the section figure. The caller must close it.
+
+    Args:
+        projected: Output of project_section_data
+        styles: Output of style_section_data
+        show_labels: Whether to show borehole labels
+        figsize: Figure size in inches (width, height)
+        dpi: Figure resolution
+        color_alpha: Alpha value for geological fill colors
+        hatch_alpha: Alpha value for geological patterns
+        ags_title: Optional title for the section header
+        hatching: Draw hatch patterns; previews skip them to render faster
+
+    Returns:
+        matplotlib Figure
+    """
+    merged_df = projected["merged_df"]
+    borehole_x_map = projected["borehole_x_map"]
+    ordered_boreholes = projected["ordered_boreholes"]
+    color_map, hatch_map, leg_label_map = styles
+    if not hatching:
+        hatch_map = {}
+
+    borehole_width = calculate_borehole_width(borehole_x_map, len(ordered_boreholes))
+
+    fig, ax = create_professional_layout(figsize, dpi, ags_title)
+    try:
+        plot_geological_intervals(
+            ax,
+            merged_df,
+            borehole_x_map,
+            ordered_boreholes,
+            color_map,
+            hatch_map,
+            borehole_width,
+            color_alpha,
+            hatch_alpha,
+        )
+        plot_ground_surface(
+            ax, merged_df, borehole_x_map, ordered_boreholes, borehole_width
+        )
+        set_axis_limits_and_aspect(ax, merged_df, borehole_x_map)
+        add_professional_formatting(
+            ax, merged_df, borehole_x_map, ordered_boreholes, show_labels
+        )
+        add_title_and_header(fig, ax, ags_title, figsize)
+
+        has_legend = bool(color_map)
+        optimize_layout_for_legend(fig, ax, has_legend, figsize)
+        if has_legend:
+            create_professional_legend(ax, color_map, hatch_map, leg_label_map, figsize)
+
+        add_professional_footer(fig, figsize)
+    except Exception:
+        safe_close_figure(fig)
+        raise
+
+    return fig
+
+
+def encode_section_figure(
+    fig: plt.Figure, dpi: int, image_format: str = "png", tight: bool = True
+) -> bytes:
+    """
+    Encode stage: save a figure to image bytes.
+
+    ``tight`` crops to the drawn content, which costs an extra layout pass;
+    previews keep the fixed A4 page instead.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(
+        buffer,
+        format=image_format,
+        dpi=dpi,
+        bbox_inches="tight" if tight else None,
+        facecolor="white",
+        edgecolor="none",
+    )
+    return buffer.getvalue()
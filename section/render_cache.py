@@ -0,0 +1,494 @@
+"""
+Section Render Cache Module.
+
+Toggling "show labels" back, re-checking the same boreholes or pressing
+"download" used to re-parse the AGS data and redraw the whole matplotlib
+figure. This module caches the encoded section images so that repeated
+requests for an identical render are served from memory.
+
+Key Features:
+- **Render Identity**: Entries are keyed by dataset hash, sorted borehole IDs,
+  section line hash, label toggle, DPI, output format and render variant
+  (fast "preview" or full-detail "full")
+- **Byte-Bounded LRU**: Least recently used images are evicted once the total
+  cached size exceeds ``PERFORMANCE_CONFIG.SECTION_RENDER_CACHE_MAX_MB``
+- **Observable**: Hits, misses, evictions and cached bytes via ``get_stats()``
+- **Multi-Page Renders**: Borehole logs are cached as one entry per page
+  under a shared key via ``get_or_render_pages()``
+- **Single Flight**: Concurrent misses for the same key share one render
+  (see ``render_workers.SingleFlight``)
+- **Served by URL**: Each entry has a short image ID; ``image_src()`` returns a
+  ``PERFORMANCE_CONFIG.RENDER_IMAGE_ROUTE`` URL for it (served with ETag and
+  Cache-Control headers by ``app_modules.server_routes``) instead of a base64
+  data URI
+- **Pinned Until Fetched**: Entries handed out by URL are not evicted until
+  the browser fetches them (or ``RENDER_IMAGE_PIN_SECONDS`` pass); when the
+  pin budget is used up, ``image_src()`` returns a data URI instead
+- **Separate Log Budget**: Borehole log pages live in their own cache
+  (``get_log_render_cache()``) so they never evict section previews
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import mimetypes
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app_constants import PERFORMANCE_CONFIG
+from render_workers import get_render_single_flight
+
+logger = logging.getLogger(__name__)
+
+BYTES_PER_MB = 1024 * 1024
+MAX_PAGE_SETS = 1024
+
+RenderKey = Tuple[str, Tuple[str, ...], Optional[str], bool, int, str, str]
+
+
+def hash_section_line(
+    section_line: Optional[Sequence[Sequence[float]]],
+) -> Optional[str]:
+    """
+    Hash a section polyline for use in a render key.
+
+    Coordinates are rounded to 1e-7 so that float noise from the browser
+    does not produce distinct keys for the same line.
+
+    Returns:
+        str: Short hex digest, or None for a straight (non-polyline) section
+    """
+    if not section_line:
+        return None
+    rounded = [[round(float(value), 7) for value in point] for point in section_line]
+    return hashlib.sha1(json.dumps(rounded).encode("utf-8")).hexdigest()[:16]
+
+
+def make_render_key(
+    dataset_id: str,
+    borehole_ids: Iterable[Any],
+    section_line: Optional[Sequence[Sequence[float]]] = None,
+    show_labels: bool = True,
+    dpi: int = 150,
+    image_format: str = "png",
+    variant: str = "full",
+) -> RenderKey:
+    """
+    Build the cache key identifying a section render.
+
+    Args:
+        dataset_id: Content hash of the uploaded AGS files
+        borehole_ids: Boreholes included in the section (order-independent)
+        section_line: Optional polyline the boreholes are projected onto
+        show_labels: Whether borehole labels are drawn
+        dpi: Output resolution
+        image_format: Output format ('png', 'pdf', 'svg', ...)
+        variant: "preview" for reduced-detail renders, "full" otherwise
+
+    Returns:
+        tuple: Hashable render key
+    """
+    return (
+        str(dataset_id),
+        tuple(sorted({str(borehole_id) for borehole_id in borehole_ids})),
+        hash_section_line(section_line),
+        bool(show_labels),
+        int(dpi),
+        image_format.lower(),
+        variant,
+    )
+
+
+def render_image_id(key: RenderKey) -> str:
+    """Get the short URL-safe ID of a render key."""
+    return hashlib.sha1(json.dumps(list(key)).encode("utf-8")).hexdigest()[:24]
+
+
+def render_image_mimetype(image_format: str) -> str:
+    """Get the MIME type of an image format ('png', 'pdf', 'svg', ...)."""
+    return mimetypes.types_map.get(f".{image_format}", "application/octet-stream")
+
+
+class SectionRenderCache:
+    """LRU cache of encoded section images bounded by total size in bytes."""
+
+    def __init__(
+        self, max_mb: float = PERFORMANCE_CONFIG.SECTION_RENDER_CACHE_MAX_MB
+    ):
+        self.max_bytes = int(max_mb * BYTES_PER_MB)
+        self._entries: "OrderedDict[RenderKey, bytes]" = OrderedDict()
+        self._keys_by_id: Dict[str, RenderKey] = {}
+        self._page_counts: "OrderedDict[RenderKey, int]" = OrderedDict()
+        # Keys served by URL but not yet fetched: key -> (pins, expiry, bytes)
+        self._pins: Dict[RenderKey, Tuple[int, float, int]] = {}
+        self._pinned_bytes = 0
+        self._total_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "render_seconds": 0.0}
+        self._lock = threading.Lock()
+
+    def get(self, key: RenderKey) -> Optional[bytes]:
+        """Get a cached image, marking it as recently used."""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: RenderKey, data: bytes) -> None:
+        """Cache an image, evicting least recently used entries as needed."""
+        size = len(data)
+        if size > self.max_bytes:
+            logger.debug(f"Section render of {size} bytes exceeds cache size")
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous)
+            self._entries[key] = data
+            self._keys_by_id[render_image_id(key)] = key
+            self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Evict least recently used unpinned entries until within budget."""
+        self._expire_pins()
+        for key in list(self._entries):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if key in self._pins:
+                continue
+            evicted = self._entries.pop(key)
+            self._keys_by_id.pop(render_image_id(key), None)
+            self._total_bytes -= len(evicted)
+            self._stats["evictions"] += 1
+
+    def _expire_pins(self) -> None:
+        """Release pins whose images were never fetched."""
+        now = time.monotonic()
+        for key, (_, expiry, size) in list(self._pins.items()):
+            if expiry <= now:
+                del self._pins[key]
+                self._pinned_bytes -= size
+
+    def _pin(self, key: RenderKey) -> bool:
+        """
+        Pin a cached entry until its URL is fetched.
+
+        Returns:
+            bool: False if the entry is not cached or the pin budget is full
+        """
+        with self._lock:
+            self._expire_pins()
+            data = self._entries.get(key)
+            if data is None:
+                return False
+            expiry = time.monotonic() + PERFORMANCE_CONFIG.RENDER_IMAGE_PIN_SECONDS
+            if key in self._pins:
+                count, _, size = self._pins[key]
+                self._pins[key] = (count + 1, expiry, size)
+                return True
+            max_pinned = self.max_bytes * PERFORMANCE_CONFIG.RENDER_IMAGE_PIN_FRACTION
+            if self._pinned_bytes + len(data) > max_pinned:
+                return False
+            self._pins[key] = (1, expiry, len(data))
+            self._pinned_bytes += len(data)
+            return True
+
+    def _release_pin(self, key: RenderKey) -> None:
+        """Release one pin of an entry (called with the lock held)."""
+        pin = self._pins.get(key)
+        if pin is None:
+            return
+        count, expiry, size = pin
+        if count > 1:
+            self._pins[key] = (count - 1, expiry, size)
+        else:
+            del self._pins[key]
+            self._pinned_bytes -= size
+
+    def get_by_id(self, image_id: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Get a cached image by its image ID, releasing the pin taken when its
+        URL was handed out.
+
+        Returns:
+            tuple: (image bytes, MIME type), or None if not (or no longer) cached
+        """
+        with self._lock:
+            key = self._keys_by_id.get(image_id)
+            data = self._entries.get(key) if key is not None else None
+            if data is None:
+                return None
+            self._entries.move_to_end(key)
+            self._release_pin(key)
+        return data, render_image_mimetype(key[5])
+
+    def image_src(self, key: RenderKey, data: Optional[bytes] = None) -> str:
+        """
+        Get an ``html.Img`` source for a rendered image.
+
+        Args:
+            key: Render key from make_render_key
+            data: Encoded image; cached under key if given
+
+        Returns:
+            str: URL of the cached image (pinned until fetched), or a base64
+            data URI if the image is too large to cache or too much is pinned
+        """
+        if data is None:
+            data = self.get(key)
+            if data is None:
+                raise KeyError(f"No cached render for {key}")
+        elif self.get(key) is None:
+            self.put(key, data)
+
+        image_format = key[5]
+        # Images larger than the whole cache are never stored
+        if self._pin(key):
+            return (
+                f"{PERFORMANCE_CONFIG.RENDER_IMAGE_ROUTE}/"
+                f"{render_image_id(key)}.{image_format}"
+            )
+
+        encoded = base64.b64encode(data).decode("ascii")
+        return f"data:{render_image_mimetype(image_format)};base64,{encoded}"
+
+    def get_or_render(self, key: RenderKey, render: Callable[[], bytes]) -> bytes:
+        """
+        Return the cached image for a key, rendering and caching it on a miss.
+
+        Concurrent misses for the same key are coalesced into one render.
+
+        Args:
+            key: Render key from make_render_key
+            render: Zero-argument function producing the encoded image
+
+        Returns:
+            bytes: Encoded image
+        """
+        data = self.get(key)
+        if data is not None:
+            with self._lock:
+                self._stats["hits"] += 1
+            logger.info(f"Section render cache hit ({len(data) / 1024:.1f}KB)")
+            return data
+
+        def render_and_cache() -> bytes:
+            # A render for this key may have finished since the lookup above
+            data = self.get(key)
+            if data is not None:
+                return data
+
+            start = time.perf_counter()
+            data = render()
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._stats["misses"] += 1
+                self._stats["render_seconds"] += elapsed
+            self.put(key, data)
+            logger.info(
+                f"Rendered section in {elapsed:.2f}s ({len(data) / 1024:.1f}KB, cached)"
+            )
+            return data
+
+        return get_render_single_flight().do(("section_render", key), render_and_cache)
+
+    @staticmethod
+    def page_key(key: RenderKey, page_number: int) -> RenderKey:
+        """Get the key of one page of a multi-page render."""
+        return key[:-1] + (f"{key[-1]}-page-{page_number}",)
+
+    def _get_pages(self, key: RenderKey) -> Optional[List[Tuple[RenderKey, bytes]]]:
+        with self._lock:
+            count = self._page_counts.get(key)
+            if count is None:
+                return None
+            self._page_counts.move_to_end(key)
+
+        pages = []
+        for page_number in range(1, count + 1):
+            page_key = self.page_key(key, page_number)
+            data = self.get(page_key)
+            if data is None:
+                # A page was evicted; the whole render must be repeated
+                with self._lock:
+                    self._page_counts.pop(key, None)
+                return None
+            pages.append((page_key, data))
+        return pages
+
+    def get_or_render_pages(
+        self, key: RenderKey, render_pages: Callable[[], List[bytes]]
+    ) -> List[Tuple[RenderKey, bytes]]:
+        """
+        Multi-page variant of get_or_render (e.g. borehole logs).
+
+        Each page is cached (and served by URL) as its own entry; the set is
+        only reused while all of its pages are cached.
+
+        Args:
+            key: Render key from make_render_key, identifying the whole render
+            render_pages: Zero-argument function producing encoded pages
+
+        Returns:
+            list: (page key, page bytes) for each page
+        """
+        pages = self._get_pages(key)
+        if pages is not None:
+            with self._lock:
+                self._stats["hits"] += 1
+            logger.info(f"Render cache hit ({len(pages)} page(s))")
+            return pages
+
+        def render_and_cache() -> List[Tuple[RenderKey, bytes]]:
+            pages = self._get_pages(key)
+            if pages is not None:
+                return pages
+
+            start = time.perf_counter()
+            rendered = render_pages()
+            elapsed = time.perf_counter() - start
+
+            pages = [
+                (self.page_key(key, page_number), data)
+                for page_number, data in enumerate(rendered, start=1)
+            ]
+            for page_key, data in pages:
+                self.put(page_key, data)
+            with self._lock:
+                self._stats["misses"] += 1
+                self._stats["render_seconds"] += elapsed
+                self._page_counts[key] = len(pages)
+                self._page_counts.move_to_end(key)
+                while len(self._page_counts) > MAX_PAGE_SETS:
+                    self._page_counts.popitem(last=False)
+            logger.info(f"Rendered {len(pages)} page(s) in {elapsed:.2f}s (cached)")
+            return pages
+
+        return get_render_single_flight().do(("page_render", key), render_and_cache)
+
+    def clear_cache(self) -> None:
+        """Drop all cached images (statistics are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_id.clear()
+            self._page_counts.clear()
+            self._pins.clear()
+            self._pinned_bytes = 0
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts and cache occupancy."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "cached_bytes": self._total_bytes,
+                "pinned": len(self._pins),
+                "pinned_bytes": self._pinned_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+def log_page_srcs(
+    dataset_id: str,
+    borehole_id: str,
+    render_pages: Callable[[], List[bytes]],
+    show_labels: bool = True,
+    dpi: int = 150,
+) -> List[str]:
+    """
+    Get an ``html.Img`` source for each page of a borehole log, rendering
+    the log only if it is not cached.
+
+    Args:
+        dataset_id: Content hash of the uploaded AGS files
+        borehole_id: Borehole the log is drawn for
+        render_pages: Zero-argument function producing PNG bytes per page
+        show_labels: Whether labels are drawn
+        dpi: Resolution the pages are rendered at
+
+    Returns:
+        list: Image URLs (or data URIs for pages too large to cache)
+    """
+    cache = get_log_render_cache()
+    key = make_render_key(
+        dataset_id, [borehole_id], None, show_labels, dpi, "png", "log"
+    )
+    return [
+        cache.image_src(page_key, data)
+        for page_key, data in cache.get_or_render_pages(key, render_pages)
+    ]
+
+
+def warm_log_pages(
+    dataset_id: str,
+    borehole_id: str,
+    render_pages: Callable[[], List[bytes]],
+    show_labels: bool = True,
+    dpi: int = 150,
+) -> int:
+    """
+    Render a borehole log into the cache ahead of a click, without handing
+    out (and so pinning) image URLs. Arguments are as for log_page_srcs.
+
+    Returns:
+        int: Number of pages cached
+    """
+    key = make_render_key(
+        dataset_id, [borehole_id], None, show_labels, dpi, "png", "log"
+    )
+    return len(get_log_render_cache().get_or_render_pages(key, render_pages))
+
+
+# Global render cache instances
+_section_render_cache: Optional[SectionRenderCache] = None
+_log_render_cache: Optional[SectionRenderCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_section_render_cache() -> SectionRenderCache:
+    """Get the global section render cache."""
+    global _section_render_cache
+    if _section_render_cache is None:
+        with _cache_lock:
+            if _section_render_cache is None:
+                _section_render_cache = SectionRenderCache()
+    return _section_render_cache
+
+
+def get_log_render_cache() -> SectionRenderCache:
+    """Get the global borehole log page cache (separate from sections)."""
+    global _log_render_cache
+    if _log_render_cache is None:
+        with _cache_lock:
+            if _log_render_cache is None:
+                _log_render_cache = SectionRenderCache(
+                    PERFORMANCE_CONFIG.LOG_RENDER_CACHE_MAX_MB
+                )
+    return _log_render_cache
+
+
+def get_rendered_image(image_id: str) -> Optional[Tuple[bytes, str]]:
+    """
+    Get a section or log image by its image ID.
+
+    Returns:
+        tuple: (image bytes, MIME type), or None if not (or no longer) cached
+    """
+    for cache in (get_section_render_cache(), get_log_render_cache()):
+        cached = cache.get_by_id(image_id)
+        if cached is not None:
+            return cached
+    return None
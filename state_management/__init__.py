@@ -6,6 +6,20 @@ eliminating the chaotic "State Spaghetti" pattern identified in the health repor
 """
 
 from .app_state import AppState, get_app_state_manager
+from .store_codec import decode_column, decode_dataframe, encode_dataframe
+from .derived_views import (
+    DerivedViewCache,
+    derived_view,
+    get_borehole_frame,
+    get_derived_view_cache,
+    selection_key,
+)
+from .session_store import (
+    SessionStateStore,
+    bind_session_id,
+    get_current_session_id,
+    get_session_state_store,
+)
 from .state_models import (
     BoreholeData,
     MapState,
@@ -17,6 +31,18 @@ from .state_models import (
 __all__ = [
     "AppState",
     "get_app_state_manager",
+    "SessionStateStore",
+    "bind_session_id",
+    "get_current_session_id",
+    "get_session_state_store",
+    "encode_dataframe",
+    "decode_dataframe",
+    "decode_column",
+    "DerivedViewCache",
+    "derived_view",
+    "get_borehole_frame",
+    "get_derived_view_cache",
+    "selection_key",
     "BoreholeData",
     "MapState",
     "SelectionState",
@@ -1,8 +1,9 @@
 """
 Centralized Application State Manager for Consistent Data Management.
 
-This module provides a sophisticated singleton state manager that maintains all
-application state in a centralized, thread-safe manner. It replaces fragmented
+This module provides a sophisticated state manager that maintains all
+application state in a centralized, thread-safe manner, with one instance per
+browser session (see session_store). It replaces fragmented
 state management patterns with a professional, scalable solution that provides
 reliable data consistency across the entire Geo Borehole Sections Render application.
 
@@ -60,6 +61,7 @@ from .state_models import (
     PlotState,
     UploadState,
 )
+from .store_codec import decode_dataframe, encode_dataframe
 
 logger = logging.getLogger(__name__)
 
@@ -201,6 +203,24 @@ class AppState:
                 "last_updated": self._borehole_data.last_updated.isoformat(),
             }
 
+    def estimate_memory_bytes(self) -> int:
+        """
+        Estimate the memory held by this state container.
+
+        Counts the borehole DataFrame, raw AGS file content and the last
+        rendered section plot, which dominate a session's footprint.
+        """
+        with self._lock:
+            total = 0
+            loca_df = self._borehole_data.loca_df
+            if loca_df is not None:
+                total += int(loca_df.memory_usage(deep=True).sum())
+            for content in (self._borehole_data.filename_map or {}).values():
+                total += len(content) if content else 0
+            if self._plot_state.last_generated_section:
+                total += len(self._plot_state.last_generated_section)
+            return total
+
     def add_change_listener(self, callback):
         """Add a callback to be notified of state changes."""
         with self._lock:
@@ -229,13 +249,9 @@ class AppState:
         while providing centralized state management.
         """
         with self._lock:
-            # Convert borehole DataFrame to dict format for Dash
-            loca_df_dict = None
-            if self._borehole_data.loca_df is not None:
-                loca_df_dict = self._borehole_data.loca_df.to_dict("records")
-
+            # Convert borehole DataFrame to the compact columnar store format
             return {
-                "loca_df": loca_df_dict,
+                "loca_df": encode_dataframe(self._borehole_data.loca_df),
                 "filename_map": self._borehole_data.filename_map,
                 "all_borehole_ids": self._borehole_data.all_borehole_ids,
                 "selection_boreholes": self._selection_state.selected_borehole_ids,
@@ -261,9 +277,7 @@ class AppState:
         with self._lock:
             # Update borehole data
             if "loca_df" in data and data["loca_df"]:
-                import pandas as pd
-
-                self._borehole_data.loca_df = pd.DataFrame(data["loca_df"])
+                self._borehole_data.loca_df = decode_dataframe(data["loca_df"])
 
             if "filename_map" in data:
                 self._borehole_data.filename_map = data["filename_map"]
@@ -304,37 +318,34 @@ class AppState:
             logger.debug("Updated state from Dash Store format")
 
 
-# Global singleton instance
-_app_state_instance: Optional[AppState] = None
-_instance_lock = threading.Lock()
+def get_app_state_manager(session_id: Optional[str] = None) -> AppState:
+    """
+    Get the application state manager for a session.
 
+    Each browser session has its own AppState (see session_store), so
+    concurrent users do not overwrite each other's state.
 
-def get_app_state_manager() -> AppState:
-    """
-    Get the singleton application state manager.
+    Args:
+        session_id: Session to look up; defaults to the current request's
+            session, or the shared default session outside a request
 
     Returns:
-        AppState: The singleton application state manager
+        AppState: The session's application state manager
     """
-    global _app_state_instance
-
-    if _app_state_instance is None:
-        with _instance_lock:
-            if _app_state_instance is None:
-                _app_state_instance = AppState()
-                logger.info("Created singleton application state manager")
+    from .session_store import get_current_session_id, get_session_state_store
 
-    return _app_state_instance
+    if session_id is None:
+        session_id = get_current_session_id()
+    return get_session_state_store().get_state(session_id)
 
 
 def reset_app_state_manager() -> None:
     """
-    Reset the singleton application state manager.
+    Reset all session application state managers.
 
     This should only be used for testing purposes.
     """
-    global _app_state_instance
+    from .session_store import get_session_state_store
 
-    with _instance_lock:
-        _app_state_instance = None
-        logger.info("Reset application state manager")
+    get_session_state_store().clear()
+    logger.info("Reset application state manager")
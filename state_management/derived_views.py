@@ -0,0 +1,212 @@
+"""
+Derived-View Memoization.
+
+Callbacks rebuild the same derived data (decoded borehole frames, search
+options, marker lists) on every invocation even when nothing they depend on
+has changed. This module lets such views declare their dependencies, e.g. the
+dataset ID or a selection/state version, and caches each result until one of
+those dependency values changes.
+
+Key Features:
+- **Declared Dependencies**: ``@derived_view(name, depends_on=(...))`` names
+  the keyword arguments that identify the view's inputs
+- **Version-Keyed Entries**: Results are cached per view and dependency
+  values; a changed version simply produces a new key
+- **Bounded LRU**: Entries across all views share one size-limited cache
+- **Observable Hit Rates**: Per-view hits, misses, uncached calls and compute
+  time via ``get_derived_view_cache().get_stats()``
+
+Usage::
+
+    @derived_view("search_options", depends_on=("dataset_id",))
+    def build_search_options(loca_df, dataset_id=None):
+        ...
+
+    options = build_search_options(loca_df, dataset_id=stored["dataset_id"])
+
+If any dependency value is None the view is computed without caching, since
+its inputs cannot be identified.
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from app_constants import PERFORMANCE_CONFIG
+
+from .store_codec import decode_dataframe
+
+logger = logging.getLogger(__name__)
+
+
+def selection_key(borehole_ids: Optional[Iterable[Any]]) -> frozenset:
+    """Build an order-independent dependency value for a set of borehole IDs."""
+    return frozenset(str(borehole_id) for borehole_id in (borehole_ids or []))
+
+
+class DerivedViewCache:
+    """Shared LRU cache for derived views, with per-view statistics."""
+
+    def __init__(self, max_entries: int = PERFORMANCE_CONFIG.DERIVED_VIEW_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Tuple[Any, ...]], Any]" = OrderedDict()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _view_stats(self, name: str) -> Dict[str, float]:
+        return self._stats.setdefault(
+            name,
+            {"hits": 0, "misses": 0, "uncached": 0, "compute_seconds": 0.0},
+        )
+
+    def get_or_compute(
+        self,
+        name: str,
+        dependencies: Tuple[Any, ...],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Return the cached view for these dependency values, computing it if needed.
+
+        Args:
+            name: View name
+            dependencies: Dependency values identifying the view's inputs
+            compute: Zero-argument function producing the view
+
+        Returns:
+            The (possibly cached) view value
+        """
+        cacheable = all(value is not None for value in dependencies)
+        key = (name, dependencies)
+
+        if cacheable:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self._view_stats(name)["hits"] += 1
+                    return self._entries[key]
+
+        start = time.perf_counter()
+        value = compute()
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            stats = self._view_stats(name)
+            stats["compute_seconds"] += elapsed
+            if not cacheable:
+                stats["uncached"] += 1
+                return value
+
+            stats["misses"] += 1
+            self._entries[key] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        logger.debug(f"Computed derived view '{name}' in {elapsed:.3f}s")
+        return value
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop cached entries for one view, or all views."""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == name]:
+                del self._entries[key]
+
+    def clear_cache(self) -> None:
+        """Drop all cached entries (statistics are kept)."""
+        self.invalidate()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-view hit/miss counts, hit rates and compute time."""
+        with self._lock:
+            views = {}
+            for name, stats in self._stats.items():
+                lookups = stats["hits"] + stats["misses"]
+                views[name] = {
+                    **stats,
+                    "hit_rate": stats["hits"] / lookups if lookups else 0.0,
+                    "entries": sum(1 for key in self._entries if key[0] == name),
+                }
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "views": views,
+            }
+
+
+# Global derived view cache instance
+_derived_view_cache: Optional[DerivedViewCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_derived_view_cache() -> DerivedViewCache:
+    """Get the global derived view cache."""
+    global _derived_view_cache
+    if _derived_view_cache is None:
+        with _cache_lock:
+            if _derived_view_cache is None:
+                _derived_view_cache = DerivedViewCache()
+    return _derived_view_cache
+
+
+def derived_view(name: str, depends_on: Sequence[str]):
+    """
+    Decorator registering a memoized derived view.
+
+    The decorated function must receive every dependency in ``depends_on`` as
+    a keyword argument; only those values form the cache key, so other
+    arguments must be fully determined by them.
+
+    Args:
+        name: View name used for statistics and invalidation
+        depends_on: Names of the keyword arguments the view depends on
+    """
+    depends_on = tuple(depends_on)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            dependencies = tuple(kwargs.get(dependency) for dependency in depends_on)
+            return get_derived_view_cache().get_or_compute(
+                name, dependencies, lambda: func(*args, **kwargs)
+            )
+
+        wrapper.view_name = name
+        wrapper.depends_on = depends_on
+        return wrapper
+
+    return decorator
+
+
+@derived_view("borehole_frame", depends_on=("dataset_id",))
+def _decode_borehole_frame(payload: Any, dataset_id: Optional[str] = None):
+    return decode_dataframe(payload)
+
+
+def get_borehole_frame(stored_data: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Get the decoded borehole DataFrame for a borehole-data-store value.
+
+    The frame is decoded once per dataset ID. Callers receive a shallow copy,
+    so adding or replacing columns does not affect the cached frame.
+
+    Args:
+        stored_data: borehole-data-store contents
+
+    Returns:
+        pd.DataFrame: Borehole locations
+    """
+    frame = _decode_borehole_frame(
+        stored_data.get("loca_df"), dataset_id=stored_data.get("dataset_id")
+    )
+    return frame.copy(deep=False)
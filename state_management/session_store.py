@@ -0,0 +1,290 @@
+"""
+Session-Scoped Application State Store.
+
+This module keeps one AppState container per browser session instead of a
+single process-wide instance, so concurrent users of a deployed app no
+longer overwrite each other's selection, map and plot state.
+
+Key Features:
+- **Session Isolation**: AppState containers keyed by a session ID taken from
+  a cookie set on the first request
+- **Memory Accounting**: Per-session memory estimate (DataFrames, AGS content,
+  rendered plots), recomputed only when the session's state version changes
+- **Idle TTL Eviction**: Sessions unused for longer than the TTL are dropped
+- **Global Memory Cap**: Least-recently-used sessions are evicted while the
+  total exceeds the configured cap or session count
+- **Default Session**: Code running outside a Flask request (tests, scripts,
+  background threads) shares a single default session, unless a session was
+  bound with ``bind_session_id`` (e.g. for Dash background callbacks)
+- **Dataset Lookup**: ``find_dataset`` returns the uploaded dataset a session
+  holds, so callbacks and routes can work from a dataset ID instead of the
+  whole ``borehole-data-store`` payload
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional, Set
+
+from app_constants import PERFORMANCE_CONFIG
+
+from .app_state import AppState
+from .state_models import BoreholeData
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_ID = "default"
+
+_bound_session_id: ContextVar[Optional[str]] = ContextVar(
+    "borehole_session_id", default=None
+)
+
+
+def new_session_id() -> str:
+    """Generate a new random session ID."""
+    return uuid.uuid4().hex
+
+
+def get_current_session_id() -> str:
+    """
+    Get the session ID of the current Flask request.
+
+    The ID is read from the session cookie, or from ``flask.g`` when the
+    cookie is being issued by this request (see
+    app_modules.server_routes.register_session_hooks).
+
+    Returns:
+        str: Session ID; outside a request context the session bound with
+        bind_session_id, or DEFAULT_SESSION_ID
+    """
+    try:
+        from flask import g, has_request_context, request
+    except ImportError:
+        return _bound_session_id.get() or DEFAULT_SESSION_ID
+
+    if not has_request_context():
+        return _bound_session_id.get() or DEFAULT_SESSION_ID
+
+    session_id = getattr(g, "borehole_session_id", None)
+    if session_id is None:
+        session_id = request.cookies.get(PERFORMANCE_CONFIG.SESSION_COOKIE_NAME)
+    return session_id or DEFAULT_SESSION_ID
+
+
+def bind_session_id(session_id: Optional[str]) -> Token:
+    """
+    Bind a session ID to the current context outside a Flask request.
+
+    Used by work started from a request but run on another thread, such as
+    Dash background callbacks.
+
+    Returns:
+        Token: Token for ``_bound_session_id.reset``
+    """
+    return _bound_session_id.set(session_id)
+
+
+class _SessionEntry:
+    """AppState container plus its bookkeeping."""
+
+    __slots__ = ("state", "last_access", "memory_bytes", "memory_version")
+
+    def __init__(self, state: AppState):
+        self.state = state
+        self.last_access = time.monotonic()
+        self.memory_bytes = 0
+        self.memory_version = -1
+
+
+class SessionStateStore:
+    """
+    LRU store of per-session AppState containers.
+
+    Sessions are ordered by last access. Eviction sweeps run when a session
+    is created and otherwise at most once per sweep interval, so the common
+    path is a dictionary lookup under a lock.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = PERFORMANCE_CONFIG.SESSION_STATE_TTL_SECONDS,
+        max_sessions: int = PERFORMANCE_CONFIG.SESSION_STATE_MAX_SESSIONS,
+        max_memory_mb: float = PERFORMANCE_CONFIG.SESSION_STATE_MAX_MEMORY_MB,
+        sweep_interval: float = PERFORMANCE_CONFIG.SESSION_STATE_SWEEP_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.sweep_interval = sweep_interval
+        self._sessions: "OrderedDict[str, _SessionEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+        self._stats = {"created": 0, "ttl_evictions": 0, "memory_evictions": 0}
+
+    def get_state(self, session_id: str) -> AppState:
+        """
+        Get (or create) the AppState for a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            AppState: The session's state container
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            created = entry is None
+            if created:
+                entry = _SessionEntry(AppState())
+                self._sessions[session_id] = entry
+                self._stats["created"] += 1
+                logger.info(f"Created application state for session {session_id[:8]}")
+            else:
+                self._sessions.move_to_end(session_id)
+            entry.last_access = now
+
+            if created or now - self._last_sweep >= self.sweep_interval:
+                self._sweep(now, keep=session_id)
+
+            return entry.state
+
+    def find_dataset(
+        self, dataset_id: Optional[str], session_id: Optional[str] = None
+    ) -> Optional[BoreholeData]:
+        """
+        Find the borehole data of an uploaded dataset held by a live session.
+
+        The given (or current) session is checked first; any other session
+        holding the same dataset ID (a content hash) is used otherwise.
+
+        Args:
+            dataset_id: Dataset identifier from borehole-data-store
+            session_id: Session to prefer; defaults to the current session
+
+        Returns:
+            BoreholeData: The dataset's state, or None if no session holds it
+        """
+        if not dataset_id:
+            return None
+        if session_id is None:
+            session_id = get_current_session_id()
+
+        with self._lock:
+            own = self._sessions.get(session_id)
+            entries = [own] if own is not None else []
+            entries.extend(
+                entry for entry in self._sessions.values() if entry is not own
+            )
+
+        for entry in entries:
+            data = entry.state.borehole_data
+            if data.dataset_id == dataset_id and data.is_loaded:
+                return data
+        return None
+
+    def dataset_ids(self) -> Set[str]:
+        """Get the IDs of the datasets held by live sessions."""
+        with self._lock:
+            states = [entry.state for entry in self._sessions.values()]
+        return {
+            state.borehole_data.dataset_id
+            for state in states
+            if state.borehole_data.dataset_id
+        }
+
+    def remove_session(self, session_id: str) -> bool:
+        """Drop a session's state. Returns True if it existed."""
+        with self._lock:
+            entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return False
+        entry.state.clear_all_state()
+        return True
+
+    def sweep(self) -> None:
+        """Run TTL and memory-cap eviction now."""
+        with self._lock:
+            self._sweep(time.monotonic())
+
+    def _sweep(self, now: float, keep: Optional[str] = None) -> None:
+        """Evict idle sessions, then LRU sessions over the count/memory cap."""
+        self._last_sweep = now
+        evicted = []
+
+        for session_id, entry in list(self._sessions.items()):
+            if session_id != keep and now - entry.last_access > self.ttl_seconds:
+                evicted.append(self._sessions.pop(session_id))
+                self._stats["ttl_evictions"] += 1
+
+        total_bytes = sum(self._measure(entry) for entry in self._sessions.values())
+        for session_id in list(self._sessions):
+            if (
+                len(self._sessions) <= self.max_sessions
+                and total_bytes <= self.max_memory_bytes
+            ):
+                break
+            if session_id == keep:
+                continue
+            entry = self._sessions.pop(session_id)
+            total_bytes -= entry.memory_bytes
+            evicted.append(entry)
+            self._stats["memory_evictions"] += 1
+
+        # Release DataFrame references held by evicted sessions
+        for entry in evicted:
+            entry.state.clear_all_state()
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} idle/over-budget session states")
+
+    @staticmethod
+    def _measure(entry: _SessionEntry) -> int:
+        """Return the session's memory estimate, recomputing on state change."""
+        version = entry.state.get_state_version()
+        if version != entry.memory_version:
+            entry.memory_bytes = entry.state.estimate_memory_bytes()
+            entry.memory_version = version
+        return entry.memory_bytes
+
+    def clear(self) -> None:
+        """Drop all session states."""
+        with self._lock:
+            entries = list(self._sessions.values())
+            self._sessions.clear()
+        for entry in entries:
+            entry.state.clear_all_state()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get session counts, memory usage and eviction statistics."""
+        with self._lock:
+            memory_bytes = sum(
+                self._measure(entry) for entry in self._sessions.values()
+            )
+            return {
+                "sessions": len(self._sessions),
+                "memory_mb": memory_bytes / (1024 * 1024),
+                "max_sessions": self.max_sessions,
+                "max_memory_mb": self.max_memory_bytes / (1024 * 1024),
+                **self._stats,
+            }
+
+
+# Global session store instance
+_session_store: Optional[SessionStateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_state_store() -> SessionStateStore:
+    """Get the global session state store."""
+    global _session_store
+    if _session_store is None:
+        with _store_lock:
+            if _session_store is None:
+                _session_store = SessionStateStore()
+    return _session_store
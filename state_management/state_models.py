@@ -19,6 +19,7 @@ class BoreholeData:
     loca_df: Optional[pd.DataFrame] = None
     filename_map: Dict[str, str] = field(default_factory=dict)
     all_borehole_ids: List[str] = field(default_factory=list)
+    dataset_id: Optional[str] = None
     ags_file: Optional[str] = None
     last_updated: datetime = field(default_factory=datetime.now)
 
@@ -0,0 +1,229 @@
+"""
+Compact Columnar Codec for Dash Store DataFrames.
+
+DataFrames placed in ``dcc.Store`` components used to be serialized with
+``to_dict("records")``, which repeats every column name on every row and
+writes floats as long decimal strings. This codec stores one entry per
+column instead.
+
+Key Features:
+- **Column-Oriented Layout**: Column names appear once per payload
+- **Binary Numeric Columns**: Numbers stored as base64-encoded little-endian
+  numpy buffers (exact round trip, no per-value JSON formatting)
+- **Dictionary Encoding**: Repetitive text/categorical columns stored as a
+  category list plus integer codes
+- **Vectorized Decoding**: DataFrames rebuilt from whole-column arrays, with
+  no per-row dict construction
+- **Backward Compatible**: Decoders still accept legacy lists of records
+
+Payload format::
+
+    {
+        "codec": "columnar-v1",
+        "length": 3,
+        "columns": ["LOCA_ID", "LOCA_GL"],
+        "data": {
+            "LOCA_ID": {"kind": "values", "values": ["BH01", "BH02", null]},
+            "LOCA_GL": {"kind": "numeric", "dtype": "<f8", "data": "..."}
+        }
+    }
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import base64
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app_constants import PERFORMANCE_CONFIG
+
+CODEC_NAME = "columnar-v1"
+
+
+def is_encoded_frame(payload: Any) -> bool:
+    """Check whether a store value was produced by encode_dataframe."""
+    return isinstance(payload, dict) and payload.get("codec") == CODEC_NAME
+
+
+def _encode_array(values: np.ndarray, binary: bool) -> Any:
+    """Encode a numeric numpy array as base64 little-endian bytes or a list."""
+    if not binary:
+        return values.tolist()
+    little_endian = values.astype(values.dtype.newbyteorder("<"), copy=False)
+    return base64.b64encode(np.ascontiguousarray(little_endian).tobytes()).decode(
+        "ascii"
+    )
+
+
+def _decode_array(encoded: Any, dtype: str) -> np.ndarray:
+    """Decode an array written by _encode_array (always writable)."""
+    if isinstance(encoded, str):
+        # frombuffer views the immutable bytes; copy so callers can modify
+        return np.frombuffer(base64.b64decode(encoded), dtype=np.dtype(dtype)).copy()
+    return np.asarray(encoded, dtype=np.dtype(dtype))
+
+
+def _json_value(value: Any) -> Any:
+    """Convert a scalar to a JSON-friendly value (None for missing)."""
+    if value is None or (not isinstance(value, (list, dict)) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def _encode_column(series: pd.Series, binary: bool) -> Dict[str, Any]:
+    """Encode a single column."""
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype) and not series.isna().any():
+        values = series.to_numpy(dtype=np.uint8)
+        return {"kind": "bool", "data": _encode_array(values, binary)}
+
+    if pd.api.types.is_numeric_dtype(dtype) and not isinstance(
+        dtype, pd.CategoricalDtype
+    ):
+        if isinstance(dtype, np.dtype):
+            values = series.to_numpy()
+        elif series.isna().any() or pd.api.types.is_float_dtype(dtype):
+            # Nullable extension numerics: missing values become NaN
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = series.to_numpy(dtype=np.int64)
+        return {
+            "kind": "numeric",
+            "dtype": values.dtype.newbyteorder("<").str,
+            "data": _encode_array(values, binary),
+        }
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy(dtype=np.int32)
+        categories = series.cat.categories
+    else:
+        codes, categories = pd.factorize(series, use_na_sentinel=True)
+        codes = codes.astype(np.int32, copy=False)
+        # Only dictionary-encode columns with repeated values
+        if len(categories) * 2 > len(series):
+            return {
+                "kind": "values",
+                "values": [_json_value(value) for value in series.tolist()],
+            }
+
+    return {
+        "kind": "dictionary",
+        "categories": [_json_value(value) for value in list(categories)],
+        "codes": _encode_array(codes, binary),
+    }
+
+
+def _decode_column(encoded: Dict[str, Any], length: int) -> Any:
+    """Decode a single column to a numpy array or list of values."""
+    kind = encoded.get("kind")
+
+    if kind == "numeric":
+        return _decode_array(encoded["data"], encoded["dtype"])
+
+    if kind == "bool":
+        return _decode_array(encoded["data"], "u1").astype(bool)
+
+    if kind == "dictionary":
+        codes = _decode_array(encoded["codes"], "<i4")
+        categories = np.empty(len(encoded["categories"]) + 1, dtype=object)
+        categories[:-1] = encoded["categories"]
+        categories[-1] = None
+        # Missing values (code -1) pick the trailing None
+        return categories[codes]
+
+    values = encoded.get("values")
+    return values if values is not None else [None] * length
+
+
+def encode_dataframe(
+    df: Optional[pd.DataFrame], binary: Optional[bool] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Encode a DataFrame for a Dash store.
+
+    Args:
+        df: DataFrame to encode (the index is not preserved)
+        binary: Store numeric data as base64 buffers; defaults to
+            PERFORMANCE_CONFIG.STORE_BINARY_COLUMNS
+
+    Returns:
+        dict: JSON-serializable columnar payload, or None for a missing frame
+    """
+    if df is None:
+        return None
+    if binary is None:
+        binary = PERFORMANCE_CONFIG.STORE_BINARY_COLUMNS
+
+    columns = [str(column) for column in df.columns]
+    return {
+        "codec": CODEC_NAME,
+        "length": len(df),
+        "columns": columns,
+        "data": {
+            name: _encode_column(df.iloc[:, position], binary)
+            for position, name in enumerate(columns)
+        },
+    }
+
+
+def decode_dataframe(payload: Any, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Rebuild a DataFrame from a store payload.
+
+    Args:
+        payload: Output of encode_dataframe, or a legacy list of records
+        columns: Optional subset of columns to decode
+
+    Returns:
+        pd.DataFrame: Decoded DataFrame (empty if payload is empty)
+    """
+    if not payload:
+        return pd.DataFrame(columns=columns)
+
+    if not is_encoded_frame(payload):
+        df = pd.DataFrame(payload)
+        if columns is not None:
+            df = df.reindex(columns=columns)
+        return df
+
+    length = payload["length"]
+    names = payload["columns"] if columns is None else columns
+    data = {}
+    for name in names:
+        encoded = payload["data"].get(name)
+        data[name] = (
+            _decode_column(encoded, length) if encoded else [None] * length
+        )
+    return pd.DataFrame(data, columns=names, index=pd.RangeIndex(length))
+
+
+def decode_column(payload: Any, column: str) -> List[Any]:
+    """
+    Decode a single column as a list, without rebuilding the DataFrame.
+
+    Args:
+        payload: Output of encode_dataframe, or a legacy list of records
+        column: Column name
+
+    Returns:
+        list: Column values (empty if the payload or column is missing)
+    """
+    if not payload:
+        return []
+
+    if not is_encoded_frame(payload):
+        return [record.get(column) for record in payload]
+
+    encoded = payload["data"].get(column)
+    if encoded is None:
+        return []
+    values = _decode_column(encoded, payload["length"])
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
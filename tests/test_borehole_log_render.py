@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test in-memory borehole log rendering from AGS content and its caching.
+"""
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+from tests.test_section_pipeline import AGS_CONTENT as SECTION_AGS  # noqa: E402
+
+AGS_CONTENT = (
+    SECTION_AGS
+    + """
+GROUP,SAMP
+HEADING,LOCA_ID,SAMP_TOP,SAMP_BASE,SAMP_REF,SAMP_TYPE,SAMP_ID
+UNITS,,m,m,,,
+TYPE,X,2DP,2DP,X,X,X
+DATA,BH001,1.00,1.45,1,U,S1
+DATA,BH002,2.00,2.45,1,B,S2
+"""
+)
+
+DEEP_AGS = """GROUP,LOCA
+HEADING,LOCA_ID,LOCA_NATE,LOCA_NATN,LOCA_GL
+DATA,BH900,400000.00,300000.00,10.00
+
+GROUP,GEOL
+HEADING,LOCA_ID,GEOL_TOP,GEOL_BASE,GEOL_DESC
+DATA,BH900,0.00,12.00,Firm brown CLAY
+DATA,BH900,12.00,40.00,Weak white CHALK
+"""
+
+
+def test_log_pages_are_png_bytes():
+    """The compatibility wrapper renders real pages instead of returning []."""
+    from borehole_log import plot_borehole_log_from_ags_content
+
+    pages = plot_borehole_log_from_ags_content(AGS_CONTENT, "BH001", dpi=40)
+    assert len(pages) == 1 and pages[0].startswith(b"\x89PNG")
+
+    deep_pages = plot_borehole_log_from_ags_content(DEEP_AGS, "BH900", dpi=30)
+    assert len(deep_pages) > 1
+    assert plot_borehole_log_from_ags_content(AGS_CONTENT, "NOPE", dpi=40) == []
+    print("✅ Borehole logs render to PNG pages in memory")
+
+
+def test_index_is_built_once_per_dataset():
+    """GEOL/SAMP records are indexed by borehole and memoized per dataset."""
+    from borehole_log import build_borehole_log_index
+    from state_management import get_derived_view_cache
+
+    ags_data = [("site.ags", AGS_CONTENT)]
+    index = build_borehole_log_index(ags_data, "log-index")
+    assert [r["GEOL_TOP"] for r in index["geology"]["BH001"]] == [0.0, 1.5]
+    assert index["samples"]["BH002"][0]["SAMP_ID"] == "S2"
+    assert index["locations"]["BH003"]["LOCA_GL"] == 98.75
+
+    stats = get_derived_view_cache().get_stats()["views"]["borehole_log_index"]
+    build_borehole_log_index(ags_data, "log-index")
+    after = get_derived_view_cache().get_stats()["views"]["borehole_log_index"]
+    assert after["hits"] == stats["hits"] + 1 and after["misses"] == stats["misses"]
+    print("✅ Borehole log index is memoized per dataset")
+
+
+def test_marker_click_reuses_cached_log():
+    """Clicking the same marker again is served from the render cache."""
+    import callbacks.marker_handling as marker_handling
+    from render_workers import RenderWorkerPool
+    from section.render_cache import get_log_render_cache
+
+    class CountingPool(RenderWorkerPool):
+        runs = 0
+
+        def map(self, fn, *iterables, timeout=None):
+            CountingPool.runs += 1
+            return super().map(fn, *iterables, timeout=timeout)
+
+    pool = CountingPool(max_workers=1, use_processes=False)
+    original_pool = marker_handling.get_render_worker_pool
+    marker_handling.get_render_worker_pool = lambda: pool
+    try:
+        callback = marker_handling.MarkerHandlingCallback()
+        filename_map = {"site.ags": AGS_CONTENT}
+        first = callback._generate_borehole_log_display(
+            filename_map, "log-ds", "BH002", []
+        )
+        second = callback._generate_borehole_log_display(
+            filename_map, "log-ds", "BH002", []
+        )
+    finally:
+        marker_handling.get_render_worker_pool = original_pool
+        pool.shutdown()
+
+    def image_srcs(component):
+        return [
+            child.src for child in component.children[-1].children if hasattr(child, "src")
+        ]
+
+    assert CountingPool.runs == 1
+    assert image_srcs(first) == image_srcs(second)
+    assert image_srcs(first)[0].startswith("/renders/")
+    assert get_log_render_cache().get_stats()["hits"] >= 1
+    print("✅ Re-clicking a marker reuses the cached log")
+
+
+if __name__ == "__main__":
+    test_log_pages_are_png_bytes()
+    test_index_is_built_once_per_dataset()
+    test_marker_click_reuses_cached_log()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test the per-dataset borehole presentation table (tooltips, search labels).
+"""
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _sample_loca_df():
+    return pd.DataFrame(
+        {
+            "LOCA_ID": ["BH02 ", "BH01", "bh03"],
+            "LOCA_GL": ["12.5", "not a number", None],
+            "LOCA_FDEP": [20, 15.25, None],
+            "LOCA_NATE": [530000.0, 530100.0, None],
+            "LOCA_NATN": [180000.0, 180100.0, 180200.0],
+        }
+    )
+
+
+def test_presentation_table_formatting():
+    """Labels and tooltips match the previous per-row formatting."""
+    from borehole_presentation import build_presentation_table
+
+    table = build_presentation_table(_sample_loca_df())
+
+    assert list(table.index) == ["BH02", "BH01", "bh03"]
+    assert table.loc["BH02", "search_label"] == "BH02 (GL: 12.50m, Depth: 20.00m)"
+    assert table.loc["BH01", "search_label"] == "BH01 (Depth: 15.25m)"
+    assert table.loc["bh03", "search_label"] == "bh03"
+    assert table.loc["bh03", "search_key"] == "bh03"
+    assert "Ground Level: N/A" in table.loc["BH01", "tooltip"]
+    assert "Total Depth: 20.00m" in table.loc["BH02", "tooltip"]
+
+    ordered = table.sort_values("sort_key").index.tolist()
+    assert ordered == ["BH01", "BH02", "bh03"]
+    print("✅ Presentation table formatted correctly")
+
+
+def test_presentation_cache_per_dataset():
+    """Tables are cached per dataset ID and evicted least-recently-used first."""
+    from borehole_presentation import PresentationCache, compute_dataset_id
+
+    dataset_a = compute_dataset_id({"a.ags": "content a"})
+    dataset_b = compute_dataset_id({"b.ags": "content b"})
+    assert dataset_a == compute_dataset_id({"a.ags": "content a"})
+    assert dataset_a != dataset_b
+
+    cache = PresentationCache(max_datasets=1)
+    first = cache.get_or_build(dataset_a, _sample_loca_df())
+    assert cache.get_or_build(dataset_a, _sample_loca_df()) is first
+    cache.get_or_build(dataset_b, _sample_loca_df())
+    assert cache.get(dataset_a) is None
+
+    stats = cache.get_cache_stats()
+    assert stats["evictions"] == 1
+    assert stats["datasets"] == 1
+    print("✅ Presentation cache keyed by dataset")
+
+
+def test_markers_use_presentation_table():
+    """Upload marker creation zips coordinates with precomputed tooltips."""
+    from callbacks.file_upload.processing import (
+        transform_coordinates_and_create_markers,
+    )
+
+    loca_df = _sample_loca_df()
+    markers, valid_coords = transform_coordinates_and_create_markers(loca_df)
+
+    assert len(markers) == 2
+    assert len(valid_coords) == 2
+    assert [marker.id["index"] for marker in markers] == ["BH02", "BH01"]
+    assert markers[0].children.children.startswith("Borehole: BH02")
+    assert loca_df["lat"].notna().sum() == 2
+    print("✅ Markers built from presentation table")
+
+
+if __name__ == "__main__":
+    test_presentation_table_formatting()
+    test_presentation_cache_per_dataset()
+    test_markers_use_presentation_table()
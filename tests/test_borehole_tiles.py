@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test the server-side borehole tile index, tile cache and Flask route.
+"""
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _random_boreholes(count=5000, seed=1):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "LOCA_ID": [f"BH{i:05d}" for i in range(count)],
+            "LOCA_GL": rng.uniform(0, 50, count),
+            "LOCA_FDEP": rng.uniform(5, 40, count),
+            "lat": rng.uniform(51.0, 52.0, count),
+            "lon": rng.uniform(-1.0, 0.5, count),
+        }
+    )
+
+
+def _tile_of(lat, lon, z):
+    from borehole_tiles import lonlat_to_unit
+
+    unit_x, unit_y = lonlat_to_unit(np.array([lon]), np.array([lat]))
+    return int(unit_x[0] * 2**z), int(unit_y[0] * 2**z)
+
+
+def test_tile_query_matches_brute_force():
+    """Morton-range tile queries return exactly the points inside each tile."""
+    from borehole_tiles import BoreholeTileIndex, lonlat_to_unit
+
+    loca_df = _random_boreholes()
+    index = BoreholeTileIndex(loca_df, index_zoom=12)
+    unit_x, unit_y = lonlat_to_unit(loca_df["lon"].values, loca_df["lat"].values)
+
+    for z in (4, 8, 12, 14):
+        x, y = _tile_of(51.5, -0.25, z)
+        expected = set(
+            loca_df["LOCA_ID"][
+                (np.floor(unit_x * 2**z) == x) & (np.floor(unit_y * 2**z) == y)
+            ]
+        )
+        found = set(index.loca_ids[index.query_tile(z, x, y)])
+        assert found == expected, f"Mismatch at zoom {z}"
+
+    assert len(index.query_tile(3, 99, 0)) == 0
+    print("✅ Tile queries match brute force")
+
+
+def test_dense_tiles_are_aggregated():
+    """Dense tiles return cluster points whose counts add up to the tile total."""
+    from borehole_tiles import BoreholeTileIndex
+
+    index = BoreholeTileIndex(_random_boreholes())
+    x, y = _tile_of(51.5, -0.25, 5)
+    total = len(index.query_tile(5, x, y))
+
+    tile = index.build_tile(5, x, y, max_features=100, cluster_depth=3)
+    counts = [f["properties"].get("point_count", 1) for f in tile["features"]]
+    assert sum(counts) == total
+    assert len(tile["features"]) <= 4**3
+    assert any(f["properties"].get("cluster") for f in tile["features"])
+    print("✅ Dense tiles aggregated into clusters")
+
+
+def test_tile_service_cache_and_route():
+    """Tiles are cached per (dataset, z, x, y) and served by the Flask route."""
+    import dash
+
+    from app_modules.server_routes import register_borehole_tile_routes
+    from borehole_tiles import BoreholeTileService
+    import borehole_tiles
+
+    service = BoreholeTileService(max_tiles=2)
+    service.register_dataset("dataset-a", _random_boreholes(200))
+    x, y = _tile_of(51.5, -0.25, 10)
+
+    first = service.get_tile("dataset-a", 10, x, y)
+    assert service.get_tile("dataset-a", 10, x, y) is first
+    assert service.get_tile("missing", 10, x, y) is None
+    assert service.get_cache_stats()["hits"] == 1
+
+    original_service = borehole_tiles._tile_service
+    borehole_tiles._tile_service = service
+    try:
+        app = dash.Dash(__name__)
+        app.layout = dash.html.Div()
+        register_borehole_tile_routes(app)
+        client = app.server.test_client()
+
+        response = client.get(f"/tiles/boreholes/dataset-a/10/{x}/{y}.geojson")
+        assert response.status_code == 200
+        assert "immutable" in response.headers["Cache-Control"]
+        assert json.loads(response.data) == json.loads(first)
+
+        assert client.get("/tiles/boreholes/missing/1/0/0.geojson").status_code == 404
+    finally:
+        borehole_tiles._tile_service = original_service
+    print("✅ Tile route serves cached tiles")
+
+
+def test_evicted_index_rebuilt_from_session_data():
+    """Missing indexes are rebuilt on demand; pinned datasets are never evicted."""
+    from borehole_tiles import BoreholeTileService
+
+    datasets = {name: _random_boreholes(seed=seed) for seed, name in enumerate("abc")}
+    datasets["small"] = _random_boreholes(count=20)
+    pinned = {"a"}
+    service = BoreholeTileService(
+        max_datasets=1,
+        load_locations=datasets.get,
+        pinned_datasets=lambda: pinned,
+    )
+    for name in "abc":
+        service.register_dataset(name, datasets[name])
+    # "a" is held by a live session; only one unpinned index is kept
+    assert service.has_dataset("a") and service.has_dataset("c")
+    assert not service.has_dataset("b")
+
+    x, y = _tile_of(51.5, -0.25, 8)
+    tile = json.loads(service.get_tile("b", 8, x, y))
+    assert tile["features"] and service.has_dataset("b")
+    assert not service.has_dataset("c")
+
+    # Datasets small enough for markers, or unknown, are not turned into tiles
+    assert service.get_tile("small", 8, x, y) is None
+    assert service.get_tile("unknown", 8, x, y) is None
+    print("✅ Tile indexes are rebuilt on a miss and pinned while in use")
+
+
+def test_tile_route_rebuilds_from_session_dataset():
+    """The global tile service finds a session's dataset after eviction."""
+    import borehole_tiles
+    from callbacks.file_upload.processing import store_session_dataset
+
+    loca_df = _random_boreholes(seed=7)
+    store_session_dataset(loca_df, {"big.ags": ""}, "session-tiles")
+    original_service = borehole_tiles._tile_service
+    borehole_tiles._tile_service = None
+    try:
+        service = borehole_tiles.get_tile_service()
+        x, y = _tile_of(51.5, -0.25, 8)
+        assert service.get_tile("session-tiles", 8, x, y) is not None
+        assert "session-tiles" in service.pinned_datasets()
+
+        # A tile 404 in the browser restores the dataset from its store
+        from app_modules.server_callbacks import restore_session_dataset
+        from callbacks.file_upload.processing import prepare_borehole_data_for_storage
+
+        stored = prepare_borehole_data_for_storage(loca_df, {"big.ags": ""}, "tiles-2")
+        click, tile_source = restore_session_dataset(
+            {"dataset_id": "tiles-2", "tiles": True}, stored
+        )
+        assert click is None and tile_source["restored"]
+        assert tile_source["url"].startswith("/tiles/boreholes/tiles-2/")
+    finally:
+        borehole_tiles._tile_service = original_service
+    print("✅ Tile service rebuilds indexes from session data")
+
+
+if __name__ == "__main__":
+    test_tile_query_matches_brute_force()
+    test_dense_tiles_are_aggregated()
+    test_tile_service_cache_and_route()
+    test_evicted_index_rebuilt_from_session_data()
+    test_tile_route_rebuilds_from_session_dataset()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test chunked uploads streamed to the on-disk spool.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+SAMPLE_AGS = """GROUP,LOCA
+HEADING,LOCA_ID,LOCA_TYPE,LOCA_NATE,LOCA_NATN,LOCA_GL
+UNITS,,,m,m,m
+TYPE,X,X,2DP,2DP,2DP
+DATA,BH001,BH,400000.00,300000.00,100.00
+DATA,BH002,BH,400025.00,300015.00,105.25
+"""
+
+
+def test_spool_enforces_order_and_limits(tmp_path):
+    """Chunks must arrive in order and within the size limits."""
+    from upload_spool import UploadNotFoundError, UploadSpool, UploadSpoolError
+
+    spool = UploadSpool(spool_dir=str(tmp_path), max_file_mb=1 / 1024)
+    upload_id = spool.create_upload()
+    assert spool.append_chunk(upload_id, 0, "a.ags", 0, b"x" * 600) == 600
+
+    for offset, data in ((0, b"y"), (600, b"y" * 600)):
+        try:
+            spool.append_chunk(upload_id, 0, "a.ags", offset, data)
+            raise AssertionError("Chunk should have been rejected")
+        except UploadSpoolError:
+            pass
+
+    spool.discard(upload_id)
+    assert not os.path.exists(os.path.join(str(tmp_path), upload_id))
+    try:
+        spool.complete_upload(upload_id)
+        raise AssertionError("Discarded upload should be unknown")
+    except UploadNotFoundError:
+        pass
+    print("✅ Spool rejects out-of-order and oversized chunks")
+
+
+def test_discard_ignores_foreign_paths(tmp_path):
+    """Client-supplied upload IDs cannot delete anything outside the spool."""
+    import upload_spool
+    from callbacks.file_upload.main import FileUploadCallback
+
+    victim = tmp_path / "victim"
+    victim.mkdir()
+    (victim / "keep.txt").write_text("keep")
+    spool_dir = tmp_path / "spool"
+    spool = upload_spool.UploadSpool(spool_dir=str(spool_dir))
+    stray = spool_dir / ("0" * 32)
+    stray.mkdir()
+
+    for upload_id in (str(victim), "../victim", "..", "", "0" * 32, None):
+        spool.discard(upload_id)
+    assert (victim / "keep.txt").exists() and stray.exists()
+
+    original_spool = upload_spool._upload_spool
+    upload_spool._upload_spool = spool
+    try:
+        for upload_id in (str(victim), "../victim"):
+            _, _, errors = FileUploadCallback()._read_spooled_upload(upload_id)
+            assert errors
+    finally:
+        upload_spool._upload_spool = original_spool
+    assert (victim / "keep.txt").exists()
+    print("✅ Spool discard ignores unknown and path-like upload IDs")
+
+
+def test_chunked_upload_routes_and_ingest(tmp_path):
+    """Files uploaded in chunks are read back through spool file handles."""
+    import dash
+
+    import upload_spool
+    from app_modules.server_routes import register_chunked_upload_routes
+    from callbacks.file_upload.main import FileUploadCallback
+
+    original_spool = upload_spool._upload_spool
+    upload_spool._upload_spool = upload_spool.UploadSpool(spool_dir=str(tmp_path))
+    try:
+        app = dash.Dash(__name__)
+        app.layout = dash.html.Div()
+        register_chunked_upload_routes(app)
+        client = app.server.test_client()
+
+        upload_id = client.post("/uploads").get_json()["upload_id"]
+        payload = SAMPLE_AGS.encode("utf-8")
+        for offset in range(0, len(payload), 64):
+            response = client.put(
+                f"/uploads/{upload_id}/files/0?name=site.ags&offset={offset}",
+                data=payload[offset : offset + 64],
+            )
+            assert response.status_code == 200
+        bad = client.put(f"/uploads/{upload_id}/files/0?name=site.ags&offset=0", data=b"x")
+        assert bad.status_code == 400
+        assert client.post("/uploads/missing/complete").status_code == 404
+
+        manifest = client.post(f"/uploads/{upload_id}/complete").get_json()
+        assert manifest["files"] == [{"name": "site.ags", "size": len(payload)}]
+
+        ags_files, total_size, errors = FileUploadCallback()._read_spooled_upload(
+            upload_id
+        )
+        assert ags_files == [("site.ags", SAMPLE_AGS)]
+        assert errors == []
+        assert not os.path.exists(os.path.join(str(tmp_path), upload_id))
+    finally:
+        upload_spool._upload_spool = original_spool
+    print("✅ Chunked upload spooled and ingested")
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    test_spool_enforces_order_and_limits(Path(tempfile.mkdtemp()))
+    test_discard_ignores_foreign_paths(Path(tempfile.mkdtemp()))
+    test_chunked_upload_routes_and_ingest(Path(tempfile.mkdtemp()))
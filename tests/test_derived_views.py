@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test derived-view memoization keyed on dataset IDs and state versions.
+"""
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def test_views_recompute_only_on_dependency_change():
+    """Views are cached per dependency values and report hit rates."""
+    from state_management import DerivedViewCache, derived_view
+    import state_management.derived_views as derived_views
+
+    calls = []
+
+    @derived_view("test_view", depends_on=("dataset_id", "selection_version"))
+    def count_selected(ids, dataset_id=None, selection_version=None):
+        calls.append(selection_version)
+        return len(ids)
+
+    original = derived_views._derived_view_cache
+    derived_views._derived_view_cache = DerivedViewCache(max_entries=8)
+    try:
+        assert count_selected(["a"], dataset_id="d1", selection_version=1) == 1
+        assert count_selected(["a"], dataset_id="d1", selection_version=1) == 1
+        assert count_selected(["a", "b"], dataset_id="d1", selection_version=2) == 2
+        count_selected(["a"], dataset_id=None, selection_version=1)
+        assert calls == [1, 2, 1]
+
+        stats = derived_views._derived_view_cache.get_stats()["views"]["test_view"]
+        assert (stats["hits"], stats["misses"], stats["uncached"]) == (1, 2, 1)
+        assert abs(stats["hit_rate"] - 1 / 3) < 1e-9
+    finally:
+        derived_views._derived_view_cache = original
+    print("✅ Derived views recomputed only on dependency change")
+
+
+def test_borehole_frame_decoded_once_per_dataset():
+    """Stored borehole frames are decoded once per dataset ID."""
+    from state_management import encode_dataframe, get_borehole_frame
+
+    stored = {
+        "loca_df": encode_dataframe(pd.DataFrame({"LOCA_ID": ["BH01", "BH02"]})),
+        "dataset_id": "frame-test",
+    }
+    first = get_borehole_frame(stored)
+    first["extra"] = 1
+    second = get_borehole_frame(stored)
+    assert "extra" not in second.columns
+    assert second["LOCA_ID"].tolist() == ["BH01", "BH02"]
+    print("✅ Borehole frame cached per dataset")
+
+
+if __name__ == "__main__":
+    test_views_recompute_only_on_dependency_change()
+    test_borehole_frame_decoded_once_per_dataset()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test batched PolyCollection rendering of geological intervals.
+"""
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def test_intervals_batched_by_legend_and_hatch():
+    """Intervals become one fill collection per code and one per hatch."""
+    from section.plotting.geology import plot_geological_intervals
+
+    merged = pd.DataFrame(
+        {
+            "LOCA_ID": ["BH1", "BH1", "BH2", "BH2", "BH3"],
+            "GEOL_LEG": ["101", "102", "101", "102", "101"],
+            "ELEV_TOP": [10.0, 8.0, 12.0, 9.0, 5.0],
+            "ELEV_BASE": [8.0, 5.0, 9.0, 9.0, 1.0],  # BH2 102 has zero thickness
+        }
+    )
+    fig, ax = plt.subplots()
+    plot_geological_intervals(
+        ax,
+        merged,
+        {"BH1": 0.0, "BH2": 100.0, "BH3": 200.0},
+        ["BH1", "BH2"],  # BH3 is not in the section
+        {"101": "red", "102": "blue"},
+        {"101": "//", "102": ""},
+        borehole_width=10.0,
+    )
+
+    assert len(ax.patches) == 0
+    assert len(ax.collections) == 3  # fills for 101, 102 and hatch "//"
+
+    fill_101 = ax.collections[0]
+    paths = fill_101.get_paths()
+    assert len(paths) == 2
+    np.testing.assert_allclose(
+        paths[1].vertices[:4], [[95, 9], [105, 9], [105, 12], [95, 12]]
+    )
+    assert ax.collections[2].get_hatch() == "//"
+    plt.close(fig)
+    print("✅ Geological intervals batched into PolyCollections")
+
+
+if __name__ == "__main__":
+    test_intervals_batched_by_legend_and_hatch()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Test bulk borehole log export as a ZIP (or combined PDF) bundle.
+"""
+import io
+import os
+import sys
+import threading
+import zipfile
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+from tests.test_borehole_log_render import AGS_CONTENT  # noqa: E402
+
+
+def test_pool_imap_bounds_jobs_in_flight():
+    """imap yields results in order with at most `window` jobs in flight."""
+    from render_workers import RenderWorkerPool
+
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def job(value):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        with lock:
+            state["running"] -= 1
+        return value * 2
+
+    pool = RenderWorkerPool(max_workers=2, max_pending=8, use_processes=False)
+    try:
+        results = pool.imap(job, range(20), window=2)
+        assert list(results) == [value * 2 for value in range(20)]
+        assert state["peak"] <= 2
+        assert pool.get_stats()["submitted"] == 20
+    finally:
+        pool.shutdown()
+    print("✅ Render pool imap keeps a bounded window of jobs")
+
+
+def test_zip_export_with_progress():
+    """Each exported borehole becomes one PDF in the ZIP, in selection order."""
+    from borehole_log import export_borehole_logs
+    from render_workers import RenderWorkerPool
+
+    updates = []
+    output = io.BytesIO()
+    pool = RenderWorkerPool(max_workers=1, use_processes=False)
+    try:
+        exported = export_borehole_logs(
+            [("site.ags", AGS_CONTENT)],
+            ["BH003", "BH001", "MISSING"],
+            output,
+            data_key="export-ds",
+            pool=pool,
+            progress=lambda done, total: updates.append((done, total)),
+        )
+    finally:
+        pool.shutdown()
+
+    assert exported == 2
+    assert updates == [(0, 2), (1, 2), (2, 2)]
+    with zipfile.ZipFile(io.BytesIO(output.getvalue())) as archive:
+        assert archive.namelist() == ["borehole_log_BH003.pdf", "borehole_log_BH001.pdf"]
+        assert archive.read("borehole_log_BH001.pdf").startswith(b"%PDF")
+    print("✅ Logs export as a ZIP of PDFs with progress")
+
+
+def test_combined_pdf_needs_pypdf():
+    """Combined PDFs are only offered when pypdf can merge the logs."""
+    from borehole_log import available_export_formats, export_borehole_logs
+    from borehole_log.export import PdfWriter
+
+    assert "zip" in available_export_formats()
+    if PdfWriter is not None:
+        output = io.BytesIO()
+        export_borehole_logs(
+            [("site.ags", AGS_CONTENT)], ["BH001", "BH002"], output, "pdf"
+        )
+        assert output.getvalue().startswith(b"%PDF")
+    else:
+        assert "pdf" not in available_export_formats()
+        try:
+            export_borehole_logs([("site.ags", AGS_CONTENT)], ["BH001"], io.BytesIO(), "pdf")
+            raise AssertionError("Combined PDF export should need pypdf")
+        except ValueError:
+            pass
+    print("✅ Combined PDF export follows pypdf availability")
+
+
+def test_combined_pdf_contains_every_log():
+    """A combined PDF holds each exported log's pages, bookmarked by borehole."""
+    import pytest
+
+    pypdf = pytest.importorskip("pypdf")
+    from borehole_log import export_borehole_logs
+    from borehole_log.export import _render_pdfs
+    from borehole_log.rendering import borehole_log_inputs, build_borehole_log_index
+
+    index = build_borehole_log_index([("site.ags", AGS_CONTENT)], "export-pdf")
+    expected_pages = sum(
+        len(pypdf.PdfReader(io.BytesIO(pdf)).pages)
+        for pdf in _render_pdfs(
+            [borehole_log_inputs(index, bh) for bh in ("BH002", "BH001")], None
+        )
+    )
+
+    output = io.BytesIO()
+    exported = export_borehole_logs(
+        [("site.ags", AGS_CONTENT)],
+        ["BH002", "BH001"],
+        output,
+        "pdf",
+        data_key="export-pdf",
+    )
+    reader = pypdf.PdfReader(io.BytesIO(output.getvalue()))
+
+    assert exported == 2
+    assert len(reader.pages) == expected_pages
+    assert [item.title for item in reader.outline] == ["BH002", "BH001"]
+    print(f"✅ Combined PDF holds {len(reader.pages)} pages from 2 logs")
+
+
+def test_export_callback_sends_zip():
+    """The export callback sends all boreholes when none are selected."""
+    import base64
+
+    import callbacks.log_export as log_export
+    from render_workers import RenderWorkerPool
+
+    pool = RenderWorkerPool(max_workers=1, use_processes=False)
+    original_pool = log_export.get_render_worker_pool
+    log_export.get_render_worker_pool = lambda: pool
+    progress = []
+    try:
+        stored = {"filename_map": {"site.ags": AGS_CONTENT}, "dataset_id": "export-cb"}
+        download, status = log_export.LogExportCallback()._export_logs(
+            stored, [], ["show_labels"], "zip", progress.append
+        )
+    finally:
+        log_export.get_render_worker_pool = original_pool
+        pool.shutdown()
+
+    assert download["filename"] == "borehole_logs.zip" and download["base64"]
+    with zipfile.ZipFile(io.BytesIO(base64.b64decode(download["content"]))) as archive:
+        assert len(archive.namelist()) == 3
+    assert len(progress) == 4 and "3" in str(status)
+    print("✅ Export callback sends a ZIP of all borehole logs")
+
+
+def test_export_callback_reports_truncation():
+    """Exports over the borehole limit say how many boreholes were left out."""
+    import callbacks.log_export as log_export
+    from app_constants import PERFORMANCE_CONFIG
+    from render_workers import RenderWorkerPool
+
+    pool = RenderWorkerPool(max_workers=1, use_processes=False)
+    original_pool = log_export.get_render_worker_pool
+    original_limit = PERFORMANCE_CONFIG.LOG_EXPORT_MAX_BOREHOLES
+    log_export.get_render_worker_pool = lambda: pool
+    PERFORMANCE_CONFIG.LOG_EXPORT_MAX_BOREHOLES = 2
+    try:
+        stored = {"filename_map": {"site.ags": AGS_CONTENT}, "dataset_id": "export-cap"}
+        download, status = log_export.LogExportCallback()._export_logs(
+            stored, [], [], "zip"
+        )
+    finally:
+        PERFORMANCE_CONFIG.LOG_EXPORT_MAX_BOREHOLES = original_limit
+        log_export.get_render_worker_pool = original_pool
+        pool.shutdown()
+
+    assert download["filename"] == "borehole_logs.zip"
+    assert "first 2 of 3 boreholes" in str(status)
+    print("✅ Export status reports boreholes left out by the limit")
+
+
+def test_combined_pdf_limited():
+    """Combined PDFs over their log limit are refused before rendering."""
+    import callbacks.log_export as log_export
+    from app_constants import PERFORMANCE_CONFIG
+    from borehole_log import export_borehole_logs
+    from borehole_log import export as export_module
+
+    original_limit = PERFORMANCE_CONFIG.LOG_EXPORT_MAX_COMBINED_PDF
+    original_writer = export_module.PdfWriter
+    original_formats = log_export.available_export_formats
+    PERFORMANCE_CONFIG.LOG_EXPORT_MAX_COMBINED_PDF = 2
+    export_module.PdfWriter = object  # Only checked for availability
+    log_export.available_export_formats = lambda: ("zip", "pdf")
+    try:
+        try:
+            export_borehole_logs(
+                [("site.ags", AGS_CONTENT)],
+                ["BH001", "BH002", "BH003"],
+                io.BytesIO(),
+                "pdf",
+            )
+            raise AssertionError("Combined PDF over the limit should be refused")
+        except ValueError as e:
+            assert "limited to 2 logs" in str(e)
+
+        stored = {"filename_map": {"site.ags": AGS_CONTENT}, "dataset_id": "export-pdf-cap"}
+        download, status = log_export.LogExportCallback()._export_logs(
+            stored, [], [], "pdf"
+        )
+    finally:
+        PERFORMANCE_CONFIG.LOG_EXPORT_MAX_COMBINED_PDF = original_limit
+        export_module.PdfWriter = original_writer
+        log_export.available_export_formats = original_formats
+
+    assert download is None
+    assert "limited to 2 boreholes (3 requested)" in str(status)
+    print("✅ Combined PDF exports limited to a small log count")
+
+
+if __name__ == "__main__":
+    test_pool_imap_bounds_jobs_in_flight()
+    test_zip_export_with_progress()
+    test_combined_pdf_needs_pypdf()
+    test_combined_pdf_contains_every_log()
+    test_export_callback_sends_zip()
+    test_export_callback_reports_truncation()
+    test_combined_pdf_limited()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test background pre-rendering of borehole logs after an upload.
+"""
+import os
+import sys
+import threading
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+from tests.test_borehole_log_render import AGS_CONTENT  # noqa: E402
+
+
+def test_nearest_boreholes_order():
+    """Boreholes are ordered by distance from the map centre."""
+    import pandas as pd
+
+    from render_warmup import nearest_boreholes
+
+    loca_df = pd.DataFrame(
+        {
+            "LOCA_ID": ["FAR", "NEAR", "NONE", "MID", "NEAR"],
+            "lat": [52.0, 51.5, None, 51.6, 51.5],
+            "lon": [0.0, -0.1, None, -0.1, -0.1],
+        }
+    )
+    assert nearest_boreholes(loca_df, [51.5, -0.1]) == ["NEAR", "MID", "FAR", "NONE"]
+    assert nearest_boreholes(loca_df, [51.5, -0.1], limit=2) == ["NEAR", "MID"]
+    assert nearest_boreholes(loca_df, None) == ["FAR", "NEAR", "NONE", "MID"]
+    print("✅ Warm-up starts with the boreholes nearest the map centre")
+
+
+def test_warmup_fills_cache_for_marker_clicks():
+    """A warmed borehole is a render cache hit when its marker is clicked."""
+    import callbacks.marker_handling as marker_handling
+    from render_warmup import LogWarmup
+    from render_workers import RenderWorkerPool
+    from section.render_cache import get_log_render_cache
+
+    pool = RenderWorkerPool(max_workers=1, use_processes=False)
+    warmup = LogWarmup(pool=pool, poll_seconds=0.01)
+    job = warmup.start([("site.ags", AGS_CONTENT)], "warmup-ds", ["BH001", "BH003"])
+    assert job.done.wait(60)
+    assert job.warmed == 2 and warmup.get_stats()["completed"] == 1
+
+    original_pool = marker_handling.get_render_worker_pool
+    marker_handling.get_render_worker_pool = lambda: pool
+    try:
+        hits = get_log_render_cache().get_stats()["hits"]
+        marker_handling.MarkerHandlingCallback()._generate_borehole_log_display(
+            {"site.ags": AGS_CONTENT}, "warmup-ds", "BH003", ["show_labels"]
+        )
+        assert get_log_render_cache().get_stats()["hits"] == hits + 1
+    finally:
+        marker_handling.get_render_worker_pool = original_pool
+        pool.shutdown()
+    print("✅ Warmed logs are served from the render cache")
+
+
+def test_warmup_yields_and_cancels():
+    """The warm-up waits while the pool is busy and stops when cancelled."""
+    from render_warmup import LogWarmup
+    from render_workers import RenderWorkerPool
+
+    release = threading.Event()
+    pool = RenderWorkerPool(max_workers=1, use_processes=False)
+    warmup = LogWarmup(pool=pool, poll_seconds=0.01)
+    try:
+        foreground = pool.submit(release.wait, 10)
+        job = warmup.start([("site.ags", AGS_CONTENT)], "warmup-busy", ["BH002"])
+        time.sleep(0.2)
+        assert pool.get_stats()["submitted"] == 1 and not job.done.is_set()
+
+        warmup.cancel()
+        assert job.done.wait(5) and job.warmed == 0
+        assert warmup.get_stats()["cancelled"] == 1
+        release.set()
+        foreground.result(5)
+        assert pool.get_stats()["submitted"] == 1
+    finally:
+        release.set()
+        pool.shutdown()
+    print("✅ Warm-up yields to interactive renders and can be cancelled")
+
+
+def test_warmups_are_per_session():
+    """An upload only cancels the earlier warm-up of its own session."""
+    from render_warmup import LogWarmup
+    from render_workers import RenderWorkerPool
+
+    release = threading.Event()
+    pool = RenderWorkerPool(max_workers=1, use_processes=False)
+    warmup = LogWarmup(pool=pool, poll_seconds=0.01)
+    ags_data = [("site.ags", AGS_CONTENT)]
+    try:
+        foreground = pool.submit(release.wait, 10)
+        first = warmup.start(ags_data, "ds-a", ["BH001"], session_id="alice")
+        other = warmup.start(ags_data, "ds-b", ["BH001"], session_id="bob")
+        assert not first.cancelled.is_set()
+        assert warmup.get_stats()["running"] == 2
+        assert warmup.get_stats()["running_datasets"] == ["ds-a", "ds-b"]
+
+        second = warmup.start(ags_data, "ds-c", ["BH002"], session_id="alice")
+        assert first.done.wait(5) and first.warmed == 0
+        assert not other.cancelled.is_set() and not second.cancelled.is_set()
+
+        warmup.cancel("bob")
+        assert other.done.wait(5) and not second.cancelled.is_set()
+        warmup.cancel("alice")
+        assert second.done.wait(5)
+        stats = warmup.get_stats()
+        assert stats["cancelled"] == 3 and stats["running"] == 0
+    finally:
+        release.set()
+        pool.shutdown()
+    foreground.result(5)
+    print("✅ Warm-ups are cancelled per session")
+
+
+def test_warmup_stops_when_cache_full():
+    """The warm-up leaves the log cache headroom for logs the user opens."""
+    from render_warmup import LogWarmup
+    from render_workers import RenderWorkerPool
+    from section.render_cache import get_log_render_cache
+
+    pool = RenderWorkerPool(max_workers=1, use_processes=False)
+    warmup = LogWarmup(pool=pool, poll_seconds=0.01, max_cache_fill=0.0)
+    try:
+        cached = get_log_render_cache().get_stats()["cached_bytes"]
+        job = warmup.start([("site.ags", AGS_CONTENT)], "warmup-full", ["BH001"])
+        assert job.done.wait(10)
+    finally:
+        pool.shutdown()
+
+    assert job.warmed == 0 and warmup.get_stats()["cache_full"] == 1
+    assert get_log_render_cache().get_stats()["cached_bytes"] == cached
+    print("✅ Warm-up stops at the log cache fill threshold")
+
+
+if __name__ == "__main__":
+    test_nearest_boreholes_order()
+    test_warmup_fills_cache_for_marker_clicks()
+    test_warmup_yields_and_cancels()
+    test_warmups_are_per_session()
+    test_warmup_stops_when_cache_full()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test marker click resolution through the LOCA_ID click relay store.
+"""
+import os
+import sys
+
+import dash
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _sample_markers():
+    """Build markers the way the lazy marker manager does."""
+    from lazy_marker_manager import LazyMarkerManager
+
+    loca_df = pd.DataFrame(
+        {
+            "LOCA_ID": ["BH01", "BH02", "BH03"],
+            "LOCA_GL": [10.0, 12.5, None],
+            "LOCA_FDEP": [20.0, 15.0, 8.0],
+            "lat": [51.50, 51.51, 51.52],
+            "lon": [-0.10, -0.11, -0.12],
+        }
+    )
+    manager = LazyMarkerManager()
+    return manager.get_visible_markers(loca_df, selected_ids=["BH02"], force_all=True)
+
+
+def test_marker_ids_use_loca_id():
+    """Marker IDs are keyed by LOCA_ID, not row position."""
+    markers = _sample_markers()
+    indexes = sorted(marker.id["index"] for marker in markers)
+    assert indexes == ["BH01", "BH02", "BH03"]
+    print("✅ Marker IDs keyed by LOCA_ID")
+
+
+def test_click_payload_resolution():
+    """The handler reads the LOCA_ID straight from the relay payload."""
+    from callbacks.file_upload.processing import store_session_dataset
+    from callbacks.marker_handling import MarkerHandlingCallback
+    from state_management import get_session_state_store
+
+    callback = MarkerHandlingCallback()
+    assert callback._get_clicked_borehole_id({"loca_id": "BH02", "timestamp": 1}) == "BH02"
+    assert callback._get_clicked_borehole_id(None) is None
+    assert callback._get_clicked_borehole_id({"loca_id": ""}) is None
+
+    loca_df = pd.DataFrame({"LOCA_ID": ["BH01", "BH02"]})
+    store_session_dataset(loca_df, {"site.ags": ""}, "relay-ds")
+    dataset = get_session_state_store().find_dataset("relay-ds")
+    assert dataset is not None and dataset.filename_map == {"site.ags": ""}
+    assert callback._is_known_borehole(dataset, "BH01")
+    assert not callback._is_known_borehole(dataset, "BH99")
+
+    click = {"loca_id": "BH99", "dataset_id": "relay-ds", "timestamp": 1}
+    output, sync = callback._handle_marker_click_logic(click, [])
+    assert "Invalid borehole" in str(output) and sync is dash.no_update
+    print("✅ Click payload resolved to LOCA_ID")
+
+
+def test_missing_dataset_is_restored_once():
+    """A click on a dataset this process lacks restores it from the store once."""
+    from app_modules.server_callbacks import restore_session_dataset
+    from callbacks.file_upload.processing import prepare_borehole_data_for_storage
+    from callbacks.marker_handling import MarkerHandlingCallback
+    from state_management import get_session_state_store
+
+    loca_df = pd.DataFrame({"LOCA_ID": ["BH01", "BH02"], "lat": [51.5, 51.6]})
+    stored = prepare_borehole_data_for_storage(loca_df, {"a.ags": "x"}, "restore-ds")
+    callback = MarkerHandlingCallback()
+    click = {"loca_id": "BH02", "dataset_id": "restore-ds", "timestamp": 1}
+
+    assert get_session_state_store().find_dataset("restore-ds") is None
+    output, sync = callback._handle_marker_click_logic(click, [])
+    assert sync == {"dataset_id": "restore-ds", "click": click}
+
+    # A store holding another dataset restores nothing
+    other = {**stored, "dataset_id": "other-ds"}
+    assert restore_session_dataset(sync, other) == (None, None)
+
+    replayed, tile_source = restore_session_dataset(sync, stored)
+    assert tile_source is None
+    assert replayed["loca_id"] == "BH02" and replayed["restored"]
+    dataset = get_session_state_store().find_dataset("restore-ds")
+    assert list(dataset.loca_df["LOCA_ID"]) == ["BH01", "BH02"]
+
+    # Replayed clicks never request a second restore
+    lost = {**replayed, "dataset_id": "gone-ds"}
+    output, sync = callback._handle_marker_click_logic(lost, [])
+    assert sync is dash.no_update and "No borehole data" in str(output)
+    print("✅ Missing datasets are restored from the client store once")
+
+
+def test_click_callback_sends_only_the_click():
+    """The server click callback receives no dataset or marker list."""
+    from app_modules.clientside_callbacks import register_marker_click_relay
+    from callbacks.marker_handling import MarkerHandlingCallback
+
+    app = dash.Dash(__name__)
+    app.layout = dash.html.Div()
+    MarkerHandlingCallback().register(app)
+    register_marker_click_relay(app)
+
+    server_entry = next(
+        entry
+        for entry in app._callback_list
+        if "section-plot-output.children" in entry["output"]
+    )
+    assert [dep["id"] for dep in server_entry["state"]] == ["show-labels-checkbox"]
+    relay_entry = next(
+        entry
+        for entry in app._callback_list
+        if entry.get("clientside_function") and "marker-click-store" in entry["output"]
+    )
+    assert "borehole-markers.children" in relay_entry["output"]
+    print("✅ Marker clicks send only LOCA_ID and dataset ID to the server")
+
+
+if __name__ == "__main__":
+    test_marker_ids_use_loca_id()
+    test_click_payload_resolution()
+    test_missing_dataset_is_restored_once()
+    test_click_callback_sends_only_the_click()
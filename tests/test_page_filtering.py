@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test searchsorted-based page filtering of borehole log records.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _overlapping(records, start, end):
+    """Reference filter: one pass over all records per page."""
+    result = []
+    for record in records:
+        try:
+            top = float(record["GEOL_TOP"])
+        except (TypeError, ValueError, KeyError):
+            continue
+        try:
+            base = max(float(record["GEOL_BASE"]), top)
+        except (TypeError, ValueError, KeyError):
+            base = top
+        if not (base < start or top > end):
+            result.append(record)
+    return result
+
+
+def test_split_matches_per_page_filter():
+    """All pages split at once equal a per-record overlap check per page."""
+    from borehole_log.overflow import split_data_by_page
+
+    rng = random.Random(7)
+    records = []
+    for index in range(300):
+        top = round(rng.uniform(0, 60), 2)
+        records.append(
+            {"id": index, "GEOL_TOP": top, "GEOL_BASE": top + rng.uniform(0, 8)}
+        )
+    # Unsorted input, a long stratum, a reversed one and unparseable depths
+    records += [
+        {"id": "long", "GEOL_TOP": 1.0, "GEOL_BASE": 55.0},
+        {"id": "reversed", "GEOL_TOP": 30.0, "GEOL_BASE": 20.0},
+        {"id": "no-base", "GEOL_TOP": "12.5", "GEOL_BASE": None},
+        {"id": "bad-base", "GEOL_TOP": 40.0, "GEOL_BASE": "n/a"},
+        {"id": "bad-top", "GEOL_TOP": "n/a", "GEOL_BASE": 3.0},
+        {"id": "no-top", "GEOL_BASE": 3.0},
+    ]
+    rng.shuffle(records)
+    page_ranges = [(0.0, 12.5), (12.5, 25.0), (25.0, 40.0), (40.0, 70.0)]
+
+    pages = split_data_by_page(records, page_ranges)
+
+    assert len(pages) == len(page_ranges)
+    for page, (start, end) in zip(pages, page_ranges):
+        assert page == _overlapping(records, start, end)
+    assert all(any(r["id"] == "long" for r in page) for page in pages[:4])
+    print("✅ Page split matches the per-record overlap check")
+
+
+def test_filter_data_for_page_keeps_api():
+    """filter_data_for_page still filters one page, including samples."""
+    from borehole_log.overflow import filter_data_for_page, split_data_by_page
+
+    samples = [
+        {"SAMP_TOP": 4.0, "SAMP_BASE": 4.45},
+        {"SAMP_TOP": 1.0, "SAMP_BASE": 1.45},
+        {"SAMP_TOP": 9.0},
+    ]
+    page = filter_data_for_page(samples, 0.0, 5.0, "SAMP_TOP", "SAMP_BASE")
+    assert page == samples[:2]
+    assert split_data_by_page([], [(0.0, 5.0), (5.0, 10.0)]) == [[], []]
+    assert split_data_by_page(samples, []) == []
+    print("✅ Single-page filtering is unchanged")
+
+
+if __name__ == "__main__":
+    test_split_matches_per_page_filter()
+    test_filter_data_for_page_keeps_api()
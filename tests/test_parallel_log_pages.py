@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test that borehole log pages render concurrently and are merged in order.
+"""
+import operator
+import os
+import sys
+import threading
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+from tests.test_borehole_log_render import DEEP_AGS  # noqa: E402
+
+
+def test_pool_map_keeps_order_beyond_queue_size():
+    """Batches larger than the queue wait for slots and keep their order."""
+    from render_workers import RenderWorkerPool
+
+    pool = RenderWorkerPool(max_workers=2, max_pending=2, use_processes=False)
+    try:
+        assert pool.map(operator.mul, range(10), range(10)) == [
+            value * value for value in range(10)
+        ]
+        stats = pool.get_stats()
+        assert stats["completed"] == 10 and stats["pending"] == 0
+    finally:
+        pool.shutdown()
+    print("✅ Render pool map returns results in order")
+
+
+def test_parallel_pages_match_sequential_render():
+    """Pages rendered on an executor equal the sequential render, in order."""
+    from borehole_log import render_borehole_log_from_ags
+
+    class RecordingPool:
+        def __init__(self):
+            self.threads = set()
+
+        def map(self, fn, *iterables):
+            results, threads = [], []
+            args_list = list(zip(*iterables))
+            results = [None] * len(args_list)
+
+            def run(index, args):
+                self.threads.add(threading.get_ident())
+                results[index] = fn(*args)
+
+            for index, args in enumerate(args_list):
+                thread = threading.Thread(target=run, args=(index, args))
+                thread.start()
+                threads.append(thread)
+            for thread in threads:
+                thread.join()
+            return results
+
+    ags_data = [("deep.ags", DEEP_AGS)]
+    sequential = render_borehole_log_from_ags(
+        ags_data, "BH900", dpi=30, data_key="parallel-log"
+    )
+    pool = RecordingPool()
+    parallel = render_borehole_log_from_ags(
+        ags_data, "BH900", dpi=30, data_key="parallel-log", executor=pool
+    )
+
+    assert len(sequential) > 1
+    assert len(pool.threads) == len(sequential)
+    assert [len(page) for page in parallel] == [len(page) for page in sequential]
+    assert all(page.startswith(b"\x89PNG") for page in parallel)
+    print(f"✅ {len(parallel)} log pages rendered concurrently in page order")
+
+
+def test_log_pages_render_in_worker_processes():
+    """Page jobs are picklable and run in the render process pool."""
+    from borehole_log import render_borehole_log_from_ags
+    from render_workers import RenderWorkerPool
+
+    pool = RenderWorkerPool(max_workers=1, max_pending=2, use_processes=True)
+    try:
+        pages = render_borehole_log_from_ags(
+            [("deep.ags", DEEP_AGS)],
+            "BH900",
+            dpi=30,
+            data_key="parallel-log-processes",
+            executor=pool,
+        )
+        stats = pool.get_stats()
+    finally:
+        pool.shutdown()
+
+    assert len(pages) > 1 and stats["mode"] == "processes"
+    assert stats["completed"] == len(pages)
+    print("✅ Log pages render in worker processes")
+
+
+def test_create_borehole_log_merges_parallel_pages(tmp_path):
+    """create_borehole_log with an executor merges its pages into one PDF."""
+    import pytest
+
+    pypdf = pytest.importorskip("pypdf")
+    from borehole_log import create_borehole_log
+    from borehole_log.rendering import borehole_log_inputs, build_borehole_log_index
+    from render_workers import RenderWorkerPool
+
+    index = build_borehole_log_index([("deep.ags", DEEP_AGS)], "parallel-pdf")
+    borehole_id, loca, geology, samples, project, settings = borehole_log_inputs(
+        index, "BH900"
+    )
+
+    def page_count(executor, name):
+        path = create_borehole_log(
+            borehole_id,
+            loca,
+            geology,
+            samples,
+            project,
+            output_path=str(tmp_path / name),
+            page_settings=settings,
+            executor=executor,
+        )
+        return len(pypdf.PdfReader(path).pages)
+
+    pool = RenderWorkerPool(max_workers=2, use_processes=False)
+    try:
+        merged_pages = page_count(pool, "parallel.pdf")
+        stats = pool.get_stats()
+    finally:
+        pool.shutdown()
+
+    sequential_pages = page_count(None, "sequential.pdf")
+    assert sequential_pages > 1 and merged_pages == sequential_pages
+    assert stats["completed"] == merged_pages
+    print(f"✅ {merged_pages} parallel PDF pages merged with pypdf")
+
+
+if __name__ == "__main__":
+    test_pool_map_keeps_order_beyond_queue_size()
+    test_parallel_pages_match_sequential_render()
+    test_log_pages_render_in_worker_processes()
+
+    import tempfile
+    from pathlib import Path
+
+    test_create_borehole_log_merges_parallel_pages(Path(tempfile.mkdtemp()))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test that superseded section previews are dropped instead of rendered.
+"""
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+from tests.test_section_pipeline import AGS_CONTENT  # noqa: E402
+
+
+def test_newer_render_supersedes_ticket():
+    """Only the latest ticket on a channel is current."""
+    from render_workers import RenderCancelled, RenderGenerations
+
+    generations = RenderGenerations(slots=2)
+    first = generations.begin("session-a")
+    other = generations.begin("session-b")
+    second = generations.begin("session-a")
+
+    assert not first.is_current()
+    assert second.is_current() and other.is_current()
+    try:
+        first.check()
+        raise AssertionError("Superseded ticket should raise")
+    except RenderCancelled:
+        pass
+
+    # A third channel recycles the least recently started slot
+    generations.begin("session-c")
+    assert not other.is_current() and second.is_current()
+    generations.close()
+    print("✅ Newer renders supersede older ones per channel")
+
+
+def test_worker_processes_see_superseded_tickets():
+    """Tickets are checked against the shared table from worker processes."""
+    from render_workers import RenderGenerations, RenderWorkerPool
+
+    generations = RenderGenerations(slots=4)
+    pool = RenderWorkerPool(max_workers=1, use_processes=True)
+    try:
+        ticket = generations.begin("session")
+        assert pool.run(ticket.is_current, timeout=60)
+        generations.begin("session")
+        assert not pool.run(ticket.is_current, timeout=60)
+    finally:
+        pool.shutdown()
+        generations.close()
+    print("✅ Worker processes see superseded renders")
+
+
+def test_superseded_preview_is_dropped():
+    """A preview superseded mid-flight returns no update and is not cached."""
+    import dash
+
+    import callbacks.plot_generation as plot_generation
+    from render_workers import RenderWorkerPool, get_render_generations
+    from section.render_cache import SectionRenderCache
+    from state_management import get_current_session_id
+
+    class SupersedingPool(RenderWorkerPool):
+        """Starts a newer preview just before each render runs."""
+
+        def run(self, fn, *args, timeout=None, **kwargs):
+            get_render_generations().begin(
+                ("section_preview", get_current_session_id())
+            )
+            return super().run(fn, *args, timeout=timeout, **kwargs)
+
+    cache = SectionRenderCache()
+    pool = SupersedingPool(max_workers=1, use_processes=False)
+    original_cache = plot_generation.get_section_render_cache
+    original_pool = plot_generation.get_render_worker_pool
+    plot_generation.get_section_render_cache = lambda: cache
+    plot_generation.get_render_worker_pool = lambda: pool
+    try:
+        cancelled_before = get_render_generations().get_stats()["cancelled"]
+        stored = {"filename_map": {"site.ags": AGS_CONTENT}, "dataset_id": "cancel"}
+        outputs = plot_generation.PlotGenerationCallback()._handle_plot_generation_logic(
+            ["BH001", "BH002"], ["show_labels"], None, stored
+        )
+        assert outputs == (dash.no_update, dash.no_update, dash.no_update)
+        assert cache.get_stats()["entries"] == 0
+        assert get_render_generations().get_stats()["cancelled"] == cancelled_before + 1
+    finally:
+        plot_generation.get_section_render_cache = original_cache
+        plot_generation.get_render_worker_pool = original_pool
+        pool.shutdown()
+    print("✅ Superseded previews are dropped before encoding")
+
+
+if __name__ == "__main__":
+    test_newer_render_supersedes_ticket()
+    test_worker_processes_see_superseded_tickets()
+    test_superseded_preview_is_dropped()
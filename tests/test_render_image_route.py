@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test that rendered images are served by URL from the render image route.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _make_app():
+    import dash
+    from dash import html
+
+    from app_modules.server_routes import register_render_image_routes
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div()
+    register_render_image_routes(app)
+    return app
+
+
+def test_image_route_serves_cached_render():
+    """Cached images are served with ETag and Cache-Control headers."""
+    from section.render_cache import get_section_render_cache, make_render_key
+
+    key = make_render_key("route-ds", ["BH001"], dpi=72, variant="preview")
+    src = get_section_render_cache().image_src(key, b"\x89PNG route test")
+    assert src.startswith("/renders/") and src.endswith(".png")
+
+    client = _make_app().server.test_client()
+    response = client.get(src)
+    assert response.status_code == 200
+    assert response.mimetype == "image/png"
+    assert response.data == b"\x89PNG route test"
+    assert "max-age" in response.headers["Cache-Control"]
+    etag = response.headers["ETag"]
+
+    revalidated = client.get(src, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304 and not revalidated.data
+
+    assert client.get("/renders/0123456789abcdef01234567.png").status_code == 404
+    print("✅ Rendered images are served by URL with caching headers")
+
+
+def test_uncacheable_image_falls_back_to_data_uri():
+    """Images too large for the cache are still displayed inline."""
+    from section.render_cache import SectionRenderCache, make_render_key
+
+    cache = SectionRenderCache(max_mb=0.001)
+    key = make_render_key("route-ds", ["BH002"], image_format="svg")
+    src = cache.image_src(key, b"<svg>" + b" " * 2048 + b"</svg>")
+    assert src.startswith("data:image/svg+xml;base64,")
+    print("✅ Oversized renders fall back to data URIs")
+
+
+def test_served_image_pinned_until_fetched():
+    """Images handed out by URL survive eviction until the browser fetches them."""
+    from section.render_cache import SectionRenderCache, make_render_key
+
+    cache = SectionRenderCache(max_mb=10 / 1024)
+    served = make_render_key("pin-ds", ["BH001"])
+    src = cache.image_src(served, b"s" * 3000)
+    assert src.startswith("/renders/")
+
+    for number in range(5):
+        cache.put(make_render_key("pin-ds", [f"BH1{number}"]), b"o" * 3000)
+    assert cache.get(served) is not None
+    assert cache.get_stats()["pinned"] == 1
+
+    # Half of the cache may be pinned; beyond that images are sent inline
+    other = make_render_key("pin-ds", ["BH002"])
+    assert cache.image_src(other, b"x" * 3000).startswith("data:image/png;base64,")
+
+    image_id = src.rsplit("/", 1)[-1].split(".")[0]
+    assert cache.get_by_id(image_id)[0] == b"s" * 3000
+    assert cache.get_stats()["pinned"] == 0
+    for number in range(5):
+        cache.put(make_render_key("pin-ds", [f"BH2{number}"]), b"o" * 3000)
+    assert cache.get(served) is None
+    print("✅ Served images are pinned until fetched")
+
+
+def test_pins_expire():
+    """Pins on images that are never fetched lapse after the pin lifetime."""
+    from app_constants import PERFORMANCE_CONFIG
+    from section.render_cache import SectionRenderCache, make_render_key
+
+    original = PERFORMANCE_CONFIG.RENDER_IMAGE_PIN_SECONDS
+    PERFORMANCE_CONFIG.RENDER_IMAGE_PIN_SECONDS = 0
+    try:
+        cache = SectionRenderCache(max_mb=10 / 1024)
+        served = make_render_key("expiry-ds", ["BH001"])
+        assert cache.image_src(served, b"s" * 3000).startswith("/renders/")
+        for number in range(5):
+            cache.put(make_render_key("expiry-ds", [f"BH1{number}"]), b"o" * 3000)
+    finally:
+        PERFORMANCE_CONFIG.RENDER_IMAGE_PIN_SECONDS = original
+
+    assert cache.get(served) is None
+    assert cache.get_stats()["pinned_bytes"] == 0
+    print("✅ Unfetched image pins expire")
+
+
+def test_log_pages_use_their_own_cache():
+    """Log pages are cached apart from section images and served by the route."""
+    from section.render_cache import (
+        get_log_render_cache,
+        get_section_render_cache,
+        log_page_srcs,
+    )
+
+    sections = get_section_render_cache().get_stats()["entries"]
+    srcs = log_page_srcs("log-route-ds", "BH001", lambda: [b"\x89PNG page 1"])
+    assert get_section_render_cache().get_stats()["entries"] == sections
+    assert get_log_render_cache().get_stats()["pinned"] >= 1
+
+    response = _make_app().server.test_client().get(srcs[0])
+    assert response.status_code == 200 and response.data == b"\x89PNG page 1"
+    print("✅ Log pages have their own cache budget")
+
+
+if __name__ == "__main__":
+    test_image_route_serves_cached_render()
+    test_uncacheable_image_falls_back_to_data_uri()
+    test_served_image_pinned_until_fetched()
+    test_pins_expire()
+    test_log_pages_use_their_own_cache()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Test the render worker pool and the in-process background callback manager.
+"""
+import json
+import operator
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def test_worker_pool_runs_in_processes():
+    """Render jobs run in the process pool and report statistics."""
+    from render_workers import RenderWorkerPool
+
+    pool = RenderWorkerPool(max_workers=1, max_pending=2, use_processes=True)
+    try:
+        assert pool.run(operator.mul, 6, 7, timeout=60) == 42
+        stats = pool.get_stats()
+        assert stats["completed"] == 1 and stats["pending"] == 0
+        assert stats["mode"] == "processes"
+    finally:
+        pool.shutdown()
+    print("✅ Render worker pool runs jobs in worker processes")
+
+
+def test_worker_pool_queue_is_bounded():
+    """Submissions beyond the queue size are refused instead of queued."""
+    from render_workers import RenderQueueFullError, RenderWorkerPool
+
+    release = threading.Event()
+    pool = RenderWorkerPool(max_workers=1, max_pending=2, use_processes=False)
+    try:
+        first = pool.submit(release.wait, 10)
+        second = pool.submit(release.wait, 10)
+        try:
+            pool.submit(release.wait, 10)
+            raise AssertionError("Third render should have been refused")
+        except RenderQueueFullError:
+            pass
+        release.set()
+        assert first.result(5) and second.result(5)
+        time.sleep(0.05)
+        stats = pool.get_stats()
+        assert stats["rejected"] == 1 and stats["pending"] == 0
+    finally:
+        pool.shutdown()
+    print("✅ Render queue refuses jobs beyond its bound")
+
+
+def _poll_background_callback(app):
+    """Trigger the "go" -> "out" background callback and poll until it returns."""
+    client = app.server.test_client()
+    body = {
+        "output": "out.children",
+        "outputs": {"id": "out", "property": "children"},
+        "inputs": [{"id": "go", "property": "n_clicks", "value": 1}],
+        "changedPropIds": ["go.n_clicks"],
+        "state": [],
+    }
+    job = json.loads(client.post("/_dash-update-component", json=body).data)
+    assert "cacheKey" in job and "job" in job
+
+    responses = []
+    for _ in range(50):
+        time.sleep(0.05)
+        response = client.post(
+            f"/_dash-update-component?cacheKey={job['cacheKey']}&job={job['job']}",
+            json=body,
+        )
+        responses.append(json.loads(response.data))
+        if "response" in responses[-1]:
+            break
+    return responses
+
+
+def test_background_callback_round_trip():
+    """A background callback reports progress and returns its result."""
+    import dash
+    from dash import Input, Output, html
+
+    from render_workers import InProcessCallbackManager
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div([html.Button(id="go"), html.Div(id="out"), html.Div(id="bar")])
+
+    @app.callback(
+        Output("out", "children"),
+        Input("go", "n_clicks"),
+        background=True,
+        manager=InProcessCallbackManager(max_workers=1),
+        progress=[Output("bar", "children")],
+        prevent_initial_call=True,
+    )
+    def slow(set_progress, n_clicks):
+        set_progress(["rendering"])
+        time.sleep(0.2)
+        return f"done {n_clicks}"
+
+    responses = _poll_background_callback(app)
+    assert responses[-1]["response"]["out"]["children"] == "done 1"
+    assert any(
+        r.get("progress", {}).get("bar.children") == "rendering" for r in responses
+    )
+    print("✅ Background callbacks run off the request thread")
+
+
+def test_dash_background_manager_contract():
+    """Fails when a Dash release changes the internals the manager relies on."""
+    import inspect
+
+    import dash
+    from dash import Input, Output, html
+    from dash.background_callback.managers import BaseBackgroundCallbackManager
+
+    from render_workers import InProcessCallbackManager
+
+    for name in (
+        "make_job_fn",
+        "call_job_fn",
+        "terminate_job",
+        "terminate_unhealthy_job",
+        "job_running",
+        "get_progress",
+        "result_ready",
+        "get_result",
+        "get_updated_props",
+    ):
+        expected = inspect.signature(getattr(BaseBackgroundCallbackManager, name))
+        actual = inspect.signature(getattr(InProcessCallbackManager, name))
+        assert list(actual.parameters) == list(expected.parameters), name
+    manager = InProcessCallbackManager(max_workers=1)
+    assert manager._make_progress_key("k") != manager._make_set_props_key("k")
+    assert manager.UNDEFINED is BaseBackgroundCallbackManager.UNDEFINED
+
+    # set_props inside the job reaches the browser through the proxy Dash reads
+    app = dash.Dash(__name__)
+    app.layout = html.Div([html.Button(id="go"), html.Div(id="out"), html.Div(id="side")])
+
+    @app.callback(
+        Output("out", "children"),
+        Input("go", "n_clicks"),
+        background=True,
+        manager=manager,
+        prevent_initial_call=True,
+    )
+    def with_side_update(n_clicks):
+        assert dash.callback_context.triggered_id == "go"
+        dash.set_props("side", {"children": "updated"})
+        return "done"
+
+    responses = _poll_background_callback(app)
+    assert responses[-1]["response"]["out"]["children"] == "done"
+    assert any(
+        r.get("sideUpdate", {}).get("side") == {"children": "updated"}
+        for r in responses
+    )
+    print("✅ Background manager matches the installed Dash internals")
+
+
+def test_plot_callback_is_background():
+    """The section plot callback is registered as a background callback."""
+    import dash
+
+    from callbacks.plot_generation import PlotGenerationCallback
+
+    app = dash.Dash(__name__)
+    PlotGenerationCallback().register(app)
+    plot_callbacks = [
+        entry
+        for entry in app._callback_list
+        if "section-plot-output.children" in entry["output"]
+    ]
+    assert plot_callbacks and plot_callbacks[0].get("background")
+    print("✅ Section plots render in a background callback")
+
+
+def _worker_main_module():
+    return sys.modules["__main__"].__spec__.name
+
+
+def test_spawned_workers_skip_app_setup():
+    """Spawned render workers start from render_worker_main, not app.py."""
+    import types
+
+    from render_workers import RenderWorkerPool
+
+    # As when serving with "python app.py"
+    app_main = types.ModuleType("__main__")
+    app_main.__file__ = os.path.join(os.path.dirname(__file__), "..", "app.py")
+    app_main.__spec__ = None
+    original_main = sys.modules["__main__"]
+    sys.modules["__main__"] = app_main
+    pool = RenderWorkerPool(max_workers=1, use_processes=True)
+    try:
+        assert pool.run(_worker_main_module, timeout=60) == "render_worker_main"
+        assert sys.modules["__main__"] is app_main
+    finally:
+        sys.modules["__main__"] = original_main
+        pool.shutdown()
+    print("✅ Spawned render workers do not import app.py")
+
+
+if __name__ == "__main__":
+    test_worker_pool_runs_in_processes()
+    test_worker_pool_queue_is_bounded()
+    test_background_callback_round_trip()
+    test_dash_background_manager_contract()
+    test_plot_callback_is_background()
+    test_spawned_workers_skip_app_setup()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test gzip compression of large Dash callback responses.
+"""
+import gzip
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _callback_app():
+    import dash
+    from dash import Input, Output, html
+
+    from app_modules.response_compression import register_response_compression
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div([html.Div(id="size"), html.Div(id="out")])
+
+    @app.callback(Output("out", "children"), Input("size", "children"))
+    def make_payload(size):
+        return "borehole " * int(size)
+
+    register_response_compression(app, min_bytes=1024)
+    return app
+
+
+def _post_callback(client, size, encoding="gzip"):
+    body = {
+        "output": "out.children",
+        "outputs": {"id": "out", "property": "children"},
+        "inputs": [{"id": "size", "property": "children", "value": size}],
+        "changedPropIds": ["size.children"],
+    }
+    return client.post(
+        "/_dash-update-component",
+        data=json.dumps(body),
+        content_type="application/json",
+        headers={"Accept-Encoding": encoding},
+    )
+
+
+def test_large_callback_response_compressed():
+    """Responses over the threshold are gzipped and metrics are recorded."""
+    from app_modules.response_compression import get_compression_stats
+
+    get_compression_stats().clear()
+    client = _callback_app().server.test_client()
+
+    response = _post_callback(client, 5000)
+    assert response.headers["Content-Encoding"] == "gzip"
+    payload = json.loads(gzip.decompress(response.data))
+    assert payload["response"]["out"]["children"].startswith("borehole")
+
+    small = _post_callback(client, 2)
+    assert "Content-Encoding" not in small.headers
+
+    plain = _post_callback(client, 5000, encoding="identity")
+    assert "Content-Encoding" not in plain.headers
+
+    stats = get_compression_stats().get_stats()["out.children"]
+    assert stats["responses"] == 3
+    assert stats["saved_bytes"] > 0
+    print(f"✅ Callback payload compressed (ratio {stats['ratio']:.2f})")
+
+
+def test_accept_encoding_quality_values():
+    """Encodings with a zero q-value are refused in any spelling."""
+    from app_modules.response_compression import _accepted_encoding
+
+    assert _accepted_encoding("gzip, deflate") == "gzip"
+    assert _accepted_encoding("gzip;q=0.5, identity") == "gzip"
+    for header in ("gzip;q=0", "gzip;q=0.0", "gzip; q=0", "GZIP ; Q=0.000", ""):
+        assert _accepted_encoding(header) is None, header
+    assert _accepted_encoding("gzip;q=bogus") is None
+    print("✅ Accept-Encoding q-values are parsed")
+
+
+def test_incompressible_response_recorded():
+    """Responses that do not shrink are sent as-is but still counted."""
+    from flask import Response
+
+    from app_modules.response_compression import get_compression_stats
+
+    app = _callback_app()
+    noise = os.urandom(4096)
+    app.server.add_url_rule(
+        "/noise", "noise", lambda: Response(noise, mimetype="text/plain")
+    )
+    get_compression_stats().clear()
+
+    response = app.server.test_client().get(
+        "/noise", headers={"Accept-Encoding": "gzip"}
+    )
+    assert "Content-Encoding" not in response.headers and response.data == noise
+
+    stats = get_compression_stats().get_stats()["/noise"]
+    assert stats["responses"] == 1
+    assert stats["raw_bytes"] == stats["sent_bytes"] == len(noise)
+    print("✅ Incompressible responses are recorded as uncompressed")
+
+
+if __name__ == "__main__":
+    test_large_callback_response_compressed()
+    test_accept_encoding_quality_values()
+    test_incompressible_response_recorded()
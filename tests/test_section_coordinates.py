@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized section coordinate preparation.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+LOCA = pd.DataFrame(
+    {
+        "LOCA_ID": ["BH003", "BH001", "BH002", "BH004"],
+        "LOCA_NATE": ["400040", "400000", "400020", "bad"],
+        "LOCA_NATN": ["300020", "300000", "300010", "300030"],
+        "LOCA_GL": [98.75, 100.0, 105.5, 99.0],
+    }
+)
+GEOL = pd.DataFrame(
+    {
+        "LOCA_ID": ["BH001", "BH001", "BH002", "BH003", "BH004"],
+        "GEOL_TOP": [0.0, 1.5, 0.0, 0.0, 0.0],
+        "GEOL_BASE": [1.5, 4.0, 3.2, 5.5, 2.0],
+    }
+)
+
+
+def test_bng_ordering_uses_one_easting_per_borehole():
+    """Boreholes are ordered by easting; invalid coordinates are skipped."""
+    from section.plotting.coordinates import prepare_bng_coordinates
+
+    result = prepare_bng_coordinates(GEOL, LOCA)
+    assert result["ordered_boreholes"] == ["BH001", "BH002", "BH003"]
+    assert result["borehole_x_map"] == {
+        "BH001": 400000.0,
+        "BH002": 400020.0,
+        "BH003": 400040.0,
+    }
+    assert len(result["merged_df"]) == len(GEOL)
+    print("✅ BNG coordinates are prepared without row iteration")
+
+
+def test_projection_matches_shapely_project():
+    """Array projection matches projecting each borehole individually."""
+    from shapely.geometry import LineString, Point
+
+    from section.plotting.coordinates import project_onto_section_line
+
+    rng = np.random.default_rng(7)
+    coords = rng.uniform(0, 1000, size=(50, 2))
+    utm_coords = {f"BH{i:03d}": tuple(xy) for i, xy in enumerate(coords)}
+    line = [(0.0, 0.0), (400.0, 600.0), (1000.0, 500.0)]
+
+    result = project_onto_section_line(GEOL, LOCA, utm_coords, line)
+
+    geom = LineString(line)
+    expected = {bh: geom.project(Point(xy)) for bh, xy in utm_coords.items()}
+    for borehole_id, distance in expected.items():
+        assert abs(result["borehole_x_map"][borehole_id] - distance) < 1e-9
+    assert result["ordered_boreholes"] == sorted(expected, key=expected.get)
+    print("✅ Boreholes are projected onto the section line as arrays")
+
+
+def test_polyline_preparation_skips_invalid_coordinates():
+    """Polyline mode transforms valid boreholes and orders them along the line."""
+    from section.plotting.coordinates import prepare_coordinate_data
+
+    line = [(49.766, -7.556), (49.767, -7.555)]
+    result = prepare_coordinate_data(GEOL, LOCA, line)
+    assert set(result["ordered_boreholes"]) == {"BH001", "BH002", "BH003"}
+    print("✅ Polyline preparation skips boreholes without coordinates")
+
+
+if __name__ == "__main__":
+    test_bng_ordering_uses_one_easting_per_borehole()
+    test_projection_matches_shapely_project()
+    test_polyline_preparation_skips_invalid_coordinates()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test that the staged section pipeline reuses earlier stages.
+"""
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+AGS_CONTENT = """GROUP,LOCA
+HEADING,LOCA_ID,LOCA_TYPE,LOCA_NATE,LOCA_NATN,LOCA_GL
+UNITS,,,m,m,m
+TYPE,X,X,2DP,2DP,2DP
+DATA,BH001,BH,400000.00,300000.00,100.00
+DATA,BH002,BH,400020.00,300010.00,105.50
+DATA,BH003,BH,400040.00,300020.00,98.75
+
+GROUP,GEOL
+HEADING,LOCA_ID,GEOL_TOP,GEOL_BASE,GEOL_GEOL,GEOL_LEG,GEOL_DESC
+UNITS,,m,m,,,
+TYPE,X,2DP,2DP,X,X,X
+DATA,BH001,0.00,1.50,MADE GROUND,MG,MADE GROUND
+DATA,BH001,1.50,4.00,LONDON CLAY,LC,LONDON CLAY
+DATA,BH002,0.00,3.20,LONDON CLAY,LC,LONDON CLAY
+DATA,BH003,0.00,5.50,CHALK,CH,CHALK
+"""
+
+
+def _view_stats(name):
+    from state_management import get_derived_view_cache
+
+    return get_derived_view_cache().get_stats()["views"].get(
+        name, {"hits": 0, "misses": 0}
+    )
+
+
+def _counts(*names):
+    return {name: dict(_view_stats(name)) for name in names}
+
+
+def test_render_options_reuse_projected_data():
+    """Changing labels or DPI only repeats the render stage."""
+    from section.plotting.main import render_section_image
+
+    ags_data = [("site.ags", AGS_CONTENT)]
+    render_section_image(ags_data, dpi=50, data_key="pipeline-a")
+    before = _counts("section_parse", "section_project", "section_style")
+
+    render_section_image(ags_data, show_labels=False, dpi=60, data_key="pipeline-a")
+    after = _counts("section_parse", "section_project", "section_style")
+
+    for name in before:
+        assert after[name]["misses"] == before[name]["misses"], name
+    assert after["section_project"]["hits"] == before["section_project"]["hits"] + 1
+    print("✅ Render-only changes reuse projected and styled data")
+
+
+def test_new_polyline_reuses_prepared_data():
+    """A new section line re-projects but does not re-parse or re-filter."""
+    from section.plotting.pipeline import project_section_data
+
+    ags_data = [("site.ags", AGS_CONTENT)]
+    selection = ["BH001", "BH002"]
+    project_section_data(ags_data, selection, None, "pipeline-b")
+    before = _counts("section_parse", "section_prepare", "section_project")
+
+    line = [(52.6, -1.9), (52.61, -1.89)]
+    projected = project_section_data(ags_data, selection, line, "pipeline-b")
+    after = _counts("section_parse", "section_prepare", "section_project")
+
+    assert after["section_parse"]["misses"] == before["section_parse"]["misses"]
+    assert after["section_prepare"]["misses"] == before["section_prepare"]["misses"]
+    assert after["section_prepare"]["hits"] == before["section_prepare"]["hits"] + 1
+    assert after["section_project"]["misses"] == before["section_project"]["misses"] + 1
+    assert set(projected["ordered_boreholes"]) == {"BH001", "BH002"}
+    print("✅ New polylines reuse parsed and filtered data")
+
+
+def test_style_follows_selection():
+    """Legend mappings only include codes from the selected boreholes."""
+    from section.plotting.pipeline import style_section_data
+
+    ags_data = [("site.ags", AGS_CONTENT)]
+    color_map, _, _ = style_section_data(ags_data, ["BH001"], "pipeline-c")
+    assert set(color_map) == {"MG", "LC"}
+    color_map, _, _ = style_section_data(ags_data, None, "pipeline-c")
+    assert set(color_map) == {"MG", "LC", "CH"}
+    print("✅ Style stage is keyed on the selection")
+
+
+if __name__ == "__main__":
+    test_render_options_reuse_projected_data()
+    test_new_polyline_reuses_prepared_data()
+    test_style_follows_selection()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test the byte-bounded section render cache and its use by the plot callback.
+"""
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+AGS_CONTENT = """GROUP,LOCA
+HEADING,LOCA_ID,LOCA_TYPE,LOCA_NATE,LOCA_NATN,LOCA_GL
+UNITS,,,m,m,m
+TYPE,X,X,2DP,2DP,2DP
+DATA,BH001,BH,400000.00,300000.00,100.00
+DATA,BH002,BH,400020.00,300010.00,105.50
+DATA,BH003,BH,400040.00,300020.00,98.75
+
+GROUP,GEOL
+HEADING,LOCA_ID,GEOL_TOP,GEOL_BASE,GEOL_GEOL,GEOL_LEG,GEOL_DESC
+UNITS,,m,m,,,
+TYPE,X,2DP,2DP,X,X,X
+DATA,BH001,0.00,1.50,MADE GROUND,MG,MADE GROUND
+DATA,BH001,1.50,4.00,LONDON CLAY,LC,LONDON CLAY
+DATA,BH002,0.00,3.20,LONDON CLAY,LC,LONDON CLAY
+DATA,BH003,0.00,5.50,LONDON CLAY,LC,LONDON CLAY
+"""
+
+
+def test_render_key_is_order_independent():
+    """Borehole order and float noise in the line do not change the key."""
+    from section.render_cache import make_render_key
+
+    line = [(51.5, -0.12), (51.51, -0.11)]
+    noisy = [(51.50000000001, -0.12), (51.51, -0.10999999999)]
+    assert make_render_key("d1", ["B", "A"], line) == make_render_key(
+        "d1", ["A", "B"], noisy
+    )
+    assert make_render_key("d1", ["A"], None, True) != make_render_key(
+        "d1", ["A"], None, False
+    )
+    assert make_render_key("d1", ["A"], dpi=150) != make_render_key(
+        "d1", ["A"], dpi=300
+    )
+    print("✅ Render keys normalise selection and section line")
+
+
+def test_cache_evicts_by_bytes():
+    """Least recently used images are evicted once the byte budget is hit."""
+    from section.render_cache import SectionRenderCache
+
+    cache = SectionRenderCache(max_mb=1)
+    block = b"x" * (400 * 1024)
+    cache.put("a", block)
+    cache.put("b", block)
+    assert cache.get("a") is not None  # "b" is now least recently used
+    cache.put("c", block)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["cached_bytes"] == 2 * len(block)
+
+    cache.put("huge", b"x" * (2 * 1024 * 1024))
+    assert cache.get("huge") is None
+    print("✅ Section render cache is bounded by bytes")
+
+
+def test_plot_callback_reuses_cached_render():
+    """Repeated plot requests for the same selection render only once."""
+    from callbacks.plot_generation import PlotGenerationCallback
+    from section import get_section_render_cache
+
+    cache = get_section_render_cache()
+    cache.clear_cache()
+    misses = cache.get_stats()["misses"]
+
+    callback = PlotGenerationCallback()
+    stored = {"filename_map": {"site.ags": AGS_CONTENT}, "dataset_id": "test-ds"}
+
+    first = callback._handle_plot_generation_logic(
+        ["BH001", "BH002"], ["show_labels"], None, stored
+    )
+    second = callback._handle_plot_generation_logic(
+        ["BH002", "BH001"], ["show_labels"], None, stored
+    )
+
+    assert first[0].src.startswith("/renders/")
+    assert first[0].src == second[0].src
+    stats = cache.get_stats()
+    assert stats["misses"] == misses + 1
+    assert stats["hits"] >= 1
+
+    callback._handle_plot_generation_logic(["BH001", "BH002"], [], None, stored)
+    assert cache.get_stats()["misses"] == misses + 2
+    print("✅ Plot callback serves repeated requests from the render cache")
+
+
+if __name__ == "__main__":
+    test_render_key_is_order_independent()
+    test_cache_evicts_by_bytes()
+    test_plot_callback_reuses_cached_render()
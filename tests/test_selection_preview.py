@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test that selection highlighting and buffer preview run in the browser.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _callbacks_for_input(app, component_id, prop):
+    """Return registered callback specs that listen to component_id.prop."""
+    return [
+        spec
+        for spec in app._callback_list
+        if any(
+            dep["id"] == component_id and dep["property"] == prop
+            for dep in spec["inputs"]
+        )
+    ]
+
+
+def test_selection_preview_is_clientside():
+    """Checkbox and buffer width changes are handled by clientside callbacks."""
+    import dash
+
+    from app_modules.clientside_callbacks import register_selection_preview_callbacks
+
+    app = dash.Dash(__name__)
+    register_selection_preview_callbacks(app)
+
+    checkbox_callbacks = _callbacks_for_input(app, "subselection-checkbox-grid", "value")
+    buffer_callbacks = _callbacks_for_input(app, "buffer-input", "value")
+
+    assert len(checkbox_callbacks) == 1
+    assert len(buffer_callbacks) == 1
+    assert all("clientside_function" in spec for spec in checkbox_callbacks)
+    assert all("clientside_function" in spec for spec in buffer_callbacks)
+    assert "borehole-markers.children" in checkbox_callbacks[0]["output"]
+    print("✅ Selection preview registered as clientside callbacks")
+
+
+def test_map_interactions_only_recompute_selection():
+    """The server map callback is only triggered by drawing and Update Buffer."""
+    import dash
+
+    from callbacks.map_interactions import MapInteractionCallback
+
+    app = dash.Dash(__name__)
+    MapInteractionCallback().register(app)
+
+    inputs = {
+        (dep["id"], dep["property"])
+        for spec in app._callback_list
+        for dep in spec["inputs"]
+    }
+    assert inputs == {("draw-control", "geojson"), ("update-buffer-btn", "n_clicks")}
+    print("✅ Server map callback limited to authoritative selection changes")
+
+
+if __name__ == "__main__":
+    test_selection_preview_is_clientside()
+    test_map_interactions_only_recompute_selection()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test per-session application state with TTL and memory-cap eviction.
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def test_sessions_are_isolated():
+    """Selection updates in one session do not leak into another."""
+    from state_management import get_app_state_manager
+
+    alice = get_app_state_manager("session-a")
+    bob = get_app_state_manager("session-b")
+    assert alice is not bob
+    assert get_app_state_manager("session-a") is alice
+
+    alice.update_selection_state(selected_borehole_ids=["BH01"])
+    assert bob.selection_state.selected_borehole_ids == []
+    print("✅ Session states isolated")
+
+
+def test_ttl_and_memory_eviction():
+    """Idle sessions expire and the memory cap evicts least-recently-used."""
+    from state_management import SessionStateStore
+
+    store = SessionStateStore(ttl_seconds=0.05, max_memory_mb=1, sweep_interval=0)
+    idle = store.get_state("idle")
+    idle.update_borehole_data(loca_df=pd.DataFrame({"LOCA_ID": ["BH01"]}))
+    time.sleep(0.1)
+    store.get_state("active")
+    assert store.get_stats()["ttl_evictions"] == 1
+    assert idle.borehole_data.loca_df is None
+
+    store = SessionStateStore(ttl_seconds=60, max_memory_mb=1, sweep_interval=0)
+    for name in ("first", "second"):
+        store.get_state(name).update_borehole_data(
+            filename_map={"big.ags": "x" * 600 * 1024}
+        )
+    store.sweep()
+    stats = store.get_stats()
+    assert stats["sessions"] == 1
+    assert stats["memory_evictions"] == 1
+    assert store.get_state("second").borehole_data.filename_map
+    print("✅ Idle and over-budget sessions evicted")
+
+
+def test_session_cookie_scopes_state():
+    """Requests are assigned a session cookie that selects their state."""
+    import dash
+    from flask import jsonify
+
+    from app_constants import PERFORMANCE_CONFIG
+    from app_modules.server_routes import register_session_hooks
+    from state_management import get_app_state_manager, get_current_session_id
+
+    app = dash.Dash(__name__)
+    app.layout = dash.html.Div()
+    register_session_hooks(app)
+
+    @app.server.route("/whoami")
+    def whoami():
+        return jsonify(session=get_current_session_id())
+
+    client = app.server.test_client()
+    response = client.get("/whoami")
+    cookie = client.get_cookie(PERFORMANCE_CONFIG.SESSION_COOKIE_NAME)
+    assert cookie is not None
+    assert response.get_json()["session"] == cookie.value
+
+    with app.server.test_request_context(
+        headers={"Cookie": f"{PERFORMANCE_CONFIG.SESSION_COOKIE_NAME}={cookie.value}"}
+    ):
+        assert get_app_state_manager() is get_app_state_manager(cookie.value)
+    print("✅ Session cookie selects per-session state")
+
+
+if __name__ == "__main__":
+    test_sessions_are_isolated()
+    test_ttl_and_memory_eviction()
+    test_session_cookie_scopes_state()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test that identical concurrent renders are coalesced into one.
+"""
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def test_concurrent_misses_share_one_render():
+    """Concurrent requests for the same section render it once."""
+    from render_workers import get_render_single_flight
+    from section.render_cache import SectionRenderCache, make_render_key
+
+    cache = SectionRenderCache()
+    key = make_render_key("flight-ds", ["BH001", "BH002"], dpi=72)
+    calls = []
+
+    def render():
+        calls.append(1)
+        time.sleep(0.3)
+        return b"rendered"
+
+    coalesced_before = get_render_single_flight().get_stats()["coalesced"]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(lambda _: cache.get_or_render(key, render), range(4))
+        )
+
+    assert results == [b"rendered"] * 4
+    assert len(calls) == 1
+    assert cache.get_stats()["misses"] == 1
+    stats = get_render_single_flight().get_stats()
+    assert stats["coalesced"] - coalesced_before == 3
+    assert stats["in_flight"] == 0
+    print("✅ Concurrent identical renders are coalesced")
+
+
+def test_followers_receive_leader_error():
+    """A failed render is reported to every waiting caller, then retried."""
+    from render_workers import SingleFlight
+
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.2)
+        raise ValueError("render failed")
+
+    def call(fn):
+        try:
+            return flight.do("key", fn)
+        except ValueError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(call, failing)
+        started.wait(5)
+        follower = executor.submit(call, lambda: "should not run")
+        assert leader.result(5) == "render failed"
+        assert follower.result(5) == "render failed"
+
+    assert flight.do("key", lambda: "retried") == "retried"
+    assert flight.get_stats() == {"leaders": 2, "coalesced": 1, "in_flight": 0}
+    print("✅ Render failures are shared and not remembered")
+
+
+if __name__ == "__main__":
+    test_concurrent_misses_share_one_render()
+    test_followers_receive_leader_error()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test that map interactions write small selection stores, not the dataset.
+"""
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _stored_data():
+    loca_df = pd.DataFrame(
+        {
+            "LOCA_ID": ["BH01", "BH02"],
+            "LOCA_NATE": [530000.0, 530050.0],
+            "LOCA_NATN": [180000.0, 180050.0],
+            "lat": [51.50, 51.51],
+            "lon": [-0.12, -0.11],
+        }
+    )
+    return {
+        "loca_df": loca_df.to_dict("records"),
+        "filename_map": {"large.ags": "x" * 100000},
+        "all_borehole_ids": ["BH01", "BH02"],
+    }
+
+
+def test_map_callback_outputs_small_stores():
+    """The map callback targets selection/polyline/buffer stores only."""
+    import dash
+
+    from callbacks.map_interactions import MapInteractionCallback
+
+    app = dash.Dash(__name__)
+    MapInteractionCallback().register(app)
+
+    outputs = app._callback_list[0]["output"]
+    assert "borehole-data-store.data" not in outputs
+    for store in ("selection-store", "polyline-store", "buffer-store"):
+        assert f"{store}.data" in outputs
+    print("✅ Map callback no longer echoes borehole-data-store")
+
+
+def test_polyline_response_payload():
+    """A polyline selection returns only IDs, coordinates and buffer width."""
+    from callbacks.map_interactions import MapInteractionCallback
+
+    callback = MapInteractionCallback()
+    # Only the store payloads are under test here, not the checkbox grid
+    callback._create_checkbox_grid = lambda ids, checked: None
+    stored = _stored_data()
+    feature = {
+        "type": "Feature",
+        "geometry": {
+            "type": "LineString",
+            "coordinates": [[-0.125, 51.495], [-0.105, 51.515]],
+        },
+    }
+    result = callback._handle_polyline_selection(
+        feature,
+        pd.DataFrame(stored["loca_df"]),
+        stored,
+        None,
+        {"buffer_meters": 500},
+    )
+
+    selection, polyline, buffer = result[5], result[6], result[7]
+    assert selection["is_polyline"] is True
+    assert set(selection["selection_boreholes"]) == {"BH01", "BH02"}
+    assert polyline["last_polyline"][0] == [51.495, -0.125]
+    assert buffer == {"buffer_meters": 500}
+    assert "filename_map" not in selection and "loca_df" not in selection
+    print("✅ Polyline selection writes small stores")
+
+
+def test_empty_response_leaves_stores():
+    """No-op interactions leave the selection stores untouched."""
+    from dash import no_update
+
+    from callbacks.map_interactions import MapInteractionCallback
+
+    result = MapInteractionCallback()._empty_response()
+    assert result[5:8] == (no_update, no_update, no_update)
+    print("✅ Empty response leaves stores unchanged")
+
+
+if __name__ == "__main__":
+    test_map_callback_outputs_small_stores()
+    test_polyline_response_payload()
+    test_empty_response_leaves_stores()
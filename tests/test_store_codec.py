@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the compact columnar codec used for DataFrames in Dash stores.
+"""
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath("."))
+
+
+def _loca_df(count=2000, seed=3):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "LOCA_ID": [f"BH{i:05d}" for i in range(count)],
+            "LOCA_TYPE": rng.choice(["CP", "RC", "TP"], count),
+            "LOCA_GL": rng.uniform(0, 50, count),
+            "LOCA_FDEP": rng.uniform(5, 40, count).astype("float32"),
+            "LOCA_NATE": rng.integers(400000, 600000, count),
+            "lat": np.where(rng.random(count) < 0.1, np.nan, rng.uniform(51, 52, count)),
+            "ags_file": pd.Categorical(rng.choice(["a.ags", "b.ags"], count)),
+        }
+    )
+
+
+def test_round_trip_exact():
+    """Encoded frames decode to the same values, including missing values."""
+    from state_management import decode_dataframe, encode_dataframe
+
+    original = _loca_df()
+    original.loc[5, "LOCA_TYPE"] = None
+    for binary in (True, False):
+        payload = json.loads(json.dumps(encode_dataframe(original, binary=binary)))
+        decoded = decode_dataframe(payload)
+
+        assert list(decoded.columns) == list(original.columns)
+        assert decoded["LOCA_ID"].tolist() == original["LOCA_ID"].tolist()
+        assert decoded["LOCA_TYPE"].isna().sum() == 1
+        assert decoded["ags_file"].tolist() == original["ags_file"].tolist()
+        np.testing.assert_array_equal(decoded["LOCA_GL"], original["LOCA_GL"])
+        np.testing.assert_array_equal(decoded["LOCA_FDEP"], original["LOCA_FDEP"])
+        np.testing.assert_array_equal(decoded["LOCA_NATE"], original["LOCA_NATE"])
+        np.testing.assert_array_equal(decoded["lat"], original["lat"])
+    print("✅ Columnar codec round-trips exactly")
+
+
+def test_payload_smaller_than_records():
+    """The columnar payload is several times smaller than to_dict('records')."""
+    from state_management import encode_dataframe
+
+    loca_df = _loca_df()
+    records_size = len(json.dumps(loca_df.astype({"ags_file": str}).to_dict("records")))
+    columnar_size = len(json.dumps(encode_dataframe(loca_df)))
+    assert columnar_size * 2 < records_size
+    print(f"✅ Store payload {records_size} -> {columnar_size} bytes")
+
+
+def test_legacy_records_accepted():
+    """Legacy record lists still decode, and single columns decode directly."""
+    from state_management import decode_column, decode_dataframe, encode_dataframe
+
+    records = [{"LOCA_ID": "BH01", "LOCA_GL": 1.5}, {"LOCA_ID": "BH02", "LOCA_GL": 2.0}]
+    assert decode_dataframe(records)["LOCA_ID"].tolist() == ["BH01", "BH02"]
+    assert decode_column(records, "LOCA_ID") == ["BH01", "BH02"]
+    assert decode_column(encode_dataframe(pd.DataFrame(records)), "LOCA_GL") == [1.5, 2.0]
+    assert decode_dataframe(None).empty
+    print("✅ Legacy record stores still supported")
+
+
+def test_decoded_frame_is_writable():
+    """Binary columns decode to writable arrays, not read-only buffer views."""
+    from state_management import decode_dataframe, encode_dataframe
+    from state_management.store_codec import _decode_column
+
+    payload = encode_dataframe(_loca_df(50))
+    for column in ("LOCA_GL", "LOCA_FDEP", "LOCA_NATE"):
+        assert _decode_column(payload["data"][column], 50).flags.writeable
+
+    decoded = decode_dataframe(payload)
+    decoded.loc[0, "LOCA_GL"] = -1.0
+    decoded["LOCA_NATE"] += 1
+    assert decoded.loc[0, "LOCA_GL"] == -1.0
+    print("✅ Decoded frames are writable")
+
+
+if __name__ == "__main__":
+    test_round_trip_exact()
+    test_payload_smaller_than_records()
+    test_legacy_records_accepted()
+    test_decoded_frame_is_writable()
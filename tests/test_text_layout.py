@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test glyph-metric text measurement and cached wrapping for borehole logs.
+"""
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+DESCRIPTION = (
+    "Firm to stiff thinly laminated grey brown slightly sandy silty CLAY with "
+    "occasional fine to medium subangular flint gravel and rare shell fragments"
+)
+
+
+def _rendered_width(text, fontsize):
+    """Width in points of text as matplotlib draws it."""
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure()
+    try:
+        artist = fig.text(0, 0, text, fontsize=fontsize)
+        extent = artist.get_window_extent(fig.canvas.get_renderer())
+        return extent.width * 72 / fig.dpi
+    finally:
+        plt.close(fig)
+
+
+def test_measured_width_matches_matplotlib():
+    """Glyph-based widths agree with matplotlib's own text extents."""
+    from borehole_log.text_layout import TextLayout
+
+    layout = TextLayout()
+    for text in ("Firm brown CLAY", "WWWW", "iiii", DESCRIPTION[:60]):
+        measured = layout.text_width(text, 8)
+        assert abs(measured - _rendered_width(text, 8)) <= 0.03 * measured + 1, text
+    print("✅ Text widths match rendered matplotlib text")
+
+
+def test_wrap_fits_width_and_is_cached():
+    """Wrapped lines fit the width in points and repeats hit the cache."""
+    from borehole_log.text_layout import TextLayout
+
+    layout = TextLayout()
+    wrapped = layout.wrap(DESCRIPTION, 150, fontsize=8)
+    lines = wrapped.split("\n")
+    assert len(lines) > 1 and " ".join(lines) == DESCRIPTION
+    assert all(layout.text_width(line, 8) <= 150 for line in lines)
+
+    assert layout.wrap(DESCRIPTION, 150, fontsize=8) == wrapped
+    stats = layout.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["fonts"] == 1
+
+    # Narrow columns split long words; max_lines ends with an ellipsis
+    assert all(
+        layout.text_width(line, 8) <= 20
+        for line in layout.wrap("Unweathered", 20, fontsize=8).split("\n")
+    )
+    truncated = layout.wrap(DESCRIPTION, 100, fontsize=8, max_lines=3).split("\n")
+    assert len(truncated) == 3 and truncated[-1] == "..."
+    assert layout.wrap(None, 100) == ""
+    print("✅ Wrapping fits the width in points and is cached")
+
+
+def test_log_descriptions_use_text_layout():
+    """Borehole log pages wrap descriptions through the shared service."""
+    from borehole_log import get_text_layout, render_borehole_log_pages
+
+    before = get_text_layout().get_stats()
+    geology = [
+        {"GEOL_TOP": 0.0, "GEOL_BASE": 2.0, "GEOL_DESC": DESCRIPTION},
+        {"GEOL_TOP": 2.0, "GEOL_BASE": 4.0, "GEOL_DESC": DESCRIPTION},
+    ]
+    pages = render_borehole_log_pages("BH1", {"LOCA_ID": "BH1"}, geology, dpi=30)
+    after = get_text_layout().get_stats()
+
+    assert len(pages) == 1
+    assert after["misses"] >= before["misses"] + 1
+    assert after["hits"] >= before["hits"] + 1
+    print("✅ Repeated descriptions are wrapped once")
+
+
+if __name__ == "__main__":
+    test_measured_width_matches_matplotlib()
+    test_wrap_fits_width_and_is_cached()
+    test_log_descriptions_use_text_layout()
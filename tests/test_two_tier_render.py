@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test that section previews and downloads are rendered and cached separately.
+"""
+import os
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+sys.path.insert(0, os.path.abspath("."))
+
+from tests.test_section_pipeline import AGS_CONTENT  # noqa: E402
+
+
+def test_preview_skips_hatching():
+    """Previews draw intervals without hatch patterns."""
+    from section.plotting.pipeline import (
+        project_section_data,
+        render_section_figure,
+        style_section_data,
+    )
+    from section.utils import safe_close_figure
+
+    ags_data = [("site.ags", AGS_CONTENT)]
+    projected = project_section_data(ags_data, data_key="two-tier-a")
+    color_map, _, leg_label_map = style_section_data(ags_data, data_key="two-tier-a")
+    styles = (color_map, {code: "//" for code in color_map}, leg_label_map)
+
+    for hatching in (False, True):
+        fig = render_section_figure(
+            projected, styles, True, (11.69, 8.27), 50, 0.7, 0.4, hatching=hatching
+        )
+        try:
+            hatches = [
+                collection.get_hatch()
+                for collection in fig.axes[0].collections
+                if collection.get_hatch()
+            ]
+            assert bool(hatches) == hatching
+        finally:
+            safe_close_figure(fig)
+    print("✅ Preview renders skip hatch patterns")
+
+
+def test_download_renders_full_resolution_in_format():
+    """The download button renders a separately cached file in the chosen format."""
+    import dash
+
+    from app_constants import PLOT_CONFIG
+    from callbacks.plot_generation import PlotGenerationCallback
+    from render_workers import RenderWorkerPool
+    import callbacks.plot_generation as plot_generation
+    from section.render_cache import SectionRenderCache
+
+    cache = SectionRenderCache()
+    pool = RenderWorkerPool(max_workers=1, use_processes=False)
+    original_cache = plot_generation.get_section_render_cache
+    original_pool = plot_generation.get_render_worker_pool
+    plot_generation.get_section_render_cache = lambda: cache
+    plot_generation.get_render_worker_pool = lambda: pool
+    try:
+        callback = PlotGenerationCallback()
+        stored = {"filename_map": {"site.ags": AGS_CONTENT}, "dataset_id": "tt-b"}
+        args = (["BH001", "BH002"], ["show_labels"])
+
+        img, log, download = callback._handle_plot_generation_logic(
+            *args, None, stored
+        )
+        assert download is None and img.src.startswith("/renders/")
+        assert cache.get_stats()["entries"] == 1
+
+        img, log, download = callback._handle_plot_generation_logic(
+            *args,
+            1,
+            stored,
+            triggered="download-section-btn.n_clicks",
+            download_format="pdf",
+        )
+        assert img is dash.no_update and log is dash.no_update
+        assert download["filename"] == "section_plot.pdf"
+        assert cache.get_stats()["entries"] == 2
+
+        preview_key, full_key = list(cache._entries)
+        assert preview_key[-1] == "preview" and preview_key[4] == PLOT_CONFIG.PREVIEW_DPI
+        assert full_key[-1] == "full" and full_key[4] == PLOT_CONFIG.DOWNLOAD_DPI
+        assert cache.get(full_key).startswith(b"%PDF")
+    finally:
+        plot_generation.get_section_render_cache = original_cache
+        plot_generation.get_render_worker_pool = original_pool
+        pool.shutdown()
+    print("✅ Downloads render separately at full resolution")
+
+
+if __name__ == "__main__":
+    test_preview_skips_hatching()
+    test_download_renders_full_resolution_in_format()
@@ -0,0 +1,284 @@
+"""
+Chunked Upload Spool Module.
+
+This module receives AGS files in chunks over plain HTTP and streams them to
+a temporary spool directory on disk, instead of shipping base64 data URIs
+through ``dcc.Upload`` and a ``dcc.Store``. Only a small upload manifest (an
+upload ID plus file names and sizes) is placed in the Dash store; the ingest
+callback then reads the spooled files through ordinary file handles.
+
+Key Features:
+- **Streaming Writes**: Each chunk is appended to the file on disk as it
+  arrives, so the server never holds a whole upload in memory
+- **Early Limit Enforcement**: File count, per-file size and total size limits
+  are checked per chunk, so oversized uploads are rejected mid-transfer
+- **Ordered Chunks**: Chunks carry their byte offset and must arrive in order,
+  so a retried or duplicated chunk cannot corrupt the file
+- **File Handle Ingest**: ``open_files`` yields open binary handles for the
+  ingest pipeline
+- **Automatic Cleanup**: Uploads are discarded after ingest, and abandoned
+  uploads expire after a TTL
+
+Upload flow (see app_modules.server_routes and assets/chunked_upload.js):
+1. ``POST /uploads`` creates an upload and returns its ID
+2. ``PUT /uploads/<id>/files/<index>?name=...&offset=...`` appends a chunk
+3. ``POST /uploads/<id>/complete`` returns the manifest stored in
+   ``upload-data-store``
+
+Author: [Project Team]
+Last Modified: July 2025
+"""
+
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import ExitStack, contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from app_constants import FILE_LIMITS
+
+logger = logging.getLogger(__name__)
+
+BYTES_PER_MB = 1024 * 1024
+
+# Upload IDs are uuid4().hex strings; anything else never names a spool folder
+UPLOAD_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+class UploadSpoolError(ValueError):
+    """Raised when a chunk or upload request is invalid or exceeds limits."""
+
+
+class UploadNotFoundError(UploadSpoolError):
+    """Raised for unknown, expired or already-consumed upload IDs."""
+
+
+class UploadSpool:
+    """
+    Temporary on-disk storage for chunked uploads.
+
+    Upload metadata is kept in memory; file data is written to
+    ``<spool_dir>/<upload_id>/<file_index>.part``.
+    """
+
+    def __init__(
+        self,
+        spool_dir: Optional[str] = None,
+        max_files: int = FILE_LIMITS.MAX_FILES_COUNT,
+        max_file_mb: float = FILE_LIMITS.MAX_FILE_SIZE_MB,
+        max_total_mb: float = FILE_LIMITS.MAX_TOTAL_FILES_MB,
+        ttl_seconds: float = FILE_LIMITS.UPLOAD_SPOOL_TTL_SECONDS,
+    ):
+        self.spool_dir = spool_dir or tempfile.mkdtemp(prefix="borehole_uploads_")
+        self.max_files = max_files
+        self.max_file_bytes = int(max_file_mb * BYTES_PER_MB)
+        self.max_total_bytes = int(max_total_mb * BYTES_PER_MB)
+        self.ttl_seconds = ttl_seconds
+        self._uploads: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+    def _get_upload(self, upload_id: str) -> Dict[str, Any]:
+        if not is_valid_upload_id(upload_id):
+            raise UploadNotFoundError(f"Unknown upload: {upload_id!r}")
+        upload = self._uploads.get(upload_id)
+        if upload is None:
+            raise UploadNotFoundError(f"Unknown upload: {upload_id}")
+        return upload
+
+    def _upload_dir(self, upload_id: str) -> str:
+        return os.path.join(self.spool_dir, upload_id)
+
+    def _is_inside_spool(self, path: str) -> bool:
+        """Check that a resolved path is a direct child of the spool directory."""
+        spool_root = os.path.realpath(self.spool_dir)
+        return os.path.dirname(os.path.realpath(path)) == spool_root
+
+    def create_upload(self) -> str:
+        """
+        Start a new upload.
+
+        Returns:
+            str: Upload ID
+        """
+        self.cleanup_expired()
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self._upload_dir(upload_id))
+        with self._lock:
+            self._uploads[upload_id] = {
+                "created": time.monotonic(),
+                "files": {},
+                "total_bytes": 0,
+                "complete": False,
+            }
+        logger.info(f"Started chunked upload {upload_id}")
+        return upload_id
+
+    def append_chunk(
+        self, upload_id: str, file_index: int, name: str, offset: int, data: bytes
+    ) -> int:
+        """
+        Append a chunk to a spooled file.
+
+        Args:
+            upload_id: Upload ID from create_upload
+            file_index: Position of the file within the upload
+            name: Original file name
+            offset: Byte offset of this chunk; must equal the bytes received
+            data: Chunk bytes
+
+        Returns:
+            int: Bytes received so far for this file
+
+        Raises:
+            UploadSpoolError: On out-of-order chunks or exceeded limits
+        """
+        with self._lock:
+            upload = self._get_upload(upload_id)
+            if upload["complete"]:
+                raise UploadSpoolError("Upload already completed")
+
+            entry = upload["files"].get(file_index)
+            if entry is None:
+                if not 0 <= file_index < self.max_files:
+                    raise UploadSpoolError(
+                        f"Too many files (max {self.max_files})"
+                    )
+                entry = {"name": os.path.basename(name or "")[:255], "size": 0}
+                upload["files"][file_index] = entry
+
+            if offset != entry["size"]:
+                raise UploadSpoolError(
+                    f"Unexpected chunk offset {offset} for {entry['name']} "
+                    f"(expected {entry['size']})"
+                )
+            if entry["size"] + len(data) > self.max_file_bytes:
+                raise UploadSpoolError(
+                    f"File {entry['name']} too large "
+                    f"(max {self.max_file_bytes // BYTES_PER_MB}MB)"
+                )
+            if upload["total_bytes"] + len(data) > self.max_total_bytes:
+                raise UploadSpoolError(
+                    f"Total size too large (max {self.max_total_bytes // BYTES_PER_MB}MB)"
+                )
+
+            path = os.path.join(self._upload_dir(upload_id), f"{file_index}.part")
+            with open(path, "ab") as handle:
+                handle.write(data)
+            entry["size"] += len(data)
+            upload["total_bytes"] += len(data)
+            return entry["size"]
+
+    def complete_upload(self, upload_id: str) -> Dict[str, Any]:
+        """
+        Mark an upload as complete and return its manifest.
+
+        Returns:
+            dict: ``{"upload_id", "files": [{"name", "size"}], "total_bytes"}``
+        """
+        with self._lock:
+            upload = self._get_upload(upload_id)
+            if not upload["files"]:
+                raise UploadSpoolError("Upload contains no files")
+            upload["complete"] = True
+            return {
+                "upload_id": upload_id,
+                "files": [
+                    dict(upload["files"][index]) for index in sorted(upload["files"])
+                ],
+                "total_bytes": upload["total_bytes"],
+            }
+
+    @contextmanager
+    def open_files(self, upload_id: str) -> Iterator[List[Tuple[str, BinaryIO, int]]]:
+        """
+        Open the spooled files of a completed upload.
+
+        Yields:
+            list: ``(name, binary_file_handle, size_bytes)`` in upload order
+        """
+        with self._lock:
+            upload = self._get_upload(upload_id)
+            if not upload["complete"]:
+                raise UploadSpoolError("Upload is not complete")
+            files = sorted(upload["files"].items())
+
+        with ExitStack() as stack:
+            handles = [
+                (
+                    entry["name"],
+                    stack.enter_context(
+                        open(
+                            os.path.join(
+                                self._upload_dir(upload_id), f"{index}.part"
+                            ),
+                            "rb",
+                        )
+                    ),
+                    entry["size"],
+                )
+                for index, entry in files
+            ]
+            yield handles
+
+    def discard(self, upload_id: str) -> None:
+        """
+        Delete an upload and its spooled files.
+
+        Only uploads created by this spool are deleted; unknown or malformed
+        IDs are ignored so a client-supplied ID can never name a path outside
+        the spool directory.
+        """
+        if not is_valid_upload_id(upload_id):
+            logger.warning(f"Refusing to discard invalid upload ID {upload_id!r}")
+            return
+        with self._lock:
+            upload = self._uploads.pop(upload_id, None)
+        if upload is None:
+            return
+
+        upload_dir = self._upload_dir(upload_id)
+        if not self._is_inside_spool(upload_dir):
+            logger.warning(f"Refusing to delete {upload_dir} outside the spool")
+            return
+        shutil.rmtree(upload_dir, ignore_errors=True)
+
+    def cleanup_expired(self) -> int:
+        """Discard uploads older than the TTL. Returns the number removed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                upload_id
+                for upload_id, upload in self._uploads.items()
+                if now - upload["created"] > self.ttl_seconds
+            ]
+        for upload_id in expired:
+            self.discard(upload_id)
+        if expired:
+            logger.info(f"Discarded {len(expired)} expired uploads")
+        return len(expired)
+
+
+def is_valid_upload_id(upload_id: Any) -> bool:
+    """Check that an upload ID has the format produced by create_upload."""
+    return isinstance(upload_id, str) and bool(UPLOAD_ID_PATTERN.fullmatch(upload_id))
+
+
+# Global upload spool instance
+_upload_spool: Optional[UploadSpool] = None
+_spool_lock = threading.Lock()
+
+
+def get_upload_spool() -> UploadSpool:
+    """Get global upload spool instance."""
+    global _upload_spool
+    if _upload_spool is None:
+        with _spool_lock:
+            if _upload_spool is None:
+                _upload_spool = UploadSpool()
+    return _upload_spool